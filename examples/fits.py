@@ -7,50 +7,46 @@
 
 from pathlib import Path
 from time import sleep
-from typing import List, Optional
-
-from astropy.io import fits
-from numpy import array, uint16
+from typing import Optional
 
 from zwo import (
     ZWOASICamera,
     ZWOASICameraParams,
+    ZWOASIFrameBuffer,
     ZWOASIImageType,
     get_all_connected_camera_ids,
+    get_fits_header_cards,
+    write_fits,
 )
 
 # **************************************************************************************
 
 
-# Example to convert a List[int] frame to a FITS file on disk:
+# Example to stream a raw frame buffer to a FITS file on disk:
 def save_frame_to_disk(
-    frame: List[int],
-    height: int,
-    width: int,
+    zwo: ZWOASICamera,
+    frame: ZWOASIFrameBuffer,
     where: Path,
-    headers: fits.Header,
 ) -> Optional[Exception]:
-    shape = (height, width)
-
-    # Convert frame data to a numpy array for saving to disk:
-    # (Adjust the shape as needed; here we assume it's a 1D array):
-    data = array(frame, dtype=uint16).reshape(shape)
+    # Build the header from the camera's cached state (e.g., without SDK calls):
+    cards = get_fits_header_cards(zwo)
 
-    # Create a primary HDU (Header/Data Unit) with the data array, or return an error
-    # if the data array is invalid:
-    try:
-        hdu = fits.PrimaryHDU(data=data)
-    except Exception as error:
-        return error
+    # Amend and add headers as needed:
+    cards.append(("OBSERVER", "zwoasi", "observer"))
 
-    # If headers is an astropy Header, extend/update the current header:
-    if isinstance(headers, fits.Header):
-        hdu.header.extend(headers, update=True)
+    # ... etc.
 
-    # Create an HDUList and write to disk, overwriting any existing file or
-    # return an error if the file cannot be written to disk:
+    # Stream the frame straight from the SDK's buffer to disk, or return an error if
+    # the file cannot be written to disk:
     try:
-        hdu.writeto(where.as_posix(), overwrite=True, checksum=True)
+        write_fits(
+            where,
+            frame.data,
+            frame.width,
+            frame.height,
+            frame.image_type,
+            cards=cards,
+        )
     except Exception as error:
         return error
 
@@ -238,21 +234,12 @@ def main() -> None:
 
     print(f"Camera Temperature: {temperature}°C")
 
-    # Get the frame from the camera:
-    frame = zwo.get_frame()
-
-    print(f"Camera Frame Size: {len(frame)}")
-
-    # Save the frame to disk:
-    headers = fits.Header()
-
-    # Amend and add headers as needed:
-    headers["INSTRUME"] = name
-
-    # ... etc.
+    # Get the frame from the camera, into a reusable frame buffer:
+    with zwo.get_frame_buffer() as frame:
+        print(f"Camera Frame Size: {frame.size}")
 
-    # Save the frame to disk:
-    save_frame_to_disk(frame, height, width, Path("example.fits"), headers)
+        # Save the frame to disk:
+        save_frame_to_disk(zwo, frame, Path("example.fits"))
 
     # Turn off the camera's cooler:
     zwo.turn_off_cooler()
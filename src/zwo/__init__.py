@@ -5,35 +5,249 @@
 
 # **************************************************************************************
 
-from .camera import (
-    ZWOASI_VENDOR_ID,
-    BaseDeviceState,
-    ZWOASICamera,
-    ZWOASICameraParams,
-    ZWOASIGPSExposureData,
-    get_all_connected_camera_ids,
-    is_connected,
-)
-from .capabilities import ZWOASI_CAMERA_CAPABILITIES_CTYPE, ZWOASICameraCapabilities
-from .enums import (
-    ZWOASIBayerPattern,
-    ZWOASIBool,
-    ZWOASICameraMode,
-    ZWOASIControlType,
-    ZWOASIErrorCode,
-    ZWOASIExposureStatus,
-    ZWOASIFlipStatus,
-    ZWOASIGuideDirection,
-    ZWOASIImageType,
-    ZWOASITriggerOutput,
-)
-from .errors import ZWOASIError, ZWOASIExposureError, ZWOASIIOError
-from .gps import ZWOASI_GPS_DATA_CTYPE, ZWOASIGPSData
-from .info import ZWOASI_CAMERA_INFORMATION_CTYPE, ZWOASICameraInformation
-from .mode import ZWOASI_CAMERA_SUPPORTED_MODE_CTYPE, ZWOASICameraSupportedMode
-from .time import ZWOASI_CAMERA_DATE_TIME_CTYPE, ZWOASIDateTime
-from .utils import get_asi_libary_path
-from .version import ZWOASI_SDK_VERSION
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .aio import AsyncZWOASICamera
+    from .cache import (
+        ZWOASI_CAMERA_CACHE_FORMAT_VERSION,
+        ZWOASICameraCache,
+        ZWOASICameraCacheEntry,
+    )
+    from .camera import (
+        ZWOASI_VENDOR_ID,
+        BaseDeviceState,
+        ZWOASICamera,
+        ZWOASICameraParams,
+        ZWOASIGPSExposureData,
+        ZWOASISequenceBreakdown,
+        ZWOASISequenceResult,
+        get_all_connected_camera_ids,
+        is_connected,
+    )
+    from .capabilities import ZWOASI_CAMERA_CAPABILITIES_CTYPE, ZWOASICameraCapabilities
+    from .controls import (
+        ZWOASI_CONTROL_CACHE_MAXIMUM_AGE,
+        ZWOASIControlCache,
+        ZWOASIControlCacheStatistics,
+        ZWOASIControlValue,
+    )
+    from .enums import (
+        ZWOASIBayerPattern,
+        ZWOASIBool,
+        ZWOASICameraMode,
+        ZWOASIControlType,
+        ZWOASIErrorCode,
+        ZWOASIExposureStatus,
+        ZWOASIFlipStatus,
+        ZWOASIGuideDirection,
+        ZWOASIImageType,
+        ZWOASITriggerOutput,
+    )
+    from .errors import ZWOASIError, ZWOASIExposureError, ZWOASIIOError
+    from .exposure import ZWOASIExposureCompletion, ZWOASIExposureWaiter
+    from .fits import (
+        ZWOASI_FITS_BLOCK_SIZE,
+        ZWOASI_FITS_CHUNK_SIZE,
+        ZWOASIFITSCard,
+        ZWOASIFITSValue,
+        format_fits_card,
+        get_fits_header,
+        get_fits_header_cards,
+        write_fits,
+    )
+    from .gps import (
+        ZWOASI_GPS_DATA_CTYPE,
+        ZWOASI_GPS_SERIES_COLUMNS,
+        ZWOASIGPSData,
+        ZWOASIGPSRecord,
+        ZWOASIGPSSeries,
+    )
+    from .handle import (
+        ZWOASIExposureHandle,
+        ZWOASIExposureMonitor,
+        get_exposure_monitor,
+    )
+    from .info import ZWOASI_CAMERA_INFORMATION_CTYPE, ZWOASICameraInformation
+    from .instrumentation import (
+        ZWOASI_LATENCY_BUCKETS,
+        ZWOASISDKCallStatistics,
+        ZWOASISDKInstrumentation,
+    )
+    from .lib import (
+        ZWOASI_SDK_FUNCTIONS,
+        ZWOASICameraLib,
+        ZWOASICameraLibTiming,
+        get_asi_camera_lib,
+        prewarm_asi_camera_lib,
+        set_asi_camera_lib,
+    )
+    from .metrics import (
+        ZWOASI_OPENMETRICS_CONTENT_TYPE,
+        ZWOASICameraMetrics,
+        ZWOASIMetricsCollector,
+    )
+    from .mode import ZWOASI_CAMERA_SUPPORTED_MODE_CTYPE, ZWOASICameraSupportedMode
+    from .pool import (
+        ZWOASIFrameBuffer,
+        ZWOASIFrameBufferPool,
+        ZWOASIFrameBufferPoolStatistics,
+    )
+    from .profile import ZWOASICameraProfile, ZWOASIConfigurationResult
+    from .roi import ZWOASIRegionOfInterest
+    from .ser import (
+        ZWOASI_SER_HEADER_SIZE,
+        ZWOASISERRecorder,
+        ZWOASISERRecorderStatistics,
+        get_gps_ser_ticks,
+        get_ser_ticks,
+    )
+    from .shm import (
+        ZWOASISharedFrame,
+        ZWOASISharedFramePublisher,
+        ZWOASISharedFrameReader,
+        ZWOASISharedFrameReaderStatus,
+        ZWOASISharedFrameRing,
+    )
+    from .simulator import (
+        ZWOASISimulatedCameraConfiguration,
+        ZWOASISimulatedCameraLib,
+        ZWOASISimulatedSDK,
+        install_simulated_asi_camera_lib,
+    )
+    from .time import (
+        ZWOASI_CAMERA_DATE_TIME_CTYPE,
+        ZWOASIDateTime,
+        ZWOASIDateTimeRecord,
+    )
+    from .tracing import (
+        ZWOASI_SPAN_NAMES,
+        ZWOASISpan,
+        ZWOASISpanRecorder,
+        ZWOASISpanSummary,
+        ZWOASITracer,
+    )
+    from .utils import get_asi_libary_path
+    from .version import ZWOASI_SDK_VERSION
+    from .video import ZWOASIVideoFrame, ZWOASIVideoStream, ZWOASIVideoStreamStatistics
+    from .writer import (
+        ZWOASIFrameWriter,
+        ZWOASIFrameWriterFunction,
+        ZWOASIFrameWriterPolicy,
+        ZWOASIFrameWriterStatistics,
+    )
+
+# **************************************************************************************
+
+# The submodule defining each name of the public API, which is imported lazily (on
+# first access) so that `import zwo` doesn't construct every ctypes structure and
+# pydantic model up front:
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "AsyncZWOASICamera": "aio",
+    "ZWOASI_CAMERA_CACHE_FORMAT_VERSION": "cache",
+    "ZWOASICameraCache": "cache",
+    "ZWOASICameraCacheEntry": "cache",
+    "ZWOASI_VENDOR_ID": "camera",
+    "BaseDeviceState": "camera",
+    "ZWOASICamera": "camera",
+    "ZWOASICameraParams": "camera",
+    "ZWOASIGPSExposureData": "camera",
+    "ZWOASISequenceBreakdown": "camera",
+    "ZWOASISequenceResult": "camera",
+    "get_all_connected_camera_ids": "camera",
+    "is_connected": "camera",
+    "ZWOASI_CAMERA_CAPABILITIES_CTYPE": "capabilities",
+    "ZWOASICameraCapabilities": "capabilities",
+    "ZWOASI_CONTROL_CACHE_MAXIMUM_AGE": "controls",
+    "ZWOASIControlCache": "controls",
+    "ZWOASIControlCacheStatistics": "controls",
+    "ZWOASIControlValue": "controls",
+    "ZWOASIBayerPattern": "enums",
+    "ZWOASIBool": "enums",
+    "ZWOASICameraMode": "enums",
+    "ZWOASIControlType": "enums",
+    "ZWOASIErrorCode": "enums",
+    "ZWOASIExposureStatus": "enums",
+    "ZWOASIFlipStatus": "enums",
+    "ZWOASIGuideDirection": "enums",
+    "ZWOASIImageType": "enums",
+    "ZWOASITriggerOutput": "enums",
+    "ZWOASIError": "errors",
+    "ZWOASIExposureError": "errors",
+    "ZWOASIIOError": "errors",
+    "ZWOASIExposureCompletion": "exposure",
+    "ZWOASIExposureWaiter": "exposure",
+    "ZWOASI_FITS_BLOCK_SIZE": "fits",
+    "ZWOASI_FITS_CHUNK_SIZE": "fits",
+    "ZWOASIFITSCard": "fits",
+    "ZWOASIFITSValue": "fits",
+    "format_fits_card": "fits",
+    "get_fits_header": "fits",
+    "get_fits_header_cards": "fits",
+    "write_fits": "fits",
+    "ZWOASI_GPS_DATA_CTYPE": "gps",
+    "ZWOASI_GPS_SERIES_COLUMNS": "gps",
+    "ZWOASIGPSData": "gps",
+    "ZWOASIGPSRecord": "gps",
+    "ZWOASIGPSSeries": "gps",
+    "ZWOASIExposureHandle": "handle",
+    "ZWOASIExposureMonitor": "handle",
+    "get_exposure_monitor": "handle",
+    "ZWOASI_CAMERA_INFORMATION_CTYPE": "info",
+    "ZWOASICameraInformation": "info",
+    "ZWOASI_LATENCY_BUCKETS": "instrumentation",
+    "ZWOASISDKCallStatistics": "instrumentation",
+    "ZWOASISDKInstrumentation": "instrumentation",
+    "ZWOASI_SDK_FUNCTIONS": "lib",
+    "ZWOASICameraLib": "lib",
+    "ZWOASICameraLibTiming": "lib",
+    "get_asi_camera_lib": "lib",
+    "prewarm_asi_camera_lib": "lib",
+    "set_asi_camera_lib": "lib",
+    "ZWOASI_OPENMETRICS_CONTENT_TYPE": "metrics",
+    "ZWOASICameraMetrics": "metrics",
+    "ZWOASIMetricsCollector": "metrics",
+    "ZWOASI_CAMERA_SUPPORTED_MODE_CTYPE": "mode",
+    "ZWOASICameraSupportedMode": "mode",
+    "ZWOASIFrameBuffer": "pool",
+    "ZWOASIFrameBufferPool": "pool",
+    "ZWOASIFrameBufferPoolStatistics": "pool",
+    "ZWOASICameraProfile": "profile",
+    "ZWOASIConfigurationResult": "profile",
+    "ZWOASIRegionOfInterest": "roi",
+    "ZWOASI_SER_HEADER_SIZE": "ser",
+    "ZWOASISERRecorder": "ser",
+    "ZWOASISERRecorderStatistics": "ser",
+    "get_gps_ser_ticks": "ser",
+    "get_ser_ticks": "ser",
+    "ZWOASISharedFrame": "shm",
+    "ZWOASISharedFramePublisher": "shm",
+    "ZWOASISharedFrameReader": "shm",
+    "ZWOASISharedFrameReaderStatus": "shm",
+    "ZWOASISharedFrameRing": "shm",
+    "ZWOASISimulatedCameraConfiguration": "simulator",
+    "ZWOASISimulatedCameraLib": "simulator",
+    "ZWOASISimulatedSDK": "simulator",
+    "install_simulated_asi_camera_lib": "simulator",
+    "ZWOASI_CAMERA_DATE_TIME_CTYPE": "time",
+    "ZWOASIDateTime": "time",
+    "ZWOASIDateTimeRecord": "time",
+    "ZWOASI_SPAN_NAMES": "tracing",
+    "ZWOASISpan": "tracing",
+    "ZWOASISpanRecorder": "tracing",
+    "ZWOASISpanSummary": "tracing",
+    "ZWOASITracer": "tracing",
+    "get_asi_libary_path": "utils",
+    "ZWOASI_SDK_VERSION": "version",
+    "ZWOASIVideoFrame": "video",
+    "ZWOASIVideoStream": "video",
+    "ZWOASIVideoStreamStatistics": "video",
+    "ZWOASIFrameWriter": "writer",
+    "ZWOASIFrameWriterFunction": "writer",
+    "ZWOASIFrameWriterPolicy": "writer",
+    "ZWOASIFrameWriterStatistics": "writer",
+}
 
 # **************************************************************************************
 
@@ -48,38 +262,136 @@ __license__ = "MIT"
 __all__: list[str] = [
     "__version__",
     "__license__",
+    "format_fits_card",
     "get_all_connected_camera_ids",
+    "get_asi_camera_lib",
     "get_asi_libary_path",
+    "get_exposure_monitor",
+    "get_fits_header",
+    "get_fits_header_cards",
+    "get_gps_ser_ticks",
+    "get_ser_ticks",
+    "install_simulated_asi_camera_lib",
     "is_connected",
+    "prewarm_asi_camera_lib",
+    "set_asi_camera_lib",
+    "write_fits",
+    "AsyncZWOASICamera",
     "BaseDeviceState",
     "ZWOASI_SDK_VERSION",
+    "ZWOASI_CAMERA_CACHE_FORMAT_VERSION",
     "ZWOASI_CAMERA_CAPABILITIES_CTYPE",
     "ZWOASI_CAMERA_DATE_TIME_CTYPE",
     "ZWOASI_CAMERA_INFORMATION_CTYPE",
     "ZWOASI_CAMERA_SUPPORTED_MODE_CTYPE",
+    "ZWOASI_CONTROL_CACHE_MAXIMUM_AGE",
+    "ZWOASI_FITS_BLOCK_SIZE",
+    "ZWOASI_FITS_CHUNK_SIZE",
     "ZWOASI_GPS_DATA_CTYPE",
+    "ZWOASI_GPS_SERIES_COLUMNS",
+    "ZWOASI_LATENCY_BUCKETS",
+    "ZWOASI_OPENMETRICS_CONTENT_TYPE",
+    "ZWOASI_SDK_FUNCTIONS",
+    "ZWOASI_SER_HEADER_SIZE",
+    "ZWOASI_SPAN_NAMES",
     "ZWOASI_VENDOR_ID",
     "ZWOASIBayerPattern",
     "ZWOASIBool",
     "ZWOASICamera",
+    "ZWOASICameraCache",
+    "ZWOASICameraCacheEntry",
     "ZWOASICameraParams",
+    "ZWOASICameraProfile",
     "ZWOASICameraCapabilities",
     "ZWOASICameraMode",
     "ZWOASICameraInformation",
+    "ZWOASICameraLib",
+    "ZWOASICameraLibTiming",
+    "ZWOASICameraMetrics",
     "ZWOASICameraSupportedMode",
+    "ZWOASIConfigurationResult",
+    "ZWOASIControlCache",
+    "ZWOASIControlCacheStatistics",
     "ZWOASIControlType",
+    "ZWOASIControlValue",
     "ZWOASIDateTime",
+    "ZWOASIDateTimeRecord",
     "ZWOASIError",
     "ZWOASIErrorCode",
     "ZWOASIExposureError",
+    "ZWOASIExposureCompletion",
+    "ZWOASIExposureHandle",
+    "ZWOASIExposureMonitor",
     "ZWOASIExposureStatus",
+    "ZWOASIExposureWaiter",
+    "ZWOASIFITSCard",
+    "ZWOASIFITSValue",
     "ZWOASIFlipStatus",
+    "ZWOASIFrameBuffer",
+    "ZWOASIFrameBufferPool",
+    "ZWOASIFrameBufferPoolStatistics",
+    "ZWOASIFrameWriter",
+    "ZWOASIFrameWriterFunction",
+    "ZWOASIFrameWriterPolicy",
+    "ZWOASIFrameWriterStatistics",
     "ZWOASIGPSData",
     "ZWOASIGPSExposureData",
+    "ZWOASIGPSRecord",
+    "ZWOASIGPSSeries",
     "ZWOASIGuideDirection",
     "ZWOASIIOError",
     "ZWOASIImageType",
+    "ZWOASIMetricsCollector",
+    "ZWOASIRegionOfInterest",
+    "ZWOASISDKCallStatistics",
+    "ZWOASISDKInstrumentation",
+    "ZWOASISequenceBreakdown",
+    "ZWOASISERRecorder",
+    "ZWOASISERRecorderStatistics",
+    "ZWOASISequenceResult",
+    "ZWOASISharedFrame",
+    "ZWOASISharedFramePublisher",
+    "ZWOASISharedFrameReader",
+    "ZWOASISharedFrameReaderStatus",
+    "ZWOASISharedFrameRing",
+    "ZWOASISimulatedCameraConfiguration",
+    "ZWOASISimulatedCameraLib",
+    "ZWOASISimulatedSDK",
+    "ZWOASISpan",
+    "ZWOASISpanRecorder",
+    "ZWOASISpanSummary",
+    "ZWOASITracer",
     "ZWOASITriggerOutput",
+    "ZWOASIVideoFrame",
+    "ZWOASIVideoStream",
+    "ZWOASIVideoStreamStatistics",
 ]
 
 # **************************************************************************************
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a name of the public API from its submodule, on first access.
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+
+    # Cache the value, so that subsequent accesses bypass __getattr__:
+    globals()[name] = value
+
+    return value
+
+
+# **************************************************************************************
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+# **************************************************************************************
@@ -0,0 +1,270 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from asyncio import CancelledError, Event, get_running_loop, wait_for
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional, TypeVar
+
+from .cache import ZWOASICameraCache
+from .camera import ZWOASICamera, ZWOASICameraParams
+from .enums import ZWOASIExposureStatus
+from .pool import ZWOASIFrameBuffer
+from .video import ZWOASIVideoFrame
+
+# **************************************************************************************
+
+T = TypeVar("T")
+
+# **************************************************************************************
+
+
+class AsyncZWOASICamera(object):
+    """
+    An asyncio interface to a ZWOASICamera.
+
+    Every blocking SDK call is run on a dedicated, single-worker executor for the
+    camera, so calls to the same camera are serialised, whilst one event loop can
+    drive many cameras (and other devices). Waiting for an exposure, or for the next
+    video frame, uses non-blocking timers and callbacks rather than the executor.
+
+    Any public ZWOASICamera method is also available as a coroutine, e.g.:
+
+        gain = await camera.get_gain()
+
+        await camera.set_gain(100)
+    """
+
+    # The underlying (blocking) camera:
+    camera: ZWOASICamera
+
+    def __init__(
+        self, camera: ZWOASICamera, executor: Optional[ThreadPoolExecutor] = None
+    ) -> None:
+        """
+        Initialise the asyncio camera interface.
+
+        Args:
+            camera (ZWOASICamera): The (connected) camera to wrap.
+            executor (Optional[ThreadPoolExecutor]): The executor to run SDK calls on,
+                which should have a single worker. Defaults to a new executor.
+        """
+        self.camera = camera
+
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"zwoasi-camera-{camera.id}"
+        )
+
+    @classmethod
+    async def open(
+        cls,
+        id: int,
+        params: Optional[ZWOASICameraParams] = None,
+        cache: Optional[ZWOASICameraCache] = None,
+    ) -> "AsyncZWOASICamera":
+        """
+        Open (and connect to) the camera with the given index, without blocking.
+
+        Args:
+            id (int): The camera index.
+            params (Optional[ZWOASICameraParams]): Optional device parameters.
+            cache (Optional[ZWOASICameraCache]): An optional persistent cache of the
+                camera's mode and control capabilities.
+
+        Returns:
+            AsyncZWOASICamera: The asyncio interface to the connected camera.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"zwoasi-camera-{id}"
+        )
+
+        try:
+            camera = await get_running_loop().run_in_executor(
+                executor, ZWOASICamera, id, params, cache
+            )
+        except BaseException:
+            executor.shutdown(wait=False)
+            raise
+
+        return cls(camera, executor=executor)
+
+    async def __aenter__(self) -> "AsyncZWOASICamera":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        # Only expose the camera's public methods, run on the camera's executor:
+        method = getattr(self.camera, name) if not name.startswith("_") else None
+
+        if not callable(method):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self.run(method, *args, **kwargs)
+
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+
+        return call
+
+    async def run(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking function on the camera's executor.
+
+        Args:
+            function (Callable[..., T]): The function to run, e.g., a camera method.
+
+        Returns:
+            T: The return value of the function.
+        """
+        return await get_running_loop().run_in_executor(
+            self._executor, partial(function, *args, **kwargs)
+        )
+
+    async def close(self) -> None:
+        """
+        Disconnect from the camera, and shut down its executor.
+        """
+        try:
+            await self.run(self.camera.disconnect)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    async def expose(
+        self,
+        exposure_time: Optional[float] = None,
+        is_dark: bool = False,
+        timeout: Optional[float] = None,
+    ) -> ZWOASIFrameBuffer:
+        """
+        Capture a single exposure, awaiting its completion without blocking.
+
+        If the awaiting task is cancelled, the exposure is stopped in the SDK.
+
+        Args:
+            exposure_time (Optional[float]): The exposure time (in seconds), or None
+                to use the camera's current exposure time.
+            is_dark (bool): Whether to capture a 'dark' exposure (e.g. shutter closed).
+            timeout (Optional[float]): The maximum time (in seconds) to wait beyond
+                the expected end of the exposure, or None to wait indefinitely.
+
+        Returns:
+            ZWOASIFrameBuffer: The pooled frame buffer holding the raw frame, which
+            must be released after use.
+        """
+        camera = self.camera
+
+        if not camera.is_connected():
+            raise RuntimeError("Device is not connected.")
+
+        if camera.is_video_streaming:
+            raise RuntimeError("Cannot expose whilst streaming video.")
+
+        if not await self.run(camera.is_ready):
+            raise RuntimeError("Device is not ready to capture frames.")
+
+        if exposure_time is None:
+            exposure_time = await self.run(camera.get_exposure_time)
+        else:
+            await self.run(camera.set_exposure_time, exposure_time)
+
+        buffer = await self.run(camera._get_frame_buffer)
+
+        try:
+            start = await self.run(camera._start_exposure, is_dark)
+
+            async def get_status() -> ZWOASIExposureStatus:
+                return await self.run(camera.get_acquisition_status)
+
+            try:
+                completion = await camera.exposure_waiter.wait_async(
+                    get_status, start, exposure_time, timeout=timeout
+                )
+            except (CancelledError, TimeoutError):
+                # Abort the exposure (N.B. without awaiting, as we may be cancelled):
+                self._executor.submit(camera.lib.ASIStopExposure, camera.id)
+                raise
+
+            camera._emit_span("wait", start, completion["detected"])
+
+            camera._complete_exposure(completion)
+
+            await self.run(camera._get_exposure_data, buffer.data)
+        except BaseException:
+            buffer.release()
+            raise
+
+        return buffer
+
+    async def stream(
+        self, slots: int = 4, timeout: Optional[float] = None
+    ) -> AsyncGenerator[ZWOASIVideoFrame, None]:
+        """
+        Iterate over the camera's video frames as they arrive.
+
+        If the camera is not already streaming, acquisition is started for the
+        duration of the iteration, and stopped once the iteration ends.
+
+        Args:
+            slots (int): The number of frame slots in the video reader's ring.
+            timeout (Optional[float]): The maximum time (in seconds) to wait for each
+                frame, or None to wait indefinitely.
+
+        Yields:
+            ZWOASIVideoFrame: Each new video frame, in sequence.
+        """
+        camera = self.camera
+
+        is_owner = not camera.is_video_streaming
+
+        if is_owner:
+            await self.run(camera.start_acquisition, slots)
+
+        video = camera.video
+
+        if video is None:
+            raise RuntimeError("Device is not streaming video.")
+
+        loop = get_running_loop()
+
+        arrived = Event()
+
+        def listener(sequence: int) -> None:
+            loop.call_soon_threadsafe(arrived.set)
+
+        video.add_listener(listener)
+
+        after = video.sequence
+
+        try:
+            while True:
+                arrived.clear()
+
+                # Wait (without blocking) for the reader thread to publish a frame:
+                if video.sequence <= after and video.is_running:
+                    await wait_for(arrived.wait(), timeout)
+                    continue
+
+                # Copy the frame out of the ring on the executor, rather than on the
+                # event loop (N.B. this raises if the reader has stopped, or failed):
+                frame = await self.run(video.get_next_frame, after=after, timeout=0)
+
+                after = frame.sequence
+
+                yield frame
+        finally:
+            video.remove_listener(listener)
+
+            if is_owner:
+                await self.run(camera.stop_acquisition)
+
+
+# **************************************************************************************
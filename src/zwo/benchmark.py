@@ -0,0 +1,661 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import json
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from ctypes import byref, create_string_buffer
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from platform import platform, python_version
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypedDict
+
+from .camera import ZWOASICamera
+from .capabilities import ZWOASI_CAMERA_CAPABILITIES_CTYPE, ZWOASICameraCapabilities
+from .enums import ZWOASIControlType, ZWOASIImageType
+from .frame import get_frame_size
+from .gps import ZWOASI_GPS_DATA_CTYPE, ZWOASIGPSData, ZWOASIGPSRecord
+from .info import ZWOASI_CAMERA_INFORMATION_CTYPE, ZWOASICameraInformation
+from .lib import set_asi_camera_lib
+from .simulator import ZWOASISimulatedCameraConfiguration, ZWOASISimulatedCameraLib
+from .version import ZWOASI_SDK_VERSION
+
+# **************************************************************************************
+
+# The capture paths that can be benchmarked:
+#   buffer: get_frame_buffer(), e.g., a pooled buffer with no conversion.
+#   list: get_frame(), e.g., including the conversion to a list of integers.
+#   array: get_frame_array(), e.g., a NumPy array (requires NumPy).
+#   video: get_next_video_frame(), e.g., via the background video reader.
+ZWOASI_BENCHMARK_CAPTURE_PATHS: Tuple[str, ...] = ("buffer", "list", "array", "video")
+
+# The default sensor sizes (width, height) to benchmark:
+ZWOASI_BENCHMARK_SIZES: Tuple[Tuple[int, int], ...] = (
+    (640, 480),
+    (1920, 1080),
+    (3840, 2160),
+)
+
+# The default image types to benchmark:
+ZWOASI_BENCHMARK_IMAGE_TYPES: Tuple[ZWOASIImageType, ...] = (
+    ZWOASIImageType.RAW8,
+    ZWOASIImageType.RAW16,
+    ZWOASIImageType.RGB24,
+)
+
+# **************************************************************************************
+
+
+class ZWOASICaptureBenchmarkResult(TypedDict):
+    # The capture path benchmarked, e.g., "buffer", "list", "array" or "video":
+    path: str
+    # The name of the image type, e.g., "RAW16":
+    image_type: str
+    # The width of the frame (in pixels):
+    width: int
+    # The height of the frame (in pixels):
+    height: int
+    # The size of each frame (in bytes):
+    frame_size: int
+    # The number of frames captured:
+    frames: int
+    # The total time (in seconds) taken to capture the frames:
+    elapsed: float
+    # The number of frames captured per second:
+    frames_per_second: float
+    # The number of megabytes (10^6 bytes) of frame data captured per second:
+    megabytes_per_second: float
+    # The mean peak memory (in bytes) allocated whilst capturing each frame:
+    allocated_bytes_per_frame: float
+    # The memory (in bytes) still allocated after all of the frames were captured:
+    retained_bytes: int
+    # The peak resident set size (in bytes) of the process after the benchmark:
+    peak_rss: int
+
+
+# **************************************************************************************
+
+
+class ZWOASIOperationBenchmarkResult(TypedDict):
+    # The name of the operation, e.g., "get_gain":
+    name: str
+    # The number of times the operation was run:
+    iterations: int
+    # The total time (in seconds) taken to run the operation:
+    elapsed: float
+    # The mean time (in seconds) taken by each operation:
+    mean: float
+    # The number of operations run per second:
+    operations_per_second: float
+
+
+# **************************************************************************************
+
+
+class ZWOASIBenchmarkReport(TypedDict):
+    # The version of the zwo package benchmarked:
+    version: str
+    # The (simulated) SDK version benchmarked against:
+    sdk_version: List[int]
+    # The Python version the benchmarks were run with:
+    python: str
+    # The platform the benchmarks were run on:
+    platform: str
+    # The UTC time at which the benchmarks were run (ISO 8601):
+    created: str
+    # The capture benchmark results:
+    capture: List[ZWOASICaptureBenchmarkResult]
+    # The operation (e.g., control lookup and connect) benchmark results:
+    operations: List[ZWOASIOperationBenchmarkResult]
+    # The peak resident set size (in bytes) of the process after all benchmarks:
+    peak_rss: int
+
+
+# **************************************************************************************
+
+
+class ZWOASIBenchmarkComparison(TypedDict):
+    # The key of the compared result, e.g., "buffer RAW16 1920x1080" or "get_gain":
+    name: str
+    # The baseline throughput (frames or operations per second):
+    baseline: float
+    # The current throughput (frames or operations per second):
+    current: float
+    # The ratio of the current to the baseline throughput (> 1 is faster):
+    ratio: float
+
+
+# **************************************************************************************
+
+
+def get_peak_rss() -> int:
+    """
+    Get the peak resident set size (in bytes) of the current process.
+
+    Returns:
+        int: The peak resident set size, or 0 if it is unavailable on this platform.
+    """
+    try:
+        from resource import RUSAGE_SELF, getrusage
+    except ImportError:
+        return 0
+
+    peak = getrusage(RUSAGE_SELF).ru_maxrss
+
+    # N.B. ru_maxrss is reported in bytes on macOS, but in kilobytes elsewhere:
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# **************************************************************************************
+
+
+def benchmark_operation(
+    name: str, operation: Callable[[], object], iterations: int
+) -> ZWOASIOperationBenchmarkResult:
+    """
+    Benchmark the latency of a single (synchronous) operation.
+
+    Args:
+        name (str): The name to report the operation as.
+        operation (Callable[[], object]): The operation to run.
+        iterations (int): The number of times to run the operation.
+
+    Returns:
+        ZWOASIOperationBenchmarkResult: The operation's timings.
+    """
+    # Warm up, e.g., any lazily initialised state or caches:
+    operation()
+
+    began = perf_counter()
+
+    for _ in range(iterations):
+        operation()
+
+    elapsed = perf_counter() - began
+
+    return ZWOASIOperationBenchmarkResult(
+        name=name,
+        iterations=iterations,
+        elapsed=elapsed,
+        mean=elapsed / iterations,
+        operations_per_second=iterations / elapsed if elapsed > 0 else 0.0,
+    )
+
+
+# **************************************************************************************
+
+
+def benchmark_capture(
+    camera: ZWOASICamera,
+    path: str,
+    image_type: ZWOASIImageType,
+    frames: int,
+    warmup: int = 10,
+    traced: int = 3,
+) -> ZWOASICaptureBenchmarkResult:
+    """
+    Benchmark the throughput, and memory use, of capturing frames on a capture path.
+
+    The frames are captured at the camera's full sensor size, once to measure the
+    throughput, and then a few more (under tracemalloc) to measure the memory
+    allocated per frame, so that tracing does not distort the throughput.
+
+    Args:
+        camera (ZWOASICamera): The connected camera to capture frames with.
+        path (str): The capture path, one of ZWOASI_BENCHMARK_CAPTURE_PATHS.
+        image_type (ZWOASIImageType): The image type to capture frames as.
+        frames (int): The number of frames to capture.
+        warmup (int): The number of (untimed) frames to capture first, e.g., so that
+            the frame buffer pool and the exposure waiter's readout estimate settle.
+        traced (int): The number of frames to capture under tracemalloc.
+
+    Returns:
+        ZWOASICaptureBenchmarkResult: The capture path's throughput and memory use.
+    """
+    if path not in ZWOASI_BENCHMARK_CAPTURE_PATHS:
+        raise ValueError(
+            f"Unknown capture path {path!r}, expected one of "
+            f"{ZWOASI_BENCHMARK_CAPTURE_PATHS}."
+        )
+
+    info = camera.info
+
+    if info is None:
+        raise RuntimeError("Device is not connected.")
+
+    width, height = info.maximum_width, info.maximum_height
+
+    camera.set_region_of_interest(width, height, 1, image_type)
+
+    frame_size = get_frame_size(width, height, image_type)
+
+    if path == "video":
+        camera.start_acquisition()
+
+    sequence: List[int] = [camera.video.sequence if camera.video else 0]
+
+    def capture() -> None:
+        if path == "buffer":
+            camera.get_frame_buffer().release()
+        elif path == "list":
+            camera.get_frame()
+        elif path == "array":
+            camera.get_frame_array()
+        else:
+            frame = camera.get_next_video_frame(after=sequence[0], timeout=5.0)
+            sequence[0] = frame.sequence
+
+    try:
+        for _ in range(warmup):
+            capture()
+
+        began = perf_counter()
+
+        for _ in range(frames):
+            capture()
+
+        elapsed = perf_counter() - began
+
+        allocated = 0
+
+        tracemalloc.start()
+
+        try:
+            baseline, _ = tracemalloc.get_traced_memory()
+
+            for _ in range(traced):
+                tracemalloc.reset_peak()
+
+                before, _ = tracemalloc.get_traced_memory()
+
+                capture()
+
+                _, peak = tracemalloc.get_traced_memory()
+
+                allocated += peak - before
+
+            retained, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        if path == "video":
+            camera.stop_acquisition()
+
+    return ZWOASICaptureBenchmarkResult(
+        path=path,
+        image_type=image_type.name,
+        width=width,
+        height=height,
+        frame_size=frame_size,
+        frames=frames,
+        elapsed=elapsed,
+        frames_per_second=frames / elapsed if elapsed > 0 else 0.0,
+        megabytes_per_second=frames * frame_size / elapsed / 1e6
+        if elapsed > 0
+        else 0.0,
+        allocated_bytes_per_frame=allocated / traced if traced > 0 else 0.0,
+        retained_bytes=max(retained - baseline, 0),
+        peak_rss=get_peak_rss(),
+    )
+
+
+# **************************************************************************************
+
+
+def benchmark_operations(
+    camera: ZWOASICamera, iterations: int
+) -> List[ZWOASIOperationBenchmarkResult]:
+    """
+    Benchmark the latency of control lookups, and of the ctypes to model conversions.
+
+    Args:
+        camera (ZWOASICamera): The connected camera to run the operations against.
+        iterations (int): The number of times to run each operation.
+
+    Returns:
+        List[ZWOASIOperationBenchmarkResult]: The timings of each operation.
+    """
+    info = ZWOASI_CAMERA_INFORMATION_CTYPE()
+
+    camera.lib.ASIGetCameraProperty(byref(info), camera.id)
+
+    capabilities = ZWOASI_CAMERA_CAPABILITIES_CTYPE()
+
+    camera.lib.ASIGetControlCaps(camera.id, 0, byref(capabilities))
+
+    gps = ZWOASI_GPS_DATA_CTYPE()
+
+    camera.lib.ASIGPSGetData(camera.id, byref(gps), byref(ZWOASI_GPS_DATA_CTYPE()))
+
+    operations: Dict[str, Callable[[], object]] = {
+        "_get_control_capability": lambda: camera._get_control_capability(
+            ZWOASIControlType.GAIN
+        ),
+        "get_gain": camera.get_gain,
+        "set_gain": lambda: camera.set_gain(100),
+        "get_exposure_time": camera.get_exposure_time,
+        "get_region_of_interest": camera.get_region_of_interest,
+        "get_acquisition_status": camera.get_acquisition_status,
+        "ZWOASICameraInformation.from_c_types": lambda: (
+            ZWOASICameraInformation.from_c_types(info)
+        ),
+        "ZWOASICameraCapabilities.from_c_types": lambda: (
+            ZWOASICameraCapabilities.from_c_types(capabilities)
+        ),
+        "ZWOASIGPSData.from_c_types": lambda: ZWOASIGPSData.from_c_types(gps),
+        "ZWOASIGPSRecord.from_c_types": lambda: ZWOASIGPSRecord.from_c_types(gps),
+        "create_string_buffer": lambda: create_string_buffer(64),
+    }
+
+    return [
+        benchmark_operation(name, operation, iterations)
+        for name, operation in operations.items()
+    ]
+
+
+# **************************************************************************************
+
+
+def run_benchmarks(
+    sizes: Sequence[Tuple[int, int]] = ZWOASI_BENCHMARK_SIZES,
+    image_types: Sequence[ZWOASIImageType] = ZWOASI_BENCHMARK_IMAGE_TYPES,
+    paths: Sequence[str] = ZWOASI_BENCHMARK_CAPTURE_PATHS,
+    frames: int = 20,
+    iterations: int = 1000,
+    connect_iterations: int = 5,
+    readout_rate: float = 0.0,
+) -> ZWOASIBenchmarkReport:
+    """
+    Run the benchmark suite against a simulated SDK, e.g., with no camera attached.
+
+    N.B. The simulated SDK replaces the shared SDK library for the duration of the
+    benchmarks, after which the caller's previous library is restored (or, if there
+    was none, the real SDK is loaded again on next use).
+
+    Args:
+        sizes (Sequence[Tuple[int, int]]): The sensor sizes (width, height).
+        image_types (Sequence[ZWOASIImageType]): The image types to capture as.
+        paths (Sequence[str]): The capture paths to benchmark.
+        frames (int): The number of frames to capture for each capture benchmark.
+        iterations (int): The number of times to run each operation benchmark.
+        connect_iterations (int): The number of times to connect to the camera.
+        readout_rate (float): The simulated readout rate (in bytes per second), or
+            0 to measure the overhead of the bindings alone.
+
+    Returns:
+        ZWOASIBenchmarkReport: The results of every benchmark.
+    """
+    if frames < 1 or iterations < 1 or connect_iterations < 1:
+        raise ValueError("The number of frames and iterations must be positive.")
+
+    for path in paths:
+        if path not in ZWOASI_BENCHMARK_CAPTURE_PATHS:
+            raise ValueError(
+                f"Unknown capture path {path!r}, expected one of "
+                f"{ZWOASI_BENCHMARK_CAPTURE_PATHS}."
+            )
+
+    # Simulate one (color, GPS) camera per sensor size, e.g., so every image type,
+    # and the GPS data conversions, are supported:
+    library = ZWOASISimulatedCameraLib(
+        cameras=[
+            ZWOASISimulatedCameraConfiguration(
+                width=width,
+                height=height,
+                is_color=True,
+                has_gps=True,
+                readout_rate=readout_rate,
+            )
+            for width, height in sizes
+        ],
+        version=ZWOASI_SDK_VERSION,
+    )
+
+    # Install the simulated SDK, keeping whichever library the caller had installed
+    # (real or simulated), so that it can be restored once we are done:
+    previous = set_asi_camera_lib(library, version=ZWOASI_SDK_VERSION)
+
+    capture: List[ZWOASICaptureBenchmarkResult] = []
+
+    operations: List[ZWOASIOperationBenchmarkResult] = []
+
+    try:
+        operations.append(
+            benchmark_operation(
+                "connect",
+                lambda: ZWOASICamera(0).disconnect(),
+                connect_iterations,
+            )
+        )
+
+        for id in range(len(sizes)):
+            camera = ZWOASICamera(id)
+
+            try:
+                camera.set_exposure_time(camera.get_exposure_time_minimum())
+
+                if id == 0:
+                    operations += benchmark_operations(camera, iterations)
+
+                for image_type in image_types:
+                    for path in paths:
+                        if path == "array" and not _has_numpy():
+                            continue
+
+                        capture.append(
+                            benchmark_capture(camera, path, image_type, frames)
+                        )
+            finally:
+                camera.disconnect()
+    finally:
+        set_asi_camera_lib(previous, version=ZWOASI_SDK_VERSION)
+
+    return ZWOASIBenchmarkReport(
+        version=_get_version(),
+        sdk_version=list(ZWOASI_SDK_VERSION),
+        python=python_version(),
+        platform=platform(),
+        created=datetime.now(timezone.utc).isoformat(),
+        capture=capture,
+        operations=operations,
+        peak_rss=get_peak_rss(),
+    )
+
+
+# **************************************************************************************
+
+
+def compare_benchmark_reports(
+    baseline: ZWOASIBenchmarkReport, current: ZWOASIBenchmarkReport
+) -> List[ZWOASIBenchmarkComparison]:
+    """
+    Compare the throughput of the results common to two benchmark reports.
+
+    Args:
+        baseline (ZWOASIBenchmarkReport): The baseline report, e.g., of a release.
+        current (ZWOASIBenchmarkReport): The current report.
+
+    Returns:
+        List[ZWOASIBenchmarkComparison]: A comparison of each common result.
+    """
+
+    def get_throughputs(report: ZWOASIBenchmarkReport) -> Dict[str, float]:
+        throughputs = {
+            f"{result['path']} {result['image_type']} "
+            f"{result['width']}x{result['height']}": result["frames_per_second"]
+            for result in report["capture"]
+        }
+
+        throughputs.update(
+            {
+                result["name"]: result["operations_per_second"]
+                for result in report["operations"]
+            }
+        )
+
+        return throughputs
+
+    before = get_throughputs(baseline)
+
+    after = get_throughputs(current)
+
+    return [
+        ZWOASIBenchmarkComparison(
+            name=name,
+            baseline=before[name],
+            current=after[name],
+            ratio=after[name] / before[name] if before[name] > 0 else 0.0,
+        )
+        for name in before
+        if name in after
+    ]
+
+
+# **************************************************************************************
+
+
+def _has_numpy() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+
+    return True
+
+
+# **************************************************************************************
+
+
+def _get_version() -> str:
+    try:
+        return version("zwo")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+# **************************************************************************************
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the benchmark suite from the command line, e.g.:
+
+        python -m zwo.benchmark --output results.json --baseline previous.json
+
+    Returns:
+        int: The exit status, which is 1 if any result regressed beyond the threshold.
+    """
+    parser = ArgumentParser(
+        prog="python -m zwo.benchmark",
+        description="Benchmark the zwo capture hot path against a simulated SDK.",
+    )
+
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        default=[f"{width}x{height}" for width, height in ZWOASI_BENCHMARK_SIZES],
+        help="The sensor sizes to benchmark, e.g., 1920x1080.",
+    )
+
+    parser.add_argument(
+        "--image-types",
+        nargs="+",
+        default=[image_type.name for image_type in ZWOASI_BENCHMARK_IMAGE_TYPES],
+        choices=[image_type.name for image_type in ZWOASI_BENCHMARK_IMAGE_TYPES],
+        help="The image types to benchmark.",
+    )
+
+    parser.add_argument(
+        "--paths",
+        nargs="+",
+        default=list(ZWOASI_BENCHMARK_CAPTURE_PATHS),
+        choices=ZWOASI_BENCHMARK_CAPTURE_PATHS,
+        help="The capture paths to benchmark.",
+    )
+
+    parser.add_argument("--frames", type=int, default=20)
+
+    parser.add_argument("--iterations", type=int, default=1000)
+
+    parser.add_argument(
+        "--readout-rate",
+        type=float,
+        default=0.0,
+        help="The simulated readout rate (in bytes per second), 0 for instant.",
+    )
+
+    parser.add_argument(
+        "--output", help="The file to write the JSON report to (default: stdout)."
+    )
+
+    parser.add_argument(
+        "--baseline", help="A previous JSON report to compare the results against."
+    )
+
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="The fractional slowdown versus the baseline to treat as a regression.",
+    )
+
+    args = parser.parse_args(argv)
+
+    sizes: List[Tuple[int, int]] = []
+
+    for size in args.sizes:
+        width, _, height = size.partition("x")
+        sizes.append((int(width), int(height)))
+
+    report = run_benchmarks(
+        sizes=sizes,
+        image_types=[ZWOASIImageType[name] for name in args.image_types],
+        paths=args.paths,
+        frames=args.frames,
+        iterations=args.iterations,
+        readout_rate=args.readout_rate,
+    )
+
+    output = json.dumps(report, indent=2)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline: ZWOASIBenchmarkReport = json.load(f)
+
+    status = 0
+
+    for comparison in compare_benchmark_reports(baseline, report):
+        is_regression = comparison["ratio"] < 1 - args.threshold
+
+        if is_regression:
+            status = 1
+
+        print(
+            f"{'REGRESSED' if is_regression else 'ok':>9}  {comparison['ratio']:6.2f}x  "
+            f"{comparison['name']}",
+            file=sys.stderr,
+        )
+
+    return status
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# **************************************************************************************
@@ -0,0 +1,212 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import json
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple, TypedDict, Union
+
+from .capabilities import ZWOASICameraCapabilities
+from .enums import ZWOASIControlType
+from .mode import ZWOASICameraSupportedMode
+from .version import ZWOASI_SDK_VERSION
+
+# **************************************************************************************
+
+# The version of the cache file format, which invalidates the file when changed:
+ZWOASI_CAMERA_CACHE_FORMAT_VERSION: int = 2
+
+# **************************************************************************************
+
+
+class ZWOASICameraCacheEntry(TypedDict):
+    # The camera's supported modes:
+    mode: ZWOASICameraSupportedMode
+    # The camera's control capabilities, keyed by control type:
+    controls: Dict[ZWOASIControlType, ZWOASICameraCapabilities]
+
+
+# **************************************************************************************
+
+
+class ZWOASICameraCache(object):
+    """
+    A persistent, on-disk cache of each camera's supported modes and control
+    capabilities, keyed by camera name and serial number.
+
+    N.B. The camera's information is not cached, as it is always read from the SDK
+    (via ASIGetCameraProperty) to identify the camera by name, and it reports the
+    host's current USB connection.
+
+    The cache is stored as a single compact JSON file, which is discarded if it was
+    written for a different SDK version. Cached entries are restored without being
+    re-validated, so warm starts skip both the SDK enumeration and validation.
+    """
+
+    # The path of the cache file:
+    path: Path
+
+    # The SDK version the cache is valid for:
+    sdk_version: Tuple[int, int, int]
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        sdk_version: Tuple[int, int, int] = ZWOASI_SDK_VERSION,
+    ) -> None:
+        """
+        Initialise the cache. The file is read (and created) on first use.
+
+        Args:
+            path (Union[str, Path]): The path of the cache file.
+            sdk_version (Tuple[int, int, int]): The SDK version the cache is valid for.
+        """
+        self.path = Path(path).expanduser()
+
+        self.sdk_version = sdk_version
+
+        self._cameras: Optional[Dict[str, Any]] = None
+
+        self._lock = Lock()
+
+    def get(self, name: str, serial_number: str) -> Optional[ZWOASICameraCacheEntry]:
+        """
+        Get the cached properties of a camera.
+
+        Args:
+            name (str): The name of the camera, e.g., from its information.
+            serial_number (str): The serial number of the camera.
+
+        Returns:
+            Optional[ZWOASICameraCacheEntry]: The cached properties, or None.
+        """
+        with self._lock:
+            if self._cameras is None:
+                self._cameras = self._load()
+
+            entry = self._cameras.get(_get_key(name, serial_number))
+
+        if entry is None:
+            return None
+
+        try:
+            return _construct_entry(entry)
+        except (KeyError, TypeError, ValueError):
+            # Discard an entry written by an incompatible version of this package:
+            return None
+
+    def set(
+        self,
+        name: str,
+        serial_number: str,
+        mode: ZWOASICameraSupportedMode,
+        controls: Dict[ZWOASIControlType, ZWOASICameraCapabilities],
+    ) -> None:
+        """
+        Store the properties of a camera, and write the cache file.
+
+        Args:
+            name (str): The name of the camera, e.g., from its information.
+            serial_number (str): The serial number of the camera.
+            mode (ZWOASICameraSupportedMode): The camera's supported modes.
+            controls (Dict[ZWOASIControlType, ZWOASICameraCapabilities]): The camera's
+                control capabilities.
+        """
+        entry = {
+            "mode": mode.model_dump(mode="json"),
+            "controls": {
+                str(int(control)): capability.model_dump(mode="json")
+                for control, capability in controls.items()
+            },
+        }
+
+        with self._lock:
+            # Merge with the current file, e.g., as written by another process:
+            self._cameras = self._load()
+
+            self._cameras[_get_key(name, serial_number)] = entry
+
+            self._save(self._cameras)
+
+    def clear(self) -> None:
+        """
+        Discard every cached camera, and remove the cache file.
+        """
+        with self._lock:
+            self._cameras = {}
+
+            self.path.unlink(missing_ok=True)
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "rb") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != ZWOASI_CAMERA_CACHE_FORMAT_VERSION
+            or tuple(data.get("sdk_version", ())) != tuple(self.sdk_version)
+            or not isinstance(data.get("cameras"), dict)
+        ):
+            return {}
+
+        return data["cameras"]
+
+    def _save(self, cameras: Dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "version": ZWOASI_CAMERA_CACHE_FORMAT_VERSION,
+            "sdk_version": list(self.sdk_version),
+            "cameras": cameras,
+        }
+
+        # Write to a temporary file, then atomically replace the cache file, so that
+        # concurrent readers never see a partially written file:
+        with NamedTemporaryFile(
+            "w", dir=self.path.parent, prefix=f".{self.path.name}.", delete=False
+        ) as file:
+            try:
+                json.dump(data, file, separators=(",", ":"))
+            except BaseException:
+                os.unlink(file.name)
+                raise
+
+        os.replace(file.name, self.path)
+
+
+# **************************************************************************************
+
+
+def _get_key(name: str, serial_number: str) -> str:
+    return f"{name}/{serial_number}"
+
+
+# **************************************************************************************
+
+
+def _construct_entry(entry: Dict[str, Any]) -> ZWOASICameraCacheEntry:
+    """
+    Construct the models of a cached entry without re-validating them, converting
+    only the enumerated fields from their JSON values.
+    """
+    return ZWOASICameraCacheEntry(
+        mode=ZWOASICameraSupportedMode.model_construct(**entry["mode"]),
+        controls={
+            ZWOASIControlType(int(control)): ZWOASICameraCapabilities.model_construct(
+                **capability
+            )
+            for control, capability in entry["controls"].items()
+        },
+    )
+
+
+# **************************************************************************************
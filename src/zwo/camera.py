@@ -6,6 +6,7 @@
 # **************************************************************************************
 
 from array import array
+from collections.abc import Buffer
 from concurrent.futures import ThreadPoolExecutor, TimeoutError
 from ctypes import (
     CDLL,
@@ -19,10 +20,22 @@ from ctypes import (
 )
 from enum import Enum
 from pathlib import Path
+from queue import Queue
 from sys import byteorder
-from time import sleep
-from typing import List, Optional, Tuple, TypedDict
+from threading import Lock, Thread
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+)
 
+from .cache import ZWOASICameraCache
 from .capabilities import ZWOASI_CAMERA_CAPABILITIES_CTYPE, ZWOASICameraCapabilities
 from .enums import (
     ZWOASIBool,
@@ -33,13 +46,31 @@ from .enums import (
     ZWOASIImageType,
     ZWOASITriggerOutput,
 )
+from .controls import ZWOASIControlCache
 from .errors import ZWOASIExposureError, errors
-from .gps import ZWOASI_GPS_DATA_CTYPE, ZWOASIGPSData
+from .exposure import ZWOASIExposureCompletion, ZWOASIExposureWaiter
+from .frame import (
+    get_frame_dtype,
+    get_frame_shape,
+    get_frame_size,
+    get_frame_view,
+    import_numpy,
+)
+from .gps import ZWOASI_GPS_DATA_CTYPE, ZWOASIGPSData, ZWOASIGPSRecord
+from .handle import ZWOASIExposureHandle, get_exposure_monitor
 from .info import ZWOASI_CAMERA_INFORMATION_CTYPE, ZWOASICameraInformation
-from .lib import ZWOASICameraLib
+from .lib import get_asi_camera_lib
 from .mode import ZWOASI_CAMERA_SUPPORTED_MODE_CTYPE, ZWOASICameraSupportedMode
+from .pool import ZWOASIFrameBuffer, ZWOASIFrameBufferPool
+from .profile import ZWOASICameraProfile, ZWOASIConfigurationResult
+from .roi import ZWOASIRegionOfInterest
+from .tracing import ZWOASISpan, ZWOASITracer, get_next_trace_id
 from .utils import is_hexadecimal
 from .version import ZWOASI_SDK_VERSION
+from .video import ZWOASIVideoFrame, ZWOASIVideoStream, ZWOASIVideoStreamStatistics
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
 
 # **************************************************************************************
 
@@ -70,9 +101,45 @@ class ZWOASIGPSExposureData(TypedDict):
 # **************************************************************************************
 
 
+class ZWOASISequenceBreakdown(TypedDict):
+    # The total time (in seconds) spent starting exposures (ASIStartExposure):
+    start_exposure: float
+    # The total time (in seconds) spent waiting for exposures to complete:
+    wait: float
+    # The total time (in seconds) spent reading out frames (ASIGetDataAfterExp):
+    get_data: float
+    # The total time (in seconds) the consumer spent processing frames (N.B. on the
+    # worker thread, so overlapping with the next exposure):
+    process: float
+    # The remaining time (in seconds) on the capture thread, e.g., acquiring buffers
+    # and waiting for the worker to catch up:
+    other: float
+
+
+# **************************************************************************************
+
+
+class ZWOASISequenceResult(TypedDict):
+    # The number of frames captured in the sequence:
+    count: int
+    # The exposure time (in seconds) of each frame:
+    exposure_time: float
+    # The total shutter-open time (in seconds) across the sequence:
+    exposed: float
+    # The wall-clock time (in seconds) taken to capture the sequence:
+    elapsed: float
+    # The fraction of the wall-clock time the shutter was open (exposed / elapsed):
+    duty_cycle: float
+    # The breakdown of the wall-clock time by stage:
+    breakdown: ZWOASISequenceBreakdown
+
+
+# **************************************************************************************
+
+
 def get_all_connected_camera_ids() -> List[int]:
-    # Instantiate the ZWO library wrapper for the ASICamera SDK:
-    sdk = ZWOASICameraLib(version=ZWOASI_SDK_VERSION)
+    # Get the shared (process-wide) ZWO library wrapper for the ASICamera SDK:
+    sdk = get_asi_camera_lib(version=ZWOASI_SDK_VERSION)
 
     # If the SDK library failed to load, raise an error:
     if sdk.lib is None:
@@ -89,8 +156,8 @@ def get_all_connected_camera_ids() -> List[int]:
 
 
 def is_connected(vid: str, pid: str) -> bool:
-    # Instantiate the ZWO library wrapper for the ASICamera SDK:
-    sdk = ZWOASICameraLib(version=ZWOASI_SDK_VERSION)
+    # Get the shared (process-wide) ZWO library wrapper for the ASICamera SDK:
+    sdk = get_asi_camera_lib(version=ZWOASI_SDK_VERSION)
 
     # If the SDK library failed to load, raise an error:
     if sdk.lib is None:
@@ -137,13 +204,63 @@ class ZWOASICamera(object):
     # The camera's supported mode:
     mode: ZWOASICameraSupportedMode
 
+    # The camera's control capabilities, enumerated once at initialisation:
+    controls: Dict[ZWOASIControlType, ZWOASICameraCapabilities]
+
+    # The optional persistent cache of the camera's mode and control capabilities:
+    cache: Optional[ZWOASICameraCache] = None
+
+    # The write-through cache of the last confirmed control values:
+    control_cache: ZWOASIControlCache
+
+    # The authoritative (cached) ROI format and start position of the camera:
+    roi: ZWOASIRegionOfInterest
+
+    # The pool of reusable frame buffers for the current ROI format:
+    frame_buffer_pool: ZWOASIFrameBufferPool
+
+    # The deadline-based waiter used to detect the completion of exposures:
+    exposure_waiter: ZWOASIExposureWaiter
+
+    # The completion timings of the most recent exposure:
+    last_exposure_completion: Optional[ZWOASIExposureCompletion] = None
+
+    # The handle of the most recent exposure started without blocking:
+    exposure_handle: Optional[ZWOASIExposureHandle] = None
+
+    # The number of frames retrieved from the SDK since the camera was created,
+    # including the frames read by the background video reader once it has stopped:
+    frames_captured: int = 0
+
+    # The total exposure time (in seconds) of the exposures successfully completed:
+    exposed_time: float = 0.0
+
+    # Guards the frame and exposure counters, which are updated by the calling,
+    # background video reader and exposure monitor threads:
+    _counters_lock: Lock
+
+    # The user-supplied tracer called with the timing span of each exposure stage:
+    tracer: Optional[ZWOASITracer] = None
+
+    # The trace identifier of the most recently started exposure, as used by the
+    # spans of the capturing thread (N.B. video frames carry their own identifier):
+    _trace: int = 0
+
     # Whether the camera is streaming video:
     is_video_streaming: bool = False
 
+    # The background video reader, whilst the camera is streaming video:
+    video: Optional[ZWOASIVideoStream] = None
+
     # Whether the camera is cabable of returning GPS data:
     has_gps_support: bool = False
 
-    def __init__(self, id: int, params: Optional[ZWOASICameraParams] = None) -> None:
+    def __init__(
+        self,
+        id: int,
+        params: Optional[ZWOASICameraParams] = None,
+        cache: Optional[ZWOASICameraCache] = None,
+    ) -> None:
         """
         Initialise the base camera interface.
 
@@ -151,13 +268,17 @@ class ZWOASICamera(object):
             params (Optional[BaseDeviceParameters]): An optional dictionary-like object
                 containing device parameters such as vendor ID (vid), product ID (pid),
                 or device ID (did).
+            cache (Optional[ZWOASICameraCache]): An optional persistent cache, from
+                which the camera's mode and control capabilities are restored (rather
+                than enumerated via the SDK) when it is initialised.
         """
         self.id = id
+        self.cache = cache
         self.pid = params.get("pid", None) if params else None
         self.did = f"{id}"
 
-        # Instantiate the ZWO library wrapper for the ASICamera SDK:
-        sdk = ZWOASICameraLib(version=ZWOASI_SDK_VERSION)
+        # Get the shared (process-wide) ZWO library wrapper for the ASICamera SDK:
+        sdk = get_asi_camera_lib(version=ZWOASI_SDK_VERSION)
 
         # If the SDK library failed to load, raise an error:
         if sdk.lib is None:
@@ -177,6 +298,23 @@ class ZWOASICamera(object):
         # Attempt to get the camera information model for this device:
         self.info = self.get_configuration()
 
+        # Create the pool of reusable frame buffers (configured on first use):
+        self.frame_buffer_pool = ZWOASIFrameBufferPool()
+
+        # The ROI state is synchronised with the SDK once connected:
+        self.roi = ZWOASIRegionOfInterest()
+
+        # The control capabilities are enumerated when the camera is initialised:
+        self.controls = {}
+
+        # The control values are cached as they are confirmed by the SDK:
+        self.control_cache = ZWOASIControlCache()
+
+        # The exposure waiter's readout estimate is seeded once connected:
+        self.exposure_waiter = ZWOASIExposureWaiter()
+
+        self._counters_lock = Lock()
+
         # Connect to the camera (which in turn initialises the device):
         self.connect()
 
@@ -260,13 +398,26 @@ class ZWOASICamera(object):
                     f"Failed to initialise camera {self.id}. Error: {errors[error]}"
                 )
 
-            # Attempt to get the camer mode model for this device:
-            self.mode = self.get_mode()
+            # Identify the camera in the persistent cache (if any) once, as reading
+            # its serial number is itself an SDK round-trip:
+            key = self._get_cache_key()
+
+            # Restore the mode and control capabilities from the cache (if any):
+            if not self._restore_from_cache(key):
+                # Attempt to get the camer mode model for this device:
+                self.mode = self.get_mode()
+
+                # Enumerate all of the control capabilities once, keyed by control type:
+                self.controls = self._enumerate_control_capabilities()
+
+                self._store_in_cache(key)
+
+            # Discard any control values cached before the camera was (re)opened:
+            self.control_cache.invalidate()
 
             # Check if the camera is capable of returning GPS data:
             self.has_gps_support = (
-                self._get_control_capability(ZWOASIControlType.GPS_SUPPORT_INDICATOR)
-                is not None
+                ZWOASIControlType.GPS_SUPPORT_INDICATOR in self.controls
             )
 
         # Keep a track of the number of attempts:
@@ -330,6 +481,16 @@ class ZWOASICamera(object):
         # Update the device state to connected:
         self.state = BaseDeviceState.CONNECTED
 
+        try:
+            # Synchronise the cached ROI state with the SDK:
+            self.refresh_state()
+        except Exception as e:
+            self.state = BaseDeviceState.ERROR
+            raise e
+
+        # Seed the exposure waiter with an estimate of the frame readout time:
+        self.exposure_waiter.readout_time = self._estimate_readout_time()
+
     def disconnect(self) -> None:
         """
         Disconnect from the device.
@@ -347,6 +508,11 @@ class ZWOASICamera(object):
         if self.is_video_streaming:
             self.stop_acquisition()
 
+        # If an exposure was started without blocking, cancel it (if still pending), or,
+        # if its frame is being read out, wait for the read out to finish first:
+        if self.exposure_handle is not None and not self.exposure_handle.cancel():
+            self.exposure_handle.wait()
+
         # Close the camera to free resources and disconnect:
         error: int = self.lib.ASICloseCamera(self.id)
 
@@ -379,13 +545,14 @@ class ZWOASICamera(object):
         # Get the current acquisition status:
         status = self.get_acquisition_status()
 
-        # We are ready if the device is connected and is not currently exposing:
+        # We are ready if the device is connected and is not currently exposing (N.B.
+        # a stopped, or failed, exposure leaves the camera idle until the next one):
         return (
             self.state == BaseDeviceState.CONNECTED
             and self.info is not None
             and self.mode is not None
             and self.lib is not None
-            and status == ZWOASIExposureStatus.IDLE
+            and status in (ZWOASIExposureStatus.IDLE, ZWOASIExposureStatus.FAILED)
         )
 
     def get_id(self) -> int:
@@ -559,60 +726,118 @@ class ZWOASICamera(object):
         # Create a new camera mode model from the C struct:
         return ZWOASICameraSupportedMode.from_c_types(c_mode)
 
-    def _get_number_of_controls(self) -> int:
+    def _get_cache_key(self) -> Optional[Tuple[str, str]]:
         """
-        Retrieve the number of controls available for the camera.
+        Get the (name, serial number) key of the camera in the persistent cache.
 
         Returns:
-            int: The number of control entries.
+            Optional[Tuple[str, str]]: The key, or None if there is no cache or the
+            camera has no serial number to identify it by.
+        """
+        if self.cache is None:
+            return None
 
-        Raises:
-            RuntimeError: If the number of controls cannot be retrieved.
+        try:
+            serial_number = self.get_serial_number()
+        except RuntimeError:
+            return None
+
+        return (self.info.name, serial_number) if serial_number else None
+
+    def _restore_from_cache(self, key: Optional[Tuple[str, str]]) -> bool:
         """
-        if not self.is_connected():
-            return 0
+        Restore the camera's mode and control capabilities from the persistent cache.
 
-        number_of_controls = c_int()
+        N.B. The camera's information is always read from the SDK, as it identifies
+        the camera (and reports the host's current USB connection).
 
-        error: int = self.lib.ASIGetNumOfControls(self.id, number_of_controls)
+        Args:
+            key (Optional[Tuple[str, str]]): The key of the camera in the cache, as
+                per _get_cache_key().
 
-        # If an error occurred, raise an exception:
-        if error != ZWOASIErrorCode.SUCCESS:
-            raise RuntimeError(
-                f"Error retrieving number of controls for camera {self.id}. Error: {errors[error]}"
-            )
+        Returns:
+            bool: True if the camera was found in the cache.
+        """
+        if self.cache is None or key is None:
+            return False
+
+        entry = self.cache.get(*key)
+
+        if entry is None:
+            return False
 
-        return number_of_controls.value
+        self.mode = entry["mode"]
 
-    def _get_control_capability_by_index(
-        self, index: int
-    ) -> "ZWOASICameraCapabilities":
+        self.controls = entry["controls"]
+
+        return True
+
+    def _store_in_cache(self, key: Optional[Tuple[str, str]]) -> None:
         """
-        Retrieve the capabilities for a specific control index.
+        Store the camera's mode and control capabilities in the persistent cache, for
+        subsequent (warm) starts.
 
         Args:
-            index (int): The index of the control.
+            key (Optional[Tuple[str, str]]): The key of the camera in the cache, as
+                per _get_cache_key().
+        """
+        if self.cache is None or key is None:
+            return
+
+        try:
+            self.cache.set(*key, self.mode, self.controls)
+        except OSError:
+            # The cache is an optimisation, so failing to write it is not fatal:
+            pass
+
+    def _enumerate_control_capabilities(
+        self,
+    ) -> Dict[ZWOASIControlType, "ZWOASICameraCapabilities"]:
+        """
+        Enumerate the capabilities of every control the camera exposes via the SDK.
+
+        N.B. This is called whilst the camera is being initialised, and so does not
+        require the device to be in the connected state.
 
         Returns:
-            ZWOASICameraCapabilities: The control capabilities
+            Dict[ZWOASIControlType, ZWOASICameraCapabilities]: The capabilities keyed by
+            control type (controls unknown to ZWOASIControlType are omitted).
 
         Raises:
-            RuntimeError if the SDK call fails.
+            RuntimeError if the SDK calls fail.
         """
-        if not self.is_connected():
-            return ZWOASICameraCapabilities()
-
-        c_capability = ZWOASI_CAMERA_CAPABILITIES_CTYPE()
+        number_of_controls = c_int()
 
-        error: int = self.lib.ASIGetControlCaps(self.id, index, c_capability)
+        error: int = self.lib.ASIGetNumOfControls(self.id, byref(number_of_controls))
 
         # If an error occurred, raise an exception:
         if error != ZWOASIErrorCode.SUCCESS:
             raise RuntimeError(
-                f"Error retrieving control caps (camera={self.id}, index={index}). Error: {errors[error]}"
+                f"Error retrieving number of controls for camera {self.id}. Error: {errors[error]}"
             )
 
-        return ZWOASICameraCapabilities.from_c_types(c_capability)
+        controls: Dict[ZWOASIControlType, ZWOASICameraCapabilities] = {}
+
+        c_capability = ZWOASI_CAMERA_CAPABILITIES_CTYPE()
+
+        for index in range(number_of_controls.value):
+            error = self.lib.ASIGetControlCaps(self.id, index, byref(c_capability))
+
+            # If an error occurred, raise an exception:
+            if error != ZWOASIErrorCode.SUCCESS:
+                raise RuntimeError(
+                    f"Error retrieving control caps (camera={self.id}, index={index}). Error: {errors[error]}"
+                )
+
+            # Skip any controls that are newer than our known control types:
+            try:
+                control_type = ZWOASIControlType(c_capability.ControlType)
+            except ValueError:
+                continue
+
+            controls[control_type] = ZWOASICameraCapabilities.from_c_types(c_capability)
+
+        return controls
 
     def _get_control_capability(
         self, control_type: int
@@ -624,24 +849,111 @@ class ZWOASICamera(object):
             control_type (int): The control type.
 
         Returns:
-            ZWOASICameraCapabilities: The control capabilities
+            ZWOASICameraCapabilities: The control capabilities, or None if the control
+            is not supported by the camera (or is unknown to ZWOASIControlType).
         """
         if not self.is_connected():
             return None
 
-        number_of_controls = self._get_number_of_controls()
+        try:
+            return self.controls.get(ZWOASIControlType(control_type))
+        except ValueError:
+            return None
+
+    def _get_control_value(self, control_type: ZWOASIControlType, name: str) -> int:
+        """
+        Retrieve the value of a control, from the control cache whilst it is fresh.
+
+        Args:
+            control_type (ZWOASIControlType): The control type.
+            name (str): The name of the control, for error messages.
 
-        for i in range(number_of_controls):
-            capability = self._get_control_capability_by_index(i)
+        Returns:
+            int: The control value, in the SDK's units.
+        """
+        cached = self.control_cache.get(control_type)
 
-            if capability.control_type == control_type:
-                return capability
+        if cached is not None:
+            return cached.value
 
-        return None
+        value = c_long()
 
-    def get_region_of_interest(self) -> Tuple[int, int, int, int]:
+        # Whether the control is controlled automatically:
+        is_auto = c_int()
+
+        error: int = self.lib.ASIGetControlValue(
+            self.id, control_type, byref(value), byref(is_auto)
+        )
+
+        # If an error occurred, raise an exception:
+        if error != ZWOASIErrorCode.SUCCESS:
+            raise RuntimeError(
+                f"Error getting {name} for index {self.id}. Error: {errors[error]}"
+            )
+
+        self.control_cache.store(control_type, value.value, bool(is_auto.value))
+
+        return value.value
+
+    def _set_control_value(
+        self, control_type: ZWOASIControlType, value: int, name: str
+    ) -> None:
+        """
+        Set the value of a control (with auto disabled), unless it is unchanged.
+
+        Args:
+            control_type (ZWOASIControlType): The control type.
+            value (int): The value, in the SDK's units.
+            name (str): The name of the control, for error messages.
+        """
+        capability = self.controls.get(control_type)
+
+        # N.B. The SDK clamps values to the control's range, so cache the clamped value:
+        if capability is not None:
+            value = min(max(value, capability.minimum_value), capability.maximum_value)
+
+        if self.control_cache.is_unchanged(control_type, value):
+            return
+
+        error: int = self.lib.ASISetControlValue(self.id, control_type, value, 0)
+
+        # If an error occurred, raise an exception:
+        if error != ZWOASIErrorCode.SUCCESS:
+            self.control_cache.invalidate(control_type)
+            raise RuntimeError(
+                f"Error setting {name} for index {self.id}. Error: {errors[error]}"
+            )
+
+        self.control_cache.store(control_type, value, False)
+
+    def get_control_capabilities(
+        self,
+    ) -> Dict[ZWOASIControlType, "ZWOASICameraCapabilities"]:
+        """
+        Retrieve the capabilities of every control supported by the camera.
+
+        Returns:
+            Dict[ZWOASIControlType, ZWOASICameraCapabilities]: The control capabilities,
+            keyed by control type, as enumerated when the camera was initialised.
+        """
         if not self.is_connected():
-            return 0, 0, 0, 0
+            return {}
+
+        return dict(self.controls)
+
+    def refresh_state(self) -> ZWOASIRegionOfInterest:
+        """
+        Resynchronise the cached ROI format and start position with the SDK.
+
+        The cached state is filled in at connect time and kept up to date by the
+        setters, so this only needs to be called if the camera may have been
+        reconfigured outside of this instance.
+
+        Returns:
+            ZWOASIRegionOfInterest: The refreshed ROI state.
+        """
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
 
         # The width of the ROI:
         w = c_int()
@@ -661,7 +973,46 @@ class ZWOASICamera(object):
                 f"Error getting ROI format for index {self.id}. Error: {errors[error]}"
             )
 
-        return w.value, h.value, b.value, ZWOASIImageType(t.value)
+        # The start X position of the ROI:
+        start_x = c_int()
+        # The start Y position of the ROI:
+        start_y = c_int()
+
+        error = self.lib.ASIGetStartPos(self.id, byref(start_x), byref(start_y))
+
+        # If an error occurred, raise an exception:
+        if error != ZWOASIErrorCode.SUCCESS:
+            raise RuntimeError(
+                f"Error getting start position for index {self.id}. Error: {errors[error]}"
+            )
+
+        self.roi = ZWOASIRegionOfInterest(
+            width=w.value,
+            height=h.value,
+            binning=b.value,
+            image_type=ZWOASIImageType(t.value),
+            start_x=start_x.value,
+            start_y=start_y.value,
+        )
+
+        # Ensure the frame buffer pool is sized for the (possibly changed) format:
+        self.frame_buffer_pool.configure(
+            self.roi.width, self.roi.height, self.roi.image_type
+        )
+
+        return self.roi
+
+    def get_region_of_interest(self) -> Tuple[int, int, int, int]:
+        """
+        Retrieve the camera's current ROI format from the cached ROI state.
+
+        Returns:
+            Tuple[int, int, int, int]: The (width, height, binning, image type).
+        """
+        if not self.is_connected():
+            return 0, 0, 0, 0
+
+        return self.roi.to_format()
 
     def set_region_of_interest(
         self,
@@ -722,26 +1073,41 @@ class ZWOASICamera(object):
         if start_y < 0 or start_y + height > int(self.info.maximum_height / binning):
             raise ValueError("Start Y is out of bounds.")
 
-        # The width of the ROI:
-        w = c_int(width)
-        # The height of the ROI:
-        h = c_int(height)
-        # The binning factor (e.g., 1 = 1x1, 2 = 2x2, etc.):
-        b = c_int(binning)
-        # The type of the image (e.g., 8-bit, 16-bit, etc.):
-        t = c_int(image_type)
-
-        # Set the ROI format:
-        error: int = self.lib.ASISetROIFormat(
-            self.id, w.value, h.value, b.value, t.value
+        roi = ZWOASIRegionOfInterest(
+            width=width,
+            height=height,
+            binning=binning,
+            image_type=ZWOASIImageType(image_type),
+            start_x=start_x,
+            start_y=start_y,
         )
 
-        # If an error occurred, raise an exception:
-        if error != ZWOASIErrorCode.SUCCESS:
-            raise RuntimeError(
-                f"Error setting ROI format for index {self.id}. Error: {errors[error]}"
+        # If the ROI is unchanged, skip the (redundant) SDK calls:
+        if roi == self.roi:
+            return
+
+        # If only the start position has changed, the ROI format need not be reset:
+        if roi.to_format() != self.roi.to_format():
+            # The width of the ROI:
+            w = c_int(width)
+            # The height of the ROI:
+            h = c_int(height)
+            # The binning factor (e.g., 1 = 1x1, 2 = 2x2, etc.):
+            b = c_int(binning)
+            # The type of the image (e.g., 8-bit, 16-bit, etc.):
+            t = c_int(image_type)
+
+            # Set the ROI format:
+            error: int = self.lib.ASISetROIFormat(
+                self.id, w.value, h.value, b.value, t.value
             )
 
+            # If an error occurred, raise an exception:
+            if error != ZWOASIErrorCode.SUCCESS:
+                raise RuntimeError(
+                    f"Error setting ROI format for index {self.id}. Error: {errors[error]}"
+                )
+
         # The start X position of the ROI:
         sx = c_int(start_x)
 
@@ -757,6 +1123,12 @@ class ZWOASICamera(object):
                 f"Error setting start position for index {self.id}. Error: {errors[error]}"
             )
 
+        # Update the cached ROI state now that the SDK has accepted it:
+        self.roi = roi
+
+        # Rebuild the frame buffer pool for the new ROI format (if it has changed):
+        self.frame_buffer_pool.configure(width, height, self.roi.image_type)
+
     def get_x_size(self) -> int:
         """
         Retrieve the current width of the camera's image frame.
@@ -781,19 +1153,7 @@ class ZWOASICamera(object):
         if not self.is_connected():
             return 0
 
-        start_x = c_int()
-
-        start_y = c_int()
-
-        error: int = self.lib.ASIGetStartPos(self.id, start_x, start_y)
-
-        # If an error occurred, raise an exception:
-        if error != ZWOASIErrorCode.SUCCESS:
-            raise RuntimeError(
-                f"Error getting start position for index {self.id}. Error: {errors[error]}"
-            )
-
-        return start_x.value
+        return self.roi.start_x
 
     def get_y_size(self) -> int:
         """
@@ -819,19 +1179,7 @@ class ZWOASICamera(object):
         if not self.is_connected():
             return 0
 
-        start_x = c_int()
-
-        start_y = c_int()
-
-        error: int = self.lib.ASIGetStartPos(self.id, start_x, start_y)
-
-        # If an error occurred, raise an exception:
-        if error != ZWOASIErrorCode.SUCCESS:
-            raise RuntimeError(
-                f"Error getting start position for index {self.id}. Error: {errors[error]}"
-            )
-
-        return start_y.value
+        return self.roi.start_y
 
     def get_pixel_size_x(self) -> float:
         """
@@ -893,22 +1241,7 @@ class ZWOASICamera(object):
         if not self.is_connected():
             return 0
 
-        gain = c_long()
-
-        # Whether the gain is controlled automatically:
-        is_auto = c_int()
-
-        error: int = self.lib.ASIGetControlValue(
-            self.id, ZWOASIControlType.GAIN, byref(gain), byref(is_auto)
-        )
-
-        # If an error occurred, raise an exception:
-        if error != ZWOASIErrorCode.SUCCESS:
-            raise RuntimeError(
-                f"Error getting gain for index {self.id}. Error: {errors[error]}"
-            )
-
-        return gain.value
+        return self._get_control_value(ZWOASIControlType.GAIN, "gain")
 
     def set_gain(self, gain: int) -> None:
         """
@@ -921,15 +1254,7 @@ class ZWOASICamera(object):
         if not self.is_connected():
             return
 
-        error: int = self.lib.ASISetControlValue(
-            self.id, ZWOASIControlType.GAIN, gain, 0
-        )
-
-        # If an error occurred, raise an exception:
-        if error != ZWOASIErrorCode.SUCCESS:
-            raise RuntimeError(
-                f"Error setting gain for index {self.id}. Error: {errors[error]}"
-            )
+        self._set_control_value(ZWOASIControlType.GAIN, gain, "gain")
 
     def get_gain_minimum(self) -> int:
         """
@@ -999,22 +1324,7 @@ class ZWOASICamera(object):
         if not self.is_connected():
             return 0
 
-        offset = c_long()
-
-        # Whether the offset is controlled automatically:
-        is_auto = c_int()
-
-        error: int = self.lib.ASIGetControlValue(
-            self.id, ZWOASIControlType.OFFSET, byref(offset), byref(is_auto)
-        )
-
-        # If an error occurred, raise an exception:
-        if error != ZWOASIErrorCode.SUCCESS:
-            raise RuntimeError(
-                f"Error getting offset for index {self.id}. Error: {errors[error]}"
-            )
-
-        return offset.value
+        return self._get_control_value(ZWOASIControlType.OFFSET, "offset")
 
     def set_offset(self, offset: int) -> None:
         """
@@ -1026,15 +1336,7 @@ class ZWOASICamera(object):
         if not self.is_connected():
             return
 
-        error: int = self.lib.ASISetControlValue(
-            self.id, ZWOASIControlType.OFFSET, offset, 0
-        )
-
-        # If an error occurred, raise an exception:
-        if error != ZWOASIErrorCode.SUCCESS:
-            raise RuntimeError(
-                f"Error setting offset for index {self.id}. Error: {errors[error]}"
-            )
+        self._set_control_value(ZWOASIControlType.OFFSET, offset, "offset")
 
     def get_offset_minimum(self) -> int:
         """
@@ -1121,7 +1423,11 @@ class ZWOASICamera(object):
             raise RuntimeError("Device is not connected.")
 
         # Retrieve the current region of interest:
-        width, height, _, t = self.get_region_of_interest()
+        width, height, binning, t = self.get_region_of_interest()
+
+        # If the binning factor is unchanged, there is nothing to do:
+        if binning_x == binning:
+            return
 
         # Update the region of interest with the new binning factor:
         self.set_region_of_interest(width, height, binning_x, t)
@@ -1151,7 +1457,11 @@ class ZWOASICamera(object):
             raise RuntimeError("Device is not connected.")
 
         # Retrieve the current region of interest:
-        width, height, _, t = self.get_region_of_interest()
+        width, height, binning, t = self.get_region_of_interest()
+
+        # If the binning factor is unchanged, there is nothing to do:
+        if binning_y == binning:
+            return
 
         # Update the region of interest with the new binning factor:
         self.set_region_of_interest(width, height, binning_y, t)
@@ -1198,22 +1508,10 @@ class ZWOASICamera(object):
         if not self.is_connected():
             raise RuntimeError("Device is not connected.")
 
-        exposure_time = c_long()
-
-        # Whether the exposure is controlled automatically:
-        is_auto = c_int()
+        exposure_time = self._get_control_value(ZWOASIControlType.EXPOSURE, "exposure")
 
-        error: int = self.lib.ASIGetControlValue(
-            self.id, ZWOASIControlType.EXPOSURE, byref(exposure_time), byref(is_auto)
-        )
-
-        if error != ZWOASIErrorCode.SUCCESS:
-            raise RuntimeError(
-                f"Error getting exposure for index {self.id}. Error: {errors[error]}"
-            )
-
-        # Convert exposure time from microseconds to seconds:
-        return exposure_time.value / 1_000_000.0
+        # Convert exposure time from microseconds to seconds:
+        return exposure_time / 1_000_000.0
 
     def set_exposure_time(self, exposure_time: float) -> None:
         """
@@ -1225,19 +1523,12 @@ class ZWOASICamera(object):
         if not self.is_connected():
             raise RuntimeError("Device is not connected.")
 
-        error: int = self.lib.ASISetControlValue(
-            self.id,
+        self._set_control_value(
             ZWOASIControlType.EXPOSURE,
             int(round(exposure_time * 1_000_000)),
-            0,
+            "exposure",
         )
 
-        # If an error occurred, raise an exception:
-        if error != ZWOASIErrorCode.SUCCESS:
-            raise RuntimeError(
-                f"Error setting exposure for index {self.id}. Error: {errors[error]}"
-            )
-
     def get_image_type(self) -> ZWOASIImageType:
         """
         Retrieve the current image type for the camera.
@@ -1264,42 +1555,206 @@ class ZWOASICamera(object):
             raise RuntimeError("Device is not connected.")
 
         # Retrieve the current region of interest:
-        width, height, binning, _ = self.get_region_of_interest()
+        width, height, binning, t = self.get_region_of_interest()
+
+        # If the image type is unchanged, there is nothing to do:
+        if image_type == t:
+            return
 
-        # Update the region of interest with the new image type:
-        self.set_region_of_interest(width, height, binning, image_type)
+        # Update the region of interest with the new image type, keeping the start
+        # position (as the frame geometry is unchanged):
+        self.set_region_of_interest(
+            width,
+            height,
+            binning,
+            image_type,
+            start_x=self.roi.start_x,
+            start_y=self.roi.start_y,
+        )
+
+    def get_profile(self) -> ZWOASICameraProfile:
+        """
+        Retrieve the camera's current settings as a profile, e.g., to restore later.
 
-    def _get_frame_buffer(self) -> Tuple[bytearray, int]:
+        Returns:
+            ZWOASICameraProfile: The ROI, gain, offset, exposure time and (for cooled
+            cameras) target temperature.
         """
-        Retrieve the frame buffer and size for the camera.
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
 
-        This default implementation calculates the buffer size based on the current
-        ROI and image type (8-bit, 16-bit, or RGB). Subclasses may override this
-        method if they need a custom buffer allocation approach.
+        profile = ZWOASICameraProfile(
+            **self.roi.model_dump(),
+            gain=self.get_gain(),
+            offset=self.get_offset(),
+            exposure_time=self.get_exposure_time(),
+        )
+
+        if self.has_cooler():
+            profile.target_temperature = (
+                self._get_control_value(
+                    ZWOASIControlType.TARGET_TEMPERATURE, "target temperature"
+                )
+                / 10.0
+            )
+
+        return profile
+
+    def configure(
+        self, profile: Optional[ZWOASICameraProfile] = None, **settings: Any
+    ) -> ZWOASIConfigurationResult:
+        """
+        Apply many settings in a single pass, making only the SDK calls required to
+        change the settings which differ from the camera's current state.
+
+        The ROI format is set before the start position (and only if it differs),
+        followed by the exposure time, gain, offset and target temperature.
+
+        Args:
+            profile (Optional[ZWOASICameraProfile]): The profile to apply, e.g., an
+                imaging or guiding profile.
+            **settings: Settings to apply (overriding the profile), e.g., gain=100.
 
         Returns:
-            Tuple[bytearray, int]: A tuple of (raw byte buffer, buffer size in bytes).
+            ZWOASIConfigurationResult: The settings changed (and unchanged), and the
+            time taken to apply them.
         """
-        width, height, _, image_type = self.get_region_of_interest()
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
 
-        # Calculate the size of the frame buffer:
-        buffer_size = width * height
+        # Validate every setting before making any changes:
+        target = (profile or ZWOASICameraProfile()).merge(**settings)
 
-        # Adjust for 16-bit images:
-        if image_type == ZWOASIImageType.RAW16:
-            buffer_size *= 2
+        began = monotonic()
 
-        if image_type == ZWOASIImageType.RGB24:
-            buffer_size *= 3
+        changes: Dict[str, Tuple[Any, Any]] = {}
+
+        unchanged: List[str] = []
+
+        previous = self.roi
+
+        width = previous.width if target.width is None else target.width
+        height = previous.height if target.height is None else target.height
+        binning = previous.binning if target.binning is None else target.binning
+
+        # If the geometry changes, the ROI is centred unless a start position is given:
+        is_moved = (width, height, binning) != (
+            previous.width,
+            previous.height,
+            previous.binning,
+        )
+
+        self.set_region_of_interest(
+            width,
+            height,
+            binning,
+            previous.image_type if target.image_type is None else target.image_type,
+            start_x=target.start_x
+            if target.start_x is not None or is_moved
+            else previous.start_x,
+            start_y=target.start_y
+            if target.start_y is not None or is_moved
+            else previous.start_y,
+        )
+
+        for name, value in previous.model_dump().items():
+            if value != getattr(self.roi, name):
+                changes[name] = (value, getattr(self.roi, name))
+            elif getattr(target, name) is not None:
+                unchanged.append(name)
+
+        for name, control_type, scale, value in (
+            ("exposure_time", ZWOASIControlType.EXPOSURE, 1e6, target.exposure_time),
+            ("gain", ZWOASIControlType.GAIN, 1, target.gain),
+            ("offset", ZWOASIControlType.OFFSET, 1, target.offset),
+            (
+                "target_temperature",
+                ZWOASIControlType.TARGET_TEMPERATURE,
+                10,
+                target.target_temperature,
+            ),
+        ):
+            if value is None:
+                continue
+
+            # Cameras without a cooler have no target temperature (see set_temperature):
+            if control_type == ZWOASIControlType.TARGET_TEMPERATURE and (
+                not self.has_cooler()
+            ):
+                continue
+
+            entry = self.control_cache.peek(control_type)
+
+            self._set_control_value(
+                control_type, int(round(value * scale)), name.replace("_", " ")
+            )
+
+            confirmed = self.control_cache.peek(control_type)
+
+            if entry is not None and confirmed is not None and entry == confirmed:
+                unchanged.append(name)
+                continue
+
+            # N.B. Values are converted from the SDK's units back to the setting's:
+            before, after = [
+                None if v is None else v.value / scale if scale != 1 else v.value
+                for v in (entry, confirmed)
+            ]
+
+            changes[name] = (before, after)
+
+        return ZWOASIConfigurationResult(
+            changes=changes,
+            unchanged=unchanged,
+            elapsed=monotonic() - began,
+        )
+
+    def _estimate_readout_time(self) -> float:
+        """
+        Estimate the time taken to read out a frame in the current ROI format.
+
+        Returns:
+            float: The estimated readout time (in seconds), based on the frame size
+            and a conservative USB 3.0 (or USB 2.0) transfer rate.
+        """
+        # Conservative sustained transfer rates, in bytes per second:
+        rate = (
+            200_000_000 if self.info.is_usb3 and self.info.is_usb3_host else 20_000_000
+        )
+
+        size = get_frame_size(self.roi.width, self.roi.height, self.roi.image_type)
+
+        return size / rate
 
-        return bytearray(buffer_size), buffer_size
+    def _get_frame_buffer(self) -> ZWOASIFrameBuffer:
+        """
+        Retrieve a reusable frame buffer from the camera's frame buffer pool.
+
+        This default implementation sizes the buffer based on the current ROI and
+        image type (8-bit, 16-bit, or RGB). Subclasses may override this method if
+        they need a custom buffer allocation approach.
+
+        Returns:
+            ZWOASIFrameBuffer: A pooled frame buffer, which must be released after use.
+        """
+        # If the pool has not yet been sized, configure it from the current ROI:
+        if self.frame_buffer_pool.key is None:
+            width, height, _, image_type = self.get_region_of_interest()
+
+            self.frame_buffer_pool.configure(width, height, ZWOASIImageType(image_type))
 
-    def _convert_buffer_to_int_list(self, buffer: bytearray) -> List[int]:
+        return self.frame_buffer_pool.acquire()
+
+    def _convert_buffer_to_int_list(
+        self, buffer: Buffer, trace: Optional[int] = None
+    ) -> List[int]:
         """
-        Convert a bytearray buffer to a list of integers.
+        Convert a raw frame buffer to a list of integers.
 
         Args:
-            buffer (bytearray): The buffer to convert.
+            buffer (Buffer): The buffer to convert.
+            trace (Optional[int]): The trace identifier of the frame, for its span.
+                Defaults to the most recently started exposure.
 
         Returns:
             List[int]: The list of integers.
@@ -1312,171 +1767,849 @@ class ZWOASICamera(object):
         if image_type == ZWOASIImageType.RAW8 or image_type == ZWOASIImageType.Y8:
             typecode = "B"
 
-        # If the image type is 16-bit, convert the buffer to a list of uint16 integers:
-        if image_type == ZWOASIImageType.RAW16:
-            typecode = "H"
+        # If the image type is 16-bit, convert the buffer to a list of uint16 integers:
+        if image_type == ZWOASIImageType.RAW16:
+            typecode = "H"
+
+        # If the image type is 24-bit RGB, convert the buffer to a list of uint8 intergers:
+        # Essentially, this is a list of 3-tuples of RGB values, each represented by a uint8:
+        if image_type == ZWOASIImageType.RGB24:
+            typecode = "B"
+
+        began = monotonic()
+
+        # Convert the buffer to an array of integers of the given typecode:
+        data = array(typecode)
+
+        data.frombytes(buffer)
+
+        frame = data.tolist()
+
+        if self.tracer is not None:
+            self._emit_span("convert", began, monotonic(), trace=trace)
+
+        # Return the pixel data as a list of integers:
+        return frame
+
+    def set_tracer(self, tracer: Optional[ZWOASITracer]) -> None:
+        """
+        Set (or, if None, clear) the tracer called with the timing span of each stage
+        of every frame's lifecycle, e.g., ASIStartExposure, the wait for completion,
+        ASIGetDataAfterExp, buffer conversion and the consumer's processing.
+
+        Args:
+            tracer (Optional[ZWOASITracer]): The tracer, e.g., a ZWOASISpanRecorder or
+                an adapter onto a tracing stack. N.B. It is called synchronously on
+                the capturing (or video reader) thread, so must be fast.
+        """
+        self.tracer = tracer
+
+    def _emit_span(
+        self, name: str, start: float, end: float, trace: Optional[int] = None
+    ) -> None:
+        """
+        Emit a timing span to the tracer (if any) for the current (or given) frame.
+
+        Args:
+            name (str): The name of the stage, one of ZWOASI_SPAN_NAMES.
+            start (float): The time.monotonic() timestamp the stage started at.
+            end (float): The time.monotonic() timestamp the stage ended at.
+            trace (Optional[int]): The trace identifier of the frame. Defaults to the
+                most recently started exposure, e.g., on the capturing thread. N.B.
+                Video frames always pass the trace identifier they carry.
+        """
+        tracer = self.tracer
+
+        if tracer is None:
+            return
+
+        tracer(
+            ZWOASISpan(
+                name=name,
+                camera=self.id,
+                trace=self._trace if trace is None else trace,
+                start=start,
+                end=end,
+                duration=end - start,
+            )
+        )
+
+    def _start_exposure(self, is_dark: bool = False) -> float:
+        """
+        Start a single exposure via the SDK.
+
+        Args:
+            is_dark (bool): Whether to start a 'dark' exposure (e.g. shutter closed).
+
+        Returns:
+            float: The time.monotonic() timestamp at which the exposure started.
+
+        Raises:
+            RuntimeError: If an exposure started by start_exposure() is still pending.
+        """
+        # Never start an exposure whilst the exposure monitor still owns the camera:
+        if self.exposure_handle is not None and not self.exposure_handle.done():
+            raise RuntimeError(
+                f"Error starting exposure for index {self.id}. Error: An exposure is already in progress."
+            )
+
+        began = monotonic()
+
+        error: int = self.lib.ASIStartExposure(self.id, is_dark)
+
+        start = monotonic()
+
+        # If an error occurred, raise an exception:
+        if error != ZWOASIErrorCode.SUCCESS:
+            raise RuntimeError(
+                f"Error starting exposure for index {self.id}. Error: {errors[error]}"
+            )
+
+        if self.tracer is not None:
+            self._trace = get_next_trace_id()
+            self._emit_span("start_exposure", began, start)
+
+        return start
+
+    def _wait_for_exposure(
+        self, start: float, exposure_time: float
+    ) -> ZWOASIExposureCompletion:
+        """
+        Wait until the camera signals the exposure started at `start` is complete.
+
+        Args:
+            start (float): The time.monotonic() timestamp the exposure started at.
+            exposure_time (float): The exposure time (in seconds).
+
+        Returns:
+            ZWOASIExposureCompletion: The completion status and timings.
+
+        Raises:
+            ZWOASIExposureError: If the exposure failed (or was stopped).
+        """
+        # Sleep until the expected end of the exposure, then poll for completion:
+        completion = self.exposure_waiter.wait(
+            self.get_acquisition_status, start=start, exposure_time=exposure_time
+        )
+
+        if self.tracer is not None:
+            self._emit_span("wait", start, completion["detected"])
+
+        return self._complete_exposure(completion)
+
+    def _complete_exposure(
+        self, completion: ZWOASIExposureCompletion
+    ) -> ZWOASIExposureCompletion:
+        """
+        Record the completion of an exposure, and check that it succeeded.
+
+        Args:
+            completion (ZWOASIExposureCompletion): The detected exposure completion.
+
+        Returns:
+            ZWOASIExposureCompletion: The completion status and timings.
+
+        Raises:
+            ZWOASIExposureError: If the exposure failed (or was stopped).
+        """
+        self.last_exposure_completion = completion
+
+        # If the exposure failed (or was stopped), raise an exception:
+        if completion["status"] != ZWOASIExposureStatus.SUCCESS:
+            raise ZWOASIExposureError(
+                f"Error acquiring frame for index {self.id}. Error: Exposure failed.",
+                status_code=completion["status"],
+            )
+
+        with self._counters_lock:
+            self.exposed_time += completion["exposure_time"]
+
+        return completion
+
+    def _get_exposure_data(self, buffer: Buffer, trace: Optional[int] = None) -> None:
+        """
+        Have the SDK write the completed exposure straight into the provided buffer.
+
+        Args:
+            buffer (Buffer): A writable, C-contiguous buffer (e.g., bytearray or
+                numpy.ndarray) of the frame size in bytes.
+            trace (Optional[int]): The trace identifier of the exposure, for its span.
+                Defaults to the most recently started exposure.
+        """
+        # Wrap the destination buffer, without copying, as a C char array:
+        size = memoryview(buffer).nbytes
+
+        c_buffer = (c_char * size).from_buffer(buffer)
+
+        began = monotonic()
+
+        # Get the bytes data from the camera one we have a successful exposure:
+        error: int = self.lib.ASIGetDataAfterExp(self.id, c_buffer, size)
+
+        # If an error occurred, raise an exception:
+        if error != ZWOASIErrorCode.SUCCESS:
+            raise RuntimeError(
+                f"Error getting data after exposure for index {self.id}. Error: {errors[error]}"
+            )
+
+        with self._counters_lock:
+            self.frames_captured += 1
+
+        if self.tracer is not None:
+            self._emit_span("get_data", began, monotonic(), trace=trace)
+
+    def _expose(self, buffer: Buffer, is_dark: bool = False) -> None:
+        """
+        Capture a single exposure directly into the provided writable buffer.
+
+        This default implementation:
+          1) Starts an exposure via the SDK,
+          2) Waits until the camera signals the exposure is complete, and
+          3) Has the SDK write the raw image bytes straight into `buffer`.
+
+        Args:
+            buffer (Buffer): A writable, C-contiguous buffer (e.g., bytearray or
+                numpy.ndarray) of at least the frame size in bytes.
+            is_dark (bool): Whether to start a 'dark' exposure (e.g. shutter closed).
+        """
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
+
+        exposure_time = self.get_exposure_time()
+
+        # Start the exposure and wait for it to complete:
+        start = self._start_exposure(is_dark=is_dark)
+
+        self._wait_for_exposure(start, exposure_time)
+
+        self._get_exposure_data(buffer)
+
+    def _read_video_data(
+        self, buffer: Buffer, timeout: int = -1, trace: int = 0
+    ) -> int:
+        """
+        Read a single video frame from the SDK directly into the provided buffer.
+
+        Args:
+            buffer (Buffer): A writable, C-contiguous buffer of the frame size in bytes.
+            timeout (int): Maximum time in milliseconds to wait for a new frame.
+                           A value of -1 indicates an infinite wait.
+            trace (int): The trace identifier of the frame, for its span.
+
+        Returns:
+            int: The SDK error code returned by ASIGetVideoData.
+        """
+        # Wrap the destination buffer, without copying, as a C char array:
+        size = memoryview(buffer).nbytes
+
+        c_buffer = (c_char * size).from_buffer(buffer)
+
+        if self.tracer is None:
+            return self.lib.ASIGetVideoData(self.id, c_buffer, size, timeout)
+
+        began = monotonic()
+
+        error: int = self.lib.ASIGetVideoData(self.id, c_buffer, size, timeout)
+
+        if error == ZWOASIErrorCode.SUCCESS:
+            self._emit_span("read_video", began, monotonic(), trace=trace)
+
+        return error
+
+    def _get_video_data(self, buffer: Buffer, timeout: int = -1) -> int:
+        """
+        Retrieve a single video frame directly into the provided writable buffer.
+
+        Whilst the background video reader is running, the next frame is copied out
+        of its slot ring, otherwise the frame is read from the SDK directly.
+
+        Args:
+            buffer (Buffer): A writable, C-contiguous buffer (e.g., bytearray or
+                numpy.ndarray) of the frame size in bytes.
+            timeout (int): Maximum time in milliseconds to wait for a new frame.
+                           A value of -1 indicates an infinite wait.
+
+        Returns:
+            int: The trace identifier of the frame, e.g., for the spans of its
+            subsequent processing.
+
+        Raises:
+            TimeoutError: If no new frame arrives within the timeout.
+            RuntimeError: If the SDK fails to read the frame.
+        """
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
+
+        if not self.is_video_streaming:
+            raise RuntimeError(
+                "Device is not streaming video. You need to call start_acquisition() first."
+            )
+
+        if self.video is not None:
+            _, _, trace = self.video.read_next_into(
+                buffer, timeout=None if timeout < 0 else timeout / 1000.0
+            )
+            return trace
+
+        trace = get_next_trace_id()
+
+        # Get the bytes data from the camera one we have a successful exposure:
+        error: int = self._read_video_data(buffer, timeout=timeout, trace=trace)
+
+        # A timeout is reported as per the background video reader, e.g., so that
+        # callers can keep polling for frames of longer exposures:
+        if error == ZWOASIErrorCode.TIMEOUT:
+            raise TimeoutError("Timed out waiting for a video frame.")
+
+        # If an error occurred, raise an exception:
+        if error != ZWOASIErrorCode.SUCCESS:
+            raise RuntimeError(
+                f"Error getting data after exposure for index {self.id}. Error: {errors[error]}"
+            )
+
+        with self._counters_lock:
+            self.frames_captured += 1
+
+        return trace
+
+    def _get_frame(self, is_dark: bool = False) -> List[int]:
+        """
+        Capture a single full-frame exposure using the current ROI and exposure settings.
+
+        Subclasses may override if they need custom exposure logic.
+
+        Args:
+            is_dark (bool): Whether to start a 'dark' exposure (e.g. shutter closed).
+                            For certain camera models, this may be handled internally.
+
+        Returns:
+            List[int]: A list of pixel values representing the captured frame.
+        """
+        # Get a reusable frame buffer, which is returned to the pool on exit:
+        with self._get_frame_buffer() as buffer:
+            # Expose and read the frame directly into the frame buffer:
+            self._expose(buffer.data, is_dark=is_dark)
+
+            return self._convert_buffer_to_int_list(buffer.data)
+
+    def _get_video_frame(self, timeout: int = -1) -> List[int]:
+        """
+        Retrieve a single video frame in live-stream mode.
+
+        Subclasses may override if they need special handling of video streaming or
+        different buffer post-processing.
+
+        Args:
+            timeout (int): Maximum time in milliseconds to wait for a new frame.
+                           A value of -1 indicates an infinite wait.
+
+        Returns:
+            List[int]: A list of pixel values representing the most recent video frame.
+        """
+        # Get a reusable frame buffer, which is returned to the pool on exit:
+        with self._get_frame_buffer() as buffer:
+            # Read the video frame directly into the frame buffer:
+            trace = self._get_video_data(buffer.data, timeout=timeout)
+
+            return self._convert_buffer_to_int_list(buffer.data, trace=trace)
+
+    def _get_frame_array_buffer(self) -> "NDArray[Any]":
+        """
+        Allocate an uninitialised array shaped and typed for the current ROI format.
+
+        Returns:
+            NDArray[Any]: An (height, width) or (height, width, 3) array.
+        """
+        numpy = import_numpy()
+
+        width, height, _, t = self.get_region_of_interest()
+
+        image_type = ZWOASIImageType(t)
+
+        return numpy.empty(
+            get_frame_shape(width, height, image_type),
+            dtype=get_frame_dtype(image_type),
+        )
+
+    def _get_frame_array(self, is_dark: bool = False) -> "NDArray[Any]":
+        """
+        Capture a single exposure into a NumPy array, without intermediate copies.
+
+        Args:
+            is_dark (bool): Whether to start a 'dark' exposure (e.g. shutter closed).
+
+        Returns:
+            NDArray[Any]: The frame, written directly by the SDK into the array.
+        """
+        frame = self._get_frame_array_buffer()
+
+        self._expose(frame, is_dark=is_dark)
+
+        return frame
+
+    def _get_video_frame_array(self, timeout: int = -1) -> "NDArray[Any]":
+        """
+        Retrieve a single video frame into a NumPy array, without intermediate copies.
+
+        Args:
+            timeout (int): Maximum time in milliseconds to wait for a new frame.
+                           A value of -1 indicates an infinite wait.
+
+        Returns:
+            NDArray[Any]: The frame, written directly by the SDK into the array.
+        """
+        frame = self._get_frame_array_buffer()
+
+        self._get_video_data(frame, timeout=timeout)
+
+        return frame
+
+    def get_frame(self, is_dark: bool = False) -> List[int]:
+        """
+        Retrieve a single frame of image data from the camera.
+
+        This method may return pixel data as a list of integers, or an empty list
+        if no frame is available.
+
+        Args:
+            is_dark (bool): If True, return a dark frame (e.g., with the shutter closed). N.B. Not used when streaming video.
+
+        Returns:
+            List[int]: A list of pixel values representing the current frame.
+        """
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
+
+        if not self.is_ready():
+            raise RuntimeError("Device is not ready to capture frames.")
+
+        # If we are streaming video, get a video frame, if not, get a single frame:
+        return (
+            self._get_video_frame()
+            if self.is_video_streaming
+            else self._get_frame(is_dark=is_dark)
+        )
+
+    def get_frame_array(self, is_dark: bool = False) -> "NDArray[Any]":
+        """
+        Retrieve a single frame of image data from the camera as a NumPy array.
+
+        The SDK writes the pixels directly into the returned array, so no intermediate
+        copies or Python integer conversions are made. Requires NumPy.
+
+        Args:
+            is_dark (bool): If True, return a dark frame (e.g., with the shutter closed). N.B. Not used when streaming video.
+
+        Returns:
+            NDArray[Any]: An array of shape (height, width) for RAW8/Y8 (uint8) and
+            RAW16 (little-endian uint16), or (height, width, 3) for RGB24 (uint8, BGR).
+        """
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
+
+        if not self.is_ready():
+            raise RuntimeError("Device is not ready to capture frames.")
+
+        # If we are streaming video, get a video frame, if not, get a single frame:
+        return (
+            self._get_video_frame_array()
+            if self.is_video_streaming
+            else self._get_frame_array(is_dark=is_dark)
+        )
+
+    def get_video_frame_array(self, timeout: int = -1) -> "NDArray[Any]":
+        """
+        Retrieve a single video frame from the camera as a NumPy array.
+
+        Args:
+            timeout (int): Maximum time in milliseconds to wait for a new frame.
+                           A value of -1 indicates an infinite wait.
+
+        Returns:
+            NDArray[Any]: The video frame, see get_frame_array() for shape and dtype.
+        """
+        return self._get_video_frame_array(timeout=timeout)
+
+    def get_frame_buffer(self, is_dark: bool = False) -> ZWOASIFrameBuffer:
+        """
+        Retrieve a single frame of image data into a reusable, pooled frame buffer.
+
+        The SDK writes the pixels directly into the pooled buffer. The consumer must
+        call release() on the returned buffer (or use it as a context manager) once
+        finished, so that the buffer can be recycled for subsequent frames.
+
+        Args:
+            is_dark (bool): If True, return a dark frame (e.g., with the shutter closed). N.B. Not used when streaming video.
+
+        Returns:
+            ZWOASIFrameBuffer: The pooled frame buffer holding the raw frame.
+        """
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
+
+        if not self.is_ready():
+            raise RuntimeError("Device is not ready to capture frames.")
+
+        if self.is_video_streaming:
+            return self.get_video_frame_buffer()
+
+        buffer = self._get_frame_buffer()
+
+        try:
+            self._expose(buffer.data, is_dark=is_dark)
+        except Exception:
+            buffer.release()
+            raise
+
+        return buffer
+
+    def start_exposure(self, is_dark: bool = False) -> ZWOASIExposureHandle:
+        """
+        Start a single exposure, without blocking whilst the camera is exposing.
+
+        The completion of the exposure is detected by an exposure monitor thread
+        shared by every camera, which reads the frame into a pooled frame buffer, so
+        that a single thread can coordinate the exposures of many cameras.
+
+        Args:
+            is_dark (bool): If True, start a dark exposure (e.g., with the shutter closed).
+
+        Returns:
+            ZWOASIExposureHandle: The handle of the exposure, whose result() is the
+            pooled frame buffer holding the raw frame (which must be released after
+            use), and whose future is a concurrent.futures.Future of the same.
+        """
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
+
+        if self.is_video_streaming:
+            raise RuntimeError("Cannot expose whilst streaming video.")
+
+        exposure_time = self.get_exposure_time()
+
+        buffer = self._get_frame_buffer()
+
+        try:
+            start = self._start_exposure(is_dark=is_dark)
+        except Exception:
+            buffer.release()
+            raise
+
+        handle = ZWOASIExposureHandle(
+            self,
+            buffer,
+            start=start,
+            exposure_time=exposure_time,
+            is_dark=is_dark,
+            trace=self._trace,
+        )
+
+        self.exposure_handle = handle
+
+        get_exposure_monitor().add(handle)
+
+        return handle
+
+    def get_video_frame_buffer(self, timeout: int = -1) -> ZWOASIFrameBuffer:
+        """
+        Retrieve a single video frame into a reusable, pooled frame buffer.
+
+        Args:
+            timeout (int): Maximum time in milliseconds to wait for a new frame.
+                           A value of -1 indicates an infinite wait.
+
+        Returns:
+            ZWOASIFrameBuffer: The pooled frame buffer, which must be released after use.
+        """
+        buffer = self._get_frame_buffer()
+
+        try:
+            self._get_video_data(buffer.data, timeout=timeout)
+        except Exception:
+            buffer.release()
+            raise
+
+        return buffer
+
+    def _get_frame_destination(self, destination: Buffer) -> memoryview:
+        """
+        Get a writable view of the frame size, in the current ROI format, at the
+        start of the destination buffer.
+
+        Args:
+            destination (Buffer): A writable, C-contiguous buffer.
+
+        Returns:
+            memoryview: The view, which the SDK writes the frame straight into.
+        """
+        size = get_frame_size(self.roi.width, self.roi.height, self.roi.image_type)
+
+        return get_frame_view(destination, size)
+
+    def get_frame_into(self, destination: Buffer, is_dark: bool = False) -> int:
+        """
+        Retrieve a single frame of image data straight into the destination buffer.
+
+        The SDK writes the pixels directly into the destination, e.g., a slice of an
+        mmap (or numpy.memmap) of a preallocated sequence file, so that the frame
+        lands in the page cache once, without an intermediate copy on the heap.
+
+        Args:
+            destination (Buffer): A writable, C-contiguous buffer of at least the
+                frame size in bytes. The frame is written to its start.
+            is_dark (bool): If True, return a dark frame (e.g., with the shutter closed). N.B. Not used when streaming video.
+
+        Returns:
+            int: The number of bytes written, e.g., the frame size.
+        """
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
+
+        if not self.is_ready():
+            raise RuntimeError("Device is not ready to capture frames.")
+
+        if self.is_video_streaming:
+            return self.get_video_frame_into(destination)
+
+        view = self._get_frame_destination(destination)
+
+        size = view.nbytes
+
+        try:
+            self._expose(view, is_dark=is_dark)
+        finally:
+            # Release the view, so that the destination (e.g., an mmap) can be closed:
+            view.release()
+
+        return size
+
+    def get_video_frame_into(self, destination: Buffer, timeout: int = -1) -> int:
+        """
+        Retrieve a single video frame straight into the destination buffer.
+
+        Args:
+            destination (Buffer): A writable, C-contiguous buffer of at least the
+                frame size in bytes. The frame is written to its start.
+            timeout (int): Maximum time in milliseconds to wait for a new frame.
+                           A value of -1 indicates an infinite wait.
+
+        Returns:
+            int: The number of bytes written, e.g., the frame size.
+        """
+        view = self._get_frame_destination(destination)
+
+        size = view.nbytes
+
+        try:
+            self._get_video_data(view, timeout=timeout)
+        finally:
+            view.release()
+
+        return size
+
+    def capture_sequence(
+        self,
+        count: int,
+        exposure_time: float,
+        process: Optional[Callable[[int, ZWOASIFrameBuffer], None]] = None,
+        is_dark: bool = False,
+        queue_size: int = 2,
+    ) -> ZWOASISequenceResult:
+        """
+        Capture a pipelined sequence of exposures.
+
+        Exposure N+1 is started as soon as the data for exposure N has been read out
+        of the SDK, and frame N is handed to `process` on a separate worker thread,
+        so that frame processing and disk I/O overlap with the next exposure.
+
+        Args:
+            count (int): The number of frames to capture.
+            exposure_time (float): The exposure time (in seconds) of each frame.
+            process (Optional[Callable[[int, ZWOASIFrameBuffer], None]]): Called on
+                the worker thread with the index and pooled buffer of each frame. The
+                buffer is released back to the pool once `process` returns.
+            is_dark (bool): Whether to capture 'dark' exposures (e.g. shutter closed).
+            queue_size (int): The maximum number of frames waiting to be processed,
+                after which capture waits for the worker to catch up.
+
+        Returns:
+            ZWOASISequenceResult: The sequence timings, including the duty cycle and
+            the breakdown of the time spent in each stage.
+
+        N.B. The camera's exposure time, and the capacity of its frame buffer pool, are
+        restored once the sequence ends (or fails).
+        """
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
+
+        if self.is_video_streaming:
+            raise RuntimeError("Cannot capture a sequence whilst streaming video.")
+
+        if not self.is_ready():
+            raise RuntimeError("Device is not ready to capture frames.")
+
+        if count < 1:
+            raise ValueError("Count must be at least 1.")
+
+        if queue_size < 1:
+            raise ValueError("Queue size must be at least 1.")
+
+        previous_exposure_time = self.get_exposure_time()
+
+        previous_capacity = self.frame_buffer_pool.capacity
+
+        self.set_exposure_time(exposure_time)
+
+        # Ensure the pool retains a buffer for every frame that can be in flight:
+        self.frame_buffer_pool.capacity = max(previous_capacity, queue_size + 2)
+
+        frames: Queue[Optional[Tuple[int, ZWOASIFrameBuffer, int]]] = Queue(
+            maxsize=queue_size
+        )
+
+        failures: List[Exception] = []
+
+        # The total time (in seconds) spent in each stage of the sequence:
+        breakdown = ZWOASISequenceBreakdown(
+            start_exposure=0.0, wait=0.0, get_data=0.0, process=0.0, other=0.0
+        )
+
+        def work() -> None:
+            while True:
+                item = frames.get()
 
-        # If the image type is 24-bit RGB, convert the buffer to a list of uint8 intergers:
-        # Essentially, this is a list of 3-tuples of RGB values, each represented by a uint8:
-        if image_type == ZWOASIImageType.RGB24:
-            typecode = "B"
+                if item is None:
+                    return
 
-        # Convert the bytearray to a list of uint16 integers:
-        data = array(typecode, buffer)
+                index, buffer, trace = item
 
-        # Return the pixel data as a list of integers:
-        return data.tolist()
+                began = monotonic()
 
-    def _get_frame(self, is_dark: bool = False) -> List[int]:
-        """
-        Capture a single full-frame exposure using the current ROI and exposure settings.
+                try:
+                    if process is not None and not failures:
+                        process(index, buffer)
+                except Exception as error:
+                    failures.append(error)
+                finally:
+                    buffer.release()
 
-        This default implementation:
-          1) Starts an exposure via the SDK,
-          2) Waits until the camera signals the exposure is complete,
-          3) Retrieves the raw image bytes, and
-          4) Converts them into a list of pixel values.
+                ended = monotonic()
 
-        Subclasses may override if they need custom exposure logic.
+                breakdown["process"] += ended - began
 
-        Args:
-            is_dark (bool): Whether to start a 'dark' exposure (e.g. shutter closed).
-                            For certain camera models, this may be handled internally.
+                if process is not None:
+                    self._emit_span("process", began, ended, trace=trace)
 
-        Returns:
-            List[int]: A list of pixel values representing the captured frame.
-        """
-        if not self.is_connected():
-            raise RuntimeError("Device is not connected.")
+        worker = Thread(target=work, name="zwoasi-sequence-worker", daemon=True)
 
-        exposure_time = self.get_exposure_time()
+        worker.start()
 
-        # Start the exposure and wait for it to complete:
-        error: int = self.lib.ASIStartExposure(self.id, is_dark)
+        began = monotonic()
 
-        # If an error occurred, raise an exception:
-        if error != ZWOASIErrorCode.SUCCESS:
-            raise RuntimeError(
-                f"Error starting exposure for index {self.id}. Error: {errors[error]}"
-            )
+        # Whether an exposure has been started, but not yet read out:
+        is_exposing = False
 
-        # Get the frame buffer and size:
-        buffer, size = self._get_frame_buffer()
+        try:
+            start = self._start_exposure(is_dark=is_dark)
 
-        c_buffer_reference = c_char * size
+            is_exposing = True
 
-        c_buffer = c_buffer_reference.from_buffer(buffer)
+            breakdown["start_exposure"] += monotonic() - began
 
-        # Wait for the exposure to complete:
-        while True:
-            # Get the exposure status from the camera:
-            status = self.get_acquisition_status()
+            for index in range(count):
+                # Acquire the destination buffer whilst the exposure is in progress:
+                buffer = self._get_frame_buffer()
 
-            # If the exposure is complete, break out of the loop:
-            if status == ZWOASIExposureStatus.SUCCESS:
-                break
+                try:
+                    waited = monotonic()
 
-            # If the exposure failed, raise an exception:
-            if status == ZWOASIExposureStatus.FAILED:
-                raise ZWOASIExposureError(
-                    f"Error acquiring frame for index {self.id}. Error: Exposure failed.",
-                    status_code=ZWOASIExposureStatus.FAILED,
-                )
+                    self._wait_for_exposure(start, exposure_time)
 
-            # Sleep for 1/10th of the exposure time (which is in seconds):
-            # [TBC]: Is this the right way to wait for the exposure to complete?
-            sleep(exposure_time / 10)
+                    read = monotonic()
 
-        # [TBC]: Do we need to explicitly stop the exposure here?
-        # error = self.lib.ASIStopExposure(self.id)
+                    self._get_exposure_data(buffer.data)
 
-        # # If an error occurred, raise an exception:
-        # if error != ZWOASIErrorCode.SUCCESS:
-        #     raise RuntimeError(
-        #         f"Error stopping exposure for index {self.id}. Error: {errors[error]}"
-        #     )
+                    is_exposing = False
 
-        # Get the bytes data from the camera one we have a successful exposure:
-        error = self.lib.ASIGetDataAfterExp(self.id, c_buffer, size)
+                    breakdown["wait"] += read - waited
 
-        # If an error occurred, raise an exception:
-        if error != ZWOASIErrorCode.SUCCESS:
-            raise RuntimeError(
-                f"Error getting data after exposure for index {self.id}. Error: {errors[error]}"
-            )
+                    breakdown["get_data"] += monotonic() - read
+                except Exception:
+                    buffer.release()
+                    raise
 
-        # Convert exposure to immutable bytes to avoid any exported buffer issues:
-        return self._convert_buffer_to_int_list(bytearray(c_buffer))
+                trace = self._trace
 
-    def _get_video_frame(self, timeout: int = -1) -> List[int]:
-        """
-        Retrieve a single video frame in live-stream mode.
+                # Start the next exposure immediately, before handing off this frame,
+                # unless the worker has failed (and so the sequence is ending):
+                if index < count - 1 and not failures:
+                    started = monotonic()
 
-        This default implementation calls the SDK's ASIGetVideoData function to
-        fetch the latest frame. It then converts the retrieved buffer into a list
-        of pixel values.
+                    start = self._start_exposure(is_dark=is_dark)
 
-        Subclasses may override if they need special handling of video streaming or
-        different buffer post-processing.
+                    is_exposing = True
 
-        Args:
-            timeout (int): Maximum time in milliseconds to wait for a new frame.
-                           A value of -1 indicates an infinite wait.
+                    breakdown["start_exposure"] += monotonic() - started
 
-        Returns:
-            List[int]: A list of pixel values representing the most recent video frame.
-        """
-        if not self.is_connected():
-            raise RuntimeError("Device is not connected.")
+                frames.put((index, buffer, trace))
 
-        if not self.is_video_streaming:
-            raise RuntimeError(
-                "Device is not streaming video. You need to call start_acquisition() first."
-            )
+                if failures:
+                    break
+        finally:
+            # Abort any exposure still in progress, e.g., if the worker failed whilst
+            # the next exposure was being started:
+            if is_exposing:
+                self.lib.ASIStopExposure(self.id)
 
-        buffer, size = self._get_frame_buffer()
+            frames.put(None)
+            worker.join()
 
-        c_buffer_reference = c_char * size
+            self.frame_buffer_pool.capacity = previous_capacity
 
-        c_buffer = c_buffer_reference.from_buffer(buffer)
+            if self.is_connected():
+                self.set_exposure_time(previous_exposure_time)
 
-        # Get the bytes data from the camera one we have a successful exposure:
-        error: int = self.lib.ASIGetVideoData(self.id, c_buffer, size, timeout)
+        elapsed = monotonic() - began
 
-        # If an error occurred, raise an exception:
-        if error != ZWOASIErrorCode.SUCCESS:
-            raise RuntimeError(
-                f"Error getting data after exposure for index {self.id}. Error: {errors[error]}"
-            )
+        if failures:
+            raise failures[0]
 
-        # Convert exposure to immutable bytes to avoid any exported buffer issues:
-        return self._convert_buffer_to_int_list(bytearray(c_buffer))
+        exposed = count * exposure_time
 
-    def get_frame(self, is_dark: bool = False) -> List[int]:
-        """
-        Retrieve a single frame of image data from the camera.
+        breakdown["other"] = max(
+            elapsed
+            - breakdown["start_exposure"]
+            - breakdown["wait"]
+            - breakdown["get_data"],
+            0.0,
+        )
 
-        This method may return pixel data as a list of integers, or an empty list
-        if no frame is available.
+        return ZWOASISequenceResult(
+            count=count,
+            exposure_time=exposure_time,
+            exposed=exposed,
+            elapsed=elapsed,
+            duty_cycle=exposed / elapsed if elapsed > 0 else 0.0,
+            breakdown=breakdown,
+        )
 
-        Args:
-            is_dark (bool): If True, return a dark frame (e.g., with the shutter closed). N.B. Not used when streaming video.
+    def get_capture_counters(self) -> Tuple[int, float]:
+        """
+        Retrieve a consistent snapshot of the camera's capture counters.
 
         Returns:
-            List[int]: A list of pixel values representing the current frame.
+            Tuple[int, float]: The number of frames captured (including those read by
+            a running background video reader), and the total exposure time (in
+            seconds) of the exposures successfully completed.
         """
-        if not self.is_connected():
-            raise RuntimeError("Device is not connected.")
+        with self._counters_lock:
+            frames_captured = self.frames_captured
 
-        if not self.is_ready():
-            raise RuntimeError("Device is not ready to capture frames.")
+            # Frames read by a running background video reader are counted by it:
+            if self.video is not None:
+                frames_captured += self.video.get_statistics()["frames_captured"]
 
-        # If we are streaming video, get a video frame, if not, get a single frame:
-        return (
-            self._get_video_frame()
-            if self.is_video_streaming
-            else self._get_frame(is_dark=is_dark)
-        )
+            return frames_captured, self.exposed_time
 
     def get_dropped_frames(self) -> int:
         """
@@ -1500,12 +2633,19 @@ class ZWOASICamera(object):
 
         return dropped_frames.value
 
-    def start_acquisition(self) -> None:
+    def start_acquisition(self, slots: int = 4, reader: bool = True) -> None:
         """
         Start continuous data acquisition from the camera.
 
-        This method should handle any hardware or software steps needed to begin
-        capturing frames in a streaming or live view mode.
+        This starts video capture in the SDK, and a background reader thread which
+        loops ASIGetVideoData into a preallocated ring of frame slots, so that the
+        camera can be read at the sensor's frame rate regardless of the consumer.
+
+        Args:
+            slots (int): The number of frame slots in the video reader's ring.
+            reader (bool): Whether to start the background reader. Without it, each
+                video frame is read by the SDK straight into the consumer's buffer,
+                e.g., for a consumer which keeps up with the sensor's frame rate.
         """
         if not self.is_connected():
             raise RuntimeError("Device is not connected.")
@@ -1514,9 +2654,35 @@ class ZWOASICamera(object):
         if self.is_video_streaming:
             return
 
+        # The SDK recommends waiting for at least twice the exposure plus 500ms:
+        timeout = int(self.get_exposure_time() * 2000) + 500
+
+        error: int = self.lib.ASIStartVideoCapture(self.id)
+
+        # If an error occurred, raise an exception:
+        if error != ZWOASIErrorCode.SUCCESS:
+            raise RuntimeError(
+                f"Error starting video capture for index {self.id}. Error: {errors[error]}"
+            )
+
         # Update is_video_streaming after successful acquisition start:
         self.is_video_streaming = True
 
+        if not reader:
+            return
+
+        self.video = ZWOASIVideoStream(
+            read=self._read_video_data,
+            width=self.roi.width,
+            height=self.roi.height,
+            image_type=self.roi.image_type,
+            slots=slots,
+            timeout=timeout,
+            get_dropped_frames=self.get_dropped_frames,
+        )
+
+        self.video.start()
+
     def stop_acquisition(self) -> None:
         """
         Stop continuous data acquisition from the camera.
@@ -1531,17 +2697,78 @@ class ZWOASICamera(object):
         if not self.is_video_streaming:
             return
 
+        # Stop the background reader before stopping capture in the SDK:
+        if self.video is not None:
+            self.video.stop()
+
+            # Fold the reader's frames into the camera's total, and detach the reader,
+            # atomically, so that get_capture_counters() never counts them twice:
+            with self._counters_lock:
+                self.frames_captured += self.video.get_statistics()["frames_captured"]
+                self.video = None
+
         error: int = self.lib.ASIStopVideoCapture(self.id)
 
         # If an error occurred, raise an exception:
         if error != ZWOASIErrorCode.SUCCESS:
             raise RuntimeError(
-                f"Error starting video capture for index {self.id}. Error: {errors[error]}"
+                f"Error stopping video capture for index {self.id}. Error: {errors[error]}"
             )
 
         # Update is_video_streaming after successful acquisition stop:
         self.is_video_streaming = False
 
+    def get_latest_video_frame(self) -> Optional[ZWOASIVideoFrame]:
+        """
+        Retrieve a copy of the most recently captured video frame.
+
+        Returns:
+            Optional[ZWOASIVideoFrame]: The latest frame, or None if no frame has been
+            captured since acquisition started.
+        """
+        if self.video is None:
+            raise RuntimeError(
+                "Device is not streaming video. You need to call start_acquisition() first."
+            )
+
+        return self.video.get_latest_frame()
+
+    def get_next_video_frame(
+        self, after: Optional[int] = None, timeout: Optional[float] = None
+    ) -> ZWOASIVideoFrame:
+        """
+        Retrieve a copy of the next video frame after the given sequence number.
+
+        Args:
+            after (Optional[int]): The sequence number of the last frame consumed.
+                Defaults to the current sequence, e.g., wait for a brand new frame.
+            timeout (Optional[float]): The maximum time (in seconds) to wait.
+
+        Returns:
+            ZWOASIVideoFrame: The next frame.
+        """
+        if self.video is None:
+            raise RuntimeError(
+                "Device is not streaming video. You need to call start_acquisition() first."
+            )
+
+        return self.video.get_next_frame(after=after, timeout=timeout)
+
+    def get_video_statistics(self) -> ZWOASIVideoStreamStatistics:
+        """
+        Retrieve the capture statistics of the background video reader.
+
+        Returns:
+            ZWOASIVideoStreamStatistics: The frame sequence, skipped and dropped frame
+            counts for the current acquisition.
+        """
+        if self.video is None:
+            raise RuntimeError(
+                "Device is not streaming video. You need to call start_acquisition() first."
+            )
+
+        return self.video.get_statistics()
+
     def get_acquisition_status(self) -> ZWOASIExposureStatus:
         """
         Retrieve the current exposure status of the camera.
@@ -1654,20 +2881,47 @@ class ZWOASICamera(object):
         if not self.has_cooler():
             return self.get_temperature()
 
-        value = int(round(temperature * 10))
+        self._set_control_value(
+            ZWOASIControlType.TARGET_TEMPERATURE,
+            int(round(temperature * 10)),
+            "target temperature",
+        )
 
-        error: int = self.lib.ASISetControlValue(
-            self.id, ZWOASIControlType.TARGET_TEMPERATURE, value, 0
+        # Return the new target temperature:
+        return self.get_temperature()
+
+    def get_cooler_power(self) -> float:
+        """
+        Retrieve the current power (as a percentage) of the cooler, if available.
+
+        Returns:
+            float: The cooler power percentage, or 0.0 if not applicable.
+        """
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
+
+        if not self.has_cooler():
+            return 0.0
+
+        power = c_long()
+
+        # Whether the cooler power is controlled automatically:
+        is_auto = c_int()
+
+        error: int = self.lib.ASIGetControlValue(
+            self.id,
+            ZWOASIControlType.COOLER_POWER_PERCENTAGE,
+            byref(power),
+            byref(is_auto),
         )
 
         # If an error occurred, raise an exception:
         if error != ZWOASIErrorCode.SUCCESS:
             raise RuntimeError(
-                "Error setting target temperature. Error: {errors[error]}"
+                f"Error getting cooler power for index {self.id}. Error: {errors[error]}"
             )
 
-        # Return the new target temperature:
-        return self.get_temperature()
+        return float(power.value)
 
     def can_pulse_guide(self) -> bool:
         """
@@ -1744,14 +2998,12 @@ class ZWOASICamera(object):
         Returns:
             bool: True if GPS data is supported; otherwise, False.
         """
-        try:
-            # Use the helper to retrieve the capability for GPS support indicator:
-            capability = self._get_control_capability(
-                ZWOASIControlType.GPS_SUPPORT_INDICATOR
-            )
-            return capability is not None
-        except Exception:
-            return False
+        # Use the helper to retrieve the capability for GPS support indicator:
+        capability = self._get_control_capability(
+            ZWOASIControlType.GPS_SUPPORT_INDICATOR
+        )
+
+        return capability is not None
 
     def get_gps_data(self) -> "ZWOASIGPSExposureData":
         """
@@ -1802,15 +3054,128 @@ class ZWOASICamera(object):
         if not self.has_gps_support:
             raise RuntimeError("GPS data is not supported by this camera.")
 
-        buffer, size = self._get_frame_buffer()
+        # Get a reusable frame buffer, which is returned to the pool on exit:
+        with self._get_frame_buffer() as buffer:
+            gps_c_data = self._get_exposure_data_with_gps(buffer.data)
+
+            # Convert the returned C GPS data into your Python model:
+            gps_data = ZWOASIGPSData.from_c_types(gps_c_data)
+
+            # Convert the buffer to a list of integers:
+            frame = self._convert_buffer_to_int_list(buffer.data)
+
+        return frame, gps_data
+
+    def get_video_frame_and_gps_data(
+        self, timeout: int = -1
+    ) -> Tuple[List[int], "ZWOASIGPSData"]:
+        """
+        Retrieve the GPS data associated with the current video frame from the camera.
+
+        Returns:
+            Tuple[List[int], ZWOASIGPSData]: A tuple containing the pixel data and GPS
+            data for the current video frame.
+        """
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
+
+        if not self.has_gps_support:
+            raise RuntimeError("GPS data is not supported by this camera.")
+
+        trace = get_next_trace_id()
+
+        # Get a reusable frame buffer, which is returned to the pool on exit:
+        with self._get_frame_buffer() as buffer:
+            gps_c_data = self._get_video_data_with_gps(
+                buffer.data, timeout=timeout, trace=trace
+            )
+
+            # Convert the returned C GPS data into a Python model:
+            gps_data = ZWOASIGPSData.from_c_types(gps_c_data)
+
+            # Convert the buffer to a list of integers:
+            frame = self._convert_buffer_to_int_list(buffer.data, trace=trace)
+
+        return frame, gps_data
+
+    def get_frame_buffer_and_gps_record(
+        self,
+    ) -> Tuple[ZWOASIFrameBuffer, ZWOASIGPSRecord]:
+        """
+        Retrieve the current frame, and its GPS data, without per-frame validation.
+
+        This is the hot path equivalent of get_frame_and_gps_data(): the frame is
+        returned in a pooled buffer (which must be released after use), and the GPS
+        data as a compact record, which can be converted with to_model() if needed.
+
+        Returns:
+            Tuple[ZWOASIFrameBuffer, ZWOASIGPSRecord]: The frame and its GPS data.
+        """
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
+
+        if not self.has_gps_support:
+            raise RuntimeError("GPS data is not supported by this camera.")
+
+        buffer = self._get_frame_buffer()
+
+        try:
+            gps_c_data = self._get_exposure_data_with_gps(buffer.data)
+        except Exception:
+            buffer.release()
+            raise
+
+        return buffer, ZWOASIGPSRecord.from_c_types(gps_c_data)
+
+    def get_video_frame_buffer_and_gps_record(
+        self, timeout: int = -1
+    ) -> Tuple[ZWOASIFrameBuffer, ZWOASIGPSRecord]:
+        """
+        Retrieve the next video frame, and its GPS data, without per-frame validation.
+
+        Args:
+            timeout (int): Maximum time in milliseconds to wait for a new frame.
+                           A value of -1 indicates an infinite wait.
+
+        Returns:
+            Tuple[ZWOASIFrameBuffer, ZWOASIGPSRecord]: The frame (in a pooled buffer,
+            which must be released after use) and its GPS data.
+        """
+        if not self.is_connected():
+            raise RuntimeError("Device is not connected.")
+
+        if not self.has_gps_support:
+            raise RuntimeError("GPS data is not supported by this camera.")
+
+        buffer = self._get_frame_buffer()
+
+        try:
+            gps_c_data = self._get_video_data_with_gps(buffer.data, timeout=timeout)
+        except Exception:
+            buffer.release()
+            raise
+
+        return buffer, ZWOASIGPSRecord.from_c_types(gps_c_data)
+
+    def _get_exposure_data_with_gps(self, buffer: Buffer) -> ZWOASI_GPS_DATA_CTYPE:
+        """
+        Have the SDK write the completed exposure, and its GPS data, into `buffer`.
+
+        Args:
+            buffer (Buffer): A writable, C-contiguous buffer of the frame size in bytes.
 
-        c_buffer_reference = c_char * size
+        Returns:
+            ZWOASI_GPS_DATA_CTYPE: The GPS data filled in by the SDK.
+        """
+        size = memoryview(buffer).nbytes
 
-        c_buffer = c_buffer_reference.from_buffer(buffer)
+        c_buffer = (c_char * size).from_buffer(buffer)
 
         # Allocate a C structure for GPS data:
         gps_c_data = ZWOASI_GPS_DATA_CTYPE()
 
+        began = monotonic()
+
         error: int = self.lib.ASIGetDataAfterExpGPS(
             self.id, byref(c_buffer), size, byref(gps_c_data)
         )
@@ -1821,39 +3186,50 @@ class ZWOASICamera(object):
                 f"Error retrieving GPS data for camera {self.id}: {errors[error]}"
             )
 
-        # Convert the returned C GPS data into your Python model:
-        gps_data = ZWOASIGPSData.from_c_types(gps_c_data)
+        with self._counters_lock:
+            self.frames_captured += 1
 
-        # Convert the buffer to a list of integers:
-        frame = self._convert_buffer_to_int_list(bytearray(c_buffer))
+        if self.tracer is not None:
+            self._emit_span("get_data", began, monotonic())
 
-        return frame, gps_data
+        return gps_c_data
 
-    def get_video_frame_and_gps_data(
-        self, timeout: int = -1
-    ) -> Tuple[List[int], "ZWOASIGPSData"]:
+    def _get_video_data_with_gps(
+        self, buffer: Buffer, timeout: int = -1, trace: int = 0
+    ) -> ZWOASI_GPS_DATA_CTYPE:
         """
-        Retrieve the GPS data associated with the current video frame from the camera.
+        Read a single video frame, and its GPS data, from the SDK into `buffer`.
 
-        Returns:
-            Tuple[List[int], ZWOASIGPSData]: A tuple containing the pixel data and GPS
-            data for the current video frame.
-        """
-        if not self.is_connected():
-            raise RuntimeError("Device is not connected.")
+        Args:
+            buffer (Buffer): A writable, C-contiguous buffer of the frame size in bytes.
+            timeout (int): Maximum time in milliseconds to wait for a new frame.
+                           A value of -1 indicates an infinite wait.
+            trace (int): The trace identifier of the frame, for its span.
 
-        if not self.has_gps_support:
-            raise RuntimeError("GPS data is not supported by this camera.")
+        Returns:
+            ZWOASI_GPS_DATA_CTYPE: The GPS data filled in by the SDK.
 
-        buffer, size = self._get_frame_buffer()
+        Raises:
+            RuntimeError: If the background video reader is running, or the SDK call
+                fails.
+        """
+        # The background video reader pulls every frame from the SDK, so a second
+        # (GPS) consumer of the SDK's stream would steal frames from it:
+        if self.video is not None:
+            raise RuntimeError(
+                "Cannot read video GPS data whilst the background video reader is "
+                "running. Start acquisition with reader=False instead."
+            )
 
-        c_buffer_reference = c_char * size
+        size = memoryview(buffer).nbytes
 
-        c_buffer = c_buffer_reference.from_buffer(buffer)
+        c_buffer = (c_char * size).from_buffer(buffer)
 
         # Allocate a C structure for GPS data:
         gps_c_data = ZWOASI_GPS_DATA_CTYPE()
 
+        began = monotonic()
+
         error: int = self.lib.ASIGetVideoDataGPS(
             self.id, byref(c_buffer), size, timeout, byref(gps_c_data)
         )
@@ -1864,13 +3240,13 @@ class ZWOASICamera(object):
                 f"Error getting video GPS data for camera {self.id}: {errors[error]}"
             )
 
-        # Convert the returned C GPS data into a Python model:
-        gps_data = ZWOASIGPSData.from_c_types(gps_c_data)
+        with self._counters_lock:
+            self.frames_captured += 1
 
-        # Convert the buffer to a list of integers:
-        frame = self._convert_buffer_to_int_list(bytearray(c_buffer))
+        if self.tracer is not None:
+            self._emit_span("read_video", began, monotonic(), trace=trace)
 
-        return frame, gps_data
+        return gps_c_data
 
     def has_external_trigger(self) -> bool:
         """
@@ -0,0 +1,201 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from threading import Lock
+from time import monotonic
+from typing import Dict, NamedTuple, Optional, TypedDict
+
+from .enums import ZWOASIControlType
+
+# **************************************************************************************
+
+# The default time (in seconds) for which a cached control value is served to getters:
+ZWOASI_CONTROL_CACHE_MAXIMUM_AGE: float = 1.0
+
+# **************************************************************************************
+
+
+class ZWOASIControlValue(NamedTuple):
+    # The last value confirmed by the SDK:
+    value: int
+    # Whether the control is set to be controlled automatically:
+    is_auto: bool
+    # The (monotonic) time at which the value was confirmed:
+    timestamp: float
+
+
+# **************************************************************************************
+
+
+class ZWOASIControlCacheStatistics(TypedDict):
+    # The number of reads served from the cache:
+    hits: int
+    # The number of reads which required an SDK call:
+    misses: int
+    # The number of writes passed through to the SDK:
+    writes: int
+    # The number of writes skipped, as the value was unchanged:
+    writes_skipped: int
+    # The number of controls currently cached:
+    entries: int
+
+
+# **************************************************************************************
+
+
+class ZWOASIControlCache(object):
+    """
+    A write-through cache of a camera's control values, keyed by control type.
+
+    Each entry records the last value (and auto flag) confirmed by the SDK, either
+    when it was read or when it was written successfully. Getters are served from
+    the cache whilst an entry is younger than the staleness window, and setters are
+    skipped entirely whilst the value is unchanged.
+
+    N.B. Controls which the camera adjusts itself (e.g., whilst set to auto) are
+    never served from the cache.
+    """
+
+    # The time (in seconds) for which a cached value is served to getters:
+    maximum_age: float
+
+    def __init__(self, maximum_age: float = ZWOASI_CONTROL_CACHE_MAXIMUM_AGE) -> None:
+        """
+        Initialise the (empty) control cache.
+
+        Args:
+            maximum_age (float): The time (in seconds) for which a cached value is
+                served to getters. Zero disables cached reads (but not the skipping
+                of unchanged writes).
+        """
+        self.maximum_age = maximum_age
+
+        self._values: Dict[ZWOASIControlType, ZWOASIControlValue] = {}
+
+        self._lock = Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._writes_skipped = 0
+
+    def get(self, control: ZWOASIControlType) -> Optional[ZWOASIControlValue]:
+        """
+        Get the cached value of a control, if it is fresh enough to be served.
+
+        Args:
+            control (ZWOASIControlType): The control type.
+
+        Returns:
+            Optional[ZWOASIControlValue]: The cached value, or None on a miss, in
+            which case the caller should read the value from the SDK and store() it.
+        """
+        with self._lock:
+            entry = self._values.get(control)
+
+            if (
+                entry is None
+                or entry.is_auto
+                or monotonic() - entry.timestamp > self.maximum_age
+            ):
+                self._misses += 1
+                return None
+
+            self._hits += 1
+
+            return entry
+
+    def peek(self, control: ZWOASIControlType) -> Optional[ZWOASIControlValue]:
+        """
+        Get the last confirmed value of a control, however old, without counting a
+        hit or miss, e.g., to compare against before writing.
+
+        Args:
+            control (ZWOASIControlType): The control type.
+
+        Returns:
+            Optional[ZWOASIControlValue]: The last confirmed value, if any.
+        """
+        with self._lock:
+            return self._values.get(control)
+
+    def is_unchanged(
+        self, control: ZWOASIControlType, value: int, is_auto: bool = False
+    ) -> bool:
+        """
+        Check whether a write would leave a control unchanged, e.g., can be skipped.
+
+        Unlike reads, writes are skipped however old the cached value is, as only
+        this camera instance changes values which are not controlled automatically.
+
+        Args:
+            control (ZWOASIControlType): The control type.
+            value (int): The value to be written.
+            is_auto (bool): Whether the control is to be controlled automatically.
+
+        Returns:
+            bool: True if the last confirmed value and auto flag are the same.
+        """
+        with self._lock:
+            entry = self._values.get(control)
+
+            if (
+                entry is None
+                or entry.is_auto
+                or is_auto
+                or (entry.value, entry.is_auto) != (value, is_auto)
+            ):
+                self._writes += 1
+                return False
+
+            self._writes_skipped += 1
+
+            return True
+
+    def store(self, control: ZWOASIControlType, value: int, is_auto: bool) -> None:
+        """
+        Record a value confirmed by the SDK.
+
+        Args:
+            control (ZWOASIControlType): The control type.
+            value (int): The value read from (or successfully written to) the SDK.
+            is_auto (bool): Whether the control is controlled automatically.
+        """
+        with self._lock:
+            self._values[control] = ZWOASIControlValue(value, is_auto, monotonic())
+
+    def invalidate(self, control: Optional[ZWOASIControlType] = None) -> None:
+        """
+        Discard the cached value of a control, or (if None) of every control.
+
+        Args:
+            control (Optional[ZWOASIControlType]): The control type, or None.
+        """
+        with self._lock:
+            if control is None:
+                self._values.clear()
+            else:
+                self._values.pop(control, None)
+
+    def get_statistics(self) -> ZWOASIControlCacheStatistics:
+        """
+        Retrieve the cache's hit, miss and write counters.
+
+        Returns:
+            ZWOASIControlCacheStatistics: The current counters.
+        """
+        with self._lock:
+            return ZWOASIControlCacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                writes=self._writes,
+                writes_skipped=self._writes_skipped,
+                entries=len(self._values),
+            )
+
+
+# **************************************************************************************
@@ -0,0 +1,291 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from asyncio import sleep as asleep
+from threading import Lock
+from time import monotonic, sleep
+from typing import Awaitable, Callable, Optional, TypedDict
+
+from .enums import ZWOASIExposureStatus
+
+# **************************************************************************************
+
+
+class ZWOASIExposureCompletion(TypedDict):
+    # The final status of the exposure, e.g., SUCCESS or FAILED:
+    status: ZWOASIExposureStatus
+    # The time.monotonic() timestamp at which the exposure was started:
+    start: float
+    # The exposure time (in seconds):
+    exposure_time: float
+    # The time.monotonic() timestamp at which the exposure was expected to complete:
+    expected: float
+    # The time.monotonic() timestamp at which the completion was detected:
+    detected: float
+    # The upper bound (in seconds) on how late the completion was detected:
+    latency: float
+    # The number of status polls made after the initial sleep:
+    polls: int
+
+
+# **************************************************************************************
+
+
+class ZWOASIExposureWaiter(object):
+    """
+    Waits for an exposure to complete by sleeping until the expected end time (the
+    exposure time plus an estimated readout time), and then polling the exposure
+    status with a bounded, exponentially increasing poll interval.
+
+    The readout time estimate adapts to the observed completions, so that over a
+    sequence the initial sleep converges on the true end of the exposure.
+    """
+
+    # The smallest interval (in seconds) between status polls:
+    minimum_poll_interval: float
+
+    # The largest interval (in seconds) between status polls:
+    maximum_poll_interval: float
+
+    # The current estimate (in seconds) of the readout time after an exposure:
+    readout_time: float
+
+    # The most recent exposure completion detected by the waiter:
+    last_completion: Optional[ZWOASIExposureCompletion] = None
+
+    def __init__(
+        self,
+        minimum_poll_interval: float = 0.001,
+        maximum_poll_interval: float = 0.1,
+        readout_time: float = 0.0,
+        is_adaptive: bool = True,
+    ) -> None:
+        """
+        Initialise the exposure waiter.
+
+        Args:
+            minimum_poll_interval (float): The poll interval floor (in seconds).
+            maximum_poll_interval (float): The poll interval ceiling (in seconds).
+            readout_time (float): The initial readout time estimate (in seconds).
+            is_adaptive (bool): Whether to refine the readout time estimate from the
+                observed exposure completions.
+        """
+        if minimum_poll_interval <= 0:
+            raise ValueError("The minimum poll interval must be positive.")
+
+        if maximum_poll_interval < minimum_poll_interval:
+            raise ValueError(
+                "The maximum poll interval must not be less than the minimum."
+            )
+
+        if readout_time < 0:
+            raise ValueError("The readout time must not be negative.")
+
+        self.minimum_poll_interval = minimum_poll_interval
+        self.maximum_poll_interval = maximum_poll_interval
+        self.readout_time = readout_time
+        self.is_adaptive = is_adaptive
+
+        # Serialises completions, e.g., from the exposure monitor thread whilst a
+        # blocking capture also completes, as each updates the readout estimate:
+        self._lock = Lock()
+
+    def wait(
+        self,
+        get_status: Callable[[], ZWOASIExposureStatus],
+        start: float,
+        exposure_time: float,
+        timeout: Optional[float] = None,
+    ) -> ZWOASIExposureCompletion:
+        """
+        Wait for an exposure to complete (or fail).
+
+        Args:
+            get_status (Callable[[], ZWOASIExposureStatus]): Returns the current
+                exposure status, e.g., a wrapper around ASIGetExpStatus.
+            start (float): The time.monotonic() timestamp the exposure started at.
+            exposure_time (float): The exposure time (in seconds).
+            timeout (Optional[float]): The maximum time (in seconds) to wait beyond
+                the expected end of the exposure, or None to wait indefinitely.
+
+        Returns:
+            ZWOASIExposureCompletion: The completion status and timings.
+
+        Raises:
+            TimeoutError: If the exposure has not completed within the timeout.
+        """
+        # The earliest the exposure could possibly complete:
+        end = start + exposure_time
+
+        # The time we expect the exposure to have been read out by the camera:
+        expected = end + self.readout_time
+
+        # Sleep (once) until the expected completion time of the exposure:
+        remaining = expected - monotonic()
+
+        if remaining > 0:
+            sleep(remaining)
+
+        interval = self.minimum_poll_interval
+
+        # The last time the exposure was observed to still be in progress:
+        working: Optional[float] = None
+
+        polls = 0
+
+        while True:
+            status = get_status()
+
+            now = monotonic()
+
+            polls += 1
+
+            if status != ZWOASIExposureStatus.WORKING:
+                break
+
+            working = now
+
+            if timeout is not None and now - expected > timeout:
+                raise TimeoutError(
+                    f"Exposure did not complete within {timeout} seconds of its "
+                    "expected end time."
+                )
+
+            sleep(interval)
+
+            # Back off exponentially, bounded by the poll interval ceiling:
+            interval = min(interval * 2, self.maximum_poll_interval)
+
+        return self.complete(status, start, exposure_time, working, now, polls)
+
+    async def wait_async(
+        self,
+        get_status: Callable[[], Awaitable[ZWOASIExposureStatus]],
+        start: float,
+        exposure_time: float,
+        timeout: Optional[float] = None,
+    ) -> ZWOASIExposureCompletion:
+        """
+        Wait for an exposure to complete (or fail), without blocking the event loop.
+
+        Args:
+            get_status (Callable[[], Awaitable[ZWOASIExposureStatus]]): Returns the
+                current exposure status, e.g., ASIGetExpStatus run on an executor.
+            start (float): The time.monotonic() timestamp the exposure started at.
+            exposure_time (float): The exposure time (in seconds).
+            timeout (Optional[float]): The maximum time (in seconds) to wait beyond
+                the expected end of the exposure, or None to wait indefinitely.
+
+        Returns:
+            ZWOASIExposureCompletion: The completion status and timings.
+
+        Raises:
+            TimeoutError: If the exposure has not completed within the timeout.
+        """
+        expected = start + exposure_time + self.readout_time
+
+        # Sleep (once) until the expected completion time of the exposure:
+        remaining = expected - monotonic()
+
+        if remaining > 0:
+            await asleep(remaining)
+
+        interval = self.minimum_poll_interval
+
+        working: Optional[float] = None
+
+        polls = 0
+
+        while True:
+            status = await get_status()
+
+            now = monotonic()
+
+            polls += 1
+
+            if status != ZWOASIExposureStatus.WORKING:
+                break
+
+            working = now
+
+            if timeout is not None and now - expected > timeout:
+                raise TimeoutError(
+                    f"Exposure did not complete within {timeout} seconds of its "
+                    "expected end time."
+                )
+
+            await asleep(interval)
+
+            interval = min(interval * 2, self.maximum_poll_interval)
+
+        return self.complete(status, start, exposure_time, working, now, polls)
+
+    def complete(
+        self,
+        status: ZWOASIExposureStatus,
+        start: float,
+        exposure_time: float,
+        working: Optional[float],
+        detected: float,
+        polls: int,
+    ) -> ZWOASIExposureCompletion:
+        """
+        Record the completion of an exposure which was polled elsewhere, e.g., by the
+        exposure monitor, refining the readout time estimate (if adaptive).
+
+        Args:
+            status (ZWOASIExposureStatus): The final status of the exposure.
+            start (float): The time.monotonic() timestamp the exposure started at.
+            exposure_time (float): The exposure time (in seconds).
+            working (Optional[float]): The time.monotonic() timestamp the exposure was
+                last observed to be in progress, or None if it never was.
+            detected (float): The time.monotonic() timestamp the completion was
+                detected at.
+            polls (int): The number of status polls made.
+
+        Returns:
+            ZWOASIExposureCompletion: The completion status and timings.
+        """
+        end = start + exposure_time
+
+        # The completion happened at some point after the last "working" observation,
+        # or, if there was none, at some point after the nominal end of the exposure:
+        latency = detected - (working if working is not None else end)
+
+        with self._lock:
+            expected = end + self.readout_time
+
+            if self.is_adaptive and status == ZWOASIExposureStatus.SUCCESS:
+                self._adapt(end, working, detected)
+
+            self.last_completion = ZWOASIExposureCompletion(
+                status=ZWOASIExposureStatus(status),
+                start=start,
+                exposure_time=exposure_time,
+                expected=expected,
+                detected=detected,
+                latency=max(latency, 0.0),
+                polls=polls,
+            )
+
+            return self.last_completion
+
+    def _adapt(self, end: float, working: Optional[float], detected: float) -> None:
+        # If the exposure was already complete on the first poll, we overslept and
+        # so pull the readout estimate in towards the nominal end of the exposure:
+        if working is None:
+            self.readout_time *= 0.5
+            return
+
+        # Otherwise, the completion lies between the last two polls, so move the
+        # estimate towards the lower bound (to avoid overshooting next time):
+        observed = max(working - end, 0.0)
+
+        self.readout_time = 0.75 * self.readout_time + 0.25 * observed
+
+
+# **************************************************************************************
@@ -0,0 +1,352 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import sys
+from array import array
+from collections.abc import Buffer
+from datetime import datetime, timezone
+from pathlib import Path
+from time import monotonic, time
+from typing import TYPE_CHECKING, BinaryIO, List, Sequence, Tuple, Union
+
+from .enums import ZWOASIImageType
+from .frame import get_bytes_per_pixel, get_frame_size, import_numpy
+
+if TYPE_CHECKING:
+    from .camera import ZWOASICamera
+
+# **************************************************************************************
+
+# The size (in bytes) of a FITS block, to which the header and data are padded:
+ZWOASI_FITS_BLOCK_SIZE: int = 2880
+
+# The size (in bytes) of a FITS header card:
+ZWOASI_FITS_CARD_SIZE: int = 80
+
+# The default size (in bytes) of each chunk streamed to disk:
+ZWOASI_FITS_CHUNK_SIZE: int = 4 * 1024 * 1024
+
+# **************************************************************************************
+
+# The value of a FITS header card:
+ZWOASIFITSValue = Union[bool, int, float, str]
+
+# A FITS header card, as a (keyword, value, comment) tuple:
+ZWOASIFITSCard = Tuple[str, ZWOASIFITSValue, str]
+
+# **************************************************************************************
+
+# Flips the sign bit of the high byte of each 16-bit pixel, e.g., to offset unsigned
+# pixels by BZERO = 32768 into the signed integers stored by FITS:
+_SIGN_FLIP = bytes((byte ^ 0x80) for byte in range(256))
+
+# The FITS BAYERPAT value of each of the SDK's Bayer patterns, by pattern name:
+_BAYER_PATTERNS = {"RG": "RGGB", "BG": "BGGR", "GR": "GRBG", "GB": "GBRG"}
+
+# **************************************************************************************
+
+
+def format_fits_card(keyword: str, value: ZWOASIFITSValue, comment: str = "") -> bytes:
+    """
+    Format a single fixed-format FITS header card.
+
+    Args:
+        keyword (str): The keyword (at most 8 characters), e.g., "EXPTIME".
+        value (ZWOASIFITSValue): The card's value.
+        comment (str): An optional comment.
+
+    Returns:
+        bytes: The 80 byte (ASCII) card, with the comment truncated to fit.
+
+    Raises:
+        ValueError: If the keyword, or the keyword and value, do not fit in a card.
+    """
+    keyword = keyword.upper()
+
+    if len(keyword) > 8:
+        raise ValueError(f"FITS keyword {keyword} is longer than 8 characters.")
+
+    if isinstance(value, bool):
+        formatted = f"{'T' if value else 'F':>20}"
+    elif isinstance(value, int):
+        formatted = f"{value:>20d}"
+    elif isinstance(value, float):
+        formatted = f"{repr(value).upper():>20}"
+    else:
+        # Strings are quoted (with any quotes doubled), and padded to 8 characters:
+        formatted = "'" + f"{value.replace(chr(39), chr(39) * 2):<8}" + "'"
+
+    card = f"{keyword:<8}= {formatted}"
+
+    # Only the comment may be truncated, e.g., a truncated string would lose its
+    # closing quote, and so produce an invalid card:
+    if len(card) > ZWOASI_FITS_CARD_SIZE:
+        raise ValueError(
+            f"FITS card {keyword} is longer than {ZWOASI_FITS_CARD_SIZE} characters."
+        )
+
+    if comment:
+        card = f"{card} / {comment}"
+
+    return card[:ZWOASI_FITS_CARD_SIZE].ljust(ZWOASI_FITS_CARD_SIZE).encode("ascii")
+
+
+# **************************************************************************************
+
+
+def get_fits_header(
+    width: int,
+    height: int,
+    image_type: ZWOASIImageType,
+    cards: Sequence[ZWOASIFITSCard] = (),
+) -> bytes:
+    """
+    Build the primary FITS header for a frame, padded to a whole number of blocks.
+
+    Args:
+        width (int): The width of the frame (in pixels).
+        height (int): The height of the frame (in pixels).
+        image_type (ZWOASIImageType): The image type of the frame.
+        cards (Sequence[ZWOASIFITSCard]): Additional cards, e.g., from
+            get_fits_header_cards().
+
+    Returns:
+        bytes: The header, terminated by an END card.
+    """
+    bytes_per_pixel = get_bytes_per_pixel(image_type)
+
+    is_rgb = image_type == ZWOASIImageType.RGB24
+
+    header = [
+        format_fits_card("SIMPLE", True, "conforms to FITS standard"),
+        format_fits_card("BITPIX", 16 if bytes_per_pixel == 2 else 8),
+        format_fits_card("NAXIS", 3 if is_rgb else 2),
+        format_fits_card("NAXIS1", width),
+        format_fits_card("NAXIS2", height),
+    ]
+
+    if is_rgb:
+        header.append(format_fits_card("NAXIS3", 3))
+
+    header.append(format_fits_card("EXTEND", True))
+
+    # FITS stores signed 16-bit integers, so unsigned pixels are offset by 32768:
+    if bytes_per_pixel == 2:
+        header.append(format_fits_card("BZERO", 32768))
+        header.append(format_fits_card("BSCALE", 1))
+
+    header.extend(format_fits_card(*card) for card in cards)
+
+    header.append(b"END".ljust(ZWOASI_FITS_CARD_SIZE))
+
+    return _pad(b"".join(header), b" ")
+
+
+# **************************************************************************************
+
+
+def get_fits_header_cards(camera: "ZWOASICamera") -> List[ZWOASIFITSCard]:
+    """
+    Get the FITS header cards describing a camera's most recent frame, from its
+    cached state (e.g., without calling into the SDK).
+
+    Args:
+        camera (ZWOASICamera): The camera the frame was captured with.
+
+    Returns:
+        List[ZWOASIFITSCard]: The instrument, geometry and exposure cards.
+    """
+    info = camera.info
+
+    roi = camera.roi
+
+    cards: List[ZWOASIFITSCard] = [
+        ("INSTRUME", info.name, "camera model"),
+        ("XBINNING", roi.binning, "binning factor in x"),
+        ("YBINNING", roi.binning, "binning factor in y"),
+        ("XPIXSZ", info.pixel_size * roi.binning, "[um] binned pixel size in x"),
+        ("YPIXSZ", info.pixel_size * roi.binning, "[um] binned pixel size in y"),
+        ("XORGSUBF", roi.start_x, "subframe origin in x"),
+        ("YORGSUBF", roi.start_y, "subframe origin in y"),
+    ]
+
+    if (
+        info.is_color
+        and info.bayer_pattern is not None
+        and roi.image_type in (ZWOASIImageType.RAW8, ZWOASIImageType.RAW16)
+    ):
+        cards.append(
+            ("BAYERPAT", _BAYER_PATTERNS[info.bayer_pattern.name], "Bayer pattern")
+        )
+
+    completion = camera.last_exposure_completion
+
+    if completion is not None:
+        # Convert the (monotonic) start of the exposure to a UTC timestamp:
+        start = datetime.fromtimestamp(
+            time() - (monotonic() - completion["start"]), tz=timezone.utc
+        )
+
+        cards.append(
+            ("DATE-OBS", start.isoformat(timespec="milliseconds")[:23], "UTC start")
+        )
+
+        cards.append(("EXPTIME", completion["exposure_time"], "[s] exposure time"))
+
+    return cards
+
+
+# **************************************************************************************
+
+
+def write_fits(
+    destination: Union[str, Path, BinaryIO],
+    data: Buffer,
+    width: int,
+    height: int,
+    image_type: ZWOASIImageType,
+    cards: Sequence[ZWOASIFITSCard] = (),
+    chunk_size: int = ZWOASI_FITS_CHUNK_SIZE,
+) -> int:
+    """
+    Stream a raw frame, as written by the SDK, to a FITS file.
+
+    The frame is written in large chunks straight from the given buffer: RAW8 and
+    Y8 pixels without any copies, RAW16 pixels converted (a chunk at a time) to the
+    big-endian, BZERO-offset integers FITS requires, and RGB24 (BGR) pixels split
+    into R, G and B planes.
+
+    Args:
+        destination (Union[str, Path, BinaryIO]): The path of the file to (over)write,
+            or a binary file opened for writing.
+        data (Buffer): The raw frame data, e.g., a pooled frame buffer's data.
+        width (int): The width of the frame (in pixels).
+        height (int): The height of the frame (in pixels).
+        image_type (ZWOASIImageType): The image type of the frame.
+        cards (Sequence[ZWOASIFITSCard]): Additional header cards, e.g., from
+            get_fits_header_cards().
+        chunk_size (int): The size (in bytes) of each chunk written to disk.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    view = memoryview(data).cast("B")
+
+    size = get_frame_size(width, height, image_type)
+
+    if view.nbytes < size:
+        raise ValueError(
+            f"Frame buffer of {view.nbytes} bytes is smaller than the frame size {size}."
+        )
+
+    view = view[:size]
+
+    if isinstance(destination, (str, Path)):
+        with open(destination, "wb") as file:
+            return _write_fits(file, view, width, height, image_type, cards, chunk_size)
+
+    return _write_fits(destination, view, width, height, image_type, cards, chunk_size)
+
+
+# **************************************************************************************
+
+
+def _write_fits(
+    file: BinaryIO,
+    view: memoryview,
+    width: int,
+    height: int,
+    image_type: ZWOASIImageType,
+    cards: Sequence[ZWOASIFITSCard],
+    chunk_size: int,
+) -> int:
+    header = get_fits_header(width, height, image_type, cards)
+
+    written = file.write(header)
+
+    # N.B. Chunks must hold whole 16-bit pixels:
+    chunk_size = max(chunk_size - chunk_size % 2, 2)
+
+    if image_type == ZWOASIImageType.RAW16:
+        chunk = bytearray(min(chunk_size, view.nbytes))
+
+        for offset in range(0, view.nbytes, chunk_size):
+            part = view[offset : offset + chunk_size]
+
+            written += file.write(_convert_raw16(part, chunk))
+
+    elif image_type == ZWOASIImageType.RGB24:
+        # The SDK delivers BGR pixels, whereas FITS stores each channel as a plane:
+        pixels = chunk_size // 3 * 3
+
+        for channel in (2, 1, 0):
+            for offset in range(0, view.nbytes, pixels):
+                written += file.write(
+                    view[offset + channel : offset + pixels : 3].tobytes()
+                )
+
+    else:
+        for offset in range(0, view.nbytes, chunk_size):
+            written += file.write(view[offset : offset + chunk_size])
+
+    # Pad the data to a whole number of blocks:
+    remainder = view.nbytes % ZWOASI_FITS_BLOCK_SIZE
+
+    if remainder:
+        written += file.write(bytes(ZWOASI_FITS_BLOCK_SIZE - remainder))
+
+    return written
+
+
+# **************************************************************************************
+
+
+def _convert_raw16(part: memoryview, chunk: bytearray) -> Buffer:
+    """
+    Convert little-endian, unsigned 16-bit pixels to big-endian, BZERO-offset pixels.
+    """
+    n = part.nbytes
+
+    try:
+        numpy = import_numpy()
+    except ImportError:
+        # Flip the sign bit of each high byte, then swap each pixel to big-endian:
+        converted = bytearray(part)
+        converted[1::2] = converted[1::2].translate(_SIGN_FLIP)
+
+        pixels = array("H")
+        pixels.frombytes(converted)
+
+        if sys.byteorder == "little":
+            pixels.byteswap()
+
+        return pixels
+
+    # Offset and byte swap each pixel, in a single pass, into the reusable chunk:
+    numpy.bitwise_xor(
+        numpy.frombuffer(part, dtype="<u2"),
+        0x8000,
+        out=numpy.frombuffer(chunk, dtype=">u2", count=n // 2),
+        casting="unsafe",
+    )
+
+    return memoryview(chunk)[:n]
+
+
+# **************************************************************************************
+
+
+def _pad(data: bytes, fill: bytes) -> bytes:
+    remainder = len(data) % ZWOASI_FITS_BLOCK_SIZE
+
+    if remainder == 0:
+        return data
+
+    return data + fill * (ZWOASI_FITS_BLOCK_SIZE - remainder)
+
+
+# **************************************************************************************
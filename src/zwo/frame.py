@@ -0,0 +1,162 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from collections.abc import Buffer
+from types import ModuleType
+from typing import Tuple
+
+from .enums import ZWOASIImageType
+
+# **************************************************************************************
+
+
+def get_bytes_per_pixel(image_type: ZWOASIImageType) -> int:
+    """
+    Get the number of bytes the SDK writes per pixel for the given image type.
+
+    Args:
+        image_type (ZWOASIImageType): The image type of the frame.
+
+    Returns:
+        int: The number of bytes per pixel (1 for RAW8/Y8, 2 for RAW16, 3 for RGB24).
+
+    Raises:
+        ValueError: If the image type does not describe a frame format.
+    """
+    if image_type in (ZWOASIImageType.RAW8, ZWOASIImageType.Y8):
+        return 1
+
+    if image_type == ZWOASIImageType.RAW16:
+        return 2
+
+    if image_type == ZWOASIImageType.RGB24:
+        return 3
+
+    raise ValueError(f"Unsupported image type: {image_type}")
+
+
+# **************************************************************************************
+
+
+def get_frame_size(width: int, height: int, image_type: ZWOASIImageType) -> int:
+    """
+    Get the size, in bytes, of a frame with the given geometry and image type.
+
+    Args:
+        width (int): The width of the frame in pixels.
+        height (int): The height of the frame in pixels.
+        image_type (ZWOASIImageType): The image type of the frame.
+
+    Returns:
+        int: The size of the frame buffer in bytes.
+    """
+    return width * height * get_bytes_per_pixel(image_type)
+
+
+# **************************************************************************************
+
+
+def get_frame_shape(
+    width: int, height: int, image_type: ZWOASIImageType
+) -> Tuple[int, ...]:
+    """
+    Get the array shape of a frame with the given geometry and image type.
+
+    Args:
+        width (int): The width of the frame in pixels.
+        height (int): The height of the frame in pixels.
+        image_type (ZWOASIImageType): The image type of the frame.
+
+    Returns:
+        Tuple[int, ...]: (height, width) for mono frames, or (height, width, 3) for
+        RGB24 frames (N.B. the SDK delivers RGB24 pixels in BGR channel order).
+    """
+    if image_type == ZWOASIImageType.RGB24:
+        return (height, width, 3)
+
+    return (height, width)
+
+
+# **************************************************************************************
+
+
+def get_frame_dtype(image_type: ZWOASIImageType) -> str:
+    """
+    Get the NumPy dtype string for the pixels of the given image type.
+
+    Args:
+        image_type (ZWOASIImageType): The image type of the frame.
+
+    Returns:
+        str: "<u2" for RAW16 (little-endian, as delivered by the SDK), otherwise "u1".
+    """
+    return "<u2" if get_bytes_per_pixel(image_type) == 2 else "u1"
+
+
+# **************************************************************************************
+
+
+def get_frame_view(destination: Buffer, size: int) -> memoryview:
+    """
+    Get a writable byte view of the first frame of a destination buffer, e.g., a
+    slice of an mmap (or numpy.memmap) of a preallocated sequence file.
+
+    Args:
+        destination (Buffer): A writable, C-contiguous buffer of at least the frame
+            size in bytes.
+        size (int): The size of the frame (in bytes).
+
+    Returns:
+        memoryview: A view of exactly the frame size, which the SDK can write into.
+
+    Raises:
+        ValueError: If the destination is read-only, not C-contiguous or too small.
+    """
+    view = memoryview(destination)
+
+    if view.readonly:
+        view.release()
+        raise ValueError("Frame destination is read-only.")
+
+    if not view.c_contiguous:
+        view.release()
+        raise ValueError("Frame destination is not C-contiguous.")
+
+    if view.nbytes < size:
+        view.release()
+        raise ValueError(
+            f"Frame destination of {view.nbytes} bytes is smaller than the frame "
+            f"size {size}."
+        )
+
+    return view.cast("B")[:size]
+
+
+# **************************************************************************************
+
+
+def import_numpy() -> ModuleType:
+    """
+    Import NumPy on demand, as it is an optional dependency of this package.
+
+    Returns:
+        ModuleType: The numpy module.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            "NumPy is required for array frames, install it with `pip install zwo[numpy]`."
+        ) from error
+
+    return numpy
+
+
+# **************************************************************************************
@@ -5,13 +5,22 @@
 
 # **************************************************************************************
 
+from array import array
 from ctypes import Structure as c_Structure
 from ctypes import c_char, c_double, c_int
-from typing import cast
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Union, cast
 
 from pydantic import BaseModel, Field
 
-from .time import ZWOASI_CAMERA_DATE_TIME_CTYPE, ZWOASIDateTime
+from .frame import import_numpy
+from .time import (
+    ZWOASI_CAMERA_DATE_TIME_CTYPE,
+    ZWOASIDateTime,
+    ZWOASIDateTimeRecord,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
 
 # **************************************************************************************
 
@@ -86,3 +95,225 @@ class ZWOASIGPSData(BaseModel):
 
 
 # **************************************************************************************
+
+
+class ZWOASIGPSRecord(object):
+    """
+    A compact, unvalidated representation of the C struct ASI_GPS_DATA.
+
+    Unlike ZWOASIGPSData, constructing a record performs no validation and does not
+    decode the unused bytes, so it is cheap enough to create for every frame at video
+    rates. It can be converted to the validated Pydantic model with to_model().
+    """
+
+    __slots__ = (
+        "datetime",
+        "latitude",
+        "longitude",
+        "altitude",
+        "satellite_number",
+        "_unused",
+    )
+
+    datetime: ZWOASIDateTimeRecord
+    latitude: float
+    longitude: float
+    # Altitude in 0.1 m units:
+    altitude: int
+    satellite_number: int
+
+    def __init__(
+        self,
+        datetime: ZWOASIDateTimeRecord,
+        latitude: float = 0.0,
+        longitude: float = 0.0,
+        altitude: int = 0,
+        satellite_number: int = 0,
+        unused: bytes = b"",
+    ) -> None:
+        self.datetime = datetime
+        self.latitude = latitude
+        self.longitude = longitude
+        self.altitude = altitude
+        self.satellite_number = satellite_number
+        self._unused = unused
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.datetime!r}, {self.latitude}, "
+            f"{self.longitude}, {self.altitude}, {self.satellite_number})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ZWOASIGPSRecord):
+            return NotImplemented
+
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    @property
+    def unused(self) -> str:
+        """
+        The unused field, decoded (on demand) from the raw bytes.
+        """
+        return self._unused.decode("utf-8").rstrip("\x00")
+
+    @classmethod
+    def from_c_types(cls, c_gps_data: "ZWOASI_GPS_DATA_CTYPE") -> "ZWOASIGPSRecord":
+        """
+        Convert a ctypes ASI_GPS_DATA structure to a ZWOASIGPSRecord instance.
+        """
+        return cls(
+            ZWOASIDateTimeRecord.from_c_types(c_gps_data.Datetime),
+            c_gps_data.Latitude,
+            c_gps_data.Longitude,
+            c_gps_data.Altitude,
+            c_gps_data.SatelliteNum,
+            c_gps_data.Unused,
+        )
+
+    def to_model(self) -> ZWOASIGPSData:
+        """
+        Convert the record to the validated ZWOASIGPSData Pydantic model.
+        """
+        return ZWOASIGPSData(
+            datetime=self.datetime.to_model(),
+            latitude=self.latitude,
+            longitude=self.longitude,
+            altitude=self.altitude,
+            satellite_number=self.satellite_number,
+            unused=self.unused,
+        )
+
+
+# **************************************************************************************
+
+# The columns of a GPS series, and their array typecodes (int32 or float64):
+ZWOASI_GPS_SERIES_COLUMNS: Dict[str, str] = {
+    "year": "i",
+    "month": "i",
+    "day": "i",
+    "hour": "i",
+    "minute": "i",
+    "second": "i",
+    "milliseconds": "i",
+    "microseconds": "i",
+    "latitude": "d",
+    "longitude": "d",
+    "altitude": "i",
+    "satellite_number": "i",
+}
+
+# **************************************************************************************
+
+
+class ZWOASIGPSSeries(object):
+    """
+    A columnar accumulator of GPS readings, e.g., one per frame of a sequence.
+
+    Each field is appended to its own contiguous array (from the standard library
+    array module), so that a whole sequence of readings can be handed to NumPy (or
+    written to disk) without creating a Python object per reading.
+    """
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, array[Any]] = {
+            name: array(typecode)
+            for name, typecode in ZWOASI_GPS_SERIES_COLUMNS.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.columns["year"])
+
+    def __getitem__(self, index: int) -> ZWOASIGPSRecord:
+        c = self.columns
+
+        return ZWOASIGPSRecord(
+            ZWOASIDateTimeRecord(
+                c["year"][index],
+                c["month"][index],
+                c["day"][index],
+                c["hour"][index],
+                c["minute"][index],
+                c["second"][index],
+                c["milliseconds"][index],
+                c["microseconds"][index],
+            ),
+            c["latitude"][index],
+            c["longitude"][index],
+            c["altitude"][index],
+            c["satellite_number"][index],
+        )
+
+    def __iter__(self) -> Iterator[ZWOASIGPSRecord]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(
+        self, gps: Union["ZWOASI_GPS_DATA_CTYPE", ZWOASIGPSRecord, ZWOASIGPSData]
+    ) -> None:
+        """
+        Append a GPS reading to the series.
+
+        Args:
+            gps (Union[ZWOASI_GPS_DATA_CTYPE, ZWOASIGPSRecord, ZWOASIGPSData]): The
+                GPS reading, e.g., the ctypes structure filled in by the SDK.
+        """
+        c = self.columns
+
+        if isinstance(gps, ZWOASI_GPS_DATA_CTYPE):
+            d = gps.Datetime
+            c["year"].append(d.Year)
+            c["month"].append(d.Month)
+            c["day"].append(d.Day)
+            c["hour"].append(d.Hour)
+            c["minute"].append(d.Minute)
+            c["second"].append(d.Second)
+            c["milliseconds"].append(d.Msecond)
+            c["microseconds"].append(d.Usecond)
+            c["latitude"].append(gps.Latitude)
+            c["longitude"].append(gps.Longitude)
+            c["altitude"].append(gps.Altitude)
+            c["satellite_number"].append(gps.SatelliteNum)
+            return
+
+        t = gps.datetime
+        c["year"].append(t.year)
+        c["month"].append(t.month)
+        c["day"].append(t.day)
+        c["hour"].append(t.hour)
+        c["minute"].append(t.minute)
+        c["second"].append(t.second)
+        c["milliseconds"].append(t.milliseconds)
+        c["microseconds"].append(t.microseconds)
+        c["latitude"].append(gps.latitude)
+        c["longitude"].append(gps.longitude)
+        c["altitude"].append(gps.altitude)
+        c["satellite_number"].append(gps.satellite_number)
+
+    def clear(self) -> None:
+        """
+        Remove all readings from the series.
+        """
+        for name, typecode in ZWOASI_GPS_SERIES_COLUMNS.items():
+            self.columns[name] = array(typecode)
+
+    def to_arrays(self) -> Dict[str, "NDArray[Any]"]:
+        """
+        Get zero-copy NumPy views of each column of the series. Requires NumPy.
+
+        N.B. The series cannot be appended to (or cleared) whilst the views exist.
+
+        Returns:
+            Dict[str, NDArray[Any]]: The int32 or float64 array for each column.
+        """
+        numpy = import_numpy()
+
+        return {
+            name: numpy.frombuffer(column, dtype=numpy.dtype(column.typecode))
+            for name, column in self.columns.items()
+        }
+
+
+# **************************************************************************************
@@ -0,0 +1,386 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from concurrent.futures import Future
+from concurrent.futures import wait as wait_for_futures
+from heapq import heapify, heappop, heappush
+from itertools import count
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .enums import ZWOASIErrorCode, ZWOASIExposureStatus
+from .errors import errors
+from .exposure import ZWOASIExposureCompletion
+from .pool import ZWOASIFrameBuffer
+
+if TYPE_CHECKING:
+    from .camera import ZWOASICamera
+
+# **************************************************************************************
+
+
+class ZWOASIExposureHandle(object):
+    """
+    A handle onto a single exposure started without blocking the calling thread, e.g.,
+    by ZWOASICamera.start_exposure().
+
+    The exposure's completion is detected by the shared exposure monitor thread, which
+    then reads the frame into a pooled frame buffer and resolves the handle's future.
+    """
+
+    # The camera the exposure was started on:
+    camera: "ZWOASICamera"
+
+    # Whether the exposure is a 'dark' exposure (e.g. shutter closed):
+    is_dark: bool
+
+    # The time.monotonic() timestamp at which the exposure started:
+    start: float
+
+    # The exposure time (in seconds):
+    exposure_time: float
+
+    # The pooled frame buffer the frame is read into:
+    buffer: ZWOASIFrameBuffer
+
+    # The trace identifier of the exposure, as passed to its timing spans:
+    trace: int
+
+    # The future resolved with the frame buffer (or exception) of the exposure:
+    future: "Future[ZWOASIFrameBuffer]"
+
+    # The completion timings of the exposure, once it has completed:
+    completion: Optional[ZWOASIExposureCompletion] = None
+
+    def __init__(
+        self,
+        camera: "ZWOASICamera",
+        buffer: ZWOASIFrameBuffer,
+        start: float,
+        exposure_time: float,
+        is_dark: bool = False,
+        trace: int = 0,
+    ) -> None:
+        """
+        Initialise the handle of an exposure that has already been started.
+
+        Args:
+            camera (ZWOASICamera): The camera the exposure was started on.
+            buffer (ZWOASIFrameBuffer): The pooled frame buffer to read the frame into.
+            start (float): The time.monotonic() timestamp the exposure started at.
+            exposure_time (float): The exposure time (in seconds).
+            is_dark (bool): Whether the exposure is a 'dark' exposure.
+            trace (int): The trace identifier of the exposure, for its spans.
+        """
+        self.camera = camera
+
+        self.buffer = buffer
+
+        self.start = start
+
+        self.exposure_time = exposure_time
+
+        self.is_dark = is_dark
+
+        self.trace = trace
+
+        self.future = Future()
+
+        # The polling state of the exposure, as maintained by the monitor:
+        self._interval = camera.exposure_waiter.minimum_poll_interval
+
+        self._working: Optional[float] = None
+
+        self._polls = 0
+
+    def done(self) -> bool:
+        """
+        Check whether the exposure has completed, failed or been cancelled.
+
+        Returns:
+            bool: True if the exposure is done; otherwise, False.
+        """
+        return self.future.done()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the exposure to complete, fail or be cancelled.
+
+        Args:
+            timeout (Optional[float]): The maximum time (in seconds) to wait, or None
+                to wait indefinitely.
+
+        Returns:
+            bool: True if the exposure is done; otherwise (on timeout), False.
+        """
+        wait_for_futures([self.future], timeout=timeout)
+
+        return self.future.done()
+
+    def cancel(self) -> bool:
+        """
+        Cancel the exposure, stopping it in the SDK (via ASIStopExposure).
+
+        Returns:
+            bool: True if the exposure was (or had already been) cancelled; otherwise
+            False, e.g., if it had already completed (or its frame is being read out).
+
+        Raises:
+            RuntimeError: If the SDK fails to stop the exposure. The handle is still
+                cancelled, and its buffer released.
+        """
+        if self.future.cancelled():
+            return True
+
+        if not self.future.cancel():
+            return False
+
+        error: int = self.camera.lib.ASIStopExposure(self.camera.id)
+
+        # Stop monitoring the exposure, which now no longer owns the buffer:
+        get_exposure_monitor().discard(self)
+
+        self.buffer.release()
+
+        # If an error occurred, raise an exception:
+        if error != ZWOASIErrorCode.SUCCESS:
+            raise RuntimeError(
+                f"Error stopping exposure for index {self.camera.id}. Error: {errors[error]}"
+            )
+
+        return True
+
+    def cancelled(self) -> bool:
+        """
+        Check whether the exposure was cancelled.
+
+        Returns:
+            bool: True if the exposure was cancelled; otherwise, False.
+        """
+        return self.future.cancelled()
+
+    def result(self, timeout: Optional[float] = None) -> ZWOASIFrameBuffer:
+        """
+        Wait for, and return, the frame of the exposure.
+
+        Args:
+            timeout (Optional[float]): The maximum time (in seconds) to wait, or None
+                to wait indefinitely.
+
+        Returns:
+            ZWOASIFrameBuffer: The pooled frame buffer holding the raw frame, which
+            must be released after use.
+
+        Raises:
+            ZWOASIExposureError: If the exposure failed (or was stopped).
+            concurrent.futures.CancelledError: If the exposure was cancelled.
+            concurrent.futures.TimeoutError: If the exposure is not done in time.
+        """
+        return self.future.result(timeout=timeout)
+
+
+# **************************************************************************************
+
+
+class ZWOASIExposureMonitor(object):
+    """
+    Detects the completion of many exposures (on any number of cameras) from a single
+    background thread.
+
+    Each exposure is scheduled at its expected end time (the exposure time plus its
+    camera's readout time estimate), and then polled with a bounded, exponentially
+    increasing interval, as per ZWOASIExposureWaiter. In between, the thread sleeps
+    until the earliest deadline of all of the pending exposures.
+
+    N.B. Completed frames are read out on the monitor thread, so the readouts of
+    exposures which complete at the same time are serialised.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise the monitor. The thread is started with the first exposure.
+        """
+        self._condition = Condition()
+
+        # The pending exposures, ordered by their next poll deadline:
+        self._pending: List[Tuple[float, int, ZWOASIExposureHandle]] = []
+
+        # A tie-breaker, so that handles with equal deadlines are never compared:
+        self._sequence = count()
+
+        self._thread: Optional[Thread] = None
+
+    def add(self, handle: ZWOASIExposureHandle) -> None:
+        """
+        Monitor a started exposure, until it is done.
+
+        Args:
+            handle (ZWOASIExposureHandle): The handle of the started exposure.
+        """
+        waiter = handle.camera.exposure_waiter
+
+        expected = handle.start + handle.exposure_time + waiter.readout_time
+
+        with self._condition:
+            self._schedule(expected, handle)
+
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name="zwo-exposure-monitor", daemon=True
+                )
+                self._thread.start()
+
+    def discard(self, handle: ZWOASIExposureHandle) -> None:
+        """
+        Stop monitoring an exposure, e.g., once it has been cancelled.
+
+        Args:
+            handle (ZWOASIExposureHandle): The handle of the exposure.
+        """
+        with self._condition:
+            pending = [entry for entry in self._pending if entry[2] is not handle]
+
+            if len(pending) != len(self._pending):
+                heapify(pending)
+                self._pending = pending
+
+    def get_pending(self) -> int:
+        """
+        Get the number of exposures being monitored.
+
+        Returns:
+            int: The number of pending exposures.
+        """
+        with self._condition:
+            return len(self._pending)
+
+    def _schedule(self, deadline: float, handle: ZWOASIExposureHandle) -> None:
+        # N.B. The condition must be held by the caller:
+        heappush(self._pending, (deadline, next(self._sequence), handle))
+
+        # Wake the thread, in case the deadline is earlier than the one it awaits:
+        self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if not self._pending:
+                        self._condition.wait()
+                        continue
+
+                    remaining = self._pending[0][0] - monotonic()
+
+                    if remaining <= 0:
+                        break
+
+                    self._condition.wait(remaining)
+
+                _, _, handle = heappop(self._pending)
+
+            # Poll (and, if complete, read out) the exposure without the lock held,
+            # so that exposures can be started whilst a frame is being read out:
+            deadline = self._poll(handle)
+
+            if deadline is not None:
+                with self._condition:
+                    self._schedule(deadline, handle)
+
+    def _poll(self, handle: ZWOASIExposureHandle) -> Optional[float]:
+        """
+        Poll the status of an exposure, completing it if it is no longer in progress.
+
+        Returns:
+            Optional[float]: The time.monotonic() deadline of the next poll, or None if
+            the exposure is done.
+        """
+        if handle.future.cancelled():
+            return None
+
+        camera = handle.camera
+
+        try:
+            status = camera.get_acquisition_status()
+        except Exception as exception:
+            if handle.future.set_running_or_notify_cancel():
+                handle.buffer.release()
+                handle.future.set_exception(exception)
+            return None
+
+        now = monotonic()
+
+        handle._polls += 1
+
+        if status == ZWOASIExposureStatus.WORKING:
+            handle._working = now
+
+            deadline = now + handle._interval
+
+            # Back off exponentially, bounded by the poll interval ceiling:
+            handle._interval = min(
+                handle._interval * 2, camera.exposure_waiter.maximum_poll_interval
+            )
+
+            return deadline
+
+        # Claim the exposure, unless it has been cancelled in the meantime:
+        if not handle.future.set_running_or_notify_cancel():
+            return None
+
+        try:
+            handle.completion = camera.exposure_waiter.complete(
+                status,
+                handle.start,
+                handle.exposure_time,
+                handle._working,
+                now,
+                handle._polls,
+            )
+
+            if camera.tracer is not None:
+                camera._emit_span("wait", handle.start, now, trace=handle.trace)
+
+            camera._complete_exposure(handle.completion)
+
+            camera._get_exposure_data(handle.buffer.data, trace=handle.trace)
+        except Exception as exception:
+            handle.buffer.release()
+            handle.future.set_exception(exception)
+        else:
+            handle.future.set_result(handle.buffer)
+
+        return None
+
+
+# **************************************************************************************
+
+# The exposure monitor shared by every camera in the process:
+_monitor: Optional[ZWOASIExposureMonitor] = None
+
+_monitor_lock = Lock()
+
+# **************************************************************************************
+
+
+def get_exposure_monitor() -> ZWOASIExposureMonitor:
+    """
+    Get the exposure monitor shared by every camera in the process.
+
+    Returns:
+        ZWOASIExposureMonitor: The shared exposure monitor.
+    """
+    global _monitor
+
+    with _monitor_lock:
+        if _monitor is None:
+            _monitor = ZWOASIExposureMonitor()
+
+    return _monitor
+
+
+# **************************************************************************************
@@ -0,0 +1,299 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from bisect import bisect_left
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict
+
+from .enums import ZWOASIErrorCode
+
+# **************************************************************************************
+
+# The upper bounds (in seconds) of the SDK call latency histogram buckets, where the
+# final (implicit) bucket is +Inf:
+ZWOASI_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.000001,
+    0.0000025,
+    0.000005,
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# **************************************************************************************
+
+# The SDK functions which are not passed a camera ID:
+ZWOASI_SDK_FUNCTIONS_WITHOUT_CAMERA_ID = frozenset(
+    {
+        "ASIGetNumOfConnectedCameras",
+        "ASICameraCheck",
+        "ASIGetSDKVersion",
+    }
+)
+
+# The SDK functions which do not return an ASI_ERROR_CODE, e.g., a count or pointer:
+ZWOASI_SDK_FUNCTIONS_WITHOUT_ERROR_CODE = ZWOASI_SDK_FUNCTIONS_WITHOUT_CAMERA_ID
+
+# **************************************************************************************
+
+
+class ZWOASISDKCallStatistics(TypedDict):
+    # The name of the SDK function, e.g., "ASIGetVideoData":
+    function: str
+    # The camera ID the function was called for, or None if not applicable:
+    camera: Optional[int]
+    # The number of calls made:
+    count: int
+    # The number of calls which returned each (non-SUCCESS) error, keyed by name:
+    errors: Dict[str, int]
+    # The total time (in seconds) spent in the function:
+    total: float
+    # The mean time (in seconds) spent in each call:
+    mean: float
+    # The shortest call (in seconds):
+    minimum: float
+    # The longest call (in seconds):
+    maximum: float
+    # The cumulative number of calls within each of ZWOASI_LATENCY_BUCKETS:
+    buckets: List[int]
+
+
+# **************************************************************************************
+
+
+class ZWOASISDKCallRecorder(object):
+    """
+    The (mutable) call statistics of one SDK function for one camera.
+    """
+
+    __slots__ = ("count", "errors", "total", "minimum", "maximum", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors: Dict[int, int] = {}
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+        # N.B. The final bucket counts the calls slower than every bound (+Inf):
+        self.buckets = [0] * (len(ZWOASI_LATENCY_BUCKETS) + 1)
+
+    def record(self, latency: float, error: Optional[int]) -> None:
+        self.count += 1
+        self.total += latency
+
+        if latency < self.minimum:
+            self.minimum = latency
+
+        if latency > self.maximum:
+            self.maximum = latency
+
+        self.buckets[bisect_left(ZWOASI_LATENCY_BUCKETS, latency)] += 1
+
+        if error is not None and error != ZWOASIErrorCode.SUCCESS:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def merge(self, other: "ZWOASISDKCallRecorder") -> None:
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+        for i, count in enumerate(other.buckets):
+            self.buckets[i] += count
+
+        for error, count in other.errors.items():
+            self.errors[error] = self.errors.get(error, 0) + count
+
+    def to_statistics(
+        self, function: str, camera: Optional[int]
+    ) -> ZWOASISDKCallStatistics:
+        cumulative: List[int] = []
+
+        total = 0
+
+        for count in self.buckets[:-1]:
+            total += count
+            cumulative.append(total)
+
+        return ZWOASISDKCallStatistics(
+            function=function,
+            camera=camera,
+            count=self.count,
+            errors={_get_error_name(error): n for error, n in self.errors.items()},
+            total=self.total,
+            mean=self.total / self.count if self.count else 0.0,
+            minimum=self.minimum if self.count else 0.0,
+            maximum=self.maximum,
+            buckets=cumulative,
+        )
+
+
+# **************************************************************************************
+
+
+class ZWOASISDKInstrumentation(object):
+    """
+    Records the call counts, error codes and latency histograms of SDK functions,
+    per function and per camera ID.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+
+        self._recorders: Dict[Tuple[str, Optional[int]], ZWOASISDKCallRecorder] = {}
+
+    def record(
+        self,
+        function: str,
+        camera: Optional[int],
+        latency: float,
+        error: Optional[int] = None,
+    ) -> None:
+        """
+        Record a single call to an SDK function.
+
+        Args:
+            function (str): The name of the SDK function, e.g., "ASIGetExpStatus".
+            camera (Optional[int]): The camera ID, or None if not applicable.
+            latency (float): The duration (in seconds) of the call.
+            error (Optional[int]): The returned error code, or None if the function
+                does not return an error code.
+        """
+        key = (function, camera)
+
+        with self._lock:
+            recorder = self._recorders.get(key)
+
+            if recorder is None:
+                recorder = self._recorders[key] = ZWOASISDKCallRecorder()
+
+            recorder.record(latency, error)
+
+    def wrap(self, name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap an SDK function, so that every call to it is recorded.
+
+        Args:
+            name (str): The name of the SDK function, e.g., "ASIGetVideoData".
+            function (Callable[..., Any]): The (ctypes) function to wrap.
+
+        Returns:
+            Callable[..., Any]: The wrapped function.
+        """
+        # The position of the camera ID in the function's arguments, if any:
+        index: Optional[int] = (
+            None
+            if name in ZWOASI_SDK_FUNCTIONS_WITHOUT_CAMERA_ID
+            else 1
+            if name == "ASIGetCameraProperty"
+            else 0
+        )
+
+        has_error_code = name not in ZWOASI_SDK_FUNCTIONS_WITHOUT_ERROR_CODE
+
+        record = self.record
+
+        def call(*args: Any) -> Any:
+            began = perf_counter()
+
+            result = function(*args)
+
+            latency = perf_counter() - began
+
+            camera = (
+                _get_camera_id(args[index])
+                if index is not None and index < len(args)
+                else None
+            )
+
+            record(name, camera, latency, result if has_error_code else None)
+
+            return result
+
+        call.__name__ = name
+
+        call.__wrapped__ = function  # type: ignore[attr-defined]
+
+        return call
+
+    def get_snapshot(self, per_camera: bool = True) -> List[ZWOASISDKCallStatistics]:
+        """
+        Get a snapshot of the recorded call statistics.
+
+        Args:
+            per_camera (bool): Whether to report each camera separately, or to
+                aggregate the statistics of each function across every camera.
+
+        Returns:
+            List[ZWOASISDKCallStatistics]: The statistics, sorted by function name.
+        """
+        with self._lock:
+            recorders: Dict[Tuple[str, Optional[int]], ZWOASISDKCallRecorder] = {}
+
+            for (function, camera), recorder in self._recorders.items():
+                key = (function, camera if per_camera else None)
+
+                merged = recorders.get(key)
+
+                if merged is None:
+                    merged = recorders[key] = ZWOASISDKCallRecorder()
+
+                merged.merge(recorder)
+
+        return [
+            recorder.to_statistics(function, camera)
+            for (function, camera), recorder in sorted(
+                recorders.items(), key=lambda item: (item[0][0], item[0][1] or -1)
+            )
+        ]
+
+    def reset(self) -> None:
+        """
+        Discard all of the recorded call statistics.
+        """
+        with self._lock:
+            self._recorders.clear()
+
+
+# **************************************************************************************
+
+
+def _get_camera_id(argument: Any) -> Optional[int]:
+    try:
+        return int(getattr(argument, "value", argument))
+    except (TypeError, ValueError):
+        return None
+
+
+# **************************************************************************************
+
+
+def _get_error_name(error: int) -> str:
+    try:
+        return ZWOASIErrorCode(error).name
+    except ValueError:
+        return str(error)
+
+
+# **************************************************************************************
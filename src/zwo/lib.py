@@ -8,13 +8,77 @@
 from ctypes import CDLL, POINTER, c_char, c_int, c_long, cdll
 from ctypes.util import find_library
 from pathlib import Path
-from typing import Optional, Tuple
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict
 
 from .capabilities import ZWOASI_CAMERA_CAPABILITIES_CTYPE
 from .gps import ZWOASI_GPS_DATA_CTYPE
 from .info import ZWOASI_CAMERA_INFORMATION_CTYPE
+from .instrumentation import ZWOASISDKCallStatistics, ZWOASISDKInstrumentation
 from .mode import ZWOASI_CAMERA_SUPPORTED_MODE_CTYPE
 from .utils import get_asi_libary_path
+from .version import ZWOASI_SDK_VERSION
+
+# **************************************************************************************
+
+
+# The SDK functions configured by ZWOASICameraLib._configure():
+ZWOASI_SDK_FUNCTIONS: Tuple[str, ...] = (
+    "ASIGetNumOfConnectedCameras",
+    "ASICameraCheck",
+    "ASIGetCameraProperty",
+    "ASIOpenCamera",
+    "ASIInitCamera",
+    "ASICloseCamera",
+    "ASIGetID",
+    "ASIGetNumOfControls",
+    "ASIGetControlCaps",
+    "ASIGetControlValue",
+    "ASISetControlValue",
+    "ASIGetROIFormat",
+    "ASISetROIFormat",
+    "ASIGetStartPos",
+    "ASISetStartPos",
+    "ASIGetDroppedFrames",
+    "ASIEnableDarkSubtract",
+    "ASIDisableDarkSubtract",
+    "ASIStartVideoCapture",
+    "ASIStopVideoCapture",
+    "ASIGetVideoData",
+    "ASIPulseGuideOn",
+    "ASIPulseGuideOff",
+    "ASIStartExposure",
+    "ASIStopExposure",
+    "ASIGetExpStatus",
+    "ASIGetDataAfterExp",
+    "ASIGetGainOffset",
+    "ASIGetCameraMode",
+    "ASISetCameraMode",
+    "ASIGetCameraSupportMode",
+    "ASISendSoftTrigger",
+    "ASIGetTriggerOutputIOConf",
+    "ASISetTriggerOutputIOConf",
+    "ASIGetSDKVersion",
+    "ASIGetSerialNumber",
+    "ASIGPSGetData",
+    "ASIGetDataAfterExpGPS",
+    "ASIGetVideoDataGPS",
+)
+
+# **************************************************************************************
+
+
+class ZWOASICameraLibTiming(TypedDict):
+    # The time (in seconds) taken to locate the library file on disk:
+    resolve: float
+    # The time (in seconds) taken to load the library with ctypes:
+    load: float
+    # The time (in seconds) taken to configure the ctypes function prototypes:
+    configure: float
+    # The total time (in seconds) taken to set up the library:
+    total: float
+
 
 # **************************************************************************************
 
@@ -22,7 +86,18 @@ from .utils import get_asi_libary_path
 class ZWOASICameraLib:
     lib: Optional[CDLL] = None
 
+    # The time taken by each stage of setting up the library:
+    timing: ZWOASICameraLibTiming
+
+    # The per-SDK-call instrumentation, if enabled:
+    instrumentation: Optional[ZWOASISDKInstrumentation] = None
+
+    # The original (uninstrumented) SDK functions, whilst instrumentation is enabled:
+    _uninstrumented: Dict[str, Callable[..., Any]] = {}
+
     def __init__(self, version: Tuple[int, int, int]) -> None:
+        began = perf_counter()
+
         # Extract the semantic version provided, whereby we ignore patch versions:
         # Internally, we maintain the {major}.{minor} version to be the latest patch.
         major, minor, _ = version
@@ -51,12 +126,102 @@ class ZWOASICameraLib:
                 "ASICamera2 library not found via SDK path or system lookup."
             )
 
+        resolved = perf_counter()
+
         self.lib = cdll.LoadLibrary(name=where.as_posix())
 
+        loaded = perf_counter()
+
         # We now have loaded the SDK, so we can begin to configure the C types
         # needed to interop with the C SDK:
         self._configure()
 
+        configured = perf_counter()
+
+        self.timing = ZWOASICameraLibTiming(
+            resolve=resolved - began,
+            load=loaded - resolved,
+            configure=configured - loaded,
+            total=configured - began,
+        )
+
+    def enable_instrumentation(
+        self, instrumentation: Optional[ZWOASISDKInstrumentation] = None
+    ) -> ZWOASISDKInstrumentation:
+        """
+        Enable the per-SDK-call instrumentation, which records the call counts, error
+        codes and latency histograms of each SDK function, per camera ID.
+
+        Each configured SDK function is replaced (in place) by a recording wrapper,
+        so that every camera sharing this library is instrumented, and the original
+        functions are restored when instrumentation is disabled, such that there is
+        no overhead at all whilst instrumentation is disabled.
+
+        Args:
+            instrumentation (Optional[ZWOASISDKInstrumentation]): The instrumentation
+                to record calls with. Defaults to a new instrumentation instance.
+
+        Returns:
+            ZWOASISDKInstrumentation: The enabled instrumentation.
+        """
+        if not self.lib:
+            raise RuntimeError("Library not loaded.")
+
+        if self.instrumentation is not None:
+            return self.instrumentation
+
+        instrumentation = instrumentation or ZWOASISDKInstrumentation()
+
+        uninstrumented: Dict[str, Callable[..., Any]] = {}
+
+        for name in ZWOASI_SDK_FUNCTIONS:
+            function = getattr(self.lib, name, None)
+
+            # N.B. Older versions of the SDK may not export every function:
+            if function is None:
+                continue
+
+            uninstrumented[name] = function
+
+            setattr(self.lib, name, instrumentation.wrap(name, function))
+
+        self._uninstrumented = uninstrumented
+
+        self.instrumentation = instrumentation
+
+        return instrumentation
+
+    def disable_instrumentation(self) -> None:
+        """
+        Disable the per-SDK-call instrumentation, restoring the original functions.
+        """
+        if self.lib:
+            for name, function in self._uninstrumented.items():
+                setattr(self.lib, name, function)
+
+        self._uninstrumented = {}
+
+        self.instrumentation = None
+
+    def get_instrumentation_snapshot(
+        self, per_camera: bool = True
+    ) -> List[ZWOASISDKCallStatistics]:
+        """
+        Get a snapshot of the per-SDK-call statistics recorded whilst instrumented.
+
+        Args:
+            per_camera (bool): Whether to report each camera separately, or to
+                aggregate the statistics of each function across every camera.
+
+        Returns:
+            List[ZWOASISDKCallStatistics]: The statistics, or an empty list if
+            instrumentation is not enabled.
+        """
+        if self.instrumentation is None:
+            return []
+
+        return self.instrumentation.get_snapshot(per_camera=per_camera)
+
     def _configure(self) -> None:
         if not self.lib:
             raise RuntimeError("Library not loaded.")
@@ -339,3 +504,103 @@ class ZWOASICameraLib:
 
 
 # **************************************************************************************
+
+
+# The process-wide cache of configured SDK libraries, keyed by {major}.{minor}:
+_libraries: Dict[Tuple[int, int], ZWOASICameraLib] = {}
+
+# Guards the one-time setup of each library in the cache:
+_libraries_lock = Lock()
+
+# **************************************************************************************
+
+
+def get_asi_camera_lib(
+    version: Tuple[int, int, int] = ZWOASI_SDK_VERSION,
+) -> ZWOASICameraLib:
+    """
+    Get the process-wide, shared ZWO ASICamera SDK library for the given version.
+
+    The library is located, loaded and configured once per process (on first use),
+    and every subsequent call returns the same configured instance.
+
+    Args:
+        version (Tuple[int, int, int]): The SDK version, e.g., (1, 37, 0).
+
+    Returns:
+        ZWOASICameraLib: The shared, configured library.
+
+    Raises:
+        FileNotFoundError: If the SDK library could not be found.
+    """
+    major, minor, _ = version
+
+    key = (major, minor)
+
+    # The fast path, once the library has been set up, avoids taking the lock:
+    library = _libraries.get(key)
+
+    if library is not None:
+        return library
+
+    with _libraries_lock:
+        # Another thread may have set up the library whilst we waited on the lock:
+        library = _libraries.get(key)
+
+        if library is None:
+            library = ZWOASICameraLib(version=version)
+            _libraries[key] = library
+
+        return library
+
+
+# **************************************************************************************
+
+
+def set_asi_camera_lib(
+    library: Optional[ZWOASICameraLib],
+    version: Tuple[int, int, int] = ZWOASI_SDK_VERSION,
+) -> Optional[ZWOASICameraLib]:
+    """
+    Set (or, if None, clear) the process-wide, shared SDK library for the given
+    version, e.g., to substitute a simulated SDK for libASICamera2.
+
+    Args:
+        library (Optional[ZWOASICameraLib]): The library to share, or None to clear
+            the shared library, so that it is set up again on next use.
+        version (Tuple[int, int, int]): The SDK version, e.g., (1, 37, 0).
+
+    Returns:
+        Optional[ZWOASICameraLib]: The previously shared library (if any), e.g., so
+        that it can be restored afterwards.
+    """
+    major, minor, _ = version
+
+    with _libraries_lock:
+        previous = _libraries.pop((major, minor), None)
+
+        if library is not None:
+            _libraries[(major, minor)] = library
+
+        return previous
+
+
+# **************************************************************************************
+
+
+def prewarm_asi_camera_lib(
+    version: Tuple[int, int, int] = ZWOASI_SDK_VERSION,
+) -> ZWOASICameraLibTiming:
+    """
+    Set up the shared SDK library ahead of its first use, e.g., at daemon start up.
+
+    Args:
+        version (Tuple[int, int, int]): The SDK version, e.g., (1, 37, 0).
+
+    Returns:
+        ZWOASICameraLibTiming: The time taken by each stage of the (one-time) setup.
+    """
+    return get_asi_camera_lib(version=version).timing
+
+
+# **************************************************************************************
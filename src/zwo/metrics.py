@@ -0,0 +1,440 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Event, Lock, Thread
+from time import monotonic, time
+from typing import Dict, List, Optional, Sequence, Tuple, TypedDict
+
+from .camera import ZWOASICamera
+from .lib import get_asi_camera_lib
+from .version import ZWOASI_SDK_VERSION
+
+# **************************************************************************************
+
+# The content type of the OpenMetrics text exposition format:
+ZWOASI_OPENMETRICS_CONTENT_TYPE: str = (
+    "application/openmetrics-text; version=1.0.0; charset=utf-8"
+)
+
+# **************************************************************************************
+
+
+class ZWOASICameraMetrics(TypedDict):
+    # The camera's index:
+    camera: int
+    # The camera's name:
+    name: str
+    # The (UNIX) time at which the metrics were sampled:
+    timestamp: float
+    # The number of frames captured since the camera was created:
+    frames_captured: int
+    # The total exposure time (in seconds) of the completed exposures:
+    exposed_time: float
+    # The fraction of the last sampling interval spent exposing:
+    exposure_duty_cycle: float
+    # The number of frames dropped by the SDK during the current video capture:
+    dropped_frames: int
+    # The sensor temperature (in °C), if it could be read:
+    temperature: Optional[float]
+    # The cooler power (as a percentage), if the camera has a cooler:
+    cooler_power: Optional[float]
+    # The number of SDK calls which returned each error (requires instrumentation):
+    sdk_errors: Dict[str, int]
+    # The number of failed attempts to sample the camera's metrics:
+    sample_errors: int
+
+
+# **************************************************************************************
+
+
+class ZWOASIMetricsCollector(object):
+    """
+    Samples camera telemetry and throughput on a background schedule, and caches the
+    samples, so that they can be served (e.g., scraped in the OpenMetrics text
+    format) without ever calling into the SDK on the scraping thread.
+
+    N.B. SDK error counts are only available whilst the SDK call instrumentation is
+    enabled, e.g., with get_asi_camera_lib().enable_instrumentation().
+    """
+
+    # The cameras to sample:
+    cameras: List[ZWOASICamera]
+
+    # The interval (in seconds) between samples:
+    interval: float
+
+    def __init__(self, cameras: Sequence[ZWOASICamera], interval: float = 5.0) -> None:
+        """
+        Initialise the metrics collector.
+
+        Args:
+            cameras (Sequence[ZWOASICamera]): The (connected) cameras to sample.
+            interval (float): The interval (in seconds) between samples.
+        """
+        if interval <= 0:
+            raise ValueError("The sampling interval must be positive.")
+
+        self.cameras = list(cameras)
+
+        self.interval = interval
+
+        self._lock = Lock()
+
+        self._samples: Dict[int, ZWOASICameraMetrics] = {}
+
+        # The (time.monotonic(), exposed time) of the previous sample of each camera:
+        self._previous: Dict[int, Tuple[float, float]] = {}
+
+        self._sample_errors: Dict[int, int] = {}
+
+        self._stopped = Event()
+
+        self._thread: Optional[Thread] = None
+
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def __enter__(self) -> "ZWOASIMetricsCollector":
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def sample(self) -> List[ZWOASICameraMetrics]:
+        """
+        Sample the metrics of every camera, updating the cached samples.
+
+        N.B. This calls into the SDK, and so is usually run on the sampling thread.
+
+        Returns:
+            List[ZWOASICameraMetrics]: The new samples.
+        """
+        errors = self._get_sdk_errors()
+
+        samples = [
+            self._sample_camera(camera, errors.get(camera.id, {}))
+            for camera in self.cameras
+        ]
+
+        with self._lock:
+            for sample in samples:
+                self._samples[sample["camera"]] = sample
+
+        return samples
+
+    def get_metrics(self) -> List[ZWOASICameraMetrics]:
+        """
+        Get the most recently cached samples, without calling into the SDK.
+
+        Returns:
+            List[ZWOASICameraMetrics]: The cached samples, ordered by camera index.
+        """
+        with self._lock:
+            return [self._samples[id] for id in sorted(self._samples)]
+
+    def render(self) -> str:
+        """
+        Render the cached samples in the OpenMetrics text exposition format.
+
+        Returns:
+            str: The OpenMetrics exposition, terminated by "# EOF".
+        """
+        samples = self.get_metrics()
+
+        lines: List[str] = []
+
+        def add(
+            name: str,
+            kind: str,
+            unit: str,
+            help: str,
+            values: List[Tuple[Dict[str, str], float]],
+        ) -> None:
+            lines.append(f"# TYPE {name} {kind}")
+
+            if unit:
+                lines.append(f"# UNIT {name} {unit}")
+
+            lines.append(f"# HELP {name} {help}")
+
+            suffix = "_total" if kind == "counter" else ""
+
+            for labels, value in values:
+                lines.append(f"{name}{suffix}{_format_labels(labels)} {value!r}")
+
+        def get_labels(sample: ZWOASICameraMetrics) -> Dict[str, str]:
+            return {"camera": str(sample["camera"]), "name": sample["name"]}
+
+        add(
+            "zwoasi_frames_captured",
+            "counter",
+            "",
+            "The number of frames captured.",
+            [(get_labels(s), float(s["frames_captured"])) for s in samples],
+        )
+
+        add(
+            "zwoasi_exposure_seconds",
+            "counter",
+            "seconds",
+            "The total exposure time of the completed exposures.",
+            [(get_labels(s), s["exposed_time"]) for s in samples],
+        )
+
+        add(
+            "zwoasi_exposure_duty_cycle_ratio",
+            "gauge",
+            "ratio",
+            "The fraction of the last sampling interval spent exposing.",
+            [(get_labels(s), s["exposure_duty_cycle"]) for s in samples],
+        )
+
+        add(
+            "zwoasi_dropped_frames",
+            "gauge",
+            "",
+            "The number of frames dropped by the SDK during the current video capture.",
+            [(get_labels(s), float(s["dropped_frames"])) for s in samples],
+        )
+
+        add(
+            "zwoasi_sensor_temperature_celsius",
+            "gauge",
+            "celsius",
+            "The sensor temperature.",
+            [
+                (get_labels(s), s["temperature"])
+                for s in samples
+                if s["temperature"] is not None
+            ],
+        )
+
+        add(
+            "zwoasi_cooler_power_percent",
+            "gauge",
+            "percent",
+            "The cooler power.",
+            [
+                (get_labels(s), s["cooler_power"])
+                for s in samples
+                if s["cooler_power"] is not None
+            ],
+        )
+
+        add(
+            "zwoasi_sdk_errors",
+            "counter",
+            "",
+            "The number of SDK calls which returned an error.",
+            [
+                ({**get_labels(s), "error": error}, float(count))
+                for s in samples
+                for error, count in sorted(s["sdk_errors"].items())
+            ],
+        )
+
+        add(
+            "zwoasi_sample_errors",
+            "counter",
+            "",
+            "The number of failed attempts to sample the camera's metrics.",
+            [(get_labels(s), float(s["sample_errors"])) for s in samples],
+        )
+
+        add(
+            "zwoasi_sample_timestamp_seconds",
+            "gauge",
+            "seconds",
+            "The (UNIX) time at which the camera's metrics were last sampled.",
+            [(get_labels(s), s["timestamp"]) for s in samples],
+        )
+
+        lines.append("# EOF")
+
+        return "\n".join(lines) + "\n"
+
+    def start(self) -> None:
+        """
+        Start sampling the cameras on a background thread.
+        """
+        if self._thread is not None:
+            return
+
+        self._stopped.clear()
+
+        self._thread = Thread(
+            target=self._run, name="zwoasi-metrics-sampler", daemon=True
+        )
+
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop sampling the cameras, waiting for the sampling thread to exit.
+        """
+        self._stopped.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def serve(self, host: str = "127.0.0.1", port: int = 9464) -> ThreadingHTTPServer:
+        """
+        Serve the cached samples, in the OpenMetrics text format, from a local HTTP
+        endpoint (at /metrics) on a background thread, starting the sampler if needed.
+
+        Args:
+            host (str): The host (interface) to bind to.
+            port (int): The port to bind to, or 0 for any free port.
+
+        Returns:
+            ThreadingHTTPServer: The running HTTP server.
+        """
+        if self._server is not None:
+            return self._server
+
+        collector = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+
+                body = collector.render().encode("utf-8")
+
+                self.send_response(200)
+                self.send_header("Content-Type", ZWOASI_OPENMETRICS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+
+        self._server.daemon_threads = True
+
+        Thread(
+            target=self._server.serve_forever,
+            name="zwoasi-metrics-server",
+            daemon=True,
+        ).start()
+
+        self.start()
+
+        return self._server
+
+    def close(self) -> None:
+        """
+        Stop the HTTP server (if serving), and the sampling thread.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self.sample()
+
+            self._stopped.wait(self.interval)
+
+    def _sample_camera(
+        self, camera: ZWOASICamera, sdk_errors: Dict[str, int]
+    ) -> ZWOASICameraMetrics:
+        now = monotonic()
+
+        frames_captured, exposed_time = camera.get_capture_counters()
+
+        previous = self._previous.get(camera.id)
+
+        self._previous[camera.id] = (now, exposed_time)
+
+        duty_cycle = 0.0
+
+        if previous is not None and now > previous[0]:
+            duty_cycle = min((exposed_time - previous[1]) / (now - previous[0]), 1.0)
+
+        with self._lock:
+            sample = self._samples.get(camera.id)
+
+        dropped_frames = sample["dropped_frames"] if sample else 0
+        temperature = sample["temperature"] if sample else None
+        cooler_power = sample["cooler_power"] if sample else None
+
+        if camera.is_connected():
+            try:
+                dropped_frames = camera.get_dropped_frames()
+                temperature = camera.get_temperature()
+                cooler_power = (
+                    camera.get_cooler_power() if camera.has_cooler() else None
+                )
+            except RuntimeError:
+                # Keep the last known values, and count the failure:
+                self._sample_errors[camera.id] = (
+                    self._sample_errors.get(camera.id, 0) + 1
+                )
+
+        return ZWOASICameraMetrics(
+            camera=camera.id,
+            name=camera.info.name,
+            timestamp=time(),
+            frames_captured=frames_captured,
+            exposed_time=exposed_time,
+            exposure_duty_cycle=max(duty_cycle, 0.0),
+            dropped_frames=dropped_frames,
+            temperature=temperature,
+            cooler_power=cooler_power,
+            sdk_errors=sdk_errors,
+            sample_errors=self._sample_errors.get(camera.id, 0),
+        )
+
+    def _get_sdk_errors(self) -> Dict[int, Dict[str, int]]:
+        # The SDK error counts, per camera, summed across every SDK function:
+        errors: Dict[int, Dict[str, int]] = {}
+
+        try:
+            library = get_asi_camera_lib(version=ZWOASI_SDK_VERSION)
+        except FileNotFoundError:
+            return errors
+
+        for statistics in library.get_instrumentation_snapshot():
+            camera = statistics["camera"]
+
+            if camera is None:
+                continue
+
+            counts = errors.setdefault(camera, {})
+
+            for error, count in statistics["errors"].items():
+                counts[error] = counts.get(error, 0) + count
+
+        return errors
+
+
+# **************************************************************************************
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    escaped = (f'{key}="{_escape_label_value(value)}"' for key, value in labels.items())
+
+    return "{" + ",".join(escaped) + "}"
+
+
+# **************************************************************************************
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# **************************************************************************************
@@ -0,0 +1,270 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from mmap import mmap
+from threading import Lock
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, TypedDict, Union
+
+from .enums import ZWOASIImageType
+from .frame import get_frame_dtype, get_frame_shape, get_frame_size, import_numpy
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# **************************************************************************************
+
+# A frame buffer is either a plain bytearray, or an anonymous (page-aligned) mapping:
+ZWOASIFrameBufferData = Union[bytearray, mmap]
+
+# **************************************************************************************
+
+
+class ZWOASIFrameBufferPoolStatistics(TypedDict):
+    # The number of acquisitions served from a previously released buffer:
+    hits: int
+    # The number of acquisitions that required a new allocation:
+    misses: int
+    # The total number of bytes allocated by the pool since creation:
+    bytes_allocated: int
+    # The number of idle buffers currently held by the pool:
+    available: int
+
+
+# **************************************************************************************
+
+
+class ZWOASIFrameBuffer(object):
+    """
+    A writable frame buffer handed out by a ZWOASIFrameBufferPool.
+
+    The buffer is sized for the ROI format it was acquired for. Once the consumer
+    is finished with the frame, it should call release() (or use the buffer as a
+    context manager) so that the memory can be recycled for a subsequent frame.
+
+    N.B. Any views (e.g., from to_array()) must not be used after release().
+    """
+
+    # The underlying writable memory for the frame:
+    data: ZWOASIFrameBufferData
+
+    # The width of the frame (in pixels):
+    width: int
+
+    # The height of the frame (in pixels):
+    height: int
+
+    # The image type of the frame:
+    image_type: ZWOASIImageType
+
+    def __init__(
+        self,
+        pool: "ZWOASIFrameBufferPool",
+        data: ZWOASIFrameBufferData,
+        width: int,
+        height: int,
+        image_type: ZWOASIImageType,
+    ) -> None:
+        self._pool = pool
+        self.data = data
+        self.width = width
+        self.height = height
+        self.image_type = image_type
+        self._is_released = False
+
+    def __enter__(self) -> "ZWOASIFrameBuffer":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.release()
+
+    @property
+    def size(self) -> int:
+        """
+        The size of the frame buffer, in bytes.
+        """
+        return len(self.data)
+
+    @property
+    def key(self) -> Tuple[int, int, ZWOASIImageType]:
+        """
+        The ROI format key, e.g., (width, height, image type), of the buffer.
+        """
+        return self.width, self.height, self.image_type
+
+    @property
+    def is_released(self) -> bool:
+        """
+        Whether the buffer has been returned to its pool.
+        """
+        return self._is_released
+
+    def to_array(self) -> "NDArray[Any]":
+        """
+        Get a zero-copy NumPy view of the frame buffer. Requires NumPy.
+
+        Returns:
+            NDArray[Any]: An (height, width) or (height, width, 3) view of the buffer.
+        """
+        numpy = import_numpy()
+
+        return numpy.frombuffer(
+            self.data, dtype=get_frame_dtype(self.image_type)
+        ).reshape(get_frame_shape(self.width, self.height, self.image_type))
+
+    def release(self) -> None:
+        """
+        Return the buffer to its pool so that it can be reused for a later frame.
+        """
+        if self._is_released:
+            return
+
+        self._is_released = True
+
+        self._pool.release(self)
+
+
+# **************************************************************************************
+
+
+class ZWOASIFrameBufferPool(object):
+    """
+    A thread-safe pool of preallocated frame buffers for the current ROI format.
+
+    The pool is keyed by the ROI format (width, height and image type). Buffers
+    released for a stale format are discarded, and the pool is only rebuilt when
+    configure() is called with a new format.
+    """
+
+    # The maximum number of idle buffers retained by the pool:
+    capacity: int
+
+    # Whether buffers should be page-aligned (backed by an anonymous mapping):
+    page_aligned: bool
+
+    def __init__(self, capacity: int = 4, page_aligned: bool = False) -> None:
+        """
+        Initialise the frame buffer pool.
+
+        Args:
+            capacity (int): The maximum number of idle buffers to retain.
+            page_aligned (bool): Whether to allocate page-aligned buffers, which can
+                be faster for the SDK's USB transfers on some platforms.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+
+        self.capacity = capacity
+        self.page_aligned = page_aligned
+
+        self._lock = Lock()
+        self._key: Optional[Tuple[int, int, ZWOASIImageType]] = None
+        self._available: List[ZWOASIFrameBufferData] = []
+        self._hits = 0
+        self._misses = 0
+        self._bytes_allocated = 0
+
+    @property
+    def key(self) -> Optional[Tuple[int, int, ZWOASIImageType]]:
+        """
+        The ROI format key, e.g., (width, height, image type), of the pool.
+        """
+        return self._key
+
+    def configure(self, width: int, height: int, image_type: ZWOASIImageType) -> None:
+        """
+        Configure the pool for the given ROI format.
+
+        If the format is unchanged this is a no-op, otherwise all idle buffers are
+        discarded so that subsequent acquisitions are sized for the new format.
+
+        Args:
+            width (int): The width of the frame (in pixels).
+            height (int): The height of the frame (in pixels).
+            image_type (ZWOASIImageType): The image type of the frame.
+        """
+        key = (width, height, ZWOASIImageType(image_type))
+
+        with self._lock:
+            if key == self._key:
+                return
+
+            self._key = key
+            self._available.clear()
+
+    def acquire(self) -> ZWOASIFrameBuffer:
+        """
+        Acquire a frame buffer sized for the currently configured ROI format.
+
+        Returns:
+            ZWOASIFrameBuffer: A writable frame buffer (N.B. contents are undefined).
+
+        Raises:
+            RuntimeError: If the pool has not been configured.
+        """
+        with self._lock:
+            if self._key is None:
+                raise RuntimeError("Frame buffer pool has not been configured.")
+
+            width, height, image_type = self._key
+
+            if self._available:
+                self._hits += 1
+                return ZWOASIFrameBuffer(
+                    self, self._available.pop(), width, height, image_type
+                )
+
+            self._misses += 1
+
+            size = get_frame_size(width, height, image_type)
+
+            self._bytes_allocated += size
+
+        # Allocate outside of the lock, as large allocations can be slow:
+        data: ZWOASIFrameBufferData = (
+            mmap(-1, size) if self.page_aligned else bytearray(size)
+        )
+
+        return ZWOASIFrameBuffer(self, data, width, height, image_type)
+
+    def release(self, buffer: ZWOASIFrameBuffer) -> None:
+        """
+        Return a frame buffer to the pool.
+
+        Args:
+            buffer (ZWOASIFrameBuffer): The buffer to recycle.
+        """
+        with self._lock:
+            # Discard buffers sized for a stale ROI format, or beyond our capacity:
+            if buffer.key != self._key or len(self._available) >= self.capacity:
+                return
+
+            self._available.append(buffer.data)
+
+    def clear(self) -> None:
+        """
+        Discard all idle buffers held by the pool.
+        """
+        with self._lock:
+            self._available.clear()
+
+    def get_statistics(self) -> ZWOASIFrameBufferPoolStatistics:
+        """
+        Retrieve the pool's hit, miss and allocation counters.
+
+        Returns:
+            ZWOASIFrameBufferPoolStatistics: The current pool statistics.
+        """
+        with self._lock:
+            return ZWOASIFrameBufferPoolStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                bytes_allocated=self._bytes_allocated,
+                available=len(self._available),
+            )
+
+
+# **************************************************************************************
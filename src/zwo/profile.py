@@ -0,0 +1,109 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .enums import ZWOASIImageType
+
+# **************************************************************************************
+
+
+class ZWOASICameraProfile(BaseModel):
+    """
+    A Pydantic model representation of a set of camera settings, e.g., an imaging or
+    guiding profile. Settings which are None are left unchanged when applied.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    width: Optional[int] = Field(
+        default=None,
+        description="The width of the ROI (in binned pixels).",
+        ge=8,
+    )
+
+    height: Optional[int] = Field(
+        default=None,
+        description="The height of the ROI (in binned pixels).",
+        ge=2,
+    )
+
+    binning: Optional[int] = Field(
+        default=None,
+        description="The binning factor (e.g., 1 = 1x1, 2 = 2x2, etc.).",
+        ge=1,
+    )
+
+    image_type: Optional[ZWOASIImageType] = Field(
+        default=None,
+        description="The image type of the ROI (e.g., 8-bit, 16-bit, etc.).",
+    )
+
+    start_x: Optional[int] = Field(
+        default=None,
+        description="The start X position of the ROI (in binned pixels).",
+        ge=0,
+    )
+
+    start_y: Optional[int] = Field(
+        default=None,
+        description="The start Y position of the ROI (in binned pixels).",
+        ge=0,
+    )
+
+    gain: Optional[int] = Field(
+        default=None,
+        description="The gain, in device-specific units.",
+    )
+
+    offset: Optional[int] = Field(
+        default=None,
+        description="The offset (or brightness), in device-specific units.",
+    )
+
+    exposure_time: Optional[float] = Field(
+        default=None,
+        description="The exposure time (in seconds).",
+        ge=0,
+    )
+
+    target_temperature: Optional[float] = Field(
+        default=None,
+        description="The target sensor temperature (in °C), for cooled cameras.",
+    )
+
+    def merge(self, **settings: Any) -> "ZWOASICameraProfile":
+        """
+        Get a copy of the profile with the given settings (validated) overridden.
+
+        Args:
+            **settings: The settings to override, e.g., gain=100.
+
+        Returns:
+            ZWOASICameraProfile: The merged profile.
+        """
+        return ZWOASICameraProfile.model_validate(
+            {**self.model_dump(exclude_none=True), **settings}
+        )
+
+
+# **************************************************************************************
+
+
+class ZWOASIConfigurationResult(TypedDict):
+    # The settings which were changed, as {name: (previous, new)}, in the order the
+    # changes were applied (N.B. previous is None where it was not known):
+    changes: Dict[str, Tuple[Any, Any]]
+    # The settings which were already as requested:
+    unchanged: List[str]
+    # The time (in seconds) taken to apply the changes:
+    elapsed: float
+
+
+# **************************************************************************************
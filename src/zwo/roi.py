@@ -0,0 +1,65 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from typing import Tuple
+
+from pydantic import BaseModel, Field
+
+from .enums import ZWOASIImageType
+
+# **************************************************************************************
+
+
+class ZWOASIRegionOfInterest(BaseModel):
+    """
+    A Pydantic model representation of the camera's ROI format and start position,
+    e.g., the combined state of ASIGetROIFormat and ASIGetStartPos.
+    """
+
+    width: int = Field(
+        default=0,
+        description="The width of the ROI (in binned pixels).",
+        ge=0,
+    )
+
+    height: int = Field(
+        default=0,
+        description="The height of the ROI (in binned pixels).",
+        ge=0,
+    )
+
+    binning: int = Field(
+        default=1,
+        description="The binning factor (e.g., 1 = 1x1, 2 = 2x2, etc.).",
+        ge=1,
+    )
+
+    image_type: ZWOASIImageType = Field(
+        default=ZWOASIImageType.RAW8,
+        description="The image type of the ROI (e.g., 8-bit, 16-bit, etc.).",
+    )
+
+    start_x: int = Field(
+        default=0,
+        description="The start X position of the ROI (in binned pixels).",
+        ge=0,
+    )
+
+    start_y: int = Field(
+        default=0,
+        description="The start Y position of the ROI (in binned pixels).",
+        ge=0,
+    )
+
+    def to_format(self) -> Tuple[int, int, int, ZWOASIImageType]:
+        """
+        Get the ROI format as a (width, height, binning, image type) tuple.
+        """
+        return self.width, self.height, self.binning, self.image_type
+
+
+# **************************************************************************************
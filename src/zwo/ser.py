@@ -0,0 +1,474 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import os
+from array import array
+from collections.abc import Buffer
+from datetime import datetime
+from pathlib import Path
+from struct import Struct
+from time import monotonic, time
+from typing import TYPE_CHECKING, Optional, TypedDict, Union
+
+from .enums import ZWOASIBayerPattern, ZWOASIImageType
+from .frame import get_bytes_per_pixel, get_frame_size
+from .gps import ZWOASI_GPS_DATA_CTYPE
+
+if TYPE_CHECKING:
+    from .camera import ZWOASICamera
+
+# **************************************************************************************
+
+# The file identifier at the start of every SER file:
+ZWOASI_SER_FILE_ID: bytes = b"LUCAM-RECORDER"
+
+# The size (in bytes) of the SER file header:
+ZWOASI_SER_HEADER_SIZE: int = 178
+
+# The number of (100 ns) ticks from 0001-01-01 to the UNIX epoch, as used by the SER
+# timestamps (and .NET DateTime):
+ZWOASI_SER_EPOCH_TICKS: int = 621_355_968_000_000_000
+
+# The SER ColorID of mono and BGR frames:
+ZWOASI_SER_COLOR_MONO: int = 0
+ZWOASI_SER_COLOR_BGR: int = 101
+
+# The SER ColorID of each of the SDK's Bayer patterns:
+ZWOASI_SER_COLOR_BAYER = {
+    ZWOASIBayerPattern.RG: 8,
+    ZWOASIBayerPattern.GR: 9,
+    ZWOASIBayerPattern.GB: 10,
+    ZWOASIBayerPattern.BG: 11,
+}
+
+# **************************************************************************************
+
+# The SER header: FileID, LuID, ColorID, LittleEndian, ImageWidth, ImageHeight,
+# PixelDepthPerPlane, FrameCount, Observer, Instrument, Telescope, DateTime and
+# DateTime_UTC:
+_HEADER = Struct("<14s7i40s40s40sqq")
+
+# **************************************************************************************
+
+
+def get_ser_ticks(timestamp: float) -> int:
+    """
+    Convert a UNIX timestamp to SER (100 ns) ticks since 0001-01-01.
+
+    Args:
+        timestamp (float): The UNIX timestamp (in seconds).
+
+    Returns:
+        int: The SER timestamp.
+    """
+    return ZWOASI_SER_EPOCH_TICKS + int(timestamp * 10_000_000)
+
+
+# **************************************************************************************
+
+
+def get_gps_ser_ticks(gps: ZWOASI_GPS_DATA_CTYPE) -> Optional[int]:
+    """
+    Convert the (UTC) time of a GPS reading to SER (100 ns) ticks since 0001-01-01.
+
+    Args:
+        gps (ZWOASI_GPS_DATA_CTYPE): The GPS data filled in by the SDK.
+
+    Returns:
+        Optional[int]: The SER timestamp, or None if the GPS has no (valid) time.
+    """
+    time_ = gps.Datetime
+
+    try:
+        days = datetime(time_.Year, time_.Month, time_.Day).toordinal() - 1
+    except ValueError:
+        return None
+
+    # N.B. The SDK's Usecond is in units of 0.1 µs, e.g., SER ticks:
+    return (
+        (
+            ((days * 24 + time_.Hour) * 60 + time_.Minute) * 60 * 1000
+            + time_.Second * 1000
+            + time_.Msecond
+        )
+        * 10_000
+    ) + time_.Usecond
+
+
+# **************************************************************************************
+
+
+class ZWOASISERRecorderStatistics(TypedDict):
+    # The number of frames recorded:
+    frames_recorded: int
+    # The number of those frames timestamped with the camera's GPS time:
+    gps_timestamps: int
+    # The number of bytes of frame data written:
+    bytes_written: int
+    # The time (in seconds) since the first frame was recorded:
+    elapsed: float
+    # The frames recorded per second:
+    frame_rate: float
+    # The bytes of frame data written per second:
+    throughput: float
+    # The number of frames dropped by the SDK during the recording:
+    dropped_frames: int
+    # The frames delivered (recorded or dropped) by the camera per second:
+    camera_frame_rate: float
+    # The fraction of the camera's frames which were recorded:
+    efficiency: float
+
+
+# **************************************************************************************
+
+
+class ZWOASISERRecorder(object):
+    """
+    Records raw video frames to a SER file, as written by the SDK.
+
+    Frames are read by the SDK into a single reusable buffer, and written to the
+    file without any conversion (the SDK's little-endian RAW16, and BGR RGB24, are
+    native SER formats). The per-frame timestamps (the camera's GPS time, when
+    available) are kept in memory and written to the SER trailer on close().
+    """
+
+    # The camera to record from:
+    camera: "ZWOASICamera"
+
+    # The path of the SER file:
+    path: Path
+
+    # The width of the frames (in pixels):
+    width: int
+
+    # The height of the frames (in pixels):
+    height: int
+
+    # The image type of the frames:
+    image_type: ZWOASIImageType
+
+    def __init__(
+        self,
+        camera: "ZWOASICamera",
+        path: Union[str, Path],
+        maximum_frames: Optional[int] = None,
+        observer: str = "",
+        telescope: str = "",
+    ) -> None:
+        """
+        Initialise the recorder, creating the SER file.
+
+        Args:
+            camera (ZWOASICamera): The (connected) camera to record from, in the ROI
+                format to record.
+            path (Union[str, Path]): The path of the SER file to (over)write.
+            maximum_frames (Optional[int]): If given, the file is preallocated for
+                this many frames, and the recording stops once it is full.
+            observer (str): The observer, recorded in the header.
+            telescope (str): The telescope, recorded in the header.
+        """
+        self.camera = camera
+        self.path = Path(path)
+
+        roi = camera.roi
+
+        self.width = roi.width
+        self.height = roi.height
+        self.image_type = roi.image_type
+
+        self.maximum_frames = maximum_frames
+
+        self._frame_size = get_frame_size(self.width, self.height, self.image_type)
+
+        self._buffer = bytearray(self._frame_size)
+
+        # The SER timestamp of each frame recorded, for the trailer:
+        self._timestamps = array("q")
+
+        self._gps_timestamps = 0
+        self._started: Optional[float] = None
+        self._ended: Optional[float] = None
+        self._dropped_frames = 0
+        self._is_acquiring = False
+
+        self._file = open(self.path, "wb", buffering=0)
+
+        try:
+            self._file.write(self._get_header(observer, telescope))
+
+            if maximum_frames is not None:
+                self._preallocate(maximum_frames * self._frame_size)
+        except BaseException:
+            self._file.close()
+            raise
+
+        self._observer = observer
+        self._telescope = telescope
+
+    def __enter__(self) -> "ZWOASISERRecorder":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def frames_recorded(self) -> int:
+        """
+        The number of frames recorded.
+        """
+        return len(self._timestamps)
+
+    def _get_header(self, observer: str, telescope: str) -> bytes:
+        info = self.camera.info
+
+        planes = 3 if self.image_type == ZWOASIImageType.RGB24 else 1
+
+        if planes == 3:
+            color = ZWOASI_SER_COLOR_BGR
+        elif (
+            info.is_color
+            and info.bayer_pattern is not None
+            and self.image_type != ZWOASIImageType.Y8
+        ):
+            color = ZWOASI_SER_COLOR_BAYER[info.bayer_pattern]
+        else:
+            color = ZWOASI_SER_COLOR_MONO
+
+        depth = 8 * get_bytes_per_pixel(self.image_type) // planes
+
+        first = self._timestamps[0] if self._timestamps else get_ser_ticks(time())
+
+        # The local time of the first frame, from its UTC time:
+        offset = datetime.now().astimezone().utcoffset()
+
+        local = first + (int(offset.total_seconds() * 10_000_000) if offset else 0)
+
+        return _HEADER.pack(
+            ZWOASI_SER_FILE_ID,
+            0,
+            color,
+            # N.B. Contrary to the SER specification, the de facto convention (e.g.,
+            # of FireCapture, SharpCap and AutoStakkert!) is 0 for little-endian:
+            0,
+            self.width,
+            self.height,
+            depth,
+            self.frames_recorded,
+            _encode(observer),
+            _encode(info.name),
+            _encode(telescope),
+            local,
+            first,
+        )
+
+    def _preallocate(self, size: int) -> None:
+        try:
+            os.posix_fallocate(self._file.fileno(), ZWOASI_SER_HEADER_SIZE, size)
+        except (AttributeError, OSError):
+            # Not every platform (or filesystem) supports preallocation:
+            pass
+
+    def write_frame(self, data: Buffer, timestamp: Optional[int] = None) -> None:
+        """
+        Append a raw frame, in the recorder's ROI format, to the file.
+
+        Args:
+            data (Buffer): The raw frame data, as written by the SDK.
+            timestamp (Optional[int]): The SER (UTC) timestamp of the frame. Defaults
+                to the current time.
+        """
+        if self._file.closed:
+            raise RuntimeError("SER recorder has been closed.")
+
+        view = memoryview(data).cast("B")
+
+        if view.nbytes != self._frame_size:
+            raise ValueError(
+                f"Frame of {view.nbytes} bytes does not match the frame size "
+                f"{self._frame_size}."
+            )
+
+        if (
+            self.maximum_frames is not None
+            and self.frames_recorded >= self.maximum_frames
+        ):
+            raise RuntimeError("SER recorder is full.")
+
+        now = monotonic()
+
+        if self._started is None:
+            self._started = now
+
+        # N.B. The file is unbuffered, so each frame is a single write:
+        written = 0
+
+        while written < view.nbytes:
+            written += self._file.write(view[written:])
+
+        self._timestamps.append(
+            get_ser_ticks(time()) if timestamp is None else timestamp
+        )
+
+        self._ended = now
+
+    def record(
+        self,
+        count: Optional[int] = None,
+        duration: Optional[float] = None,
+        timeout: int = 1000,
+    ) -> ZWOASISERRecorderStatistics:
+        """
+        Record video frames from the camera, until the given number of frames have
+        been recorded, the duration has elapsed, or the file is full.
+
+        If the camera is not already streaming video, video capture is started (and
+        stopped again afterwards) without the background reader, so that the SDK
+        reads each frame straight into the recorder's buffer.
+
+        Args:
+            count (Optional[int]): The number of frames to record.
+            duration (Optional[float]): The maximum time (in seconds) to record for.
+            timeout (int): Maximum time in milliseconds to wait for each frame.
+
+        Returns:
+            ZWOASISERRecorderStatistics: The recording statistics.
+        """
+        if count is None and duration is None and self.maximum_frames is None:
+            raise ValueError(
+                "A count, duration or maximum number of frames is required."
+            )
+
+        roi = self.camera.roi
+
+        if (roi.width, roi.height, roi.image_type) != (
+            self.width,
+            self.height,
+            self.image_type,
+        ):
+            raise RuntimeError(
+                "The camera's ROI format has changed since recording began."
+            )
+
+        is_started = not self.camera.is_video_streaming
+
+        if is_started:
+            self.camera.start_acquisition(reader=False)
+
+        # The SDK counts the frames dropped since video capture started, so only the
+        # frames dropped whilst recording are attributed to the recording:
+        dropped_frames = self.camera.get_dropped_frames()
+
+        # Read GPS data with each frame straight from the SDK, when available:
+        use_gps = self.camera.has_gps_support and self.camera.video is None
+
+        recorded = 0
+
+        deadline = None if duration is None else monotonic() + duration
+
+        try:
+            while (count is None or recorded < count) and (
+                self.maximum_frames is None
+                or self.frames_recorded < self.maximum_frames
+            ):
+                if deadline is not None and monotonic() >= deadline:
+                    break
+
+                timestamp: Optional[int] = None
+
+                if use_gps:
+                    gps = self.camera._get_video_data_with_gps(
+                        self._buffer, timeout=timeout
+                    )
+
+                    timestamp = get_gps_ser_ticks(gps)
+
+                    if timestamp is not None:
+                        self._gps_timestamps += 1
+                else:
+                    self.camera._get_video_data(self._buffer, timeout=timeout)
+
+                self.write_frame(self._buffer, timestamp)
+
+                recorded += 1
+        finally:
+            self._dropped_frames += max(
+                self.camera.get_dropped_frames() - dropped_frames, 0
+            )
+
+            if is_started:
+                self.camera.stop_acquisition()
+
+        return self.get_statistics()
+
+    def get_statistics(self) -> ZWOASISERRecorderStatistics:
+        """
+        Retrieve the recording statistics.
+
+        Returns:
+            ZWOASISERRecorderStatistics: The current statistics.
+        """
+        frames = self.frames_recorded
+
+        elapsed = (
+            0.0
+            if self._started is None or self._ended is None
+            else self._ended - self._started
+        )
+
+        # N.B. The first frame starts the clock, so isn't counted in the rates:
+        frame_rate = (frames - 1) / elapsed if elapsed > 0 else 0.0
+
+        camera_frame_rate = (
+            (frames - 1 + self._dropped_frames) / elapsed if elapsed > 0 else 0.0
+        )
+
+        delivered = frames + self._dropped_frames
+
+        return ZWOASISERRecorderStatistics(
+            frames_recorded=frames,
+            gps_timestamps=self._gps_timestamps,
+            bytes_written=frames * self._frame_size,
+            elapsed=elapsed,
+            frame_rate=frame_rate,
+            throughput=frame_rate * self._frame_size,
+            dropped_frames=self._dropped_frames,
+            camera_frame_rate=camera_frame_rate,
+            efficiency=frames / delivered if delivered else 0.0,
+        )
+
+    def close(self) -> None:
+        """
+        Write the timestamp trailer, finalise the header and close the file.
+        """
+        if self._file.closed:
+            return
+
+        try:
+            end = ZWOASI_SER_HEADER_SIZE + self.frames_recorded * self._frame_size
+
+            self._file.seek(end)
+
+            self._file.write(self._timestamps.tobytes())
+
+            # Discard any preallocated space beyond the trailer:
+            self._file.truncate()
+
+            self._file.seek(0)
+
+            self._file.write(self._get_header(self._observer, self._telescope))
+        finally:
+            self._file.close()
+
+
+# **************************************************************************************
+
+
+def _encode(value: str) -> bytes:
+    return value.encode("latin-1", errors="replace")[:40]
+
+
+# **************************************************************************************
@@ -0,0 +1,976 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import os
+from collections.abc import Buffer
+from multiprocessing.shared_memory import SharedMemory
+from struct import Struct
+from threading import Event, Thread
+from time import monotonic, sleep, time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+    cast,
+)
+
+from .camera import ZWOASICamera
+from .enums import ZWOASIImageType
+from .frame import get_frame_dtype, get_frame_shape, get_frame_size, import_numpy
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# **************************************************************************************
+
+# The magic bytes at the start of every shared frame ring:
+ZWOASI_SHARED_FRAME_RING_MAGIC: bytes = b"ZWOR"
+
+# The version of the shared frame ring's memory layout:
+ZWOASI_SHARED_FRAME_RING_VERSION: int = 1
+
+# The sentinel sequence number of a slot that is empty, or currently being written:
+ZWOASI_SHARED_FRAME_SLOT_INVALID: int = -1
+
+# **************************************************************************************
+
+# The alignment (in bytes) of the ring's headers and of each slot's frame data:
+_ALIGNMENT = 64
+
+# The ring header: magic, version, slots, maximum readers, slot (frame) capacity:
+_RING_HEADER = Struct("<4sIIIQ")
+
+# The sequence number of the most recently published frame (0 if none):
+_RING_SEQUENCE = Struct("<q")
+_RING_SEQUENCE_OFFSET = 24
+
+# Whether the publisher is still open (1), or has closed the ring (0):
+_RING_OPEN = Struct("<I")
+_RING_OPEN_OFFSET = 32
+
+# Each reader's entry: pid (0 if free), last consumed sequence, frames skipped:
+_READER = Struct("<qqq")
+_READER_SIZE = 32
+
+# Each slot's header: sequence, width, height, image type, size, monotonic and UNIX
+# timestamps, where the sequence is invalidated before the slot is rewritten:
+_SLOT_HEADER = Struct("<qIIiQdd")
+_SLOT_HEADER_SIZE = 64
+
+# **************************************************************************************
+
+
+def _align(size: int) -> int:
+    return (size + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+# **************************************************************************************
+
+
+class ZWOASISharedFrameReaderStatus(TypedDict):
+    # The index of the reader's entry in the ring:
+    reader: int
+    # The process ID of the reader:
+    pid: int
+    # The sequence number of the last frame the reader consumed:
+    sequence: int
+    # The number of published frames the reader has yet to consume:
+    lag: int
+    # The number of frames overwritten in the ring before the reader consumed them:
+    frames_skipped: int
+    # Whether the reader has fallen behind, e.g., its next frame is being overwritten:
+    is_behind: bool
+
+
+# **************************************************************************************
+
+
+class ZWOASISharedFrameRing(object):
+    """
+    A ring of fixed-size frame slots in a named shared memory block, which can be
+    written by one publishing process and read, without copying, by many others.
+
+    Each slot carries a header with the frame's sequence number, shape, image type
+    (and so dtype) and timestamps. As with ZWOASIVideoStream, the slot's sequence is
+    invalidated before the slot is rewritten, so readers can detect (and discard) a
+    frame that was overwritten underneath them.
+    """
+
+    # The number of frame slots in the ring:
+    slots: int
+
+    # The maximum number of readers which can attach to the ring:
+    maximum_readers: int
+
+    # The capacity (in bytes) of each frame slot:
+    slot_size: int
+
+    def __init__(self, memory: SharedMemory, owner: bool) -> None:
+        """
+        Initialise the ring over an existing (and initialised) shared memory block.
+
+        N.B. Use ZWOASISharedFrameRing.create() or ZWOASISharedFrameRing.attach().
+        """
+        # N.B. The buffer of an open shared memory block is never None:
+        self._buffer = cast(memoryview, memory.buf)
+
+        magic, version, slots, maximum_readers, slot_size = _RING_HEADER.unpack_from(
+            self._buffer, 0
+        )
+
+        if magic != ZWOASI_SHARED_FRAME_RING_MAGIC:
+            raise ValueError(f"Shared memory {memory.name} is not a shared frame ring.")
+
+        if version != ZWOASI_SHARED_FRAME_RING_VERSION:
+            raise ValueError(f"Unsupported shared frame ring version: {version}")
+
+        self.slots = slots
+        self.maximum_readers = maximum_readers
+        self.slot_size = slot_size
+
+        self._memory = memory
+        self._owner = owner
+
+        self._readers_offset = _ALIGNMENT
+        self._slots_offset = self._readers_offset + _align(
+            maximum_readers * _READER_SIZE
+        )
+        self._slot_stride = _SLOT_HEADER_SIZE + _align(slot_size)
+
+    @classmethod
+    def create(
+        cls,
+        slot_size: int,
+        slots: int = 8,
+        maximum_readers: int = 8,
+        name: Optional[str] = None,
+    ) -> "ZWOASISharedFrameRing":
+        """
+        Create (and own) a new shared frame ring.
+
+        Args:
+            slot_size (int): The capacity (in bytes) of each frame slot.
+            slots (int): The number of frame slots in the ring (at least 2).
+            maximum_readers (int): The maximum number of readers.
+            name (Optional[str]): The name of the shared memory block, or None to
+                generate a unique name.
+
+        Returns:
+            ZWOASISharedFrameRing: The new (empty) ring.
+        """
+        if slots < 2:
+            raise ValueError("The shared frame ring requires at least 2 slots.")
+
+        if slot_size <= 0:
+            raise ValueError("The shared frame ring's slot size must be positive.")
+
+        if maximum_readers < 1:
+            raise ValueError("The shared frame ring requires at least 1 reader.")
+
+        size = (
+            _ALIGNMENT
+            + _align(maximum_readers * _READER_SIZE)
+            + slots * (_SLOT_HEADER_SIZE + _align(slot_size))
+        )
+
+        memory = SharedMemory(name=name, create=True, size=size)
+
+        buffer = cast(memoryview, memory.buf)
+
+        # N.B. Fresh shared memory is zero-filled, so every reader entry is free:
+        _RING_HEADER.pack_into(
+            buffer,
+            0,
+            ZWOASI_SHARED_FRAME_RING_MAGIC,
+            ZWOASI_SHARED_FRAME_RING_VERSION,
+            slots,
+            maximum_readers,
+            slot_size,
+        )
+
+        _RING_SEQUENCE.pack_into(buffer, _RING_SEQUENCE_OFFSET, 0)
+
+        _RING_OPEN.pack_into(buffer, _RING_OPEN_OFFSET, 1)
+
+        ring = cls(memory, owner=True)
+
+        for index in range(slots):
+            _SLOT_HEADER.pack_into(
+                buffer,
+                ring._get_slot_offset(index),
+                ZWOASI_SHARED_FRAME_SLOT_INVALID,
+                0,
+                0,
+                0,
+                0,
+                0.0,
+                0.0,
+            )
+
+        return ring
+
+    @classmethod
+    def attach(cls, name: str) -> "ZWOASISharedFrameRing":
+        """
+        Attach to an existing shared frame ring by name.
+
+        Args:
+            name (str): The name of the ring's shared memory block.
+
+        Returns:
+            ZWOASISharedFrameRing: The attached ring.
+        """
+        # N.B. The publisher owns the block, so it must not be unlinked on our exit:
+        return cls(SharedMemory(name=name, track=False), owner=False)
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the ring's shared memory block, used by readers to attach.
+        """
+        return self._memory.name
+
+    @property
+    def sequence(self) -> int:
+        """
+        The sequence number of the most recently published frame (0 if none).
+        """
+        return int(_RING_SEQUENCE.unpack_from(self._buffer, _RING_SEQUENCE_OFFSET)[0])
+
+    @property
+    def is_open(self) -> bool:
+        """
+        Whether the publisher has yet to close the ring.
+        """
+        return bool(_RING_OPEN.unpack_from(self._buffer, _RING_OPEN_OFFSET)[0])
+
+    def _get_slot_offset(self, index: int) -> int:
+        return self._slots_offset + index * self._slot_stride
+
+    def _get_reader_offset(self, reader: int) -> int:
+        return self._readers_offset + reader * _READER_SIZE
+
+    def get_slot_data(self, sequence: int) -> memoryview:
+        """
+        Get a writable view of the whole data area of the slot for a sequence number.
+        """
+        offset = self._get_slot_offset(sequence % self.slots) + _SLOT_HEADER_SIZE
+
+        return self._buffer[offset : offset + self.slot_size]
+
+    def begin_write(self, sequence: int) -> memoryview:
+        """
+        Invalidate the slot for the given sequence number, before it is rewritten.
+
+        Args:
+            sequence (int): The sequence number of the frame about to be written.
+
+        Returns:
+            memoryview: A writable view of the slot's data area.
+        """
+        _RING_SEQUENCE.pack_into(
+            self._buffer,
+            self._get_slot_offset(sequence % self.slots),
+            ZWOASI_SHARED_FRAME_SLOT_INVALID,
+        )
+
+        return self.get_slot_data(sequence)
+
+    def end_write(
+        self,
+        sequence: int,
+        width: int,
+        height: int,
+        image_type: ZWOASIImageType,
+        timestamp: Optional[float] = None,
+        time_: Optional[float] = None,
+    ) -> None:
+        """
+        Publish the frame written into the slot for the given sequence number.
+
+        Args:
+            sequence (int): The sequence number of the frame written.
+            width (int): The width of the frame (in pixels).
+            height (int): The height of the frame (in pixels).
+            image_type (ZWOASIImageType): The image type of the frame.
+            timestamp (Optional[float]): The time.monotonic() timestamp of the frame.
+            time_ (Optional[float]): The UNIX timestamp of the frame.
+        """
+        offset = self._get_slot_offset(sequence % self.slots)
+
+        # Write the header with the slot still invalid, then validate the slot:
+        _SLOT_HEADER.pack_into(
+            self._buffer,
+            offset,
+            ZWOASI_SHARED_FRAME_SLOT_INVALID,
+            width,
+            height,
+            int(image_type),
+            get_frame_size(width, height, image_type),
+            monotonic() if timestamp is None else timestamp,
+            time() if time_ is None else time_,
+        )
+
+        _RING_SEQUENCE.pack_into(self._buffer, offset, sequence)
+
+        _RING_SEQUENCE.pack_into(self._buffer, _RING_SEQUENCE_OFFSET, sequence)
+
+    def get_slot_sequence(self, sequence: int) -> int:
+        """
+        Get the sequence number currently held by the slot for a sequence number.
+        """
+        return int(
+            _RING_SEQUENCE.unpack_from(
+                self._buffer, self._get_slot_offset(sequence % self.slots)
+            )[0]
+        )
+
+    def get_slot_header(
+        self, sequence: int
+    ) -> Optional[Tuple[int, int, ZWOASIImageType, int, float, float]]:
+        """
+        Get the header of the frame with the given sequence number.
+
+        Returns:
+            Optional[Tuple[int, int, ZWOASIImageType, int, float, float]]: The (width,
+            height, image type, size, monotonic timestamp, UNIX timestamp) of the
+            frame, or None if the frame is no longer (or not yet) in the ring.
+        """
+        (
+            slot_sequence,
+            width,
+            height,
+            image_type,
+            size,
+            timestamp,
+            time_,
+        ) = _SLOT_HEADER.unpack_from(
+            self._buffer, self._get_slot_offset(sequence % self.slots)
+        )
+
+        if slot_sequence != sequence:
+            return None
+
+        header = (width, height, ZWOASIImageType(image_type), size, timestamp, time_)
+
+        # If the slot was invalidated whilst reading, the header may be torn:
+        if self.get_slot_sequence(sequence) != sequence:
+            return None
+
+        return header
+
+    def claim_reader(self, reader: Optional[int] = None) -> int:
+        """
+        Claim a reader entry for the calling process.
+
+        N.B. Claiming is not atomic across processes, so readers which attach at the
+        same time should be given distinct reader indices.
+
+        Args:
+            reader (Optional[int]): The index of the entry to claim, or None to claim
+                the first free entry.
+
+        Returns:
+            int: The index of the claimed entry.
+        """
+        pid = os.getpid()
+
+        candidates = range(self.maximum_readers) if reader is None else [reader]
+
+        for index in candidates:
+            if not 0 <= index < self.maximum_readers:
+                raise ValueError(f"Invalid reader index: {index}")
+
+            offset = self._get_reader_offset(index)
+
+            if _READER.unpack_from(self._buffer, offset)[0] not in (0, pid):
+                continue
+
+            _READER.pack_into(self._buffer, offset, pid, self.sequence, 0)
+
+            return index
+
+        raise RuntimeError("Shared frame ring has no free reader entries.")
+
+    def update_reader(self, reader: int, sequence: int, frames_skipped: int) -> None:
+        """
+        Record the last frame consumed by (and the frames skipped by) a reader.
+        """
+        _READER.pack_into(
+            self._buffer,
+            self._get_reader_offset(reader),
+            os.getpid(),
+            sequence,
+            frames_skipped,
+        )
+
+    def release_reader(self, reader: int) -> None:
+        """
+        Release a reader entry, so that it can be claimed by another reader.
+        """
+        _READER.pack_into(self._buffer, self._get_reader_offset(reader), 0, 0, 0)
+
+    def get_readers(self) -> List[ZWOASISharedFrameReaderStatus]:
+        """
+        Get the status of every attached reader.
+
+        Returns:
+            List[ZWOASISharedFrameReaderStatus]: The readers, by entry index.
+        """
+        latest = self.sequence
+
+        readers: List[ZWOASISharedFrameReaderStatus] = []
+
+        for index in range(self.maximum_readers):
+            pid, sequence, frames_skipped = _READER.unpack_from(
+                self._buffer, self._get_reader_offset(index)
+            )
+
+            if pid == 0:
+                continue
+
+            lag = max(latest - sequence, 0)
+
+            readers.append(
+                ZWOASISharedFrameReaderStatus(
+                    reader=index,
+                    pid=pid,
+                    sequence=sequence,
+                    lag=lag,
+                    frames_skipped=frames_skipped,
+                    # The next publish overwrites the oldest frame still in the ring:
+                    is_behind=lag >= self.slots - 1,
+                )
+            )
+
+        return readers
+
+    def close(self) -> None:
+        """
+        Detach from the ring, marking it as closed (and unlinking the shared memory
+        block) if this process created it.
+
+        N.B. Every frame view into the ring must be released before closing.
+        """
+        if self._owner:
+            _RING_OPEN.pack_into(self._buffer, _RING_OPEN_OFFSET, 0)
+
+        self._memory.close()
+
+        if self._owner:
+            self._memory.unlink()
+
+
+# **************************************************************************************
+
+
+class ZWOASISharedFrame(object):
+    """
+    A zero-copy view of a frame in a shared frame ring.
+
+    The view is only valid until the publisher overwrites the frame's slot, so
+    readers should check is_valid() after consuming the frame (or copy() it), and
+    must release() the frame before closing the reader.
+    """
+
+    # The monotonically increasing sequence number of the frame (starting at 1):
+    sequence: int
+
+    # The time.monotonic() timestamp at which the frame was published:
+    timestamp: float
+
+    # The (UNIX) time at which the frame was published:
+    time: float
+
+    # The width of the frame (in pixels):
+    width: int
+
+    # The height of the frame (in pixels):
+    height: int
+
+    # The image type of the frame:
+    image_type: ZWOASIImageType
+
+    # A read-only view of the frame data, in the ring's shared memory:
+    data: memoryview
+
+    def __init__(
+        self,
+        ring: ZWOASISharedFrameRing,
+        sequence: int,
+        timestamp: float,
+        time: float,
+        width: int,
+        height: int,
+        image_type: ZWOASIImageType,
+        data: memoryview,
+    ) -> None:
+        self._ring = ring
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self.time = time
+        self.width = width
+        self.height = height
+        self.image_type = image_type
+        self.data = data
+
+    def __enter__(self) -> "ZWOASISharedFrame":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.release()
+
+    @property
+    def dtype(self) -> str:
+        """
+        The NumPy dtype string of the frame's pixels.
+        """
+        return get_frame_dtype(self.image_type)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """
+        The array shape of the frame.
+        """
+        return get_frame_shape(self.width, self.height, self.image_type)
+
+    def is_valid(self) -> bool:
+        """
+        Whether the frame is still in the ring, e.g., has not been overwritten.
+        """
+        return self._ring.get_slot_sequence(self.sequence) == self.sequence
+
+    def to_array(self) -> "NDArray[Any]":
+        """
+        Get a zero-copy NumPy view of the frame data. Requires NumPy.
+
+        N.B. The array must be deleted before the frame is released.
+
+        Returns:
+            NDArray[Any]: An (height, width) or (height, width, 3) view of the frame.
+        """
+        numpy = import_numpy()
+
+        return numpy.frombuffer(self.data, dtype=self.dtype).reshape(self.shape)
+
+    def copy(self) -> Optional[bytearray]:
+        """
+        Copy the frame data out of the ring.
+
+        Returns:
+            Optional[bytearray]: The frame data, or None if the frame was overwritten
+            before (or whilst) it was copied.
+        """
+        data = bytearray(self.data)
+
+        return data if self.is_valid() else None
+
+    def release(self) -> None:
+        """
+        Release the view of the ring's shared memory.
+        """
+        self.data.release()
+
+
+# **************************************************************************************
+
+
+class ZWOASISharedFrameReader(object):
+    """
+    Attaches (e.g., from another process) to a shared frame ring by name, and reads
+    the published frames as zero-copy views.
+    """
+
+    # The index of the reader's entry in the ring:
+    reader: int
+
+    # The sequence number of the last frame consumed:
+    sequence: int
+
+    # The number of frames overwritten in the ring before they were consumed:
+    frames_skipped: int
+
+    def __init__(
+        self,
+        name: str,
+        reader: Optional[int] = None,
+        poll_interval: float = 0.0005,
+    ) -> None:
+        """
+        Initialise the reader, attaching to the ring.
+
+        Args:
+            name (str): The name of the ring (see ZWOASISharedFramePublisher.name).
+            reader (Optional[int]): The index of the reader entry to claim, or None to
+                claim the first free entry.
+            poll_interval (float): How often (in seconds) to poll for new frames.
+        """
+        self.ring = ZWOASISharedFrameRing.attach(name)
+
+        try:
+            self.reader = self.ring.claim_reader(reader)
+        except Exception:
+            self.ring.close()
+            raise
+
+        self.poll_interval = poll_interval
+
+        # Start from the most recently published frame:
+        self.sequence = self.ring.sequence
+
+        self.frames_skipped = 0
+
+    def __enter__(self) -> "ZWOASISharedFrameReader":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _get_frame(self, sequence: int) -> Optional[ZWOASISharedFrame]:
+        header = self.ring.get_slot_header(sequence)
+
+        if header is None:
+            return None
+
+        width, height, image_type, size, timestamp, time_ = header
+
+        frame = ZWOASISharedFrame(
+            self.ring,
+            sequence,
+            timestamp,
+            time_,
+            width,
+            height,
+            image_type,
+            self.ring.get_slot_data(sequence)[:size].toreadonly(),
+        )
+
+        if not frame.is_valid():
+            frame.release()
+            return None
+
+        return frame
+
+    def _consume(self, sequence: int, skipped: int) -> None:
+        self.sequence = sequence
+        self.frames_skipped += skipped
+        self.ring.update_reader(self.reader, sequence, self.frames_skipped)
+
+    def get_latest_frame(self) -> Optional[ZWOASISharedFrame]:
+        """
+        Get a view of the most recently published frame.
+
+        Returns:
+            Optional[ZWOASISharedFrame]: The latest frame, or None if no frame has
+            been published yet.
+        """
+        while True:
+            sequence = self.ring.sequence
+
+            if sequence == 0:
+                return None
+
+            frame = self._get_frame(sequence)
+
+            if frame is not None:
+                self._consume(sequence, max(sequence - self.sequence - 1, 0))
+                return frame
+
+    def get_next_frame(self, timeout: Optional[float] = None) -> ZWOASISharedFrame:
+        """
+        Get a view of the next frame after the last frame consumed.
+
+        If the reader has fallen behind, such that the following frames have already
+        been overwritten, the oldest frame still in the ring is returned instead and
+        the skipped frames are counted.
+
+        Args:
+            timeout (Optional[float]): The maximum time (in seconds) to wait.
+
+        Returns:
+            ZWOASISharedFrame: The next frame.
+
+        Raises:
+            TimeoutError: If no new frame is published within the timeout.
+            RuntimeError: If the publisher has closed the ring.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+
+        after = self.sequence
+
+        while True:
+            latest = self.ring.sequence
+
+            if latest <= after:
+                if not self.ring.is_open:
+                    raise RuntimeError("Shared frame ring has been closed.")
+
+                if deadline is not None and monotonic() >= deadline:
+                    raise TimeoutError("Timed out waiting for a shared frame.")
+
+                sleep(self.poll_interval)
+                continue
+
+            # The oldest frame which can still be in the ring:
+            sequence = max(after + 1, latest - self.ring.slots + 2)
+
+            frame = self._get_frame(sequence)
+
+            if frame is not None:
+                self._consume(sequence, sequence - self.sequence - 1)
+                return frame
+
+            # The frame was overwritten whilst reading, so try the next one:
+            after = sequence
+
+    def close(self) -> None:
+        """
+        Release the reader's entry, and detach from the ring.
+
+        N.B. Every frame returned by the reader must be released before closing.
+        """
+        self.ring.release_reader(self.reader)
+        self.ring.close()
+
+
+# **************************************************************************************
+
+
+class ZWOASISharedFramePublisher(object):
+    """
+    Publishes frames from a camera into a shared frame ring, which the SDK writes
+    into directly, so that frames reach reader processes without being serialised.
+
+    The publisher never waits on readers: the oldest slot is always overwritten, and
+    readers which have fallen behind are reported by get_readers().
+    """
+
+    # The camera to publish frames from:
+    camera: ZWOASICamera
+
+    # The shared frame ring:
+    ring: ZWOASISharedFrameRing
+
+    def __init__(
+        self,
+        camera: ZWOASICamera,
+        name: Optional[str] = None,
+        slots: int = 8,
+        maximum_readers: int = 8,
+        slot_size: Optional[int] = None,
+    ) -> None:
+        """
+        Initialise the publisher, creating the shared frame ring.
+
+        Args:
+            camera (ZWOASICamera): The (connected) camera to publish frames from.
+            name (Optional[str]): The name of the ring, or None to generate one.
+            slots (int): The number of frame slots in the ring (at least 2).
+            maximum_readers (int): The maximum number of readers.
+            slot_size (Optional[int]): The capacity (in bytes) of each frame slot.
+                Defaults to the size of a frame in the camera's current ROI format.
+        """
+        self.camera = camera
+
+        if slot_size is None:
+            width, height, _, image_type = camera.get_region_of_interest()
+
+            slot_size = get_frame_size(width, height, ZWOASIImageType(image_type))
+
+        self.ring = ZWOASISharedFrameRing.create(
+            slot_size=slot_size,
+            slots=slots,
+            maximum_readers=maximum_readers,
+            name=name,
+        )
+
+        self._sequence = 0
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+        self._error: Optional[BaseException] = None
+
+    def __enter__(self) -> "ZWOASISharedFramePublisher":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the ring, used by readers to attach.
+        """
+        return self.ring.name
+
+    @property
+    def sequence(self) -> int:
+        """
+        The sequence number of the most recently published frame (0 if none).
+        """
+        return self._sequence
+
+    def _publish(self, write: Callable[[memoryview], object]) -> int:
+        roi = self.camera.roi
+
+        size = get_frame_size(roi.width, roi.height, roi.image_type)
+
+        if size > self.ring.slot_size:
+            raise ValueError(
+                f"Frame size {size} exceeds the shared frame ring's slot size "
+                f"{self.ring.slot_size}."
+            )
+
+        sequence = self._sequence + 1
+
+        data = self.ring.begin_write(sequence)
+
+        try:
+            write(data[:size])
+        finally:
+            data.release()
+
+        self.ring.end_write(sequence, roi.width, roi.height, roi.image_type)
+
+        self._sequence = sequence
+
+        return sequence
+
+    def publish(self, buffer: Buffer) -> int:
+        """
+        Publish a copy of a frame in the camera's current ROI format.
+
+        Args:
+            buffer (Buffer): The raw frame data.
+
+        Returns:
+            int: The sequence number of the published frame.
+        """
+
+        def write(data: memoryview) -> None:
+            data[:] = memoryview(buffer).cast("B")
+
+        return self._publish(write)
+
+    def publish_exposure(self, is_dark: bool = False) -> int:
+        """
+        Capture a single exposure, which the SDK writes straight into the ring.
+
+        Args:
+            is_dark (bool): Whether to start a 'dark' exposure (e.g. shutter closed).
+
+        Returns:
+            int: The sequence number of the published frame.
+        """
+        return self._publish(lambda data: self.camera._expose(data, is_dark=is_dark))
+
+    def publish_video_frame(self, timeout: int = -1) -> int:
+        """
+        Publish the next video frame, which (unless the background video reader is
+        running) the SDK writes straight into the ring.
+
+        Args:
+            timeout (int): Maximum time in milliseconds to wait for a new frame.
+                           A value of -1 indicates an infinite wait.
+
+        Returns:
+            int: The sequence number of the published frame.
+        """
+        return self._publish(
+            lambda data: self.camera._get_video_data(data, timeout=timeout)
+        )
+
+    def get_readers(self) -> List[ZWOASISharedFrameReaderStatus]:
+        """
+        Get the status of every attached reader, e.g., to find readers which have
+        fallen behind.
+
+        Returns:
+            List[ZWOASISharedFrameReaderStatus]: The readers, by entry index.
+        """
+        return self.ring.get_readers()
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Whether the publishing thread is currently running.
+        """
+        return (
+            self._thread is not None
+            and self._thread.is_alive()
+            and not self._stopped.is_set()
+        )
+
+    def start(self) -> None:
+        """
+        Continuously publish frames on a background thread: video frames whilst the
+        camera is streaming, otherwise exposures.
+        """
+        if self.is_running:
+            return
+
+        if self._thread is not None:
+            self._thread.join()
+
+        self._error = None
+
+        self._stopped.clear()
+
+        self._thread = Thread(
+            target=self._run, name="zwoasi-shared-frame-publisher", daemon=True
+        )
+
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the publishing thread, waiting for any in-flight frame to complete.
+
+        Raises:
+            RuntimeError: If the publishing thread failed.
+        """
+        self._stopped.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        if self._error is not None:
+            raise RuntimeError(f"Shared frame publisher failed. Error: {self._error}")
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                if self.camera.is_video_streaming:
+                    # The SDK recommends waiting for at least twice the exposure plus
+                    # 500ms:
+                    timeout = int(self.camera.get_exposure_time() * 2000) + 500
+
+                    self.publish_video_frame(timeout=timeout)
+                else:
+                    self.publish_exposure()
+            except TimeoutError:
+                continue
+            except Exception as exception:
+                self._error = exception
+                self._stopped.set()
+                return
+
+    def close(self) -> None:
+        """
+        Stop publishing, and close (and unlink) the shared frame ring.
+        """
+        try:
+            self.stop()
+        finally:
+            self.ring.close()
+
+
+# **************************************************************************************
@@ -0,0 +1,1370 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from ctypes import CDLL, c_char_p
+from datetime import datetime, timezone
+from random import Random
+from threading import Lock
+from time import monotonic, sleep
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from pydantic import BaseModel, Field
+
+from .enums import (
+    ZWOASIBayerPattern,
+    ZWOASIBool,
+    ZWOASICameraMode,
+    ZWOASIControlType,
+    ZWOASIErrorCode,
+    ZWOASIExposureStatus,
+    ZWOASIImageType,
+)
+from .frame import get_bytes_per_pixel, get_frame_size
+from .lib import ZWOASICameraLib, ZWOASICameraLibTiming, set_asi_camera_lib
+from .version import ZWOASI_SDK_VERSION
+
+# **************************************************************************************
+
+# The number of distinct pixel values in the repeating noise pattern of a frame:
+ZWOASI_SIMULATOR_NOISE_PIXELS: int = 8191
+
+# **************************************************************************************
+
+
+class ZWOASISimulatedCameraConfiguration(BaseModel):
+    """
+    A Pydantic model of the configuration of a simulated ZWO ASI camera.
+    """
+
+    name: str = Field(
+        default="ZWO ASI Simulator",
+        description="The name of the simulated camera (up to 64 chars).",
+        max_length=64,
+    )
+
+    product_id: int = Field(
+        default=0x1234,
+        description="The USB product ID reported by the simulated camera.",
+    )
+
+    serial_number: bytes = Field(
+        default=b"\x01\x23\x45\x67\x89\xab\xcd\xef",
+        description="The 8 byte serial number of the simulated camera.",
+        min_length=8,
+        max_length=8,
+    )
+
+    width: int = Field(
+        default=1936,
+        description="The width of the sensor (in pixels).",
+        ge=8,
+    )
+
+    height: int = Field(
+        default=1096,
+        description="The height of the sensor (in pixels).",
+        ge=2,
+    )
+
+    pixel_size: float = Field(
+        default=2.9,
+        description="The pixel size of the sensor in microns (µm).",
+        gt=0,
+    )
+
+    bit_depth: int = Field(
+        default=12,
+        description="The bit depth of the sensor's ADC.",
+        ge=8,
+        le=16,
+    )
+
+    electrons_per_adu: float = Field(
+        default=1.0,
+        description="Electrons per ADU (Analog-to-Digital Unit).",
+    )
+
+    is_color: bool = Field(
+        default=False,
+        description="Whether the simulated camera is a color camera.",
+    )
+
+    bayer_pattern: ZWOASIBayerPattern = Field(
+        default=ZWOASIBayerPattern.RG,
+        description="The Bayer pattern of the sensor (if color).",
+    )
+
+    supported_binnings: List[int] = Field(
+        default=[1, 2, 4],
+        description="The supported binning factors.",
+    )
+
+    is_usb3: bool = Field(
+        default=True,
+        description="Whether the simulated camera (and host) is USB 3.0.",
+    )
+
+    has_cooler: bool = Field(
+        default=False,
+        description="Whether the simulated camera has a cooler.",
+    )
+
+    has_st4_port: bool = Field(
+        default=True,
+        description="Whether the simulated camera has an ST4 guide port.",
+    )
+
+    has_external_trigger: bool = Field(
+        default=False,
+        description="Whether the simulated camera supports triggered exposures.",
+    )
+
+    has_gps: bool = Field(
+        default=False,
+        description="Whether the simulated camera returns GPS data.",
+    )
+
+    readout_rate: float = Field(
+        default=200_000_000.0,
+        description="The frame readout rate (in bytes per second), 0 for instant.",
+        ge=0,
+    )
+
+    bias: int = Field(
+        default=1000,
+        description="The mean pixel value (in 16-bit ADU) of a frame.",
+        ge=0,
+        le=65535,
+    )
+
+    noise: float = Field(
+        default=25.0,
+        description="The standard deviation (in 16-bit ADU) of the pixel noise.",
+        ge=0,
+    )
+
+    dropped_frame_probability: float = Field(
+        default=0.0,
+        description="The probability that each video frame is dropped by the SDK.",
+        ge=0,
+        le=1,
+    )
+
+    video_buffer_frames: int = Field(
+        default=2,
+        description="The number of video frames buffered before frames are dropped.",
+        ge=1,
+    )
+
+    latitude: float = Field(
+        default=52.2053,
+        description="The latitude (+: North, -: South) reported by the GPS.",
+    )
+
+    longitude: float = Field(
+        default=0.1218,
+        description="The longitude (+: East, -: West) reported by the GPS.",
+    )
+
+    altitude: int = Field(
+        default=150,
+        description="The altitude (in 0.1 m units) reported by the GPS.",
+    )
+
+    seed: int = Field(
+        default=0,
+        description="The seed for the frame noise and dropped frame generators.",
+    )
+
+    def get_supported_image_types(self) -> List[ZWOASIImageType]:
+        """
+        Get the image types supported by the simulated camera.
+        """
+        if self.is_color:
+            return [
+                ZWOASIImageType.RAW8,
+                ZWOASIImageType.RGB24,
+                ZWOASIImageType.RAW16,
+                ZWOASIImageType.Y8,
+            ]
+
+        return [ZWOASIImageType.RAW8, ZWOASIImageType.RAW16]
+
+
+# **************************************************************************************
+
+# (control type, name, description, minimum, maximum, default, auto, writable), where
+# the control type may be unknown to ZWOASIControlType, e.g., as for a newer SDK:
+ZWOASISimulatedControl = Tuple[int, str, str, int, int, int, bool, bool]
+
+# **************************************************************************************
+
+
+def get_simulated_controls(
+    configuration: ZWOASISimulatedCameraConfiguration,
+) -> List[ZWOASISimulatedControl]:
+    """
+    Get the control capabilities of a simulated camera with the given configuration.
+    """
+    controls: List[ZWOASISimulatedControl] = [
+        (ZWOASIControlType.GAIN, "Gain", "Gain", 0, 570, 200, True, True),
+        (
+            ZWOASIControlType.EXPOSURE,
+            "Exposure",
+            "Exposure Time(us)",
+            32,
+            2_000_000_000,
+            10_000,
+            True,
+            True,
+        ),
+        (ZWOASIControlType.OFFSET, "Offset", "offset", 0, 80, 8, False, True),
+        (
+            ZWOASIControlType.BANDWIDTH_OVERLOAD,
+            "BandWidth",
+            "The total data transfer rate percentage",
+            40,
+            100,
+            50,
+            True,
+            True,
+        ),
+        (ZWOASIControlType.IMAGE_FLIP, "Flip", "Flip: 0->None", 0, 3, 0, False, True),
+        (
+            ZWOASIControlType.TEMPERATURE_READING,
+            "Temperature",
+            "Sensor temperature(degrees Celsius)",
+            -500,
+            1000,
+            200,
+            False,
+            False,
+        ),
+        (
+            ZWOASIControlType.HIGH_SPEED_MODE,
+            "HighSpeedMode",
+            "Is high speed mode:0->No 1->Yes",
+            0,
+            1,
+            0,
+            False,
+            True,
+        ),
+    ]
+
+    if configuration.is_color:
+        controls += [
+            (
+                ZWOASIControlType.WHITE_BALANCE_RED_CHANNEL,
+                "WB_R",
+                "White balance: Red component",
+                1,
+                99,
+                52,
+                True,
+                True,
+            ),
+            (
+                ZWOASIControlType.WHITE_BALANCE_BLUE_CHANNEL,
+                "WB_B",
+                "White balance: Blue component",
+                1,
+                99,
+                95,
+                True,
+                True,
+            ),
+        ]
+
+    if configuration.has_cooler:
+        controls += [
+            (
+                ZWOASIControlType.TARGET_TEMPERATURE,
+                "TargetTemp",
+                "Target temperature(cool camera only)",
+                -40,
+                30,
+                0,
+                False,
+                True,
+            ),
+            (
+                ZWOASIControlType.COOLER_ON_OFF,
+                "CoolerOn",
+                "turn on/off cooler(cool camera only)",
+                0,
+                1,
+                0,
+                False,
+                True,
+            ),
+            (
+                ZWOASIControlType.COOLER_POWER_PERCENTAGE,
+                "CoolPowerPerc",
+                "cooler power percent",
+                0,
+                100,
+                0,
+                False,
+                False,
+            ),
+        ]
+
+    if configuration.has_gps:
+        controls += [
+            (
+                ZWOASIControlType.GPS_SUPPORT_INDICATOR,
+                "GPS",
+                "the camera has a GPS or not",
+                0,
+                1,
+                1,
+                False,
+                False,
+            ),
+            (
+                ZWOASIControlType.GPS_START_LINE_POSITION,
+                "GPSStartLine",
+                "GPS start line",
+                0,
+                configuration.height - 1,
+                0,
+                False,
+                True,
+            ),
+            (
+                ZWOASIControlType.GPS_END_LINE_POSITION,
+                "GPSEndLine",
+                "GPS end line",
+                0,
+                configuration.height - 1,
+                0,
+                False,
+                True,
+            ),
+        ]
+
+    return controls
+
+
+# **************************************************************************************
+
+
+def _get_target(argument: Any) -> Any:
+    # Arguments passed with byref() wrap the underlying ctypes object:
+    return getattr(argument, "_obj", argument)
+
+
+# **************************************************************************************
+
+
+def _get_value(argument: Any) -> int:
+    # Scalars may be passed as Python ints (or enums), or as ctypes instances:
+    return int(getattr(argument, "value", argument))
+
+
+# **************************************************************************************
+
+
+def _set_value(argument: Any, value: Any) -> None:
+    _get_target(argument).value = value
+
+
+# **************************************************************************************
+
+
+class ZWOASISimulatedCamera(object):
+    """
+    The simulated state of a single camera, e.g., its controls, ROI and exposure.
+    """
+
+    def __init__(
+        self, id: int, configuration: ZWOASISimulatedCameraConfiguration
+    ) -> None:
+        self.id = id
+        self.configuration = configuration
+
+        self.lock = Lock()
+
+        self.is_open = False
+        self.is_initialised = False
+
+        self.controls: Dict[int, ZWOASISimulatedControl] = {
+            control[0]: control for control in get_simulated_controls(configuration)
+        }
+
+        self.values: Dict[int, int] = {
+            control_type: control[5] for control_type, control in self.controls.items()
+        }
+
+        self.auto: Dict[int, bool] = {
+            control_type: False for control_type in self.controls
+        }
+
+        self.mode = ZWOASICameraMode.NORMAL
+
+        self.trigger_outputs: Dict[int, Tuple[int, int, int]] = {}
+
+        self.guiding: Dict[int, bool] = {}
+
+        self.width = configuration.width
+        self.height = configuration.height
+        self.binning = 1
+        self.image_type = ZWOASIImageType.RAW8
+        self.start_x = 0
+        self.start_y = 0
+
+        self.status = ZWOASIExposureStatus.IDLE
+        self.exposure_started = 0.0
+        self.exposure_ends = 0.0
+        self.exposure_started_at = datetime.now(timezone.utc)
+
+        self.is_video_capturing = False
+        self.video_next_frame = 0.0
+        self.dropped_frames = 0
+
+        self.sequence = 0
+
+        self.random = Random(configuration.seed)
+
+        # The repeating noise pattern for the current image type:
+        self.pattern = bytearray()
+        self.pattern_image_type: Optional[ZWOASIImageType] = None
+
+    @property
+    def frame_size(self) -> int:
+        return get_frame_size(self.width, self.height, self.image_type)
+
+    @property
+    def exposure_time(self) -> float:
+        return self.values[ZWOASIControlType.EXPOSURE] / 1_000_000.0
+
+    @property
+    def readout_time(self) -> float:
+        rate = self.configuration.readout_rate
+
+        return self.frame_size / rate if rate > 0 else 0.0
+
+    def get_pattern(self) -> memoryview:
+        """
+        Get the repeating noise pattern, of at least one frame (plus one period)
+        in size, so that successive frames can be cut from it at different offsets.
+        """
+        size = self.frame_size
+
+        period = ZWOASI_SIMULATOR_NOISE_PIXELS * get_bytes_per_pixel(self.image_type)
+
+        if self.pattern_image_type == self.image_type and len(self.pattern) >= (
+            size + period
+        ):
+            return memoryview(self.pattern)
+
+        configuration = self.configuration
+
+        # The sensor's ADC values are MSB aligned in 16 bits by the SDK:
+        shift = 16 - configuration.bit_depth
+
+        values = [
+            min(
+                max(int(self.random.gauss(configuration.bias, configuration.noise)), 0),
+                65535,
+            )
+            >> shift
+            << shift
+            for _ in range(ZWOASI_SIMULATOR_NOISE_PIXELS)
+        ]
+
+        if self.image_type == ZWOASIImageType.RAW16:
+            tile = b"".join(value.to_bytes(2, "little") for value in values)
+        elif self.image_type == ZWOASIImageType.RGB24:
+            tile = bytes(value >> 8 for value in values for _ in range(3))
+        else:
+            tile = bytes(value >> 8 for value in values)
+
+        self.pattern = bytearray(tile * (size // len(tile) + 2))
+        self.pattern_image_type = self.image_type
+
+        return memoryview(self.pattern)
+
+    def render(self, buffer: Any, size: int) -> int:
+        """
+        Write the next simulated frame into the given (ctypes) buffer.
+        """
+        if size < self.frame_size:
+            return ZWOASIErrorCode.BUFFER_TOO_SMALL
+
+        pattern = self.get_pattern()
+
+        self.sequence += 1
+
+        bytes_per_pixel = get_bytes_per_pixel(self.image_type)
+
+        # Cut each successive frame at a different (pixel-aligned) offset:
+        offset = (self.sequence * 7 % ZWOASI_SIMULATOR_NOISE_PIXELS) * bytes_per_pixel
+
+        frame_size = self.frame_size
+
+        destination = memoryview(_get_target(buffer)).cast("B")
+
+        destination[:frame_size] = pattern[offset : offset + frame_size]
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def update_status(self) -> ZWOASIExposureStatus:
+        if (
+            self.status == ZWOASIExposureStatus.WORKING
+            and monotonic() >= self.exposure_ends
+        ):
+            self.status = ZWOASIExposureStatus.SUCCESS
+
+        return self.status
+
+
+# **************************************************************************************
+
+
+class ZWOASISimulatedSDK(object):
+    """
+    A pure Python stand-in for the libASICamera2 shared library.
+
+    The simulated SDK implements the same function surface as configured by
+    ZWOASICameraLib._configure(), accepting the same ctypes arguments (including
+    byref() pointers), and returning the same error codes, so that ZWOASICamera can
+    be driven end to end without a camera (or the vendor library) being present.
+    """
+
+    # The simulated cameras, indexed by camera ID:
+    cameras: List[ZWOASISimulatedCamera]
+
+    def __init__(
+        self,
+        cameras: Optional[List[ZWOASISimulatedCameraConfiguration]] = None,
+        version: Tuple[int, int, int] = ZWOASI_SDK_VERSION,
+    ) -> None:
+        """
+        Initialise the simulated SDK.
+
+        Args:
+            cameras (Optional[List[ZWOASISimulatedCameraConfiguration]]): The
+                configuration of each simulated camera. Defaults to one camera.
+            version (Tuple[int, int, int]): The SDK version to report.
+        """
+        self.cameras = [
+            ZWOASISimulatedCamera(id, configuration)
+            for id, configuration in enumerate(
+                cameras
+                if cameras is not None
+                else [ZWOASISimulatedCameraConfiguration()]
+            )
+        ]
+
+        major, minor, patch = version
+
+        # N.B. Kept as an attribute so that the returned pointer remains valid:
+        self._version = c_char_p(f"{major}, {minor}, {patch}".encode("utf-8"))
+
+    def _get_camera(self, id: Any) -> Optional[ZWOASISimulatedCamera]:
+        index = _get_value(id)
+
+        if index < 0 or index >= len(self.cameras):
+            return None
+
+        return self.cameras[index]
+
+    def _get_open_camera(
+        self, id: Any
+    ) -> Tuple[Optional[ZWOASISimulatedCamera], ZWOASIErrorCode]:
+        camera = self._get_camera(id)
+
+        if camera is None:
+            return None, ZWOASIErrorCode.INVALID_INDEX
+
+        if not camera.is_open:
+            return None, ZWOASIErrorCode.CAMERA_CLOSED
+
+        return camera, ZWOASIErrorCode.SUCCESS
+
+    # [Enumeration]
+
+    def ASIGetNumOfConnectedCameras(self) -> int:
+        return len(self.cameras)
+
+    def ASICameraCheck(self, vid: Any, pid: Any) -> int:
+        return (
+            ZWOASIBool.TRUE
+            if _get_value(vid) == 0x03C3
+            and any(
+                camera.configuration.product_id == _get_value(pid)
+                for camera in self.cameras
+            )
+            else ZWOASIBool.FALSE
+        )
+
+    def ASIGetCameraProperty(self, info: Any, index: Any) -> int:
+        camera = self._get_camera(index)
+
+        if camera is None:
+            return ZWOASIErrorCode.INVALID_INDEX
+
+        configuration = camera.configuration
+
+        c_info = _get_target(info)
+
+        c_info.Name = configuration.name.encode("utf-8")
+        c_info.CameraID = camera.id
+        c_info.MaxHeight = configuration.height
+        c_info.MaxWidth = configuration.width
+        c_info.IsColorCam = int(configuration.is_color)
+        c_info.BayerPattern = (
+            configuration.bayer_pattern if configuration.is_color else 0
+        )
+
+        for i, binning in enumerate(configuration.supported_binnings[:15]):
+            c_info.SupportedBins[i] = binning
+
+        image_types = configuration.get_supported_image_types()
+
+        for i, image_type in enumerate(image_types[:7]):
+            c_info.SupportedVideoFormat[i] = image_type
+
+        c_info.SupportedVideoFormat[min(len(image_types), 7)] = ZWOASIImageType.END
+
+        c_info.PixelSize = configuration.pixel_size
+        c_info.MechanicalShutter = 0
+        c_info.ST4Port = int(configuration.has_st4_port)
+        c_info.IsCoolerCam = int(configuration.has_cooler)
+        c_info.IsUSB3Host = int(configuration.is_usb3)
+        c_info.IsUSB3Camera = int(configuration.is_usb3)
+        c_info.ElecPerADU = configuration.electrons_per_adu
+        c_info.BitDepth = configuration.bit_depth
+        c_info.IsTriggerCam = int(configuration.has_external_trigger)
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIOpenCamera(self, id: Any) -> int:
+        camera = self._get_camera(id)
+
+        if camera is None:
+            return ZWOASIErrorCode.INVALID_INDEX
+
+        camera.is_open = True
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIInitCamera(self, id: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        with camera.lock:
+            camera.is_initialised = True
+            camera.width = camera.configuration.width
+            camera.height = camera.configuration.height
+            camera.binning = 1
+            camera.image_type = ZWOASIImageType.RAW8
+            camera.start_x = 0
+            camera.start_y = 0
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASICloseCamera(self, id: Any) -> int:
+        camera = self._get_camera(id)
+
+        if camera is None:
+            return ZWOASIErrorCode.INVALID_INDEX
+
+        with camera.lock:
+            camera.is_open = False
+            camera.is_initialised = False
+            camera.is_video_capturing = False
+            camera.status = ZWOASIExposureStatus.IDLE
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIGetID(self, id: Any, c_id: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        memoryview(_get_target(c_id)).cast("B")[:8] = camera.id.to_bytes(8, "little")
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIGetSerialNumber(self, id: Any, serial_number: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        memoryview(_get_target(serial_number)).cast("B")[:8] = (
+            camera.configuration.serial_number
+        )
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIGetSDKVersion(self) -> c_char_p:
+        return self._version
+
+    # [Controls]
+
+    def ASIGetNumOfControls(self, id: Any, number_of_controls: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        _set_value(number_of_controls, len(camera.controls))
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIGetControlCaps(self, id: Any, index: Any, capabilities: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        controls = list(camera.controls.values())
+
+        i = _get_value(index)
+
+        if i < 0 or i >= len(controls):
+            return ZWOASIErrorCode.INVALID_CONTROL_TYPE
+
+        control_type, name, description, minimum, maximum, default, auto, writable = (
+            controls[i]
+        )
+
+        c_capabilities = _get_target(capabilities)
+
+        c_capabilities.Name = name.encode("utf-8")
+        c_capabilities.Description = description.encode("utf-8")
+        c_capabilities.MaxValue = maximum
+        c_capabilities.MinValue = minimum
+        c_capabilities.DefaultValue = default
+        c_capabilities.IsAutoSupported = int(auto)
+        c_capabilities.IsWritable = int(writable)
+        c_capabilities.ControlType = control_type
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIGetControlValue(
+        self, id: Any, control_type: Any, value: Any, is_auto: Any
+    ) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        control = _get_value(control_type)
+
+        if control not in camera.controls:
+            return ZWOASIErrorCode.INVALID_CONTROL_TYPE
+
+        with camera.lock:
+            current = camera.values[control]
+
+            # Simulate the sensor settling at the cooler's target temperature:
+            if control == ZWOASIControlType.TEMPERATURE_READING and camera.values.get(
+                ZWOASIControlType.COOLER_ON_OFF
+            ):
+                current = camera.values[ZWOASIControlType.TARGET_TEMPERATURE] * 10
+
+            _set_value(value, current)
+            _set_value(is_auto, int(camera.auto[control]))
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASISetControlValue(
+        self, id: Any, control_type: Any, value: Any, is_auto: Any
+    ) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        control = _get_value(control_type)
+
+        if control not in camera.controls:
+            return ZWOASIErrorCode.INVALID_CONTROL_TYPE
+
+        _, _, _, minimum, maximum, _, auto, writable = camera.controls[control]
+
+        if not writable:
+            return ZWOASIErrorCode.GENERAL_ERROR
+
+        with camera.lock:
+            # The SDK clamps values to the supported range of the control:
+            camera.values[control] = min(max(_get_value(value), minimum), maximum)
+            camera.auto[control] = auto and bool(_get_value(is_auto))
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIGetGainOffset(
+        self,
+        id: Any,
+        offset_highest_dynamic_range: Any,
+        offset_unity_gain: Any,
+        gain_lowest_read_noise: Any,
+        offset_lowest_read_noise: Any,
+    ) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        # The presets are derived from the configured (default) gain and offset:
+        gain = camera.controls[ZWOASIControlType.GAIN][5]
+
+        offset = camera.controls[ZWOASIControlType.OFFSET][5]
+
+        _set_value(offset_highest_dynamic_range, offset)
+        _set_value(offset_unity_gain, offset)
+        _set_value(gain_lowest_read_noise, gain)
+        _set_value(offset_lowest_read_noise, offset)
+
+        return ZWOASIErrorCode.SUCCESS
+
+    # [ROI]
+
+    def ASIGetROIFormat(
+        self, id: Any, width: Any, height: Any, binning: Any, image_type: Any
+    ) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        with camera.lock:
+            _set_value(width, camera.width)
+            _set_value(height, camera.height)
+            _set_value(binning, camera.binning)
+            _set_value(image_type, camera.image_type)
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASISetROIFormat(
+        self, id: Any, width: Any, height: Any, binning: Any, image_type: Any
+    ) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        w, h, b, t = (
+            _get_value(width),
+            _get_value(height),
+            _get_value(binning),
+            _get_value(image_type),
+        )
+
+        configuration = camera.configuration
+
+        if b not in configuration.supported_binnings:
+            return ZWOASIErrorCode.INVALID_VIDEO_SIZE
+
+        if (
+            w < 8
+            or h < 2
+            or w % 8 != 0
+            or h % 2 != 0
+            or w * b > configuration.width
+            or h * b > configuration.height
+        ):
+            return ZWOASIErrorCode.INVALID_VIDEO_SIZE
+
+        if t not in configuration.get_supported_image_types():
+            return ZWOASIErrorCode.INVALID_IMAGE_TYPE
+
+        with camera.lock:
+            if camera.is_video_capturing:
+                return ZWOASIErrorCode.VIDEO_MODE_ACTIVE
+
+            camera.width = w
+            camera.height = h
+            camera.binning = b
+            camera.image_type = ZWOASIImageType(t)
+
+            # Like the SDK, a new ROI format is centred on the sensor:
+            camera.start_x = (configuration.width // b - w) // 2
+            camera.start_y = (configuration.height // b - h) // 2
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIGetStartPos(self, id: Any, start_x: Any, start_y: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        with camera.lock:
+            _set_value(start_x, camera.start_x)
+            _set_value(start_y, camera.start_y)
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASISetStartPos(self, id: Any, start_x: Any, start_y: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        x, y = _get_value(start_x), _get_value(start_y)
+
+        configuration = camera.configuration
+
+        with camera.lock:
+            if (
+                x < 0
+                or y < 0
+                or x + camera.width > configuration.width // camera.binning
+                or y + camera.height > configuration.height // camera.binning
+            ):
+                return ZWOASIErrorCode.START_POSITION_OUT_OF_BOUNDARY
+
+            camera.start_x = x
+            camera.start_y = y
+
+        return ZWOASIErrorCode.SUCCESS
+
+    # [Modes]
+
+    def ASIGetCameraMode(self, id: Any, mode: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        _set_value(mode, camera.mode)
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASISetCameraMode(self, id: Any, mode: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        value = _get_value(mode)
+
+        if value != ZWOASICameraMode.NORMAL and (
+            not camera.configuration.has_external_trigger
+        ):
+            return ZWOASIErrorCode.INVALID_MODE
+
+        try:
+            camera.mode = ZWOASICameraMode(value)
+        except ValueError:
+            return ZWOASIErrorCode.INVALID_MODE
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIGetCameraSupportMode(self, id: Any, modes: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        supported = (
+            [mode for mode in ZWOASICameraMode if mode != ZWOASICameraMode.END]
+            if camera.configuration.has_external_trigger
+            else [ZWOASICameraMode.NORMAL]
+        )
+
+        c_modes = _get_target(modes)
+
+        for i, mode in enumerate(supported):
+            c_modes.SupportedCameraMode[i] = mode
+
+        c_modes.SupportedCameraMode[len(supported)] = ZWOASICameraMode.END
+
+        return ZWOASIErrorCode.SUCCESS
+
+    # [Exposures]
+
+    def ASIStartExposure(self, id: Any, is_dark: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        with camera.lock:
+            if camera.is_video_capturing:
+                return ZWOASIErrorCode.VIDEO_MODE_ACTIVE
+
+            if camera.update_status() == ZWOASIExposureStatus.WORKING:
+                return ZWOASIErrorCode.EXPOSURE_IN_PROGRESS
+
+            camera.status = ZWOASIExposureStatus.WORKING
+            camera.exposure_started = monotonic()
+            camera.exposure_started_at = datetime.now(timezone.utc)
+            camera.exposure_ends = (
+                camera.exposure_started + camera.exposure_time + camera.readout_time
+            )
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIStopExposure(self, id: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        with camera.lock:
+            # Like the SDK, stopping an exposure in progress marks it as failed:
+            if camera.update_status() == ZWOASIExposureStatus.WORKING:
+                camera.status = ZWOASIExposureStatus.FAILED
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIGetExpStatus(self, id: Any, status: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        with camera.lock:
+            _set_value(status, camera.update_status())
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIGetDataAfterExp(self, id: Any, buffer: Any, size: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        with camera.lock:
+            if camera.update_status() != ZWOASIExposureStatus.SUCCESS:
+                return ZWOASIErrorCode.GENERAL_ERROR
+
+            error = ZWOASIErrorCode(camera.render(buffer, _get_value(size)))
+
+            if error == ZWOASIErrorCode.SUCCESS:
+                camera.status = ZWOASIExposureStatus.IDLE
+
+        return error
+
+    def ASIGetDataAfterExpGPS(self, id: Any, buffer: Any, size: Any, gps: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        if not camera.configuration.has_gps:
+            return ZWOASIErrorCode.GPS_NOT_SUPPORTED
+
+        error = ZWOASIErrorCode(self.ASIGetDataAfterExp(id, buffer, size))
+
+        if error == ZWOASIErrorCode.SUCCESS:
+            self._set_gps(camera, gps, camera.exposure_started_at)
+
+        return error
+
+    # [Video]
+
+    def ASIStartVideoCapture(self, id: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        with camera.lock:
+            if camera.update_status() == ZWOASIExposureStatus.WORKING:
+                return ZWOASIErrorCode.EXPOSURE_IN_PROGRESS
+
+            camera.is_video_capturing = True
+            camera.dropped_frames = 0
+            camera.video_next_frame = monotonic() + self._get_frame_interval(camera)
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIStopVideoCapture(self, id: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        with camera.lock:
+            camera.is_video_capturing = False
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def _get_frame_interval(self, camera: ZWOASISimulatedCamera) -> float:
+        # The sensor can read out the previous frame whilst exposing the next:
+        return max(camera.exposure_time, camera.readout_time, 1e-4)
+
+    def ASIGetVideoData(self, id: Any, buffer: Any, size: Any, timeout: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        if not camera.is_video_capturing:
+            return ZWOASIErrorCode.INVALID_SEQUENCE
+
+        configuration = camera.configuration
+
+        wait = _get_value(timeout)
+
+        deadline = None if wait < 0 else monotonic() + wait / 1000.0
+
+        while True:
+            with camera.lock:
+                interval = self._get_frame_interval(camera)
+
+                now = monotonic()
+
+                due = camera.video_next_frame
+
+                if now >= due:
+                    # Frames beyond the SDK's internal buffer have been dropped:
+                    backlog = int((now - due) / interval)
+
+                    if backlog >= configuration.video_buffer_frames:
+                        dropped = backlog - configuration.video_buffer_frames + 1
+                        camera.dropped_frames += dropped
+                        due += dropped * interval
+
+                    camera.video_next_frame = due + interval
+
+                    # Randomly drop frames, e.g., to simulate USB bandwidth issues:
+                    if (
+                        configuration.dropped_frame_probability > 0
+                        and camera.random.random()
+                        < configuration.dropped_frame_probability
+                    ):
+                        camera.dropped_frames += 1
+                        continue
+
+                    camera.exposure_started_at = datetime.now(timezone.utc)
+
+                    return camera.render(buffer, _get_value(size))
+
+            if deadline is not None and due > deadline:
+                sleep(max(deadline - monotonic(), 0.0))
+                return ZWOASIErrorCode.TIMEOUT
+
+            sleep(max(due - monotonic(), 0.0))
+
+    def ASIGetVideoDataGPS(
+        self, id: Any, buffer: Any, size: Any, timeout: Any, gps: Any
+    ) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        if not camera.configuration.has_gps:
+            return ZWOASIErrorCode.GPS_NOT_SUPPORTED
+
+        error = ZWOASIErrorCode(self.ASIGetVideoData(id, buffer, size, timeout))
+
+        if error == ZWOASIErrorCode.SUCCESS:
+            self._set_gps(camera, gps, camera.exposure_started_at)
+
+        return error
+
+    def ASIGetDroppedFrames(self, id: Any, dropped_frames: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        _set_value(dropped_frames, camera.dropped_frames)
+
+        return ZWOASIErrorCode.SUCCESS
+
+    # [GPS]
+
+    def _set_gps(self, camera: ZWOASISimulatedCamera, gps: Any, at: datetime) -> None:
+        configuration = camera.configuration
+
+        c_gps = _get_target(gps)
+
+        c_gps.Datetime.Year = at.year
+        c_gps.Datetime.Month = at.month
+        c_gps.Datetime.Day = at.day
+        c_gps.Datetime.Hour = at.hour
+        c_gps.Datetime.Minute = at.minute
+        c_gps.Datetime.Second = at.second
+        c_gps.Datetime.Msecond = at.microsecond // 1000
+        c_gps.Datetime.Usecond = (at.microsecond % 1000) * 10
+        c_gps.Latitude = configuration.latitude
+        c_gps.Longitude = configuration.longitude
+        c_gps.Altitude = configuration.altitude
+        c_gps.SatelliteNum = 12
+
+    def ASIGPSGetData(self, id: Any, start: Any, end: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        if not camera.configuration.has_gps:
+            return ZWOASIErrorCode.GPS_NOT_SUPPORTED
+
+        self._set_gps(camera, start, camera.exposure_started_at)
+
+        self._set_gps(camera, end, datetime.now(timezone.utc))
+
+        return ZWOASIErrorCode.SUCCESS
+
+    # [Guiding]
+
+    def ASIPulseGuideOn(self, id: Any, direction: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        if not camera.configuration.has_st4_port:
+            return ZWOASIErrorCode.GENERAL_ERROR
+
+        camera.guiding[_get_value(direction)] = True
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIPulseGuideOff(self, id: Any, direction: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        if not camera.configuration.has_st4_port:
+            return ZWOASIErrorCode.GENERAL_ERROR
+
+        camera.guiding[_get_value(direction)] = False
+
+        return ZWOASIErrorCode.SUCCESS
+
+    # [Dark Subtraction]
+
+    def ASIEnableDarkSubtract(self, id: Any, path: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        return error if camera is None else ZWOASIErrorCode.SUCCESS
+
+    def ASIDisableDarkSubtract(self, id: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        return error if camera is None else ZWOASIErrorCode.SUCCESS
+
+    # [Triggers]
+
+    def ASISendSoftTrigger(self, id: Any, start: Any) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        if not camera.configuration.has_external_trigger:
+            return ZWOASIErrorCode.INVALID_MODE
+
+        if camera.mode == ZWOASICameraMode.NORMAL:
+            return ZWOASIErrorCode.INVALID_MODE
+
+        # A soft trigger (start) begins an exposure in the triggered modes:
+        if _get_value(start):
+            return self.ASIStartExposure(id, 0)
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASIGetTriggerOutputIOConf(
+        self, id: Any, pin: Any, high: Any, delay: Any, duration: Any
+    ) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        if not camera.configuration.has_external_trigger:
+            return ZWOASIErrorCode.GENERAL_ERROR
+
+        is_high, d, t = camera.trigger_outputs.get(_get_value(pin), (1, 0, 0))
+
+        _set_value(high, is_high)
+        _set_value(delay, d)
+        _set_value(duration, t)
+
+        return ZWOASIErrorCode.SUCCESS
+
+    def ASISetTriggerOutputIOConf(
+        self, id: Any, pin: Any, high: Any, delay: Any, duration: Any
+    ) -> int:
+        camera, error = self._get_open_camera(id)
+
+        if camera is None:
+            return error
+
+        if not camera.configuration.has_external_trigger:
+            return ZWOASIErrorCode.GENERAL_ERROR
+
+        camera.trigger_outputs[_get_value(pin)] = (
+            _get_value(high),
+            _get_value(delay),
+            _get_value(duration),
+        )
+
+        return ZWOASIErrorCode.SUCCESS
+
+
+# **************************************************************************************
+
+
+class ZWOASISimulatedCameraLib(ZWOASICameraLib):
+    """
+    A ZWOASICameraLib backed by the simulated SDK, rather than libASICamera2.
+    """
+
+    # The simulated SDK, e.g., to inspect (or modify) the simulated camera state:
+    sdk: ZWOASISimulatedSDK
+
+    def __init__(
+        self,
+        cameras: Optional[List[ZWOASISimulatedCameraConfiguration]] = None,
+        version: Tuple[int, int, int] = ZWOASI_SDK_VERSION,
+    ) -> None:
+        self.sdk = ZWOASISimulatedSDK(cameras=cameras, version=version)
+
+        self.lib = cast(CDLL, self.sdk)
+
+        self.timing = ZWOASICameraLibTiming(
+            resolve=0.0, load=0.0, configure=0.0, total=0.0
+        )
+
+
+# **************************************************************************************
+
+
+def install_simulated_asi_camera_lib(
+    cameras: Optional[List[ZWOASISimulatedCameraConfiguration]] = None,
+    version: Tuple[int, int, int] = ZWOASI_SDK_VERSION,
+) -> ZWOASISimulatedCameraLib:
+    """
+    Install a simulated SDK as the process-wide shared library for the given version,
+    so that subsequently created cameras are backed by the simulated cameras.
+
+    N.B. Call set_asi_camera_lib(None, version) to uninstall the simulated SDK.
+
+    Args:
+        cameras (Optional[List[ZWOASISimulatedCameraConfiguration]]): The
+            configuration of each simulated camera. Defaults to one camera.
+        version (Tuple[int, int, int]): The SDK version to install the library for.
+
+    Returns:
+        ZWOASISimulatedCameraLib: The installed simulated library.
+    """
+    library = ZWOASISimulatedCameraLib(cameras=cameras, version=version)
+
+    set_asi_camera_lib(library, version=version)
+
+    return library
+
+
+# **************************************************************************************
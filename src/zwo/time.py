@@ -120,3 +120,131 @@ class ZWOASIDateTime(BaseModel):
 
 
 # **************************************************************************************
+
+
+class ZWOASIDateTimeRecord(object):
+    """
+    A compact, unvalidated representation of the C struct ASI_DATE_TIME.
+
+    Unlike ZWOASIDateTime, constructing a record performs no validation and does not
+    decode the unused bytes, so it is cheap enough to create for every frame. It can
+    be converted to the validated Pydantic model on demand with to_model().
+    """
+
+    __slots__ = (
+        "year",
+        "month",
+        "day",
+        "hour",
+        "minute",
+        "second",
+        "milliseconds",
+        "microseconds",
+        "_unused",
+    )
+
+    year: int
+    month: int
+    day: int
+    hour: int
+    minute: int
+    second: int
+    milliseconds: int
+    # Microseconds in 0.1µs units (0-9999):
+    microseconds: int
+
+    def __init__(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: int = 0,
+        minute: int = 0,
+        second: int = 0,
+        milliseconds: int = 0,
+        microseconds: int = 0,
+        unused: bytes = b"",
+    ) -> None:
+        self.year = year
+        self.month = month
+        self.day = day
+        self.hour = hour
+        self.minute = minute
+        self.second = second
+        self.milliseconds = milliseconds
+        self.microseconds = microseconds
+        self._unused = unused
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.year}, {self.month}, {self.day}, "
+            f"{self.hour}, {self.minute}, {self.second}, {self.milliseconds}, "
+            f"{self.microseconds})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ZWOASIDateTimeRecord):
+            return NotImplemented
+
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    @property
+    def unused(self) -> str:
+        """
+        The unused field, decoded (on demand) from the raw bytes.
+        """
+        return self._unused.decode("utf-8").rstrip("\x00")
+
+    @classmethod
+    def from_c_types(
+        cls, c_datetime: ZWOASI_CAMERA_DATE_TIME_CTYPE
+    ) -> "ZWOASIDateTimeRecord":
+        """
+        Convert a ctypes ASI_DATE_TIME structure to a ZWOASIDateTimeRecord instance.
+        """
+        return cls(
+            c_datetime.Year,
+            c_datetime.Month,
+            c_datetime.Day,
+            c_datetime.Hour,
+            c_datetime.Minute,
+            c_datetime.Second,
+            c_datetime.Msecond,
+            c_datetime.Usecond,
+            c_datetime.Unused,
+        )
+
+    def to_datetime(self) -> datetime:
+        """
+        Convert the record to a (naive) datetime, truncated to whole microseconds.
+        """
+        return datetime(
+            self.year,
+            self.month,
+            self.day,
+            self.hour,
+            self.minute,
+            self.second,
+            self.milliseconds * 1000 + self.microseconds // 10,
+        )
+
+    def to_model(self) -> ZWOASIDateTime:
+        """
+        Convert the record to the validated ZWOASIDateTime Pydantic model.
+        """
+        return ZWOASIDateTime(
+            year=self.year,
+            month=self.month,
+            day=self.day,
+            hour=self.hour,
+            minute=self.minute,
+            second=self.second,
+            milliseconds=self.milliseconds,
+            microseconds=self.microseconds,
+            unused=self.unused,
+        )
+
+
+# **************************************************************************************
@@ -0,0 +1,162 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from collections import deque
+from itertools import count
+from threading import Lock
+from typing import Callable, Deque, Dict, List, Optional, Tuple, TypedDict
+
+# **************************************************************************************
+
+# The names of the spans emitted for each stage of a frame's lifecycle:
+#   start_exposure: the call to ASIStartExposure.
+#   wait: from the start of the exposure until its completion was detected.
+#   get_data: the call to ASIGetDataAfterExp (or ASIGetDataAfterExpGPS).
+#   read_video: the call to ASIGetVideoData (or ASIGetVideoDataGPS).
+#   convert: the conversion of the frame buffer, e.g., to a list of integers.
+#   process: the consumer's handling (e.g., write) of a frame in a sequence.
+ZWOASI_SPAN_NAMES: Tuple[str, ...] = (
+    "start_exposure",
+    "wait",
+    "get_data",
+    "read_video",
+    "convert",
+    "process",
+)
+
+# **************************************************************************************
+
+
+class ZWOASISpan(TypedDict):
+    # The name of the stage, one of ZWOASI_SPAN_NAMES:
+    name: str
+    # The index of the camera the span was emitted by:
+    camera: int
+    # The identifier shared by every span of the same frame (unique per process):
+    trace: int
+    # The time.monotonic() timestamp at which the stage started:
+    start: float
+    # The time.monotonic() timestamp at which the stage ended:
+    end: float
+    # The duration (in seconds) of the stage:
+    duration: float
+
+
+# **************************************************************************************
+
+# A user-supplied tracer, called (synchronously) with each span as it ends, e.g., to
+# forward the span to a tracing stack. N.B. It must be fast, and must not raise:
+ZWOASITracer = Callable[[ZWOASISpan], None]
+
+# **************************************************************************************
+
+# The source of the (process-wide) unique trace identifiers of each frame:
+_trace_ids = count(1)
+
+# **************************************************************************************
+
+
+def get_next_trace_id() -> int:
+    """
+    Get a new, process-wide unique, trace identifier for a frame.
+    """
+    return next(_trace_ids)
+
+
+# **************************************************************************************
+
+
+class ZWOASISpanSummary(TypedDict):
+    # The number of spans recorded:
+    count: int
+    # The total duration (in seconds) of the spans:
+    total: float
+    # The mean duration (in seconds) of the spans:
+    mean: float
+    # The longest span (in seconds):
+    maximum: float
+
+
+# **************************************************************************************
+
+
+class ZWOASISpanRecorder(object):
+    """
+    A tracer which keeps the most recent spans, and a running summary per stage, and
+    optionally forwards every span on to another tracer.
+    """
+
+    def __init__(
+        self, maximum_spans: int = 1000, forward: Optional[ZWOASITracer] = None
+    ) -> None:
+        """
+        Initialise the span recorder.
+
+        Args:
+            maximum_spans (int): The number of most recent spans to keep.
+            forward (Optional[ZWOASITracer]): A tracer to forward every span to.
+        """
+        self._lock = Lock()
+
+        self._spans: Deque[ZWOASISpan] = deque(maxlen=maximum_spans)
+
+        # The (count, total, maximum) of the spans of each stage:
+        self._totals: Dict[str, Tuple[int, float, float]] = {}
+
+        self.forward = forward
+
+    def __call__(self, span: ZWOASISpan) -> None:
+        duration = span["duration"]
+
+        with self._lock:
+            self._spans.append(span)
+
+            number, total, maximum = self._totals.get(span["name"], (0, 0.0, 0.0))
+
+            self._totals[span["name"]] = (
+                number + 1,
+                total + duration,
+                max(maximum, duration),
+            )
+
+        if self.forward is not None:
+            self.forward(span)
+
+    def get_spans(self) -> List[ZWOASISpan]:
+        """
+        Get the most recently recorded spans, oldest first.
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def get_summary(self) -> Dict[str, ZWOASISpanSummary]:
+        """
+        Get a summary of the recorded spans, per stage.
+        """
+        with self._lock:
+            totals = dict(self._totals)
+
+        return {
+            name: ZWOASISpanSummary(
+                count=number,
+                total=total,
+                mean=total / number if number else 0.0,
+                maximum=maximum,
+            )
+            for name, (number, total, maximum) in totals.items()
+        }
+
+    def clear(self) -> None:
+        """
+        Discard the recorded spans and summary.
+        """
+        with self._lock:
+            self._spans.clear()
+            self._totals.clear()
+
+
+# **************************************************************************************
@@ -0,0 +1,531 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from collections.abc import Buffer
+from threading import Condition, Event, Thread
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, TypedDict
+
+from .enums import ZWOASIErrorCode, ZWOASIImageType
+from .errors import errors
+from .frame import get_frame_dtype, get_frame_shape, get_frame_size, import_numpy
+from .tracing import get_next_trace_id
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# **************************************************************************************
+
+# The sentinel sequence number of a slot that is empty, or currently being written:
+ZWOASI_VIDEO_SLOT_INVALID: int = -1
+
+# **************************************************************************************
+
+
+class ZWOASIVideoStreamStatistics(TypedDict):
+    # The sequence number of the most recently captured frame (0 if none):
+    sequence: int
+    # The number of frames captured by the reader thread:
+    frames_captured: int
+    # The number of frames overwritten in the ring before a consumer read them:
+    frames_skipped: int
+    # The number of frames dropped by the SDK (as reported by ASIGetDroppedFrames):
+    dropped_frames: int
+    # The number of reads that timed out waiting for a frame from the SDK:
+    timeouts: int
+
+
+# **************************************************************************************
+
+
+class ZWOASIVideoFrame(object):
+    """
+    A video frame copied out of the video stream's slot ring.
+    """
+
+    # The monotonically increasing sequence number of the frame (starting at 1):
+    sequence: int
+
+    # The time.monotonic() timestamp at which the frame was received from the SDK:
+    timestamp: float
+
+    # The width of the frame (in pixels):
+    width: int
+
+    # The height of the frame (in pixels):
+    height: int
+
+    # The image type of the frame:
+    image_type: ZWOASIImageType
+
+    # The raw frame data, as written by the SDK:
+    data: bytearray
+
+    # The trace identifier of the frame, as passed to its timing spans:
+    trace: int
+
+    def __init__(
+        self,
+        sequence: int,
+        timestamp: float,
+        width: int,
+        height: int,
+        image_type: ZWOASIImageType,
+        data: bytearray,
+        trace: int = 0,
+    ) -> None:
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self.width = width
+        self.height = height
+        self.image_type = image_type
+        self.data = data
+        self.trace = trace
+
+    def to_array(self) -> "NDArray[Any]":
+        """
+        Get a zero-copy NumPy view of the frame data. Requires NumPy.
+
+        Returns:
+            NDArray[Any]: An (height, width) or (height, width, 3) view of the frame.
+        """
+        numpy = import_numpy()
+
+        return numpy.frombuffer(
+            self.data, dtype=get_frame_dtype(self.image_type)
+        ).reshape(get_frame_shape(self.width, self.height, self.image_type))
+
+
+# **************************************************************************************
+
+
+class ZWOASIVideoStream(object):
+    """
+    A continuous video reader, which loops ASIGetVideoData on a dedicated thread
+    into a ring of preallocated frame slots.
+
+    The reader never waits on consumers: each slot carries a sequence number which
+    is invalidated before the slot is rewritten, so consumers copying a frame out
+    can detect (and discard) a frame that was overwritten underneath them.
+    """
+
+    # The width of the frames in the stream (in pixels):
+    width: int
+
+    # The height of the frames in the stream (in pixels):
+    height: int
+
+    # The image type of the frames in the stream:
+    image_type: ZWOASIImageType
+
+    def __init__(
+        self,
+        read: Callable[[Buffer, int, int], int],
+        width: int,
+        height: int,
+        image_type: ZWOASIImageType,
+        slots: int = 4,
+        timeout: int = 1000,
+        get_dropped_frames: Optional[Callable[[], int]] = None,
+        dropped_frames_interval: float = 1.0,
+    ) -> None:
+        """
+        Initialise the video stream.
+
+        Args:
+            read (Callable[[Buffer, int, int], int]): Reads one video frame into the
+                given buffer, waiting at most the given timeout (in milliseconds), and
+                returns the SDK error code, e.g., a wrapper around ASIGetVideoData. It
+                is also passed the trace identifier of the frame, for its spans.
+            width (int): The width of the frames (in pixels).
+            height (int): The height of the frames (in pixels).
+            image_type (ZWOASIImageType): The image type of the frames.
+            slots (int): The number of frame slots in the ring (at least 2).
+            timeout (int): The per-read timeout (in milliseconds) passed to `read`.
+            get_dropped_frames (Optional[Callable[[], int]]): Returns the number of
+                frames dropped by the SDK, sampled by the reader thread.
+            dropped_frames_interval (float): How often (in seconds) to sample the
+                dropped frame count.
+        """
+        if slots < 2:
+            raise ValueError("The video stream requires at least 2 slots.")
+
+        self.width = width
+        self.height = height
+        self.image_type = ZWOASIImageType(image_type)
+
+        self._read = read
+        self._timeout = timeout
+        self._get_dropped_frames = get_dropped_frames
+        self._dropped_frames_interval = dropped_frames_interval
+
+        size = get_frame_size(width, height, self.image_type)
+
+        self._slots: List[bytearray] = [bytearray(size) for _ in range(slots)]
+        self._slot_sequences: List[int] = [ZWOASI_VIDEO_SLOT_INVALID] * slots
+        self._slot_timestamps: List[float] = [0.0] * slots
+        self._slot_traces: List[int] = [0] * slots
+
+        self._condition = Condition()
+        self._listeners: List[Callable[[int], None]] = []
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+        self._error: Optional[BaseException] = None
+
+        self._sequence = 0
+        self._frames_skipped = 0
+        self._dropped_frames = 0
+        self._timeouts = 0
+
+    @property
+    def size(self) -> int:
+        """
+        The size of each frame in the stream, in bytes.
+        """
+        return len(self._slots[0])
+
+    @property
+    def sequence(self) -> int:
+        """
+        The sequence number of the most recently captured frame (0 if none).
+        """
+        return self._sequence
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Whether the reader thread is currently running.
+        """
+        return (
+            self._thread is not None
+            and self._thread.is_alive()
+            and not self._stopped.is_set()
+        )
+
+    def add_listener(self, listener: Callable[[int], None]) -> None:
+        """
+        Register a callback to be notified of new frames.
+
+        The listener is called on the reader thread with the sequence number of each
+        new frame, and once more when the stream stops (or fails), so it must return
+        promptly, e.g., by scheduling work with loop.call_soon_threadsafe().
+
+        Args:
+            listener (Callable[[int], None]): The callback to register.
+        """
+        with self._condition:
+            self._listeners = [*self._listeners, listener]
+
+    def remove_listener(self, listener: Callable[[int], None]) -> None:
+        """
+        Unregister a callback previously registered with add_listener().
+
+        Args:
+            listener (Callable[[int], None]): The callback to unregister.
+        """
+        with self._condition:
+            self._listeners = [
+                registered
+                for registered in self._listeners
+                if registered is not listener
+            ]
+
+    def _notify(self) -> None:
+        # The list is replaced (never mutated) on change, so can be iterated safely:
+        for listener in self._listeners:
+            try:
+                listener(self._sequence)
+            except Exception:
+                pass
+
+    def start(self) -> None:
+        """
+        Start the reader thread.
+        """
+        if self.is_running:
+            return
+
+        # Ensure any previous (e.g., failed) reader thread has fully exited:
+        if self._thread is not None:
+            self._thread.join()
+
+        self._error = None
+
+        self._stopped.clear()
+
+        self._thread = Thread(target=self._run, name="zwoasi-video-reader", daemon=True)
+
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the reader thread, waiting for any in-flight read to complete.
+
+        Args:
+            timeout (Optional[float]): The maximum time (in seconds) to wait.
+        """
+        self._stopped.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+        self._thread = None
+
+        # Wake any consumers waiting on a frame, so they can observe the stop:
+        with self._condition:
+            self._condition.notify_all()
+
+        self._notify()
+
+    def _run(self) -> None:
+        slots = len(self._slots)
+
+        last_sampled = monotonic()
+
+        while not self._stopped.is_set():
+            sequence = self._sequence + 1
+
+            index = sequence % slots
+
+            # Invalidate the slot before the SDK starts to overwrite it:
+            self._slot_sequences[index] = ZWOASI_VIDEO_SLOT_INVALID
+
+            # The trace identifier travels with the frame in its slot, so consumers
+            # attribute their spans to the frame they actually copied:
+            trace = get_next_trace_id()
+
+            try:
+                error: int = self._read(self._slots[index], self._timeout, trace)
+            except Exception as exception:
+                self._fail(exception)
+                return
+
+            # A timeout is not fatal, e.g., the exposure may be longer than expected:
+            if error == ZWOASIErrorCode.TIMEOUT:
+                self._timeouts += 1
+                continue
+
+            if error != ZWOASIErrorCode.SUCCESS:
+                self._fail(errors[error] or RuntimeError(f"Error code {error}"))
+                return
+
+            self._slot_timestamps[index] = monotonic()
+
+            self._slot_traces[index] = trace
+
+            self._slot_sequences[index] = sequence
+
+            # Publish the new frame to any waiting consumers:
+            with self._condition:
+                self._sequence = sequence
+                self._condition.notify_all()
+
+            self._notify()
+
+            # Periodically sample the SDK's dropped frame count:
+            now = monotonic()
+
+            if (
+                self._get_dropped_frames is not None
+                and now - last_sampled >= self._dropped_frames_interval
+            ):
+                last_sampled = now
+
+                try:
+                    self._dropped_frames = self._get_dropped_frames()
+                except Exception:
+                    pass
+
+    def _fail(self, error: BaseException) -> None:
+        with self._condition:
+            self._error = error
+            self._stopped.set()
+            self._condition.notify_all()
+
+        self._notify()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"Video reader failed. Error: {self._error}")
+
+    def _copy_slot(
+        self, sequence: int, destination: Buffer
+    ) -> Optional[Tuple[float, int]]:
+        """
+        Copy the frame with the given sequence number out of the ring.
+
+        Returns:
+            Optional[Tuple[float, int]]: The (timestamp, trace) of the frame, or None
+            if the frame has been (or was being) overwritten by the reader thread.
+        """
+        index = sequence % len(self._slots)
+
+        if self._slot_sequences[index] != sequence:
+            return None
+
+        timestamp = self._slot_timestamps[index]
+
+        trace = self._slot_traces[index]
+
+        memoryview(destination).cast("B")[:] = self._slots[index]
+
+        # If the slot was invalidated during the copy, the frame may be torn:
+        if self._slot_sequences[index] != sequence:
+            return None
+
+        return timestamp, trace
+
+    def read_latest_into(self, destination: Buffer) -> Tuple[int, float, int]:
+        """
+        Copy the most recently captured frame into the destination buffer.
+
+        Args:
+            destination (Buffer): A writable buffer of exactly the frame size.
+
+        Returns:
+            Tuple[int, float, int]: The (sequence, timestamp, trace) of the frame
+            copied, or (0, 0.0, 0) if no frame has been captured yet.
+        """
+        while True:
+            self._raise_if_failed()
+
+            sequence = self._sequence
+
+            if sequence == 0:
+                return 0, 0.0, 0
+
+            copied = self._copy_slot(sequence, destination)
+
+            if copied is not None:
+                return sequence, *copied
+
+    def read_next_into(
+        self,
+        destination: Buffer,
+        after: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Tuple[int, float, int]:
+        """
+        Copy the next frame after the given sequence number into the destination.
+
+        If the consumer has fallen behind, such that the frames following `after`
+        have already been overwritten, the oldest frame still in the ring is
+        returned instead and the skipped frames are counted.
+
+        Args:
+            destination (Buffer): A writable buffer of exactly the frame size.
+            after (Optional[int]): The sequence number of the last frame consumed.
+                Defaults to the current sequence, e.g., wait for a brand new frame.
+            timeout (Optional[float]): The maximum time (in seconds) to wait.
+
+        Returns:
+            Tuple[int, float, int]: The (sequence, timestamp, trace) of the frame
+            copied.
+
+        Raises:
+            TimeoutError: If no new frame arrives within the timeout.
+        """
+        if after is None:
+            after = self._sequence
+
+        deadline = None if timeout is None else monotonic() + timeout
+
+        while True:
+            with self._condition:
+                while self._sequence <= after:
+                    self._raise_if_failed()
+
+                    if self._stopped.is_set():
+                        raise RuntimeError("Video stream has been stopped.")
+
+                    remaining = None if deadline is None else deadline - monotonic()
+
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("Timed out waiting for a video frame.")
+
+                    self._condition.wait(remaining)
+
+                latest = self._sequence
+
+            # The oldest frame which can still be in the ring:
+            sequence = max(after + 1, latest - len(self._slots) + 2)
+
+            copied = self._copy_slot(sequence, destination)
+
+            # N.B. Consumers may read concurrently, so count skipped frames under the
+            # condition's lock:
+            if copied is not None:
+                with self._condition:
+                    self._frames_skipped += sequence - after - 1
+                return sequence, *copied
+
+            # The frame was overwritten whilst copying, so try the next one:
+            with self._condition:
+                self._frames_skipped += sequence - after
+            after = sequence
+
+    def get_latest_frame(self) -> Optional[ZWOASIVideoFrame]:
+        """
+        Get a copy of the most recently captured frame.
+
+        Returns:
+            Optional[ZWOASIVideoFrame]: The latest frame, or None if no frame has been
+            captured yet.
+        """
+        data = bytearray(self.size)
+
+        sequence, timestamp, trace = self.read_latest_into(data)
+
+        if sequence == 0:
+            return None
+
+        return ZWOASIVideoFrame(
+            sequence, timestamp, self.width, self.height, self.image_type, data, trace
+        )
+
+    def get_next_frame(
+        self, after: Optional[int] = None, timeout: Optional[float] = None
+    ) -> ZWOASIVideoFrame:
+        """
+        Get a copy of the next frame after the given sequence number.
+
+        Args:
+            after (Optional[int]): The sequence number of the last frame consumed.
+                Defaults to the current sequence, e.g., wait for a brand new frame.
+            timeout (Optional[float]): The maximum time (in seconds) to wait.
+
+        Returns:
+            ZWOASIVideoFrame: The next frame.
+        """
+        data = bytearray(self.size)
+
+        sequence, timestamp, trace = self.read_next_into(
+            data, after=after, timeout=timeout
+        )
+
+        return ZWOASIVideoFrame(
+            sequence, timestamp, self.width, self.height, self.image_type, data, trace
+        )
+
+    def get_statistics(self) -> ZWOASIVideoStreamStatistics:
+        """
+        Retrieve the video stream's capture statistics.
+
+        Returns:
+            ZWOASIVideoStreamStatistics: The current statistics.
+        """
+        with self._condition:
+            return ZWOASIVideoStreamStatistics(
+                sequence=self._sequence,
+                frames_captured=self._sequence,
+                frames_skipped=self._frames_skipped,
+                dropped_frames=self._dropped_frames,
+                timeouts=self._timeouts,
+            )
+
+
+# **************************************************************************************
@@ -0,0 +1,474 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+from collections import deque
+from collections.abc import Buffer
+from enum import Enum
+from pathlib import Path
+from threading import Condition, Thread
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    List,
+    Optional,
+    Sequence,
+    TypedDict,
+    Union,
+)
+
+from .enums import ZWOASIImageType
+from .fits import ZWOASIFITSCard, get_fits_header_cards, write_fits
+from .pool import ZWOASIFrameBuffer
+
+if TYPE_CHECKING:
+    from .camera import ZWOASICamera
+
+# **************************************************************************************
+
+# Writes a raw frame to a path, with the same signature as write_fits(), returning
+# the number of bytes written:
+ZWOASIFrameWriterFunction = Callable[
+    [
+        Union[str, Path],
+        Buffer,
+        int,
+        int,
+        ZWOASIImageType,
+        Sequence[ZWOASIFITSCard],
+    ],
+    int,
+]
+
+# **************************************************************************************
+
+
+class ZWOASIFrameWriterPolicy(Enum):
+    """
+    What the frame writer does with a new frame when its queue is full.
+    """
+
+    # Block the capture loop until a queued frame has been written:
+    BLOCK = "block"
+    # Discard the oldest queued frame (unwritten), to make room for the new frame:
+    DROP_OLDEST = "drop_oldest"
+    # Once the queue is half full, queue RAW16 frames as RAW8 (their high bytes),
+    # which halves their memory and write time, and block once the queue is full:
+    DEGRADE = "degrade"
+
+
+# **************************************************************************************
+
+
+class ZWOASIFrameWriterStatistics(TypedDict):
+    # The number of frames currently waiting to be written:
+    queue_depth: int
+    # The largest number of frames that have been waiting to be written:
+    maximum_queue_depth: int
+    # The capacity of the queue:
+    queue_size: int
+    # The number of frames submitted to the writer:
+    frames_submitted: int
+    # The number of frames written to disk:
+    frames_written: int
+    # The number of queued frames discarded (unwritten) by the DROP_OLDEST policy:
+    frames_dropped: int
+    # The number of frames degraded to a smaller format by the DEGRADE policy:
+    frames_degraded: int
+    # The number of frames which failed to write:
+    write_errors: int
+    # The number of bytes written to disk:
+    bytes_written: int
+    # The total time (in seconds) submit() spent blocked on a full queue:
+    blocked_time: float
+    # The mean time (in seconds) taken to write a frame:
+    write_latency_mean: float
+    # The longest time (in seconds) taken to write a frame:
+    write_latency_maximum: float
+    # The bytes written per second, since the writer was started:
+    throughput: float
+    # The frames written per second, since the writer was started:
+    frame_rate: float
+
+
+# **************************************************************************************
+
+
+class ZWOASIFrameWriterJob(object):
+    """
+    A frame waiting to be written, which owns its (pooled) frame buffer.
+    """
+
+    __slots__ = ("path", "data", "width", "height", "image_type", "cards", "buffer")
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        data: Buffer,
+        width: int,
+        height: int,
+        image_type: ZWOASIImageType,
+        cards: Sequence[ZWOASIFITSCard],
+        buffer: Optional[ZWOASIFrameBuffer],
+    ) -> None:
+        self.path = path
+        self.data = data
+        self.width = width
+        self.height = height
+        self.image_type = image_type
+        self.cards = cards
+        self.buffer = buffer
+
+    def degrade(self) -> None:
+        """
+        Replace a RAW16 frame with its high bytes (as RAW8), releasing its buffer.
+        """
+        self.data = bytes(memoryview(self.data).cast("B")[1::2])
+        self.image_type = ZWOASIImageType.RAW8
+        self.cards = [
+            *self.cards,
+            ("DEGRADED", True, "RAW16 frame written as its high bytes"),
+        ]
+        self.release()
+
+    def release(self) -> None:
+        """
+        Release the job's frame buffer (if any) back to its pool.
+        """
+        if self.buffer is not None:
+            self.buffer.release()
+            self.buffer = None
+
+
+# **************************************************************************************
+
+
+class ZWOASIFrameWriter(object):
+    """
+    Writes frames to disk on background worker threads, from a bounded queue, so
+    that a capture loop's timing does not depend on the latency of the filesystem.
+
+    When the queue is full, the writer applies its policy: it blocks the capture
+    loop (BLOCK), discards the oldest queued frame (DROP_OLDEST), or degrades frames
+    to a smaller format before blocking (DEGRADE).
+    """
+
+    # The policy applied when the queue is full:
+    policy: ZWOASIFrameWriterPolicy
+
+    # The maximum number of frames waiting to be written:
+    queue_size: int
+
+    def __init__(
+        self,
+        queue_size: int = 8,
+        policy: ZWOASIFrameWriterPolicy = ZWOASIFrameWriterPolicy.BLOCK,
+        workers: int = 1,
+        write: ZWOASIFrameWriterFunction = write_fits,
+    ) -> None:
+        """
+        Initialise (and start) the frame writer.
+
+        Args:
+            queue_size (int): The maximum number of frames waiting to be written.
+            policy (ZWOASIFrameWriterPolicy): The policy applied when the queue is
+                full.
+            workers (int): The number of worker threads writing frames.
+            write (ZWOASIFrameWriterFunction): Writes each frame, e.g., write_fits.
+        """
+        if queue_size < 1:
+            raise ValueError("Queue size must be at least 1.")
+
+        if workers < 1:
+            raise ValueError("The frame writer requires at least 1 worker.")
+
+        self.queue_size = queue_size
+        self.policy = ZWOASIFrameWriterPolicy(policy)
+
+        self._write = write
+
+        self._condition = Condition()
+        self._queue: Deque[ZWOASIFrameWriterJob] = deque()
+        self._in_flight = 0
+        self._is_closed = False
+
+        self._started = monotonic()
+        self._maximum_queue_depth = 0
+        self._frames_submitted = 0
+        self._frames_written = 0
+        self._frames_dropped = 0
+        self._frames_degraded = 0
+        self._write_errors = 0
+        self._last_error: Optional[BaseException] = None
+        self._bytes_written = 0
+        self._blocked_time = 0.0
+        self._write_time = 0.0
+        self._write_latency_maximum = 0.0
+
+        self._workers: List[Thread] = [
+            Thread(target=self._run, name=f"zwoasi-frame-writer-{i}", daemon=True)
+            for i in range(workers)
+        ]
+
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self) -> "ZWOASIFrameWriter":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def submit(
+        self,
+        frame: ZWOASIFrameBuffer,
+        path: Union[str, Path],
+        cards: Sequence[ZWOASIFITSCard] = (),
+    ) -> None:
+        """
+        Queue a pooled frame buffer to be written to the given path.
+
+        The writer takes ownership of the buffer, and releases it back to its pool
+        once the frame has been written (or dropped).
+
+        Args:
+            frame (ZWOASIFrameBuffer): The frame to write.
+            path (Union[str, Path]): The path of the file to (over)write.
+            cards (Sequence[ZWOASIFITSCard]): Additional header cards, e.g., from
+                get_fits_header_cards().
+        """
+        job = ZWOASIFrameWriterJob(
+            path, frame.data, frame.width, frame.height, frame.image_type, cards, frame
+        )
+
+        try:
+            self._enqueue(job)
+        except BaseException:
+            job.release()
+            raise
+
+    def _enqueue(self, job: ZWOASIFrameWriterJob) -> None:
+        dropped: Optional[ZWOASIFrameWriterJob] = None
+
+        # Degrade the frame (outside of the lock, as it copies) once half full:
+        is_degraded = (
+            self.policy == ZWOASIFrameWriterPolicy.DEGRADE
+            and job.image_type == ZWOASIImageType.RAW16
+            and len(self._queue) * 2 >= self.queue_size
+        )
+
+        if is_degraded:
+            job.degrade()
+
+        with self._condition:
+            if self._is_closed:
+                raise RuntimeError("Frame writer has been closed.")
+
+            self._frames_submitted += 1
+
+            if is_degraded:
+                self._frames_degraded += 1
+
+            if len(self._queue) >= self.queue_size:
+                if self.policy == ZWOASIFrameWriterPolicy.DROP_OLDEST:
+                    dropped = self._queue.popleft()
+                    self._frames_dropped += 1
+                else:
+                    began = monotonic()
+
+                    while len(self._queue) >= self.queue_size and not self._is_closed:
+                        self._condition.wait()
+
+                    self._blocked_time += monotonic() - began
+
+                    if self._is_closed:
+                        raise RuntimeError("Frame writer has been closed.")
+
+            self._queue.append(job)
+
+            self._maximum_queue_depth = max(self._maximum_queue_depth, len(self._queue))
+
+            self._condition.notify_all()
+
+        # Release the dropped frame's buffer outside of the lock:
+        if dropped is not None:
+            dropped.release()
+
+    def capture(
+        self,
+        camera: "ZWOASICamera",
+        count: int,
+        path: Callable[[int], Union[str, Path]],
+        is_dark: bool = False,
+    ) -> None:
+        """
+        Capture a number of frames, queueing each to be written as it is read out.
+
+        Args:
+            camera (ZWOASICamera): The (connected) camera to capture with.
+            count (int): The number of frames to capture.
+            path (Callable[[int], Union[str, Path]]): Returns the path of each frame,
+                from the frame's index.
+            is_dark (bool): Whether to capture 'dark' exposures (e.g. shutter closed).
+        """
+        previous_capacity = camera.frame_buffer_pool.capacity
+
+        # Ensure the pool retains a buffer for every frame that can be in flight:
+        camera.frame_buffer_pool.capacity = max(
+            previous_capacity, self.queue_size + len(self._workers) + 1
+        )
+
+        try:
+            for index in range(count):
+                frame = camera.get_frame_buffer(is_dark=is_dark)
+
+                # N.B. The header is built from the camera's cached state:
+                self.submit(frame, path(index), get_fits_header_cards(camera))
+        finally:
+            camera.frame_buffer_pool.capacity = previous_capacity
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._is_closed:
+                    self._condition.wait()
+
+                if not self._queue:
+                    return
+
+                job = self._queue.popleft()
+
+                self._in_flight += 1
+
+                # Wake any capture loop blocked on the full queue:
+                self._condition.notify_all()
+
+            began = monotonic()
+
+            written = 0
+
+            error: Optional[BaseException] = None
+
+            try:
+                written = self._write(
+                    job.path,
+                    job.data,
+                    job.width,
+                    job.height,
+                    job.image_type,
+                    job.cards,
+                )
+            except Exception as exception:
+                error = exception
+            finally:
+                job.release()
+
+            latency = monotonic() - began
+
+            with self._condition:
+                self._in_flight -= 1
+
+                if error is None:
+                    self._frames_written += 1
+                    self._bytes_written += written
+                else:
+                    self._write_errors += 1
+                    self._last_error = error
+
+                self._write_time += latency
+                self._write_latency_maximum = max(self._write_latency_maximum, latency)
+
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for every queued frame to be written.
+
+        Args:
+            timeout (Optional[float]): The maximum time (in seconds) to wait.
+
+        Raises:
+            TimeoutError: If the queued frames are not written within the timeout.
+            RuntimeError: If any frame failed to write.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: not self._queue and self._in_flight == 0, timeout=timeout
+            ):
+                raise TimeoutError("Timed out waiting for frames to be written.")
+
+            self._raise_if_failed()
+
+    def _raise_if_failed(self) -> None:
+        if self._write_errors:
+            raise RuntimeError(
+                f"Failed to write {self._write_errors} frames. Error: {self._last_error}"
+            )
+
+    def close(self, drain: bool = True) -> None:
+        """
+        Stop the writer, waiting for the workers to exit.
+
+        Args:
+            drain (bool): Whether to write the queued frames first, or discard them.
+
+        Raises:
+            RuntimeError: If any frame failed to write.
+        """
+        discarded: List[ZWOASIFrameWriterJob] = []
+
+        with self._condition:
+            if not drain:
+                discarded = list(self._queue)
+                self._frames_dropped += len(discarded)
+                self._queue.clear()
+
+            self._is_closed = True
+
+            self._condition.notify_all()
+
+        for job in discarded:
+            job.release()
+
+        for worker in self._workers:
+            worker.join()
+
+        with self._condition:
+            self._raise_if_failed()
+
+    def get_statistics(self) -> ZWOASIFrameWriterStatistics:
+        """
+        Retrieve the writer's queue depth, write latency and throughput metrics.
+
+        Returns:
+            ZWOASIFrameWriterStatistics: The current statistics.
+        """
+        with self._condition:
+            completed = self._frames_written + self._write_errors
+
+            elapsed = monotonic() - self._started
+
+            return ZWOASIFrameWriterStatistics(
+                queue_depth=len(self._queue),
+                maximum_queue_depth=self._maximum_queue_depth,
+                queue_size=self.queue_size,
+                frames_submitted=self._frames_submitted,
+                frames_written=self._frames_written,
+                frames_dropped=self._frames_dropped,
+                frames_degraded=self._frames_degraded,
+                write_errors=self._write_errors,
+                bytes_written=self._bytes_written,
+                blocked_time=self._blocked_time,
+                write_latency_mean=self._write_time / completed if completed else 0.0,
+                write_latency_maximum=self._write_latency_maximum,
+                throughput=self._bytes_written / elapsed if elapsed > 0 else 0.0,
+                frame_rate=self._frames_written / elapsed if elapsed > 0 else 0.0,
+            )
+
+
+# **************************************************************************************
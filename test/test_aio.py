@@ -0,0 +1,156 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from collections.abc import Buffer
+from threading import current_thread
+from time import sleep
+from typing import Any, Optional
+
+from zwo import (
+    AsyncZWOASICamera,
+    ZWOASIErrorCode,
+    ZWOASIImageType,
+    ZWOASIVideoStream,
+)
+
+# **************************************************************************************
+
+
+class VideoCamera(object):
+    """
+    A stand-in for a connected ZWOASICamera, which streams counter-filled frames.
+    """
+
+    id = 0
+
+    is_video_streaming = False
+
+    video: Optional[ZWOASIVideoStream] = None
+
+    def __init__(self, interval: float = 0.002) -> None:
+        self.interval = interval
+        self.threads: list[str] = []
+        self.count = 0
+
+    def read(self, buffer: Buffer, timeout: int, trace: int = 0) -> int:
+        sleep(self.interval)
+        self.count += 1
+        view = memoryview(buffer).cast("B")
+        view[:] = bytes([self.count % 256]) * len(view)
+        return ZWOASIErrorCode.SUCCESS
+
+    def get_gain(self) -> int:
+        self.threads.append(current_thread().name)
+        return 100
+
+    def start_acquisition(self, slots: int = 4) -> None:
+        self.threads.append(current_thread().name)
+        self.video = ZWOASIVideoStream(
+            read=self.read,
+            width=8,
+            height=2,
+            image_type=ZWOASIImageType.RAW8,
+            slots=slots,
+        )
+        self.video.start()
+        self.is_video_streaming = True
+
+    def stop_acquisition(self) -> None:
+        if self.video is not None:
+            self.video.stop()
+            self.video = None
+        self.is_video_streaming = False
+
+    def disconnect(self) -> None:
+        self.threads.append(current_thread().name)
+
+
+# **************************************************************************************
+
+
+class TestAsyncZWOASICamera(unittest.IsolatedAsyncioTestCase):
+    def create_camera(self, source: VideoCamera) -> AsyncZWOASICamera:
+        camera: Any = source
+        return AsyncZWOASICamera(camera)
+
+    async def test_methods_run_on_camera_executor(self) -> None:
+        source = VideoCamera()
+
+        async with self.create_camera(source) as camera:
+            self.assertEqual(await camera.get_gain(), 100)
+
+        self.assertTrue(source.threads[0].startswith("zwoasi-camera-0"))
+        self.assertEqual(source.threads[0], source.threads[-1])
+
+    async def test_private_methods_are_not_exposed(self) -> None:
+        camera = self.create_camera(VideoCamera())
+
+        with self.assertRaises(AttributeError):
+            camera._get_frame_buffer
+
+        with self.assertRaises(AttributeError):
+            camera.is_video_streaming
+
+        await camera.close()
+
+    async def test_stream(self) -> None:
+        source = VideoCamera()
+        camera = self.create_camera(source)
+
+        frames = []
+
+        async for frame in camera.stream(timeout=1.0):
+            frames.append(frame)
+
+            if len(frames) == 5:
+                break
+
+        sequences = [frame.sequence for frame in frames]
+
+        self.assertEqual(sequences, sorted(sequences))
+        self.assertEqual(len(set(sequences)), 5)
+        self.assertEqual(frames[0].data[0], frames[0].sequence % 256)
+
+        await camera.close()
+
+    async def test_stream_stops_acquisition(self) -> None:
+        source = VideoCamera()
+        camera = self.create_camera(source)
+
+        stream = camera.stream(timeout=1.0)
+
+        await anext(stream)
+
+        self.assertTrue(source.is_video_streaming)
+
+        await stream.aclose()
+
+        self.assertFalse(source.is_video_streaming)
+
+        await camera.close()
+
+    async def test_stream_timeout(self) -> None:
+        source = VideoCamera(interval=0.2)
+        camera = self.create_camera(source)
+
+        stream = camera.stream(timeout=0.01)
+
+        with self.assertRaises(TimeoutError):
+            await anext(stream)
+
+        await stream.aclose()
+
+        await camera.close()
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
@@ -0,0 +1,173 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import json
+import os
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+from tempfile import TemporaryDirectory
+
+from zwo import (
+    ZWOASI_SDK_VERSION,
+    ZWOASIImageType,
+    get_asi_camera_lib,
+    install_simulated_asi_camera_lib,
+    set_asi_camera_lib,
+)
+from zwo.benchmark import (
+    compare_benchmark_reports,
+    main,
+    run_benchmarks,
+)
+from zwo.lib import _libraries
+
+# **************************************************************************************
+
+
+class TestRunBenchmarks(unittest.TestCase):
+    def test_report(self) -> None:
+        report = run_benchmarks(
+            sizes=[(64, 32)],
+            image_types=[ZWOASIImageType.RAW8, ZWOASIImageType.RAW16],
+            paths=["buffer", "list", "video"],
+            frames=2,
+            iterations=2,
+            connect_iterations=1,
+        )
+
+        self.assertEqual(len(report["capture"]), 6)
+
+        for result in report["capture"]:
+            self.assertEqual(result["frames"], 2)
+            self.assertGreater(result["frames_per_second"], 0)
+            self.assertGreater(result["megabytes_per_second"], 0)
+
+        sizes = {
+            (result["image_type"], result["frame_size"]) for result in report["capture"]
+        }
+
+        self.assertEqual(sizes, {("RAW8", 64 * 32), ("RAW16", 64 * 32 * 2)})
+
+        names = [result["name"] for result in report["operations"]]
+
+        self.assertIn("connect", names)
+        self.assertIn("_get_control_capability", names)
+        self.assertIn("ZWOASICameraInformation.from_c_types", names)
+
+        # The list conversion allocates (at least) one Python int per pixel:
+        conversion = next(
+            result
+            for result in report["capture"]
+            if result["path"] == "list" and result["image_type"] == "RAW16"
+        )
+
+        self.assertGreater(conversion["allocated_bytes_per_frame"], 64 * 32 * 8)
+
+        # The simulated SDK is removed once the benchmarks have run:
+        self.assertEqual(_libraries, {})
+
+    def test_restores_installed_library(self) -> None:
+        library = install_simulated_asi_camera_lib()
+
+        try:
+            run_benchmarks(
+                sizes=[(64, 32)],
+                image_types=[ZWOASIImageType.RAW8],
+                paths=["buffer"],
+                frames=1,
+                iterations=1,
+                connect_iterations=1,
+            )
+
+            self.assertIs(get_asi_camera_lib(), library)
+        finally:
+            set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+    def test_unknown_path(self) -> None:
+        with self.assertRaises(ValueError):
+            run_benchmarks(paths=["unknown"])
+
+
+# **************************************************************************************
+
+
+class TestCompareBenchmarkReports(unittest.TestCase):
+    def test_compare(self) -> None:
+        baseline = run_benchmarks(
+            sizes=[(64, 32)],
+            image_types=[ZWOASIImageType.RAW8],
+            paths=["buffer"],
+            frames=1,
+            iterations=1,
+            connect_iterations=1,
+        )
+
+        current = json.loads(json.dumps(baseline))
+
+        current["capture"][0]["frames_per_second"] *= 0.5
+
+        comparisons = {
+            comparison["name"]: comparison
+            for comparison in compare_benchmark_reports(baseline, current)
+        }
+
+        self.assertAlmostEqual(comparisons["buffer RAW8 64x32"]["ratio"], 0.5)
+        self.assertAlmostEqual(comparisons["connect"]["ratio"], 1.0)
+
+
+# **************************************************************************************
+
+
+class TestMain(unittest.TestCase):
+    def test_main_writes_report_and_detects_regressions(self) -> None:
+        with TemporaryDirectory() as directory:
+            output = os.path.join(directory, "report.json")
+
+            arguments = [
+                "--sizes",
+                "64x32",
+                "--image-types",
+                "RAW8",
+                "--paths",
+                "buffer",
+                "--frames",
+                "1",
+                "--iterations",
+                "1",
+                "--output",
+                output,
+            ]
+
+            self.assertEqual(main(arguments), 0)
+
+            with open(output) as f:
+                report = json.load(f)
+
+            self.assertEqual(report["capture"][0]["width"], 64)
+
+            # A baseline which is impossibly fast must register as a regression:
+            report["capture"][0]["frames_per_second"] *= 1e9
+
+            baseline = os.path.join(directory, "baseline.json")
+
+            with open(baseline, "w") as f:
+                json.dump(report, f)
+
+            with redirect_stderr(StringIO()) as stderr:
+                status = main(arguments + ["--baseline", baseline])
+
+            self.assertEqual(status, 1)
+            self.assertIn("REGRESSED", stderr.getvalue())
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
@@ -0,0 +1,155 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict
+
+from zwo import (
+    ZWOASI_SDK_VERSION,
+    ZWOASIBayerPattern,
+    ZWOASICamera,
+    ZWOASICameraCache,
+    ZWOASIControlType,
+    ZWOASISimulatedCameraConfiguration,
+    install_simulated_asi_camera_lib,
+    set_asi_camera_lib,
+)
+
+# **************************************************************************************
+
+
+class TestZWOASICameraCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.library = install_simulated_asi_camera_lib(
+            cameras=[
+                ZWOASISimulatedCameraConfiguration(
+                    width=64,
+                    height=32,
+                    readout_rate=0,
+                    is_color=True,
+                    bayer_pattern=ZWOASIBayerPattern.BG,
+                )
+            ]
+        )
+
+        self.directory = TemporaryDirectory()
+
+        self.path = Path(self.directory.name) / "cameras.json"
+
+    def tearDown(self) -> None:
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+        self.directory.cleanup()
+
+    def open_camera(self, cache: ZWOASICameraCache) -> Dict[str, int]:
+        """
+        Open (and close) the camera, returning the SDK calls made per function.
+        """
+        instrumentation = self.library.enable_instrumentation()
+
+        instrumentation.reset()
+
+        camera = ZWOASICamera(0, cache=cache)
+
+        self.camera = camera
+
+        camera.disconnect()
+
+        return {
+            statistics["function"]: statistics["count"]
+            for statistics in self.library.get_instrumentation_snapshot(
+                per_camera=False
+            )
+        }
+
+    def test_warm_start_skips_enumeration(self) -> None:
+        cold = self.open_camera(ZWOASICameraCache(self.path))
+
+        self.assertGreater(cold["ASIGetControlCaps"], 0)
+        self.assertTrue(self.path.exists())
+
+        # The camera's serial number is read once, to key both the lookup and store:
+        self.assertEqual(cold["ASIGetSerialNumber"], 1)
+
+        controls = self.camera.controls
+
+        warm = self.open_camera(ZWOASICameraCache(self.path))
+
+        self.assertNotIn("ASIGetNumOfControls", warm)
+        self.assertNotIn("ASIGetControlCaps", warm)
+        self.assertEqual(warm["ASIGetSerialNumber"], 1)
+
+        self.assertEqual(self.camera.controls, controls)
+        self.assertIsInstance(next(iter(self.camera.controls)), ZWOASIControlType)
+
+    def test_entry(self) -> None:
+        cache = ZWOASICameraCache(self.path)
+
+        self.open_camera(cache)
+
+        entry = ZWOASICameraCache(self.path).get(
+            self.camera.info.name, "0123456789abcdef"
+        )
+
+        self.assertIsNotNone(entry)
+        assert entry is not None
+
+        self.assertEqual(entry["mode"], self.camera.mode)
+        self.assertEqual(entry["controls"], self.camera.controls)
+
+        # The camera's information is always read from the SDK, so is not cached:
+        self.assertNotIn("info", entry)
+
+        [stored] = json.loads(self.path.read_text())["cameras"].values()
+
+        self.assertEqual(set(stored), {"mode", "controls"})
+
+        self.assertIsNone(cache.get(self.camera.info.name, "fedcba9876543210"))
+
+    def test_sdk_version_invalidates_cache(self) -> None:
+        self.open_camera(ZWOASICameraCache(self.path))
+
+        cache = ZWOASICameraCache(self.path, sdk_version=(1, 0, 0))
+
+        self.assertIsNone(cache.get(self.camera.info.name, "0123456789abcdef"))
+
+        calls = self.open_camera(cache)
+
+        self.assertGreater(calls["ASIGetControlCaps"], 0)
+
+        # The file is rewritten for the new SDK version:
+        data = json.loads(self.path.read_text())
+
+        self.assertEqual(data["sdk_version"], [1, 0, 0])
+
+    def test_corrupt_file_is_ignored(self) -> None:
+        self.path.write_text("{not json")
+
+        calls = self.open_camera(ZWOASICameraCache(self.path))
+
+        self.assertGreater(calls["ASIGetControlCaps"], 0)
+
+    def test_clear(self) -> None:
+        cache = ZWOASICameraCache(self.path)
+
+        self.open_camera(cache)
+
+        cache.clear()
+
+        self.assertFalse(self.path.exists())
+        self.assertIsNone(cache.get(self.camera.info.name, "0123456789abcdef"))
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
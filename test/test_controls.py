@@ -0,0 +1,163 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from typing import Dict
+
+from zwo import (
+    ZWOASI_SDK_VERSION,
+    ZWOASICamera,
+    ZWOASIControlCache,
+    ZWOASIControlType,
+    ZWOASIImageType,
+    ZWOASISimulatedCameraConfiguration,
+    install_simulated_asi_camera_lib,
+    set_asi_camera_lib,
+)
+
+# **************************************************************************************
+
+
+class TestZWOASIControlCache(unittest.TestCase):
+    def test_get(self) -> None:
+        cache = ZWOASIControlCache(maximum_age=60.0)
+
+        self.assertIsNone(cache.get(ZWOASIControlType.GAIN))
+
+        cache.store(ZWOASIControlType.GAIN, 100, False)
+
+        entry = cache.get(ZWOASIControlType.GAIN)
+
+        self.assertIsNotNone(entry)
+        assert entry is not None
+        self.assertEqual((entry.value, entry.is_auto), (100, False))
+
+        statistics = cache.get_statistics()
+
+        self.assertEqual((statistics["hits"], statistics["misses"]), (1, 1))
+        self.assertEqual(statistics["entries"], 1)
+
+    def test_stale_and_auto_values_are_not_served(self) -> None:
+        cache = ZWOASIControlCache(maximum_age=0.0)
+
+        cache.store(ZWOASIControlType.GAIN, 100, False)
+
+        self.assertIsNone(cache.get(ZWOASIControlType.GAIN))
+
+        cache.maximum_age = 60.0
+
+        cache.store(ZWOASIControlType.EXPOSURE, 1000, True)
+
+        self.assertIsNone(cache.get(ZWOASIControlType.EXPOSURE))
+
+    def test_is_unchanged(self) -> None:
+        cache = ZWOASIControlCache(maximum_age=0.0)
+
+        self.assertFalse(cache.is_unchanged(ZWOASIControlType.GAIN, 100))
+
+        cache.store(ZWOASIControlType.GAIN, 100, False)
+
+        # N.B. Unchanged writes are skipped, however stale the value is for reads:
+        self.assertTrue(cache.is_unchanged(ZWOASIControlType.GAIN, 100))
+        self.assertFalse(cache.is_unchanged(ZWOASIControlType.GAIN, 101))
+        self.assertFalse(cache.is_unchanged(ZWOASIControlType.GAIN, 100, True))
+
+        cache.invalidate(ZWOASIControlType.GAIN)
+
+        self.assertFalse(cache.is_unchanged(ZWOASIControlType.GAIN, 100))
+
+        statistics = cache.get_statistics()
+
+        self.assertEqual(statistics["writes"], 4)
+        self.assertEqual(statistics["writes_skipped"], 1)
+
+
+# **************************************************************************************
+
+
+class TestCameraControlCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.library = install_simulated_asi_camera_lib(
+            cameras=[
+                ZWOASISimulatedCameraConfiguration(width=64, height=32, readout_rate=0)
+            ]
+        )
+
+        self.camera = ZWOASICamera(0)
+
+        self.camera.control_cache.maximum_age = 60.0
+
+        self.library.enable_instrumentation()
+
+    def tearDown(self) -> None:
+        self.camera.disconnect()
+
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+    def get_counts(self) -> Dict[str, int]:
+        return {
+            statistics["function"]: statistics["count"]
+            for statistics in self.library.get_instrumentation_snapshot(
+                per_camera=False
+            )
+        }
+
+    def test_unchanged_settings_are_not_rewritten(self) -> None:
+        for _ in range(3):
+            self.camera.set_gain(100)
+            self.camera.set_offset(10)
+            self.camera.set_exposure_time(0.001)
+            self.camera.set_image_type(ZWOASIImageType.RAW16)
+            self.camera.set_binning_x(1)
+
+        counts = self.get_counts()
+
+        self.assertEqual(counts["ASISetControlValue"], 3)
+        self.assertEqual(counts["ASISetROIFormat"], 1)
+
+        self.assertEqual(self.camera.get_gain(), 100)
+        self.assertEqual(self.camera.get_exposure_time(), 0.001)
+
+        # The reads are served from the values confirmed by the writes:
+        self.assertNotIn("ASIGetControlValue", self.get_counts())
+
+        statistics = self.camera.control_cache.get_statistics()
+
+        self.assertEqual(statistics["writes_skipped"], 6)
+        self.assertEqual(statistics["hits"], 2)
+
+    def test_values_are_clamped(self) -> None:
+        capability = self.camera.controls[ZWOASIControlType.GAIN]
+
+        self.camera.set_gain(capability.maximum_value + 100)
+
+        self.assertEqual(self.camera.get_gain(), capability.maximum_value)
+
+        self.camera.control_cache.invalidate()
+
+        self.assertEqual(self.camera.get_gain(), capability.maximum_value)
+
+    def test_set_image_type_keeps_start_position(self) -> None:
+        self.camera.set_region_of_interest(
+            32, 16, 1, ZWOASIImageType.RAW8, start_x=8, start_y=4
+        )
+
+        self.camera.set_image_type(ZWOASIImageType.RAW16)
+
+        self.assertEqual((self.camera.roi.start_x, self.camera.roi.start_y), (8, 4))
+
+        roi = self.camera.roi
+
+        self.assertEqual(self.camera.refresh_state(), roi)
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
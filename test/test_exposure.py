@@ -0,0 +1,175 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from time import monotonic
+
+from zwo import ZWOASIExposureStatus, ZWOASIExposureWaiter
+
+# **************************************************************************************
+
+
+class ExposureClock(object):
+    """
+    A stand-in for ASIGetExpStatus, which completes after a fixed duration.
+    """
+
+    def __init__(self, duration: float, status=ZWOASIExposureStatus.SUCCESS) -> None:
+        self.start = monotonic()
+        self.duration = duration
+        self.status = status
+        self.polls = 0
+
+    def get_status(self) -> ZWOASIExposureStatus:
+        self.polls += 1
+
+        if monotonic() - self.start < self.duration:
+            return ZWOASIExposureStatus.WORKING
+
+        return self.status
+
+
+# **************************************************************************************
+
+
+class TestZWOASIExposureWaiter(unittest.TestCase):
+    def test_invalid_poll_intervals(self) -> None:
+        with self.assertRaises(ValueError):
+            ZWOASIExposureWaiter(minimum_poll_interval=0)
+
+        with self.assertRaises(ValueError):
+            ZWOASIExposureWaiter(minimum_poll_interval=0.1, maximum_poll_interval=0.01)
+
+    def test_invalid_readout_time(self) -> None:
+        with self.assertRaises(ValueError):
+            ZWOASIExposureWaiter(readout_time=-1)
+
+    def test_sleeps_until_expected_end(self) -> None:
+        waiter = ZWOASIExposureWaiter(is_adaptive=False)
+
+        clock = ExposureClock(duration=0.05)
+
+        completion = waiter.wait(clock.get_status, clock.start, exposure_time=0.05)
+
+        self.assertEqual(completion["status"], ZWOASIExposureStatus.SUCCESS)
+        self.assertGreaterEqual(completion["detected"], clock.start + 0.05)
+        # We should not busy-poll whilst the exposure is in progress:
+        self.assertLessEqual(clock.polls, 5)
+        self.assertIs(waiter.last_completion, completion)
+
+    def test_polls_during_readout_with_bounded_latency(self) -> None:
+        waiter = ZWOASIExposureWaiter(
+            minimum_poll_interval=0.001, maximum_poll_interval=0.004, is_adaptive=False
+        )
+
+        # The exposure takes 0.02 seconds longer than nominal to be read out:
+        clock = ExposureClock(duration=0.03)
+
+        completion = waiter.wait(clock.get_status, clock.start, exposure_time=0.01)
+
+        self.assertEqual(completion["status"], ZWOASIExposureStatus.SUCCESS)
+        self.assertGreater(completion["polls"], 1)
+        self.assertLess(completion["latency"], 0.02)
+
+    def test_failed_exposure(self) -> None:
+        waiter = ZWOASIExposureWaiter()
+
+        clock = ExposureClock(duration=0.0, status=ZWOASIExposureStatus.FAILED)
+
+        completion = waiter.wait(clock.get_status, clock.start, exposure_time=0.0)
+
+        self.assertEqual(completion["status"], ZWOASIExposureStatus.FAILED)
+
+    def test_timeout(self) -> None:
+        waiter = ZWOASIExposureWaiter()
+
+        clock = ExposureClock(duration=10.0)
+
+        with self.assertRaises(TimeoutError):
+            waiter.wait(clock.get_status, clock.start, exposure_time=0.0, timeout=0.01)
+
+    def test_readout_estimate_adapts(self) -> None:
+        waiter = ZWOASIExposureWaiter(readout_time=0.0)
+
+        clock = ExposureClock(duration=0.03)
+
+        waiter.wait(clock.get_status, clock.start, exposure_time=0.01)
+
+        self.assertGreater(waiter.readout_time, 0.0)
+
+    def test_oversleep_shrinks_readout_estimate(self) -> None:
+        waiter = ZWOASIExposureWaiter(readout_time=0.02)
+
+        clock = ExposureClock(duration=0.0)
+
+        waiter.wait(clock.get_status, clock.start, exposure_time=0.0)
+
+        self.assertAlmostEqual(waiter.readout_time, 0.01)
+
+    def test_complete_polled_elsewhere(self) -> None:
+        waiter = ZWOASIExposureWaiter(readout_time=0.04)
+
+        # An exposure polled elsewhere, last seen working 0.02s after its nominal end:
+        completion = waiter.complete(
+            ZWOASIExposureStatus.SUCCESS,
+            start=10.0,
+            exposure_time=1.0,
+            working=11.02,
+            detected=11.03,
+            polls=3,
+        )
+
+        self.assertAlmostEqual(completion["expected"], 11.04)
+        self.assertAlmostEqual(completion["latency"], 0.01)
+        self.assertEqual(completion["polls"], 3)
+        self.assertIs(waiter.last_completion, completion)
+
+        # The estimate moves towards the observed readout time:
+        self.assertAlmostEqual(waiter.readout_time, 0.035)
+
+
+# **************************************************************************************
+
+
+class TestZWOASIExposureWaiterAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_sleeps_until_expected_end(self) -> None:
+        waiter = ZWOASIExposureWaiter(is_adaptive=False)
+
+        clock = ExposureClock(duration=0.05)
+
+        async def get_status() -> ZWOASIExposureStatus:
+            return clock.get_status()
+
+        completion = await waiter.wait_async(
+            get_status, clock.start, exposure_time=0.05
+        )
+
+        self.assertEqual(completion["status"], ZWOASIExposureStatus.SUCCESS)
+        self.assertGreaterEqual(completion["detected"], clock.start + 0.05)
+        self.assertLessEqual(clock.polls, 5)
+        self.assertIs(waiter.last_completion, completion)
+
+    async def test_timeout(self) -> None:
+        waiter = ZWOASIExposureWaiter()
+
+        clock = ExposureClock(duration=10.0)
+
+        async def get_status() -> ZWOASIExposureStatus:
+            return clock.get_status()
+
+        with self.assertRaises(TimeoutError):
+            await waiter.wait_async(
+                get_status, clock.start, exposure_time=0.0, timeout=0.01
+            )
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
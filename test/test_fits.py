@@ -0,0 +1,238 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from io import BytesIO
+from pathlib import Path
+from struct import pack, unpack
+from tempfile import TemporaryDirectory
+
+from zwo import (
+    ZWOASI_FITS_BLOCK_SIZE,
+    ZWOASI_SDK_VERSION,
+    ZWOASIBayerPattern,
+    ZWOASICamera,
+    ZWOASIImageType,
+    ZWOASISimulatedCameraConfiguration,
+    format_fits_card,
+    get_fits_header,
+    get_fits_header_cards,
+    install_simulated_asi_camera_lib,
+    set_asi_camera_lib,
+    write_fits,
+)
+
+# **************************************************************************************
+
+
+def get_header_cards(data: bytes) -> dict[str, str]:
+    """
+    Parse the (keyword, raw value) pairs of a FITS header, up to the END card.
+    """
+    cards: dict[str, str] = {}
+
+    for offset in range(0, len(data), 80):
+        card = data[offset : offset + 80].decode("ascii")
+
+        if card.startswith("END"):
+            break
+
+        cards[card[:8].strip()] = card[10:].split(" / ")[0].strip()
+
+    return cards
+
+
+# **************************************************************************************
+
+
+class TestFormatFITSCard(unittest.TestCase):
+    def test_values(self) -> None:
+        self.assertEqual(
+            format_fits_card("simple", True),
+            b"SIMPLE  =                    T".ljust(80),
+        )
+        self.assertEqual(
+            format_fits_card("NAXIS1", 640, "width"),
+            b"NAXIS1  =                  640 / width".ljust(80),
+        )
+        self.assertEqual(
+            format_fits_card("EXPTIME", 0.5),
+            b"EXPTIME =                  0.5".ljust(80),
+        )
+        self.assertEqual(
+            format_fits_card("INSTRUME", "ZWO's"),
+            b"INSTRUME= 'ZWO''s  '".ljust(80),
+        )
+
+    def test_comment_is_truncated(self) -> None:
+        card = format_fits_card("OBJECT", "M31", "C" * 100)
+
+        self.assertEqual(len(card), 80)
+        self.assertTrue(card.startswith(b"OBJECT  = 'M31     ' / CCC"))
+
+    def test_value_too_long(self) -> None:
+        # A truncated string would lose its closing quote:
+        with self.assertRaises(ValueError):
+            format_fits_card("OBJECT", "M" * 100)
+
+        self.assertEqual(len(format_fits_card("OBJECT", "M" * 68)), 80)
+
+        with self.assertRaises(ValueError):
+            format_fits_card("OBJECT", "M" * 69)
+
+    def test_keyword_too_long(self) -> None:
+        with self.assertRaises(ValueError):
+            format_fits_card("TOOLONGKEY", 1)
+
+
+# **************************************************************************************
+
+
+class TestWriteFITS(unittest.TestCase):
+    def test_header_is_padded(self) -> None:
+        header = get_fits_header(4, 2, ZWOASIImageType.RAW16, [("GAIN", 100, "")])
+
+        self.assertEqual(len(header), ZWOASI_FITS_BLOCK_SIZE)
+
+        cards = get_header_cards(header)
+
+        self.assertEqual(cards["BITPIX"], "16")
+        self.assertEqual(cards["BZERO"], "32768")
+        self.assertEqual(cards["GAIN"], "100")
+
+    def test_raw16(self) -> None:
+        pixels = [0, 1, 32767, 32768, 65535, 256, 4095, 12345]
+
+        file = BytesIO()
+
+        # N.B. A small chunk size, to stream the frame over several chunks:
+        written = write_fits(
+            file,
+            pack("<8H", *pixels),
+            4,
+            2,
+            ZWOASIImageType.RAW16,
+            chunk_size=6,
+        )
+
+        data = file.getvalue()
+
+        self.assertEqual(written, len(data))
+        self.assertEqual(len(data), 2 * ZWOASI_FITS_BLOCK_SIZE)
+
+        stored = unpack(
+            ">8h", data[ZWOASI_FITS_BLOCK_SIZE : ZWOASI_FITS_BLOCK_SIZE + 16]
+        )
+
+        self.assertEqual([value + 32768 for value in stored], pixels)
+
+        # The data is padded with zeros:
+        self.assertEqual(set(data[ZWOASI_FITS_BLOCK_SIZE + 16 :]), {0})
+
+    def test_raw8(self) -> None:
+        file = BytesIO()
+
+        write_fits(file, bytes(range(8)), 4, 2, ZWOASIImageType.RAW8)
+
+        data = file.getvalue()
+
+        self.assertEqual(get_header_cards(data)["BITPIX"], "8")
+        self.assertEqual(
+            data[ZWOASI_FITS_BLOCK_SIZE : ZWOASI_FITS_BLOCK_SIZE + 8], bytes(range(8))
+        )
+
+    def test_rgb24_planes(self) -> None:
+        # Two BGR pixels:
+        file = BytesIO()
+
+        write_fits(file, bytes([1, 2, 3, 4, 5, 6]), 2, 1, ZWOASIImageType.RGB24)
+
+        data = file.getvalue()
+
+        cards = get_header_cards(data)
+
+        self.assertEqual(cards["NAXIS"], "3")
+        self.assertEqual(cards["NAXIS3"], "3")
+
+        # The R, G and B planes:
+        self.assertEqual(
+            data[ZWOASI_FITS_BLOCK_SIZE : ZWOASI_FITS_BLOCK_SIZE + 6],
+            bytes([3, 6, 2, 5, 1, 4]),
+        )
+
+    def test_buffer_too_small(self) -> None:
+        with self.assertRaises(ValueError):
+            write_fits(BytesIO(), bytes(4), 4, 2, ZWOASIImageType.RAW8)
+
+
+# **************************************************************************************
+
+
+class TestCameraFITS(unittest.TestCase):
+    def setUp(self) -> None:
+        install_simulated_asi_camera_lib(
+            cameras=[
+                ZWOASISimulatedCameraConfiguration(
+                    width=64,
+                    height=32,
+                    readout_rate=0,
+                    is_color=True,
+                    bayer_pattern=ZWOASIBayerPattern.GB,
+                )
+            ]
+        )
+
+        self.camera = ZWOASICamera(0)
+
+    def tearDown(self) -> None:
+        self.camera.disconnect()
+
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+    def test_write_frame(self) -> None:
+        self.camera.set_image_type(ZWOASIImageType.RAW16)
+        self.camera.set_exposure_time(0.01)
+
+        with self.camera.get_frame_buffer() as frame:
+            cards = get_fits_header_cards(self.camera)
+
+            with TemporaryDirectory() as directory:
+                path = Path(directory) / "frame.fits"
+
+                written = write_fits(
+                    path,
+                    frame.data,
+                    frame.width,
+                    frame.height,
+                    frame.image_type,
+                    cards=cards,
+                )
+
+                data = path.read_bytes()
+
+        self.assertEqual(written, len(data))
+        self.assertEqual(len(data) % ZWOASI_FITS_BLOCK_SIZE, 0)
+
+        header = get_header_cards(data)
+
+        self.assertEqual(header["NAXIS1"], "64")
+        self.assertEqual(header["NAXIS2"], "32")
+        self.assertEqual(header["BAYERPAT"], "'GBRG    '")
+        self.assertEqual(header["EXPTIME"], "0.01")
+        self.assertIn("DATE-OBS", header)
+        self.assertIn("INSTRUME", header)
+
+        # The SDK's electrons per ADU is only valid at the lowest gain:
+        self.assertNotIn("EGAIN", header)
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
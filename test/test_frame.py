@@ -0,0 +1,77 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from array import array
+
+from zwo.enums import ZWOASIImageType
+from zwo.frame import (
+    get_bytes_per_pixel,
+    get_frame_dtype,
+    get_frame_shape,
+    get_frame_size,
+    get_frame_view,
+)
+
+# **************************************************************************************
+
+
+class TestFrameGeometry(unittest.TestCase):
+    def test_bytes_per_pixel(self) -> None:
+        self.assertEqual(get_bytes_per_pixel(ZWOASIImageType.RAW8), 1)
+        self.assertEqual(get_bytes_per_pixel(ZWOASIImageType.Y8), 1)
+        self.assertEqual(get_bytes_per_pixel(ZWOASIImageType.RAW16), 2)
+        self.assertEqual(get_bytes_per_pixel(ZWOASIImageType.RGB24), 3)
+
+    def test_bytes_per_pixel_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            get_bytes_per_pixel(ZWOASIImageType.END)
+
+    def test_frame_size(self) -> None:
+        self.assertEqual(get_frame_size(640, 480, ZWOASIImageType.RAW8), 307200)
+        self.assertEqual(get_frame_size(640, 480, ZWOASIImageType.RAW16), 614400)
+        self.assertEqual(get_frame_size(640, 480, ZWOASIImageType.RGB24), 921600)
+
+    def test_frame_shape(self) -> None:
+        self.assertEqual(get_frame_shape(640, 480, ZWOASIImageType.RAW16), (480, 640))
+        self.assertEqual(
+            get_frame_shape(640, 480, ZWOASIImageType.RGB24), (480, 640, 3)
+        )
+
+    def test_frame_dtype(self) -> None:
+        self.assertEqual(get_frame_dtype(ZWOASIImageType.RAW8), "u1")
+        self.assertEqual(get_frame_dtype(ZWOASIImageType.RAW16), "<u2")
+        self.assertEqual(get_frame_dtype(ZWOASIImageType.RGB24), "u1")
+
+    def test_frame_view(self) -> None:
+        destination = array("H", range(8))
+
+        view = get_frame_view(destination, 6)
+
+        self.assertEqual((view.format, view.nbytes), ("B", 6))
+
+        view[:2] = b"\xff\xff"
+
+        self.assertEqual(destination[0], 0xFFFF)
+
+    def test_frame_view_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            get_frame_view(bytes(8), 8)
+
+        with self.assertRaises(ValueError):
+            get_frame_view(bytearray(4), 8)
+
+        with self.assertRaises(ValueError):
+            get_frame_view(memoryview(bytearray(16))[::2], 8)
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
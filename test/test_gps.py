@@ -11,8 +11,11 @@ from datetime import datetime
 from zwo import (
     ZWOASI_CAMERA_DATE_TIME_CTYPE,
     ZWOASI_GPS_DATA_CTYPE,
+    ZWOASI_GPS_SERIES_COLUMNS,
     ZWOASIDateTime,
     ZWOASIGPSData,
+    ZWOASIGPSRecord,
+    ZWOASIGPSSeries,
 )
 
 # **************************************************************************************
@@ -159,6 +162,102 @@ class TestZWOASIGPSData(unittest.TestCase):
         self.assertEqual(gps_data.unused, gps_unused)
 
 
+# **************************************************************************************
+
+
+def create_c_gps_data(second: int = 58) -> ZWOASI_GPS_DATA_CTYPE:
+    c_gps_data = ZWOASI_GPS_DATA_CTYPE()
+    c_gps_data.Datetime.Year = 2025
+    c_gps_data.Datetime.Month = 12
+    c_gps_data.Datetime.Day = 31
+    c_gps_data.Datetime.Hour = 23
+    c_gps_data.Datetime.Minute = 59
+    c_gps_data.Datetime.Second = second
+    c_gps_data.Datetime.Msecond = 500
+    c_gps_data.Datetime.Usecond = 2500
+    c_gps_data.Datetime.Unused = b"DatetimeUnused"
+    c_gps_data.Latitude = 45.1234
+    c_gps_data.Longitude = -93.4567
+    c_gps_data.Altitude = 5000
+    c_gps_data.SatelliteNum = 8
+    c_gps_data.Unused = b"GPSUnused"
+    return c_gps_data
+
+
+# **************************************************************************************
+
+
+class TestZWOASIGPSRecord(unittest.TestCase):
+    def test_from_c_types(self):
+        record = ZWOASIGPSRecord.from_c_types(create_c_gps_data())
+
+        self.assertEqual(record.datetime.year, 2025)
+        self.assertEqual(record.datetime.second, 58)
+        self.assertEqual(record.datetime.microseconds, 2500)
+        self.assertEqual(record.datetime.unused, "DatetimeUnused")
+        self.assertAlmostEqual(record.latitude, 45.1234)
+        self.assertAlmostEqual(record.longitude, -93.4567)
+        self.assertEqual(record.altitude, 5000)
+        self.assertEqual(record.satellite_number, 8)
+        self.assertEqual(record.unused, "GPSUnused")
+
+    def test_has_no_instance_dict(self):
+        record = ZWOASIGPSRecord.from_c_types(create_c_gps_data())
+
+        with self.assertRaises(AttributeError):
+            record.__dict__
+
+    def test_to_model(self):
+        c_gps_data = create_c_gps_data()
+
+        model = ZWOASIGPSRecord.from_c_types(c_gps_data).to_model()
+
+        self.assertEqual(model, ZWOASIGPSData.from_c_types(c_gps_data))
+
+    def test_to_datetime(self):
+        record = ZWOASIGPSRecord.from_c_types(create_c_gps_data())
+
+        self.assertEqual(
+            record.datetime.to_datetime(), datetime(2025, 12, 31, 23, 59, 58, 500250)
+        )
+
+
+# **************************************************************************************
+
+
+class TestZWOASIGPSSeries(unittest.TestCase):
+    def test_append(self):
+        series = ZWOASIGPSSeries()
+
+        series.append(create_c_gps_data(second=1))
+        series.append(ZWOASIGPSRecord.from_c_types(create_c_gps_data(second=2)))
+        series.append(ZWOASIGPSData.from_c_types(create_c_gps_data(second=3)))
+
+        self.assertEqual(len(series), 3)
+        self.assertEqual(list(series.columns["second"]), [1, 2, 3])
+        self.assertEqual(set(series.columns), set(ZWOASI_GPS_SERIES_COLUMNS))
+        self.assertEqual([record.datetime.second for record in series], [1, 2, 3])
+        self.assertAlmostEqual(series[2].latitude, 45.1234)
+
+    def test_clear(self):
+        series = ZWOASIGPSSeries()
+        series.append(create_c_gps_data())
+        series.clear()
+        self.assertEqual(len(series), 0)
+
+    def test_to_arrays(self):
+        series = ZWOASIGPSSeries()
+
+        for second in range(4):
+            series.append(create_c_gps_data(second=second))
+
+        arrays = series.to_arrays()
+
+        self.assertEqual(arrays["second"].tolist(), [0, 1, 2, 3])
+        self.assertEqual(arrays["latitude"].dtype.kind, "f")
+        self.assertEqual(arrays["altitude"].dtype.itemsize, 4)
+
+
 # **************************************************************************************
 
 if __name__ == "__main__":
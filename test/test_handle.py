@@ -0,0 +1,246 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import threading
+import unittest
+from collections.abc import Buffer
+from concurrent.futures import CancelledError, wait
+from time import monotonic, sleep
+from typing import Optional
+
+from zwo import (
+    ZWOASI_SDK_VERSION,
+    ZWOASICamera,
+    ZWOASIErrorCode,
+    ZWOASIExposureError,
+    ZWOASIExposureStatus,
+    ZWOASISimulatedCameraConfiguration,
+    get_exposure_monitor,
+    install_simulated_asi_camera_lib,
+    set_asi_camera_lib,
+)
+
+# **************************************************************************************
+
+
+class TestZWOASIExposureHandle(unittest.TestCase):
+    def setUp(self) -> None:
+        self.library = install_simulated_asi_camera_lib(
+            cameras=[
+                ZWOASISimulatedCameraConfiguration(width=64, height=32, readout_rate=0)
+                for _ in range(3)
+            ]
+        )
+
+        self.cameras = [ZWOASICamera(id) for id in range(3)]
+
+        self.camera = self.cameras[0]
+
+    def tearDown(self) -> None:
+        for camera in self.cameras:
+            camera.disconnect()
+
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+    def test_result(self) -> None:
+        self.camera.set_exposure_time(0.01)
+
+        handle = self.camera.start_exposure()
+
+        self.assertIs(self.camera.exposure_handle, handle)
+
+        with handle.result(timeout=5.0) as frame:
+            self.assertEqual(len(frame.data), 64 * 32)
+
+        self.assertTrue(handle.done())
+        self.assertTrue(handle.future.done())
+        self.assertFalse(handle.cancelled())
+
+        assert handle.completion is not None
+
+        self.assertEqual(handle.completion["status"], ZWOASIExposureStatus.SUCCESS)
+        self.assertIs(self.camera.last_exposure_completion, handle.completion)
+        self.assertEqual(self.camera.frames_captured, 1)
+        self.assertAlmostEqual(self.camera.exposed_time, 0.01)
+
+    def test_wait_timeout(self) -> None:
+        self.camera.set_exposure_time(0.2)
+
+        handle = self.camera.start_exposure()
+
+        self.assertFalse(handle.wait(timeout=0.01))
+        self.assertFalse(handle.done())
+
+        self.assertTrue(handle.wait(timeout=5.0))
+
+        handle.result().release()
+
+    def test_one_exposure_at_a_time(self) -> None:
+        self.camera.set_exposure_time(0.2)
+
+        handle = self.camera.start_exposure()
+
+        with self.assertRaises(RuntimeError):
+            self.camera.start_exposure()
+
+        handle.result(timeout=5.0).release()
+
+    def test_cancel(self) -> None:
+        self.camera.set_exposure_time(5.0)
+
+        handle = self.camera.start_exposure()
+
+        self.assertTrue(handle.cancel())
+        self.assertTrue(handle.done())
+        self.assertTrue(handle.cancelled())
+        self.assertEqual(get_exposure_monitor().get_pending(), 0)
+
+        # Like a future, cancelling again reports that the exposure is cancelled:
+        self.assertTrue(handle.cancel())
+
+        with self.assertRaises(CancelledError):
+            handle.result()
+
+        self.assertEqual(
+            self.camera.get_acquisition_status(), ZWOASIExposureStatus.FAILED
+        )
+
+        # The camera can start another exposure straight away:
+        self.camera.set_exposure_time(0.01)
+
+        self.camera.start_exposure().result(timeout=5.0).release()
+
+    def test_cancel_failure(self) -> None:
+        self.camera.set_exposure_time(5.0)
+
+        handle = self.camera.start_exposure()
+
+        sdk = self.library.sdk
+
+        stop_exposure = sdk.ASIStopExposure
+
+        sdk.ASIStopExposure = lambda id: ZWOASIErrorCode.GENERAL_ERROR  # type: ignore[method-assign]
+
+        try:
+            with self.assertRaises(RuntimeError):
+                handle.cancel()
+        finally:
+            sdk.ASIStopExposure = stop_exposure  # type: ignore[method-assign]
+
+        # The handle is cancelled (and no longer monitored) regardless:
+        self.assertTrue(handle.cancelled())
+        self.assertTrue(handle.buffer.is_released)
+        self.assertEqual(get_exposure_monitor().get_pending(), 0)
+
+    def test_disconnect_cancels_exposure(self) -> None:
+        self.camera.set_exposure_time(5.0)
+
+        handle = self.camera.start_exposure()
+
+        self.camera.disconnect()
+
+        self.assertTrue(handle.cancelled())
+
+    def test_disconnect_waits_for_read_out(self) -> None:
+        get_exposure_data = self.camera._get_exposure_data
+
+        def get_slow_exposure_data(buffer: Buffer, trace: Optional[int] = None) -> None:
+            sleep(0.1)
+            get_exposure_data(buffer, trace=trace)
+
+        self.camera._get_exposure_data = get_slow_exposure_data  # type: ignore[method-assign]
+
+        self.camera.set_exposure_time(0.001)
+
+        handle = self.camera.start_exposure()
+
+        # Wait for the monitor to claim the exposure, and start reading it out:
+        while not handle.future.running() and not handle.done():
+            sleep(0.001)
+
+        self.camera.disconnect()
+
+        # The read out finished before the camera was closed:
+        self.assertTrue(handle.done())
+
+        handle.result().release()
+
+    def test_blocking_capture_whilst_pending(self) -> None:
+        self.camera.set_exposure_time(0.2)
+
+        handle = self.camera.start_exposure()
+
+        with self.assertRaises(RuntimeError):
+            self.camera.get_frame()
+
+        with self.assertRaises(RuntimeError):
+            self.camera.get_frame_buffer()
+
+        with self.assertRaises(RuntimeError):
+            self.camera.capture_sequence(2, 0.01)
+
+        # The guard does not rely on the exposure status, so also holds whilst, e.g.,
+        # a stopped exposure has not yet been reaped by the monitor:
+        with self.assertRaises(RuntimeError):
+            self.camera._start_exposure()
+
+        # The pending exposure is unaffected:
+        handle.result(timeout=5.0).release()
+
+        self.assertEqual(self.camera.get_exposure_time(), 0.2)
+
+    def test_stopped_exposure_fails(self) -> None:
+        self.camera.set_exposure_time(0.2)
+
+        handle = self.camera.start_exposure()
+
+        # Stop the exposure behind the handle's back, e.g., from another application:
+        self.camera.lib.ASIStopExposure(self.camera.id)
+
+        with self.assertRaises(ZWOASIExposureError):
+            handle.result(timeout=5.0)
+
+        self.assertFalse(handle.cancelled())
+
+    def test_many_cameras_from_one_thread(self) -> None:
+        for camera in self.cameras:
+            camera.set_exposure_time(0.1)
+
+        began = monotonic()
+
+        handles = [camera.start_exposure() for camera in self.cameras]
+
+        done, pending = wait([handle.future for handle in handles], timeout=5.0)
+
+        elapsed = monotonic() - began
+
+        self.assertEqual(len(done), 3)
+        self.assertEqual(pending, set())
+
+        # The exposures overlapped, rather than running one after another:
+        self.assertLess(elapsed, 0.25)
+
+        for handle in handles:
+            handle.result().release()
+
+        # A single monitor thread detected every completion:
+        threads = [
+            thread
+            for thread in threading.enumerate()
+            if thread.name == "zwo-exposure-monitor"
+        ]
+
+        self.assertEqual(len(threads), 1)
+        self.assertEqual(get_exposure_monitor().get_pending(), 0)
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
@@ -0,0 +1,102 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import zwo
+
+# **************************************************************************************
+
+# The budget (in seconds) for `import zwo`, which is generous as the lazy import only
+# needs to define the public API's names (N.B. the eager import took ~0.5s):
+IMPORT_TIME_BUDGET: float = 0.1
+
+# **************************************************************************************
+
+
+def run_in_subprocess(code: str) -> dict:
+    """
+    Run the code in a fresh interpreter (without any zwo modules imported), and
+    return the JSON it prints.
+    """
+    # Ensure the subprocess imports the same zwo package as the tests:
+    path = os.path.dirname(os.path.dirname(os.path.abspath(zwo.__file__)))
+
+    environment = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, [path, os.environ.get("PYTHONPATH")])
+        ),
+    }
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        env=environment,
+        text=True,
+        timeout=60,
+    )
+
+    return json.loads(result.stdout)
+
+
+# **************************************************************************************
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_time_budget(self) -> None:
+        result = run_in_subprocess(
+            "import json, sys\n"
+            "from time import perf_counter\n"
+            "began = perf_counter()\n"
+            "import zwo\n"
+            "elapsed = perf_counter() - began\n"
+            "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))"
+        )
+
+        self.assertLess(result["elapsed"], IMPORT_TIME_BUDGET)
+
+        # Neither the camera, nor pydantic, are imported until they are needed:
+        self.assertNotIn("zwo.camera", result["modules"])
+        self.assertNotIn("pydantic", result["modules"])
+
+    def test_enums_are_imported_alone(self) -> None:
+        result = run_in_subprocess(
+            "import json, sys\n"
+            "from zwo import ZWOASIErrorCode, get_asi_libary_path\n"
+            "print(json.dumps({'modules': sorted(sys.modules)}))"
+        )
+
+        self.assertIn("zwo.enums", result["modules"])
+        self.assertNotIn("zwo.camera", result["modules"])
+        self.assertNotIn("zwo.lib", result["modules"])
+
+    def test_every_name_is_importable(self) -> None:
+        for name in zwo.__all__:
+            self.assertIsNotNone(getattr(zwo, name), name)
+
+        self.assertEqual(set(zwo.__all__) - set(dir(zwo)), set())
+
+    def test_unknown_name(self) -> None:
+        with self.assertRaises(AttributeError):
+            getattr(zwo, "ZWOASIUnknown")
+
+        with self.assertRaises(ImportError):
+            exec("from zwo import ZWOASIUnknown", {})
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
@@ -0,0 +1,149 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from ctypes import c_int
+
+from zwo import (
+    ZWOASI_LATENCY_BUCKETS,
+    ZWOASI_SDK_VERSION,
+    ZWOASICamera,
+    ZWOASIErrorCode,
+    ZWOASISDKInstrumentation,
+    ZWOASISimulatedCameraConfiguration,
+    install_simulated_asi_camera_lib,
+    set_asi_camera_lib,
+)
+
+# **************************************************************************************
+
+
+class TestZWOASISDKInstrumentation(unittest.TestCase):
+    def test_record(self) -> None:
+        instrumentation = ZWOASISDKInstrumentation()
+
+        instrumentation.record("ASIGetExpStatus", 0, 0.0000005, 0)
+        instrumentation.record("ASIGetExpStatus", 0, 0.002, 0)
+        instrumentation.record("ASIGetExpStatus", 0, 20.0, ZWOASIErrorCode.TIMEOUT)
+
+        [statistics] = instrumentation.get_snapshot()
+
+        self.assertEqual(statistics["function"], "ASIGetExpStatus")
+        self.assertEqual(statistics["camera"], 0)
+        self.assertEqual(statistics["count"], 3)
+        self.assertEqual(statistics["errors"], {"TIMEOUT": 1})
+        self.assertEqual(statistics["minimum"], 0.0000005)
+        self.assertEqual(statistics["maximum"], 20.0)
+
+        buckets = statistics["buckets"]
+
+        self.assertEqual(len(buckets), len(ZWOASI_LATENCY_BUCKETS))
+        self.assertEqual(buckets[0], 1)
+        self.assertEqual(buckets[ZWOASI_LATENCY_BUCKETS.index(0.0025)], 2)
+        # The 20 second call is only counted in the (implicit) +Inf bucket:
+        self.assertEqual(buckets[-1], 2)
+
+    def test_snapshot_per_function(self) -> None:
+        instrumentation = ZWOASISDKInstrumentation()
+
+        instrumentation.record("ASIGetVideoData", 0, 0.01, 0)
+        instrumentation.record("ASIGetVideoData", 1, 0.03, 0)
+        instrumentation.record("ASIGetNumOfConnectedCameras", None, 0.001)
+
+        self.assertEqual(len(instrumentation.get_snapshot()), 3)
+
+        snapshot = instrumentation.get_snapshot(per_camera=False)
+
+        self.assertEqual(
+            [(s["function"], s["camera"], s["count"]) for s in snapshot],
+            [("ASIGetNumOfConnectedCameras", None, 1), ("ASIGetVideoData", None, 2)],
+        )
+
+        self.assertAlmostEqual(snapshot[1]["mean"], 0.02)
+
+        instrumentation.reset()
+
+        self.assertEqual(instrumentation.get_snapshot(), [])
+
+    def test_wrap(self) -> None:
+        instrumentation = ZWOASISDKInstrumentation()
+
+        def get_camera_property(info: object, index: int) -> int:
+            return ZWOASIErrorCode.INVALID_INDEX
+
+        wrapped = instrumentation.wrap("ASIGetCameraProperty", get_camera_property)
+
+        self.assertEqual(wrapped(None, c_int(3)), ZWOASIErrorCode.INVALID_INDEX)
+
+        [statistics] = instrumentation.get_snapshot()
+
+        self.assertEqual(statistics["camera"], 3)
+        self.assertEqual(statistics["errors"], {"INVALID_INDEX": 1})
+
+        wrapped = instrumentation.wrap("ASIGetNumOfConnectedCameras", lambda: 2)
+
+        self.assertEqual(wrapped(), 2)
+
+        statistics = instrumentation.get_snapshot()[-1]
+
+        self.assertIsNone(statistics["camera"])
+        self.assertEqual(statistics["errors"], {})
+
+
+# **************************************************************************************
+
+
+class TestZWOASICameraLibInstrumentation(unittest.TestCase):
+    def setUp(self) -> None:
+        self.library = install_simulated_asi_camera_lib(
+            cameras=[
+                ZWOASISimulatedCameraConfiguration(width=64, height=32, readout_rate=0)
+            ]
+        )
+
+    def tearDown(self) -> None:
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+    def test_enable_and_disable(self) -> None:
+        assert self.library.lib is not None
+
+        original = self.library.lib.ASIGetExpStatus
+
+        instrumentation = self.library.enable_instrumentation()
+
+        self.assertIs(self.library.enable_instrumentation(), instrumentation)
+
+        camera = ZWOASICamera(0)
+
+        camera.set_exposure_time(0.001)
+
+        camera.get_frame_buffer().release()
+
+        camera.disconnect()
+
+        snapshot = {
+            (statistics["function"], statistics["camera"]): statistics
+            for statistics in self.library.get_instrumentation_snapshot()
+        }
+
+        self.assertEqual(snapshot[("ASIStartExposure", 0)]["count"], 1)
+        self.assertEqual(snapshot[("ASIGetDataAfterExp", 0)]["count"], 1)
+        self.assertGreaterEqual(snapshot[("ASIGetExpStatus", 0)]["count"], 1)
+        self.assertEqual(snapshot[("ASIGetNumOfConnectedCameras", None)]["count"], 1)
+
+        self.library.disable_instrumentation()
+
+        self.assertEqual(self.library.lib.ASIGetExpStatus, original)
+        self.assertEqual(self.library.get_instrumentation_snapshot(), [])
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
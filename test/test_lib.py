@@ -6,8 +6,14 @@
 # **************************************************************************************
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
-from zwo.lib import ZWOASICameraLib
+from zwo.lib import (
+    ZWOASICameraLib,
+    _libraries,
+    get_asi_camera_lib,
+    prewarm_asi_camera_lib,
+)
 
 # **************************************************************************************
 
@@ -32,6 +38,39 @@ class TestZWOASICameraLib(unittest.TestCase):
             ZWOASICameraLib(version=(1, 38, 0))
 
 
+# **************************************************************************************
+
+
+class TestGetASICameraLib(unittest.TestCase):
+    def test_missing_library_is_not_cached(self) -> None:
+        for _ in range(2):
+            with self.assertRaises(FileNotFoundError):
+                get_asi_camera_lib(version=(1, 36, 0))
+
+        self.assertNotIn((1, 36), _libraries)
+
+    def test_library_is_shared(self) -> None:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            libraries = list(
+                executor.map(lambda _: get_asi_camera_lib(version=(1, 37, 0)), range(8))
+            )
+
+        for lib in libraries:
+            self.assertIs(lib, libraries[0])
+
+        # Patch versions share the {major}.{minor} library:
+        self.assertIs(get_asi_camera_lib(version=(1, 37, 1)), libraries[0])
+
+    def test_prewarm_reports_timing(self) -> None:
+        timing = prewarm_asi_camera_lib(version=(1, 37, 0))
+
+        self.assertGreaterEqual(timing["total"], 0.0)
+        self.assertAlmostEqual(
+            timing["total"],
+            timing["resolve"] + timing["load"] + timing["configure"],
+        )
+
+
 # **************************************************************************************
 
 if __name__ == "__main__":
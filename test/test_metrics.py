@@ -0,0 +1,186 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from threading import Event, Thread
+from time import sleep
+from typing import List
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from zwo import (
+    ZWOASI_OPENMETRICS_CONTENT_TYPE,
+    ZWOASI_SDK_VERSION,
+    ZWOASICamera,
+    ZWOASIMetricsCollector,
+    ZWOASISimulatedCameraConfiguration,
+    install_simulated_asi_camera_lib,
+    set_asi_camera_lib,
+)
+
+# **************************************************************************************
+
+
+class TestZWOASIMetricsCollector(unittest.TestCase):
+    def setUp(self) -> None:
+        self.library = install_simulated_asi_camera_lib(
+            cameras=[
+                ZWOASISimulatedCameraConfiguration(
+                    name='ZWO "Simulator"',
+                    width=64,
+                    height=32,
+                    readout_rate=0,
+                    has_cooler=True,
+                )
+            ]
+        )
+
+        self.camera = ZWOASICamera(0)
+
+        self.camera.set_exposure_time(0.01)
+
+    def tearDown(self) -> None:
+        self.camera.disconnect()
+
+        self.library.disable_instrumentation()
+
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+    def test_sample(self) -> None:
+        collector = ZWOASIMetricsCollector([self.camera])
+
+        self.assertEqual(collector.get_metrics(), [])
+
+        [sample] = collector.sample()
+
+        self.assertEqual(sample["frames_captured"], 0)
+        self.assertEqual(sample["exposure_duty_cycle"], 0.0)
+        self.assertEqual(sample["temperature"], 20.0)
+        self.assertEqual(sample["cooler_power"], 0.0)
+
+        for _ in range(3):
+            self.camera.get_frame_buffer().release()
+
+        [sample] = collector.sample()
+
+        self.assertEqual(sample["frames_captured"], 3)
+        self.assertAlmostEqual(sample["exposed_time"], 0.03)
+        self.assertGreater(sample["exposure_duty_cycle"], 0.0)
+        self.assertLessEqual(sample["exposure_duty_cycle"], 1.0)
+
+        self.assertEqual(collector.get_metrics(), [sample])
+
+    def test_video_frames_are_counted(self) -> None:
+        collector = ZWOASIMetricsCollector([self.camera])
+
+        self.camera.set_exposure_time(0.001)
+
+        self.camera.start_acquisition()
+
+        frame = self.camera.get_next_video_frame(timeout=1.0)
+
+        [sample] = collector.sample()
+
+        self.assertGreaterEqual(sample["frames_captured"], frame.sequence)
+
+        self.camera.stop_acquisition()
+
+        [after] = collector.sample()
+
+        self.assertGreaterEqual(after["frames_captured"], sample["frames_captured"])
+
+    def test_capture_counters_are_consistent(self) -> None:
+        self.camera.set_exposure_time(0.001)
+
+        self.camera.start_acquisition()
+
+        self.camera.get_next_video_frame(timeout=1.0)
+
+        samples: List[int] = []
+
+        stopped = Event()
+
+        def sample() -> None:
+            while True:
+                samples.append(self.camera.get_capture_counters()[0])
+
+                if stopped.is_set():
+                    return
+
+        thread = Thread(target=sample)
+
+        thread.start()
+
+        try:
+            self.camera.stop_acquisition()
+        finally:
+            stopped.set()
+            thread.join()
+
+        frames_captured, _ = self.camera.get_capture_counters()
+
+        self.assertEqual(frames_captured, self.camera.frames_captured)
+
+        # The reader's frames are never counted twice whilst being folded in:
+        self.assertLessEqual(max(samples), frames_captured)
+        self.assertEqual(samples, sorted(samples))
+
+    def test_sdk_errors(self) -> None:
+        self.library.enable_instrumentation()
+
+        assert self.library.lib is not None
+
+        self.library.lib.ASIGetDataAfterExp(0, None, 0)
+
+        [sample] = ZWOASIMetricsCollector([self.camera]).sample()
+
+        self.assertEqual(sample["sdk_errors"], {"GENERAL_ERROR": 1})
+
+    def test_render(self) -> None:
+        collector = ZWOASIMetricsCollector([self.camera])
+
+        collector.sample()
+
+        text = collector.render()
+
+        labels = '{camera="0",name="ZWO \\"Simulator\\""}'
+
+        self.assertIn("# TYPE zwoasi_frames_captured counter", text)
+        self.assertIn(f"zwoasi_frames_captured_total{labels} 0.0", text)
+        self.assertIn(f"zwoasi_sensor_temperature_celsius{labels} 20.0", text)
+        self.assertIn(f"zwoasi_cooler_power_percent{labels} 0.0", text)
+        self.assertTrue(text.endswith("# EOF\n"))
+
+    def test_serve(self) -> None:
+        collector = ZWOASIMetricsCollector([self.camera], interval=0.01)
+
+        server = collector.serve(port=0)
+
+        try:
+            host, port = server.server_address[:2]
+
+            while not collector.get_metrics():
+                sleep(0.01)
+
+            with urlopen(f"http://{host!s}:{port}/metrics") as response:
+                self.assertEqual(
+                    response.headers["Content-Type"], ZWOASI_OPENMETRICS_CONTENT_TYPE
+                )
+                self.assertIn("zwoasi_frames_captured_total", response.read().decode())
+
+            with self.assertRaises(HTTPError):
+                urlopen(f"http://{host!s}:{port}/")
+        finally:
+            collector.close()
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
@@ -0,0 +1,128 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from mmap import mmap
+
+from zwo import ZWOASIFrameBufferPool, ZWOASIImageType
+
+# **************************************************************************************
+
+
+class TestZWOASIFrameBufferPool(unittest.TestCase):
+    def test_acquire_requires_configuration(self) -> None:
+        pool = ZWOASIFrameBufferPool()
+
+        with self.assertRaises(RuntimeError):
+            pool.acquire()
+
+    def test_invalid_capacity(self) -> None:
+        with self.assertRaises(ValueError):
+            ZWOASIFrameBufferPool(capacity=0)
+
+    def test_acquire_sized_for_format(self) -> None:
+        pool = ZWOASIFrameBufferPool()
+        pool.configure(64, 32, ZWOASIImageType.RAW16)
+
+        buffer = pool.acquire()
+
+        self.assertEqual(buffer.size, 64 * 32 * 2)
+        self.assertEqual(buffer.key, (64, 32, ZWOASIImageType.RAW16))
+        self.assertIsInstance(buffer.data, bytearray)
+
+    def test_release_recycles_buffer(self) -> None:
+        pool = ZWOASIFrameBufferPool()
+        pool.configure(64, 32, ZWOASIImageType.RAW8)
+
+        with pool.acquire() as buffer:
+            data = buffer.data
+
+        self.assertTrue(buffer.is_released)
+
+        recycled = pool.acquire()
+
+        self.assertIs(recycled.data, data)
+
+        statistics = pool.get_statistics()
+        self.assertEqual(statistics["hits"], 1)
+        self.assertEqual(statistics["misses"], 1)
+        self.assertEqual(statistics["bytes_allocated"], 64 * 32)
+
+    def test_steady_state_does_not_allocate(self) -> None:
+        pool = ZWOASIFrameBufferPool()
+        pool.configure(64, 32, ZWOASIImageType.RAW16)
+
+        for _ in range(100):
+            pool.acquire().release()
+
+        statistics = pool.get_statistics()
+        self.assertEqual(statistics["misses"], 1)
+        self.assertEqual(statistics["hits"], 99)
+
+    def test_double_release_is_ignored(self) -> None:
+        pool = ZWOASIFrameBufferPool()
+        pool.configure(64, 32, ZWOASIImageType.RAW8)
+
+        buffer = pool.acquire()
+        buffer.release()
+        buffer.release()
+
+        self.assertEqual(pool.get_statistics()["available"], 1)
+
+    def test_reconfigure_discards_stale_buffers(self) -> None:
+        pool = ZWOASIFrameBufferPool()
+        pool.configure(64, 32, ZWOASIImageType.RAW8)
+
+        stale = pool.acquire()
+        pool.acquire().release()
+
+        pool.configure(128, 64, ZWOASIImageType.RAW16)
+
+        self.assertEqual(pool.get_statistics()["available"], 0)
+
+        # Releasing a buffer for the stale format should not return it to the pool:
+        stale.release()
+        self.assertEqual(pool.get_statistics()["available"], 0)
+
+        self.assertEqual(pool.acquire().size, 128 * 64 * 2)
+
+    def test_reconfigure_same_format_is_noop(self) -> None:
+        pool = ZWOASIFrameBufferPool()
+        pool.configure(64, 32, ZWOASIImageType.RAW8)
+        pool.acquire().release()
+
+        pool.configure(64, 32, ZWOASIImageType.RAW8)
+
+        self.assertEqual(pool.get_statistics()["available"], 1)
+
+    def test_capacity_limits_idle_buffers(self) -> None:
+        pool = ZWOASIFrameBufferPool(capacity=2)
+        pool.configure(64, 32, ZWOASIImageType.RAW8)
+
+        buffers = [pool.acquire() for _ in range(4)]
+
+        for buffer in buffers:
+            buffer.release()
+
+        self.assertEqual(pool.get_statistics()["available"], 2)
+
+    def test_page_aligned(self) -> None:
+        pool = ZWOASIFrameBufferPool(page_aligned=True)
+        pool.configure(64, 32, ZWOASIImageType.RAW8)
+
+        buffer = pool.acquire()
+
+        self.assertIsInstance(buffer.data, mmap)
+        self.assertEqual(buffer.size, 64 * 32)
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
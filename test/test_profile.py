@@ -0,0 +1,147 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from typing import Dict
+
+from pydantic import ValidationError
+
+from zwo import (
+    ZWOASI_SDK_VERSION,
+    ZWOASICamera,
+    ZWOASICameraProfile,
+    ZWOASIImageType,
+    ZWOASISimulatedCameraConfiguration,
+    install_simulated_asi_camera_lib,
+    set_asi_camera_lib,
+)
+
+# **************************************************************************************
+
+
+class TestZWOASICameraProfile(unittest.TestCase):
+    def test_merge(self) -> None:
+        profile = ZWOASICameraProfile(gain=100, image_type=ZWOASIImageType.RAW16)
+
+        merged = profile.merge(gain=200, exposure_time=0.5)
+
+        self.assertEqual(merged.gain, 200)
+        self.assertEqual(merged.exposure_time, 0.5)
+        self.assertEqual(merged.image_type, ZWOASIImageType.RAW16)
+        self.assertIsNone(merged.width)
+
+    def test_unknown_settings_are_rejected(self) -> None:
+        with self.assertRaises(ValidationError):
+            ZWOASICameraProfile().merge(gian=100)
+
+        with self.assertRaises(ValidationError):
+            ZWOASICameraProfile(width=4)
+
+
+# **************************************************************************************
+
+
+class TestCameraConfigure(unittest.TestCase):
+    def setUp(self) -> None:
+        self.library = install_simulated_asi_camera_lib(
+            cameras=[
+                ZWOASISimulatedCameraConfiguration(width=64, height=32, readout_rate=0)
+            ]
+        )
+
+        self.camera = ZWOASICamera(0)
+
+        self.instrumentation = self.library.enable_instrumentation()
+
+    def tearDown(self) -> None:
+        self.camera.disconnect()
+
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+    def get_counts(self) -> Dict[str, int]:
+        return {
+            statistics["function"]: statistics["count"]
+            for statistics in self.library.get_instrumentation_snapshot(
+                per_camera=False
+            )
+        }
+
+    def test_configure(self) -> None:
+        guiding = ZWOASICameraProfile(
+            width=32,
+            height=16,
+            binning=2,
+            image_type=ZWOASIImageType.RAW8,
+            gain=300,
+            exposure_time=0.5,
+        )
+
+        result = self.camera.configure(guiding, offset=20)
+
+        self.assertEqual(self.camera.roi.to_format(), (32, 16, 2, ZWOASIImageType.RAW8))
+        self.assertEqual(self.camera.get_gain(), 300)
+        self.assertEqual(self.camera.get_offset(), 20)
+        self.assertEqual(self.camera.get_exposure_time(), 0.5)
+
+        self.assertEqual(
+            list(result["changes"]),
+            ["width", "height", "binning", "exposure_time", "gain", "offset"],
+        )
+        self.assertEqual(result["changes"]["width"], (64, 32))
+        self.assertEqual(result["changes"]["exposure_time"][1], 0.5)
+        self.assertEqual(result["unchanged"], ["image_type"])
+        self.assertGreater(result["elapsed"], 0.0)
+
+        counts = self.get_counts()
+
+        self.assertEqual(counts["ASISetROIFormat"], 1)
+        self.assertEqual(counts["ASISetStartPos"], 1)
+        self.assertEqual(counts["ASISetControlValue"], 3)
+
+    def test_reapplying_a_profile_makes_no_sdk_calls(self) -> None:
+        profile = self.camera.get_profile().merge(gain=150)
+
+        self.camera.configure(profile)
+
+        self.instrumentation.reset()
+
+        result = self.camera.configure(profile)
+
+        self.assertEqual(result["changes"], {})
+        self.assertIn("gain", result["unchanged"])
+        self.assertNotIn("ASISetROIFormat", self.get_counts())
+        self.assertNotIn("ASISetControlValue", self.get_counts())
+
+    def test_start_position_only(self) -> None:
+        self.camera.configure(width=32, height=16, start_x=8, start_y=4)
+
+        self.instrumentation.reset()
+
+        result = self.camera.configure(start_x=16)
+
+        self.assertEqual(result["changes"], {"start_x": (8, 16)})
+
+        counts = self.get_counts()
+
+        # The ROI format is unchanged, so only the start position is set:
+        self.assertNotIn("ASISetROIFormat", counts)
+        self.assertEqual(counts["ASISetStartPos"], 1)
+        self.assertEqual(self.camera.refresh_state().start_y, 4)
+
+    def test_invalid_settings_make_no_changes(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.camera.configure(gain=100, binning=0)
+
+        self.assertEqual(self.get_counts(), {})
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
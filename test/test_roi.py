@@ -0,0 +1,56 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+
+from pydantic import ValidationError
+
+from zwo import ZWOASIImageType, ZWOASIRegionOfInterest
+
+# **************************************************************************************
+
+
+class TestZWOASIRegionOfInterest(unittest.TestCase):
+    def test_defaults(self) -> None:
+        roi = ZWOASIRegionOfInterest()
+        self.assertEqual(roi.width, 0)
+        self.assertEqual(roi.height, 0)
+        self.assertEqual(roi.binning, 1)
+        self.assertEqual(roi.image_type, ZWOASIImageType.RAW8)
+        self.assertEqual(roi.start_x, 0)
+        self.assertEqual(roi.start_y, 0)
+
+    def test_to_format(self) -> None:
+        roi = ZWOASIRegionOfInterest(
+            width=640,
+            height=480,
+            binning=2,
+            image_type=ZWOASIImageType.RAW16,
+            start_x=16,
+            start_y=8,
+        )
+        self.assertEqual(roi.to_format(), (640, 480, 2, ZWOASIImageType.RAW16))
+
+    def test_image_type_coercion(self) -> None:
+        roi = ZWOASIRegionOfInterest(image_type=2)
+        self.assertIs(roi.image_type, ZWOASIImageType.RAW16)
+
+    def test_invalid_binning(self) -> None:
+        with self.assertRaises(ValidationError):
+            ZWOASIRegionOfInterest(binning=0)
+
+    def test_invalid_start_position(self) -> None:
+        with self.assertRaises(ValidationError):
+            ZWOASIRegionOfInterest(start_x=-1)
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
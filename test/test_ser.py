@@ -0,0 +1,244 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from struct import unpack_from
+from tempfile import TemporaryDirectory
+
+from zwo import (
+    ZWOASI_GPS_DATA_CTYPE,
+    ZWOASI_SDK_VERSION,
+    ZWOASI_SER_HEADER_SIZE,
+    ZWOASIBayerPattern,
+    ZWOASICamera,
+    ZWOASIImageType,
+    ZWOASISERRecorder,
+    ZWOASISimulatedCameraConfiguration,
+    get_gps_ser_ticks,
+    get_ser_ticks,
+    install_simulated_asi_camera_lib,
+    set_asi_camera_lib,
+)
+
+# **************************************************************************************
+
+
+def get_header(data: bytes) -> tuple:
+    """
+    Parse the FileID, ColorID, LittleEndian, ImageWidth, ImageHeight,
+    PixelDepthPerPlane and FrameCount fields of a SER header.
+    """
+    return (data[:14],) + unpack_from("<6i", data, 18)
+
+
+# **************************************************************************************
+
+
+class TestSERTicks(unittest.TestCase):
+    def test_epoch(self) -> None:
+        self.assertEqual(get_ser_ticks(0.0), 621_355_968_000_000_000)
+        self.assertEqual(get_ser_ticks(1.5) - get_ser_ticks(0.0), 15_000_000)
+
+    def test_gps_time(self) -> None:
+        gps = ZWOASI_GPS_DATA_CTYPE()
+
+        gps.Datetime.Year = 2025
+        gps.Datetime.Month = 6
+        gps.Datetime.Day = 21
+        gps.Datetime.Hour = 22
+        gps.Datetime.Minute = 30
+        gps.Datetime.Second = 15
+        gps.Datetime.Msecond = 250
+        gps.Datetime.Usecond = 1234
+
+        timestamp = datetime(
+            2025, 6, 21, 22, 30, 15, 250000, tzinfo=timezone.utc
+        ).timestamp()
+
+        self.assertEqual(get_gps_ser_ticks(gps), get_ser_ticks(timestamp) + 1234)
+
+    def test_gps_without_time(self) -> None:
+        self.assertIsNone(get_gps_ser_ticks(ZWOASI_GPS_DATA_CTYPE()))
+
+
+# **************************************************************************************
+
+
+class TestZWOASISERRecorder(unittest.TestCase):
+    def setUp(self) -> None:
+        install_simulated_asi_camera_lib(
+            cameras=[
+                ZWOASISimulatedCameraConfiguration(
+                    width=64,
+                    height=32,
+                    readout_rate=0,
+                    is_color=True,
+                    bayer_pattern=ZWOASIBayerPattern.GR,
+                )
+            ]
+        )
+
+        self.camera = ZWOASICamera(0)
+
+        self.camera.set_exposure_time(0.001)
+
+        self.directory = TemporaryDirectory()
+
+        self.path = Path(self.directory.name) / "capture.ser"
+
+    def tearDown(self) -> None:
+        self.camera.disconnect()
+
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+        self.directory.cleanup()
+
+    def test_record(self) -> None:
+        self.camera.set_image_type(ZWOASIImageType.RAW16)
+
+        with ZWOASISERRecorder(self.camera, self.path, observer="Me") as recorder:
+            statistics = recorder.record(count=5)
+
+        self.assertEqual(statistics["frames_recorded"], 5)
+        self.assertEqual(statistics["bytes_written"], 5 * 64 * 32 * 2)
+        self.assertGreater(statistics["throughput"], 0.0)
+        self.assertGreater(statistics["camera_frame_rate"], 0.0)
+
+        # The camera's video capture was stopped again afterwards:
+        self.assertFalse(self.camera.is_video_streaming)
+
+        data = self.path.read_bytes()
+
+        self.assertEqual(get_header(data), (b"LUCAM-RECORDER", 9, 0, 64, 32, 16, 5))
+        self.assertEqual(data[42:44], b"Me")
+
+        frames = 5 * 64 * 32 * 2
+
+        self.assertEqual(len(data), ZWOASI_SER_HEADER_SIZE + frames + 5 * 8)
+
+        timestamps = unpack_from("<5q", data, ZWOASI_SER_HEADER_SIZE + frames)
+
+        self.assertEqual(list(timestamps), sorted(timestamps))
+
+        # The first frame's timestamp is recorded as the header's UTC date:
+        self.assertEqual(unpack_from("<q", data, 170)[0], timestamps[0])
+
+    def test_record_is_preallocated(self) -> None:
+        self.camera.set_image_type(ZWOASIImageType.RAW8)
+
+        with ZWOASISERRecorder(self.camera, self.path, maximum_frames=3) as recorder:
+            statistics = recorder.record(duration=5.0)
+
+        # The recording stops once the preallocated file is full:
+        self.assertEqual(statistics["frames_recorded"], 3)
+
+        data = self.path.read_bytes()
+
+        self.assertEqual(get_header(data)[-1], 3)
+        self.assertEqual(len(data), ZWOASI_SER_HEADER_SIZE + 3 * 64 * 32 + 3 * 8)
+
+        with self.assertRaises(RuntimeError):
+            recorder.write_frame(bytes(64 * 32))
+
+    def test_record_from_video_stream(self) -> None:
+        self.camera.set_image_type(ZWOASIImageType.RGB24)
+
+        self.camera.start_acquisition()
+
+        try:
+            with ZWOASISERRecorder(self.camera, self.path) as recorder:
+                recorder.record(count=2)
+
+            # The camera's video capture is left as it was:
+            self.assertTrue(self.camera.is_video_streaming)
+        finally:
+            self.camera.stop_acquisition()
+
+        data = self.path.read_bytes()
+
+        self.assertEqual(get_header(data), (b"LUCAM-RECORDER", 101, 0, 64, 32, 8, 2))
+
+    def test_record_dropped_frames(self) -> None:
+        self.camera.set_image_type(ZWOASIImageType.RAW8)
+
+        self.camera.start_acquisition(reader=False)
+
+        # The SDK's dropped frame counter, as sampled before and after each recording,
+        # having already dropped frames before the first recording started:
+        counts = iter([7, 9, 9, 12])
+
+        self.camera.get_dropped_frames = lambda: next(counts)  # type: ignore[method-assign]
+
+        try:
+            with ZWOASISERRecorder(self.camera, self.path) as recorder:
+                self.assertEqual(recorder.record(count=1)["dropped_frames"], 2)
+
+                # The drops of each recording are accumulated:
+                self.assertEqual(recorder.record(count=1)["dropped_frames"], 5)
+        finally:
+            self.camera.stop_acquisition()
+
+    def test_write_frame_size_mismatch(self) -> None:
+        with ZWOASISERRecorder(self.camera, self.path) as recorder:
+            with self.assertRaises(ValueError):
+                recorder.write_frame(bytes(8))
+
+    def test_record_requires_a_limit(self) -> None:
+        with ZWOASISERRecorder(self.camera, self.path) as recorder:
+            with self.assertRaises(ValueError):
+                recorder.record()
+
+
+# **************************************************************************************
+
+
+class TestZWOASISERRecorderGPS(unittest.TestCase):
+    def setUp(self) -> None:
+        install_simulated_asi_camera_lib(
+            cameras=[
+                ZWOASISimulatedCameraConfiguration(
+                    width=64, height=32, readout_rate=0, has_gps=True
+                )
+            ]
+        )
+
+        self.camera = ZWOASICamera(0)
+
+        self.camera.set_exposure_time(0.001)
+
+    def tearDown(self) -> None:
+        self.camera.disconnect()
+
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+    def test_gps_timestamps(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "capture.ser"
+
+            with ZWOASISERRecorder(self.camera, path) as recorder:
+                statistics = recorder.record(count=3)
+
+            data = path.read_bytes()
+
+        self.assertEqual(statistics["gps_timestamps"], 3)
+        self.assertEqual(get_header(data)[1], 0)
+
+        frames = 3 * 64 * 32
+
+        timestamps = unpack_from("<3q", data, ZWOASI_SER_HEADER_SIZE + frames)
+
+        self.assertTrue(all(timestamp > get_ser_ticks(0.0) for timestamp in timestamps))
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
@@ -0,0 +1,266 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from multiprocessing import get_context
+from multiprocessing.queues import Queue
+
+from zwo import (
+    ZWOASI_SDK_VERSION,
+    ZWOASICamera,
+    ZWOASIImageType,
+    ZWOASISharedFramePublisher,
+    ZWOASISharedFrameReader,
+    ZWOASISharedFrameRing,
+    ZWOASISimulatedCameraConfiguration,
+    install_simulated_asi_camera_lib,
+    set_asi_camera_lib,
+)
+
+# **************************************************************************************
+
+
+def read_frames(name: str, count: int, results: "Queue[object]") -> None:
+    """
+    Read frames from a shared frame ring in a separate process.
+    """
+    with ZWOASISharedFrameReader(name) as reader:
+        for _ in range(count):
+            with reader.get_next_frame(timeout=5.0) as frame:
+                results.put((frame.sequence, frame.width, frame.height, frame.data[0]))
+
+
+# **************************************************************************************
+
+
+class TestZWOASISharedFrameRing(unittest.TestCase):
+    def test_requires_two_slots(self) -> None:
+        with self.assertRaises(ValueError):
+            ZWOASISharedFrameRing.create(slot_size=64, slots=1)
+
+    def test_attach_to_non_ring(self) -> None:
+        ring = ZWOASISharedFrameRing.create(slot_size=64)
+        self.addCleanup(ring.close)
+
+        ring._buffer[:4] = b"XXXX"
+
+        with self.assertRaises(ValueError):
+            ZWOASISharedFrameRing.attach(ring.name)
+
+    def test_slot_invalidated_whilst_writing(self) -> None:
+        ring = ZWOASISharedFrameRing.create(slot_size=64, slots=2)
+        self.addCleanup(ring.close)
+
+        data = ring.begin_write(1)
+        data[:] = bytes(range(64))
+        data.release()
+
+        ring.end_write(1, 8, 8, ZWOASIImageType.RAW8)
+
+        self.assertEqual(ring.sequence, 1)
+
+        header = ring.get_slot_header(1)
+
+        assert header is not None
+
+        self.assertEqual(header[:4], (8, 8, ZWOASIImageType.RAW8, 64))
+
+        # The third frame reuses the first frame's slot:
+        ring.begin_write(3).release()
+
+        self.assertIsNone(ring.get_slot_header(1))
+        self.assertIsNone(ring.get_slot_header(3))
+
+    def test_reader_entries(self) -> None:
+        ring = ZWOASISharedFrameRing.create(slot_size=64, slots=4, maximum_readers=2)
+        self.addCleanup(ring.close)
+
+        first = ZWOASISharedFrameReader(ring.name)
+        self.addCleanup(first.close)
+
+        self.assertEqual(first.reader, 0)
+
+        # N.B. A process may claim its own entries again:
+        with self.assertRaises(ValueError):
+            ZWOASISharedFrameReader(ring.name, reader=2)
+
+        self.assertEqual(len(ring.get_readers()), 1)
+
+        ring._buffer[ring._get_reader_offset(1) : ring._get_reader_offset(1) + 8] = (
+            1
+        ).to_bytes(8, "little")
+
+        with self.assertRaises(RuntimeError):
+            ZWOASISharedFrameReader(ring.name, reader=1)
+
+
+# **************************************************************************************
+
+
+class TestZWOASISharedFramePublisher(unittest.TestCase):
+    def setUp(self) -> None:
+        install_simulated_asi_camera_lib(
+            cameras=[
+                ZWOASISimulatedCameraConfiguration(width=64, height=32, readout_rate=0)
+            ]
+        )
+
+        self.camera = ZWOASICamera(0)
+
+        self.camera.set_exposure_time(0.001)
+
+    def tearDown(self) -> None:
+        self.camera.disconnect()
+
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+    def test_publish_exposures(self) -> None:
+        with ZWOASISharedFramePublisher(self.camera, slots=4) as publisher:
+            with ZWOASISharedFrameReader(publisher.name) as reader:
+                self.assertIsNone(reader.get_latest_frame())
+
+                self.assertEqual(publisher.publish_exposure(), 1)
+
+                with reader.get_next_frame(timeout=1.0) as frame:
+                    self.assertEqual(frame.sequence, 1)
+                    self.assertEqual(frame.shape, (32, 64))
+                    self.assertEqual(frame.dtype, "u1")
+                    self.assertEqual(len(frame.data), 64 * 32)
+                    self.assertTrue(frame.data.readonly)
+                    self.assertTrue(frame.is_valid())
+
+                    expected = bytes(frame.data)
+
+                    self.assertEqual(frame.copy(), expected)
+
+                with self.assertRaises(TimeoutError):
+                    reader.get_next_frame(timeout=0.01)
+
+    def test_publish_copy(self) -> None:
+        with ZWOASISharedFramePublisher(self.camera, slots=4) as publisher:
+            with ZWOASISharedFrameReader(publisher.name) as reader:
+                publisher.publish(bytes([7]) * (64 * 32))
+
+                with reader.get_next_frame(timeout=1.0) as frame:
+                    self.assertEqual(bytes(frame.data), bytes([7]) * (64 * 32))
+
+    def test_reader_falls_behind(self) -> None:
+        with ZWOASISharedFramePublisher(self.camera, slots=4) as publisher:
+            with ZWOASISharedFrameReader(publisher.name) as reader:
+                publisher.publish_exposure()
+
+                frame = reader.get_next_frame(timeout=1.0)
+
+                self.assertEqual(frame.sequence, 1)
+
+                for _ in range(5):
+                    publisher.publish_exposure()
+
+                # The view of the first frame's slot has since been overwritten:
+                self.assertFalse(frame.is_valid())
+                self.assertIsNone(frame.copy())
+
+                frame.release()
+
+                [status] = publisher.get_readers()
+
+                self.assertEqual(status["sequence"], 1)
+                self.assertEqual(status["lag"], 5)
+                self.assertTrue(status["is_behind"])
+
+                # The oldest frame still in the ring (frames 2 and 3 were skipped):
+                with reader.get_next_frame(timeout=1.0) as frame:
+                    self.assertEqual(frame.sequence, 4)
+
+                self.assertEqual(reader.frames_skipped, 2)
+
+                [status] = publisher.get_readers()
+
+                self.assertEqual(status["lag"], 2)
+                self.assertEqual(status["frames_skipped"], 2)
+                self.assertFalse(status["is_behind"])
+
+    def test_publish_video_frame_timeout(self) -> None:
+        self.camera.set_exposure_time(1.5)
+
+        self.camera.start_acquisition(reader=False)
+
+        try:
+            with ZWOASISharedFramePublisher(self.camera, slots=4) as publisher:
+                with self.assertRaises(TimeoutError):
+                    publisher.publish_video_frame(timeout=10)
+        finally:
+            self.camera.stop_acquisition()
+
+    def test_publish_long_video_exposures(self) -> None:
+        # An exposure longer than a fixed one second poll of the SDK:
+        self.camera.set_exposure_time(1.2)
+
+        self.camera.start_acquisition(reader=False)
+
+        try:
+            with ZWOASISharedFramePublisher(self.camera, slots=4) as publisher:
+                with ZWOASISharedFrameReader(publisher.name) as reader:
+                    publisher.start()
+
+                    with reader.get_next_frame(timeout=5.0) as frame:
+                        self.assertEqual(frame.sequence, 1)
+
+                    self.assertTrue(publisher.is_running)
+
+                    publisher.stop()
+        finally:
+            self.camera.stop_acquisition()
+
+    def test_frame_larger_than_slot(self) -> None:
+        with ZWOASISharedFramePublisher(self.camera, slot_size=64) as publisher:
+            with self.assertRaises(ValueError):
+                publisher.publish_exposure()
+
+    def test_publish_to_another_process(self) -> None:
+        context = get_context("spawn")
+
+        results = context.Queue()
+
+        self.camera.start_acquisition()
+
+        try:
+            with ZWOASISharedFramePublisher(self.camera, slots=8) as publisher:
+                process = context.Process(
+                    target=read_frames, args=(publisher.name, 3, results)
+                )
+
+                process.start()
+
+                # Wait for the reader to attach, before publishing:
+                while not publisher.get_readers() and process.is_alive():
+                    pass
+
+                publisher.start()
+
+                received = [results.get(timeout=10.0) for _ in range(3)]
+
+                process.join(timeout=10.0)
+
+                publisher.stop()
+        finally:
+            self.camera.stop_acquisition()
+
+        self.assertEqual(process.exitcode, 0)
+
+        sequences = [sequence for sequence, _, _, _ in received]
+
+        self.assertEqual(sequences, sorted(sequences))
+        self.assertTrue(all((w, h) == (64, 32) for _, w, h, _ in received))
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
@@ -0,0 +1,526 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from mmap import mmap
+from ctypes import byref, c_int, c_long, create_string_buffer
+from time import monotonic, sleep
+
+from zwo import (
+    ZWOASI_CAMERA_INFORMATION_CTYPE,
+    ZWOASI_SDK_FUNCTIONS,
+    ZWOASI_SDK_VERSION,
+    AsyncZWOASICamera,
+    ZWOASICamera,
+    ZWOASIControlType,
+    ZWOASIErrorCode,
+    ZWOASIExposureStatus,
+    ZWOASIFrameBuffer,
+    ZWOASIImageType,
+    ZWOASISimulatedCameraConfiguration,
+    ZWOASISimulatedSDK,
+    ZWOASITriggerOutput,
+    get_all_connected_camera_ids,
+    get_asi_camera_lib,
+    install_simulated_asi_camera_lib,
+    set_asi_camera_lib,
+)
+
+# **************************************************************************************
+
+
+def create_configuration(**kwargs: object) -> ZWOASISimulatedCameraConfiguration:
+    return ZWOASISimulatedCameraConfiguration.model_validate(
+        {"width": 64, "height": 32, "readout_rate": 0, **kwargs}
+    )
+
+
+# **************************************************************************************
+
+
+class TestZWOASISimulatedSDK(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sdk = ZWOASISimulatedSDK(cameras=[create_configuration()])
+        self.assertEqual(self.sdk.ASIOpenCamera(0), ZWOASIErrorCode.SUCCESS)
+        self.assertEqual(self.sdk.ASIInitCamera(0), ZWOASIErrorCode.SUCCESS)
+
+    def test_simulates_every_sdk_function(self) -> None:
+        for name in ZWOASI_SDK_FUNCTIONS:
+            with self.subTest(name=name):
+                self.assertTrue(callable(getattr(self.sdk, name, None)))
+
+    def test_camera_property(self) -> None:
+        info = ZWOASI_CAMERA_INFORMATION_CTYPE()
+
+        error = self.sdk.ASIGetCameraProperty(byref(info), 0)
+
+        self.assertEqual(error, ZWOASIErrorCode.SUCCESS)
+        self.assertEqual(info.MaxWidth, 64)
+        self.assertEqual(info.MaxHeight, 32)
+        self.assertEqual(list(info.SupportedBins[:4]), [1, 2, 4, 0])
+        self.assertEqual(
+            self.sdk.ASIGetCameraProperty(byref(info), 1),
+            ZWOASIErrorCode.INVALID_INDEX,
+        )
+
+    def test_closed_camera(self) -> None:
+        self.sdk.ASICloseCamera(0)
+
+        self.assertEqual(self.sdk.ASIStartExposure(0, 0), ZWOASIErrorCode.CAMERA_CLOSED)
+
+    def test_control_values_are_clamped(self) -> None:
+        value, is_auto = c_long(), c_int()
+
+        self.sdk.ASISetControlValue(0, ZWOASIControlType.GAIN, 10_000, 0)
+        self.sdk.ASIGetControlValue(
+            0, ZWOASIControlType.GAIN, byref(value), byref(is_auto)
+        )
+
+        self.assertEqual(value.value, 570)
+
+        self.assertEqual(
+            self.sdk.ASISetControlValue(0, ZWOASIControlType.TARGET_TEMPERATURE, 0, 0),
+            ZWOASIErrorCode.INVALID_CONTROL_TYPE,
+        )
+
+    def test_gain_offset(self) -> None:
+        highest_dynamic_range, unity_gain = c_int(), c_int()
+
+        gain, offset = c_int(), c_int()
+
+        error = self.sdk.ASIGetGainOffset(
+            0,
+            byref(highest_dynamic_range),
+            byref(unity_gain),
+            byref(gain),
+            byref(offset),
+        )
+
+        self.assertEqual(error, ZWOASIErrorCode.SUCCESS)
+        self.assertEqual(
+            (highest_dynamic_range.value, unity_gain.value, gain.value, offset.value),
+            (8, 8, 200, 8),
+        )
+
+        self.sdk.ASICloseCamera(0)
+
+        self.assertEqual(
+            self.sdk.ASIGetGainOffset(0, c_int(), c_int(), c_int(), c_int()),
+            ZWOASIErrorCode.CAMERA_CLOSED,
+        )
+
+    def test_roi_format_is_validated(self) -> None:
+        self.assertEqual(
+            self.sdk.ASISetROIFormat(0, 30, 16, 1, ZWOASIImageType.RAW8),
+            ZWOASIErrorCode.INVALID_VIDEO_SIZE,
+        )
+        self.assertEqual(
+            self.sdk.ASISetROIFormat(0, 32, 16, 1, ZWOASIImageType.RGB24),
+            ZWOASIErrorCode.INVALID_IMAGE_TYPE,
+        )
+        self.assertEqual(
+            self.sdk.ASISetROIFormat(0, 32, 16, 1, ZWOASIImageType.RAW16),
+            ZWOASIErrorCode.SUCCESS,
+        )
+
+        x, y = c_int(), c_int()
+
+        self.sdk.ASIGetStartPos(0, byref(x), byref(y))
+
+        # A new ROI format is centred on the sensor:
+        self.assertEqual((x.value, y.value), (16, 8))
+
+    def test_exposure_state_machine(self) -> None:
+        status = c_int()
+
+        self.sdk.ASISetControlValue(0, ZWOASIControlType.EXPOSURE, 20_000, 0)
+
+        buffer = create_string_buffer(64 * 32)
+
+        self.assertEqual(
+            self.sdk.ASIGetDataAfterExp(0, buffer, 64 * 32),
+            ZWOASIErrorCode.GENERAL_ERROR,
+        )
+
+        self.sdk.ASIStartExposure(0, 0)
+
+        self.sdk.ASIGetExpStatus(0, byref(status))
+
+        self.assertEqual(status.value, ZWOASIExposureStatus.WORKING)
+
+        sleep(0.03)
+
+        self.sdk.ASIGetExpStatus(0, byref(status))
+
+        self.assertEqual(status.value, ZWOASIExposureStatus.SUCCESS)
+
+        self.assertEqual(
+            self.sdk.ASIGetDataAfterExp(0, buffer, 16),
+            ZWOASIErrorCode.BUFFER_TOO_SMALL,
+        )
+        self.assertEqual(
+            self.sdk.ASIGetDataAfterExp(0, buffer, 64 * 32), ZWOASIErrorCode.SUCCESS
+        )
+
+        self.sdk.ASIGetExpStatus(0, byref(status))
+
+        self.assertEqual(status.value, ZWOASIExposureStatus.IDLE)
+
+    def test_stop_exposure_fails_exposure(self) -> None:
+        status = c_int()
+
+        self.sdk.ASIStartExposure(0, 0)
+        self.sdk.ASIStopExposure(0)
+        self.sdk.ASIGetExpStatus(0, byref(status))
+
+        self.assertEqual(status.value, ZWOASIExposureStatus.FAILED)
+
+    def test_readout_latency(self) -> None:
+        sdk = ZWOASISimulatedSDK(
+            cameras=[create_configuration(readout_rate=64 * 32 / 0.05)]
+        )
+
+        sdk.ASIOpenCamera(0)
+        sdk.ASISetControlValue(0, ZWOASIControlType.EXPOSURE, 32, 0)
+
+        status = c_int()
+
+        started = monotonic()
+
+        sdk.ASIStartExposure(0, 0)
+
+        while status.value != ZWOASIExposureStatus.SUCCESS:
+            sdk.ASIGetExpStatus(0, byref(status))
+            sleep(0.001)
+
+        self.assertGreaterEqual(monotonic() - started, 0.05)
+
+    def test_video_timeout(self) -> None:
+        buffer = create_string_buffer(64 * 32)
+
+        self.sdk.ASISetControlValue(0, ZWOASIControlType.EXPOSURE, 500_000, 0)
+
+        self.assertEqual(
+            self.sdk.ASIGetVideoData(0, buffer, 64 * 32, 10),
+            ZWOASIErrorCode.INVALID_SEQUENCE,
+        )
+
+        self.sdk.ASIStartVideoCapture(0)
+
+        self.assertEqual(
+            self.sdk.ASIGetVideoData(0, buffer, 64 * 32, 10), ZWOASIErrorCode.TIMEOUT
+        )
+
+        self.sdk.ASIStopVideoCapture(0)
+
+    def test_video_drops_frames_for_slow_consumers(self) -> None:
+        buffer = create_string_buffer(64 * 32)
+
+        dropped = c_int()
+
+        self.sdk.ASISetControlValue(0, ZWOASIControlType.EXPOSURE, 1_000, 0)
+        self.sdk.ASIStartVideoCapture(0)
+
+        sleep(0.05)
+
+        self.assertEqual(
+            self.sdk.ASIGetVideoData(0, buffer, 64 * 32, 100), ZWOASIErrorCode.SUCCESS
+        )
+
+        self.sdk.ASIGetDroppedFrames(0, dropped)
+
+        self.assertGreater(dropped.value, 0)
+
+        self.sdk.ASIStopVideoCapture(0)
+
+    def test_random_dropped_frames(self) -> None:
+        sdk = ZWOASISimulatedSDK(
+            cameras=[create_configuration(dropped_frame_probability=0.5, seed=1)]
+        )
+
+        sdk.ASIOpenCamera(0)
+        sdk.ASISetControlValue(0, ZWOASIControlType.EXPOSURE, 100, 0)
+        sdk.ASIStartVideoCapture(0)
+
+        buffer = create_string_buffer(64 * 32)
+
+        for _ in range(20):
+            sdk.ASIGetVideoData(0, buffer, 64 * 32, 1000)
+
+        dropped = c_int()
+
+        sdk.ASIGetDroppedFrames(0, dropped)
+
+        self.assertGreater(dropped.value, 0)
+
+    def test_frames_are_deterministic_for_seed(self) -> None:
+        frames = []
+
+        for _ in range(2):
+            sdk = ZWOASISimulatedSDK(cameras=[create_configuration(seed=7)])
+            sdk.ASIOpenCamera(0)
+            sdk.ASISetControlValue(0, ZWOASIControlType.EXPOSURE, 32, 0)
+            sdk.ASIStartExposure(0, 0)
+            sleep(0.001)
+            buffer = create_string_buffer(64 * 32)
+            sdk.ASIGetDataAfterExp(0, buffer, 64 * 32)
+            frames.append(buffer.raw)
+
+        self.assertEqual(frames[0], frames[1])
+
+    def test_gps_not_supported(self) -> None:
+        buffer = create_string_buffer(64 * 32)
+
+        self.sdk.ASIStartVideoCapture(0)
+
+        self.assertEqual(
+            self.sdk.ASIGetVideoDataGPS(0, buffer, 64 * 32, 100, None),
+            ZWOASIErrorCode.GPS_NOT_SUPPORTED,
+        )
+
+        self.sdk.ASIStopVideoCapture(0)
+
+
+# **************************************************************************************
+
+
+class TestZWOASICameraWithSimulator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.library = install_simulated_asi_camera_lib(
+            cameras=[
+                create_configuration(
+                    width=128, height=64, has_gps=True, has_external_trigger=True
+                ),
+                create_configuration(is_color=True),
+            ]
+        )
+
+        self.camera = ZWOASICamera(0)
+
+        self.camera.set_exposure_time(0.001)
+
+    def tearDown(self) -> None:
+        self.camera.disconnect()
+
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+    def test_shared_library_is_simulated(self) -> None:
+        self.assertIs(get_asi_camera_lib(), self.library)
+        self.assertEqual(get_all_connected_camera_ids(), [0, 1])
+
+    def test_connect(self) -> None:
+        self.assertTrue(self.camera.is_connected())
+        self.assertTrue(self.camera.is_ready())
+        self.assertEqual(self.camera.get_sdk_version(), ZWOASI_SDK_VERSION)
+        self.assertEqual(
+            self.camera.get_region_of_interest(), (128, 64, 1, ZWOASIImageType.RAW8)
+        )
+
+    def test_get_frame_buffer(self) -> None:
+        with self.camera.get_frame_buffer() as frame:
+            self.assertEqual(frame.size, 128 * 64)
+
+    def test_get_frame_into(self) -> None:
+        size = 128 * 64
+
+        # Two frames, in an anonymous memory map, after a header:
+        with mmap(-1, 16 + 2 * size) as destination:
+            view = memoryview(destination)
+
+            for index in range(2):
+                offset = 16 + index * size
+
+                written = self.camera.get_frame_into(view[offset : offset + size])
+
+                self.assertEqual(written, size)
+
+            view.release()
+
+            self.assertEqual(destination[:16], bytes(16))
+            self.assertNotEqual(destination[16:], bytes(2 * size))
+
+    def test_get_frame_into_too_small(self) -> None:
+        with self.assertRaises(ValueError):
+            self.camera.get_frame_into(bytearray(128))
+
+    def test_get_video_frame_into(self) -> None:
+        destination = bytearray(128 * 64 + 8)
+
+        self.camera.start_acquisition()
+
+        try:
+            written = self.camera.get_video_frame_into(destination, timeout=1000)
+        finally:
+            self.camera.stop_acquisition()
+
+        self.assertEqual(written, 128 * 64)
+        self.assertEqual(destination[-8:], bytes(8))
+
+    def test_set_region_of_interest(self) -> None:
+        self.camera.set_region_of_interest(64, 32, 2, ZWOASIImageType.RAW16)
+
+        with self.camera.get_frame_buffer() as frame:
+            self.assertEqual(frame.size, 64 * 32 * 2)
+
+    def test_get_control_capabilities(self) -> None:
+        capabilities = self.camera.get_control_capabilities()
+
+        self.assertEqual(set(capabilities), set(self.library.sdk.cameras[0].controls))
+        self.assertEqual(capabilities[ZWOASIControlType.GAIN].maximum_value, 570)
+        self.assertEqual(capabilities[ZWOASIControlType.OFFSET].default_value, 8)
+        self.assertFalse(
+            capabilities[ZWOASIControlType.TEMPERATURE_READING].is_writable
+        )
+
+        # A copy is returned, so the camera's table cannot be modified:
+        capabilities.clear()
+
+        self.assertIn(ZWOASIControlType.GAIN, self.camera.controls)
+
+    def test_enumerate_unknown_control(self) -> None:
+        # A control newer than those known to ZWOASIControlType:
+        self.library.sdk.cameras[0].controls[99] = (
+            99,
+            "Future",
+            "A future control",
+            0,
+            1,
+            0,
+            False,
+            True,
+        )
+
+        controls = self.camera._enumerate_control_capabilities()
+
+        self.assertEqual(
+            set(controls),
+            set(self.library.sdk.cameras[0].controls) - {99},
+        )
+
+    def test_get_control_capability(self) -> None:
+        capability = self.camera._get_control_capability(int(ZWOASIControlType.GAIN))
+
+        assert capability is not None
+
+        self.assertEqual(capability.name, "Gain")
+
+        # Unknown (and unsupported) controls have no capabilities:
+        self.assertIsNone(self.camera._get_control_capability(99))
+        self.assertIsNone(
+            self.camera._get_control_capability(ZWOASIControlType.COOLER_ON_OFF)
+        )
+
+        self.camera.disconnect()
+
+        self.assertIsNone(self.camera._get_control_capability(ZWOASIControlType.GAIN))
+        self.assertEqual(self.camera.get_control_capabilities(), {})
+
+    def test_capture_sequence(self) -> None:
+        frames = []
+
+        result = self.camera.capture_sequence(
+            4, 0.001, process=lambda i, frame: frames.append((i, frame.size))
+        )
+
+        self.assertEqual(result["count"], 4)
+        self.assertEqual(frames, [(i, 128 * 64) for i in range(4)])
+
+    def test_capture_sequence_restores_state(self) -> None:
+        self.camera.set_exposure_time(0.002)
+
+        capacity = self.camera.frame_buffer_pool.capacity
+
+        result = self.camera.capture_sequence(3, 0.001, queue_size=8)
+
+        self.assertEqual(result["count"], 3)
+        self.assertEqual(result["exposed"], 0.003)
+
+        self.assertEqual(self.camera.get_exposure_time(), 0.002)
+        self.assertEqual(self.camera.frame_buffer_pool.capacity, capacity)
+        self.assertTrue(self.camera.is_ready())
+
+    def test_capture_sequence_process_failure(self) -> None:
+        def process(index: int, frame: ZWOASIFrameBuffer) -> None:
+            raise OSError("Disk full.")
+
+        with self.assertRaises(OSError):
+            self.camera.capture_sequence(5, 0.2, process=process)
+
+        # No exposure is left in progress, so the camera can capture straight away:
+        self.assertNotEqual(
+            self.camera.get_acquisition_status(), ZWOASIExposureStatus.WORKING
+        )
+
+        self.assertTrue(self.camera.is_ready())
+
+        self.camera.set_exposure_time(0.001)
+
+        self.assertEqual(len(self.camera.get_frame()), 128 * 64)
+
+    def test_video(self) -> None:
+        self.camera.start_acquisition()
+
+        try:
+            frame = self.camera.get_next_video_frame(timeout=1.0)
+            self.assertEqual(len(frame.data), 128 * 64)
+        finally:
+            self.camera.stop_acquisition()
+
+    def test_video_gps_record(self) -> None:
+        self.camera.lib.ASIStartVideoCapture(self.camera.id)
+
+        try:
+            frame, record = self.camera.get_video_frame_buffer_and_gps_record(1000)
+            frame.release()
+        finally:
+            self.camera.lib.ASIStopVideoCapture(self.camera.id)
+
+        self.assertEqual(record.latitude, 52.2053)
+        self.assertEqual(record.satellite_number, 12)
+
+    def test_video_gps_whilst_reading_video(self) -> None:
+        self.camera.start_acquisition()
+
+        try:
+            with self.assertRaises(RuntimeError):
+                self.camera.get_video_frame_buffer_and_gps_record(1000)
+
+            with self.assertRaises(RuntimeError):
+                self.camera.get_video_frame_and_gps_data(1000)
+        finally:
+            self.camera.stop_acquisition()
+
+    def test_soft_trigger_io_configuration(self) -> None:
+        configuration = self.camera.get_soft_trigger_io_configuration(
+            ZWOASITriggerOutput.PINA
+        )
+
+        self.assertEqual(configuration, (True, 0, 0))
+
+
+# **************************************************************************************
+
+
+class TestAsyncZWOASICameraWithSimulator(unittest.IsolatedAsyncioTestCase):
+    def tearDown(self) -> None:
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+    async def test_expose(self) -> None:
+        install_simulated_asi_camera_lib(cameras=[create_configuration()])
+
+        async with await AsyncZWOASICamera.open(0) as camera:
+            frame = await camera.expose(0.001)
+            self.assertEqual(frame.size, 64 * 32)
+            frame.release()
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
@@ -0,0 +1,207 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from time import sleep
+
+from zwo import (
+    ZWOASI_SDK_VERSION,
+    ZWOASICamera,
+    ZWOASIFrameBuffer,
+    ZWOASISimulatedCameraConfiguration,
+    ZWOASISpan,
+    ZWOASISpanRecorder,
+    install_simulated_asi_camera_lib,
+    set_asi_camera_lib,
+)
+
+# **************************************************************************************
+
+
+def create_span(name: str, duration: float, trace: int = 1) -> ZWOASISpan:
+    return ZWOASISpan(
+        name=name, camera=0, trace=trace, start=0.0, end=duration, duration=duration
+    )
+
+
+# **************************************************************************************
+
+
+class TestZWOASISpanRecorder(unittest.TestCase):
+    def test_summary(self) -> None:
+        forwarded: list[ZWOASISpan] = []
+
+        recorder = ZWOASISpanRecorder(maximum_spans=2, forward=forwarded.append)
+
+        recorder(create_span("wait", 1.0))
+        recorder(create_span("wait", 3.0))
+        recorder(create_span("get_data", 0.5))
+
+        self.assertEqual(len(forwarded), 3)
+
+        # Only the most recent spans are kept:
+        self.assertEqual(
+            [span["name"] for span in recorder.get_spans()], ["wait", "get_data"]
+        )
+
+        summary = recorder.get_summary()
+
+        self.assertEqual(summary["wait"]["count"], 2)
+        self.assertEqual(summary["wait"]["mean"], 2.0)
+        self.assertEqual(summary["wait"]["maximum"], 3.0)
+        self.assertEqual(summary["get_data"]["total"], 0.5)
+
+        recorder.clear()
+
+        self.assertEqual(recorder.get_spans(), [])
+        self.assertEqual(recorder.get_summary(), {})
+
+
+# **************************************************************************************
+
+
+class TestZWOASICameraTracing(unittest.TestCase):
+    def setUp(self) -> None:
+        install_simulated_asi_camera_lib(
+            cameras=[
+                ZWOASISimulatedCameraConfiguration(width=64, height=32, readout_rate=0)
+            ]
+        )
+
+        self.camera = ZWOASICamera(0)
+
+        self.camera.set_exposure_time(0.001)
+
+        self.recorder = ZWOASISpanRecorder()
+
+        self.camera.set_tracer(self.recorder)
+
+    def tearDown(self) -> None:
+        self.camera.disconnect()
+
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+    def test_get_frame_spans(self) -> None:
+        self.camera.get_frame()
+
+        spans = self.recorder.get_spans()
+
+        self.assertEqual(
+            [span["name"] for span in spans],
+            ["start_exposure", "wait", "get_data", "convert"],
+        )
+
+        self.assertEqual(len({span["trace"] for span in spans}), 1)
+
+        for previous, span in zip(spans, spans[1:]):
+            self.assertLessEqual(previous["end"], span["end"])
+            self.assertGreaterEqual(span["duration"], 0.0)
+
+        # The wait spans the exposure itself:
+        self.assertGreaterEqual(spans[1]["duration"], 0.001)
+
+    def test_no_spans_without_tracer(self) -> None:
+        self.camera.set_tracer(None)
+
+        self.camera.get_frame()
+
+        self.assertEqual(self.recorder.get_spans(), [])
+
+    def test_capture_sequence(self) -> None:
+        def process(index: int, buffer: ZWOASIFrameBuffer) -> None:
+            sleep(0.002)
+
+        result = self.camera.capture_sequence(3, 0.001, process=process)
+
+        breakdown = result["breakdown"]
+
+        self.assertGreaterEqual(breakdown["wait"], 0.0)
+        self.assertGreaterEqual(breakdown["process"], 0.006)
+        self.assertAlmostEqual(
+            breakdown["start_exposure"]
+            + breakdown["wait"]
+            + breakdown["get_data"]
+            + breakdown["other"],
+            result["elapsed"],
+        )
+
+        spans = self.recorder.get_spans()
+
+        traces = {span["trace"] for span in spans if span["name"] == "start_exposure"}
+
+        self.assertEqual(len(traces), 3)
+
+        # Each frame's processing is attributed to the exposure which captured it:
+        self.assertEqual(
+            {span["trace"] for span in spans if span["name"] == "process"}, traces
+        )
+
+        summary = self.recorder.get_summary()
+
+        self.assertEqual(summary["get_data"]["count"], 3)
+        self.assertEqual(summary["process"]["count"], 3)
+
+    def test_video_spans(self) -> None:
+        self.camera.start_acquisition()
+
+        try:
+            self.camera.get_next_video_frame(timeout=1.0)
+        finally:
+            self.camera.stop_acquisition()
+
+        summary = self.recorder.get_summary()
+
+        self.assertGreaterEqual(summary["read_video"]["count"], 1)
+
+    def test_video_convert_span_carries_frame_trace(self) -> None:
+        self.camera.start_acquisition(slots=8)
+
+        try:
+            self.camera.get_frame()
+
+            # Let the reader run ahead, so that the frames read and converted differ:
+            sleep(0.05)
+
+            self.camera.get_frame()
+        finally:
+            self.camera.stop_acquisition()
+
+        spans = self.recorder.get_spans()
+
+        read = {span["trace"] for span in spans if span["name"] == "read_video"}
+
+        converted = [span["trace"] for span in spans if span["name"] == "convert"]
+
+        self.assertEqual(len(converted), 2)
+
+        # Each conversion is attributed to a frame that was actually read:
+        self.assertLessEqual(set(converted), read)
+
+        # The frames returned are the next after each call, so are not the latest
+        # read by the reader, which has since moved on:
+        self.assertLess(converted[1], max(read))
+
+    def test_exposure_handle_spans(self) -> None:
+        handle = self.camera.start_exposure()
+
+        handle.result(timeout=5.0).release()
+
+        spans = self.recorder.get_spans()
+
+        self.assertEqual(
+            [span["name"] for span in spans], ["start_exposure", "wait", "get_data"]
+        )
+
+        self.assertEqual({span["trace"] for span in spans}, {handle.trace})
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
@@ -0,0 +1,250 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from collections.abc import Buffer
+from threading import Event, Thread
+from time import sleep
+
+from zwo import ZWOASIErrorCode, ZWOASIImageType, ZWOASIVideoStream
+
+# **************************************************************************************
+
+
+class FrameSource(object):
+    """
+    A stand-in for ASIGetVideoData, which fills each frame with a counter value.
+    """
+
+    def __init__(self, interval: float = 0.001) -> None:
+        self.count = 0
+        self.interval = interval
+        self.timeouts = 0
+        self.error = ZWOASIErrorCode.SUCCESS
+
+    def read(self, buffer: Buffer, timeout: int, trace: int = 0) -> int:
+        sleep(self.interval)
+
+        if self.timeouts > 0:
+            self.timeouts -= 1
+            return ZWOASIErrorCode.TIMEOUT
+
+        if self.error != ZWOASIErrorCode.SUCCESS:
+            return self.error
+
+        self.count += 1
+
+        view = memoryview(buffer).cast("B")
+        view[:] = bytes([self.count % 256]) * len(view)
+
+        return ZWOASIErrorCode.SUCCESS
+
+
+# **************************************************************************************
+
+
+class TestZWOASIVideoStream(unittest.TestCase):
+    def create_stream(self, source: FrameSource, slots: int = 4) -> ZWOASIVideoStream:
+        stream = ZWOASIVideoStream(
+            read=source.read,
+            width=16,
+            height=4,
+            image_type=ZWOASIImageType.RAW8,
+            slots=slots,
+        )
+        self.addCleanup(stream.stop)
+        return stream
+
+    def test_requires_two_slots(self) -> None:
+        with self.assertRaises(ValueError):
+            ZWOASIVideoStream(
+                read=FrameSource().read,
+                width=16,
+                height=4,
+                image_type=ZWOASIImageType.RAW8,
+                slots=1,
+            )
+
+    def test_latest_frame_before_start(self) -> None:
+        stream = self.create_stream(FrameSource())
+        self.assertIsNone(stream.get_latest_frame())
+
+    def test_next_frames_are_sequential(self) -> None:
+        stream = self.create_stream(FrameSource(interval=0.005), slots=8)
+        stream.start()
+
+        frame = stream.get_next_frame(timeout=1.0)
+
+        for _ in range(5):
+            following = stream.get_next_frame(after=frame.sequence, timeout=1.0)
+            self.assertEqual(following.sequence, frame.sequence + 1)
+            self.assertEqual(following.data[0], following.sequence % 256)
+            frame = following
+
+    def test_latest_frame_is_consistent(self) -> None:
+        stream = self.create_stream(FrameSource(interval=0.0))
+        stream.start()
+
+        stream.get_next_frame(timeout=1.0)
+
+        for _ in range(50):
+            frame = stream.get_latest_frame()
+            assert frame is not None
+            # Every byte of a frame was written by the same read, e.g., no tearing:
+            self.assertEqual(len(set(frame.data)), 1)
+            self.assertEqual(frame.data[0], frame.sequence % 256)
+            self.assertEqual(frame.width, 16)
+            self.assertEqual(frame.height, 4)
+
+    def test_slow_consumer_skips_overwritten_frames(self) -> None:
+        source = FrameSource(interval=0.001)
+        stream = self.create_stream(source, slots=2)
+        stream.start()
+
+        first = stream.get_next_frame(timeout=1.0)
+
+        # Wait for the reader to lap the ring several times:
+        while stream.sequence < first.sequence + 10:
+            sleep(0.001)
+
+        following = stream.get_next_frame(after=first.sequence, timeout=1.0)
+
+        self.assertGreater(following.sequence, first.sequence + 1)
+        self.assertGreater(stream.get_statistics()["frames_skipped"], 0)
+
+    def test_concurrent_consumers_count_every_skipped_frame(self) -> None:
+        stream = self.create_stream(FrameSource(interval=0.0), slots=2)
+        stream.start()
+
+        # Wait for the reader to lap the ring, so every read skips frames:
+        while stream.sequence < 10:
+            sleep(0.001)
+
+        skipped = [0] * 8
+
+        def consume(index: int) -> None:
+            destination = bytearray(stream.size)
+
+            for _ in range(100):
+                sequence, _, _ = stream.read_next_into(
+                    destination, after=0, timeout=1.0
+                )
+                skipped[index] += sequence - 1
+
+        threads = [Thread(target=consume, args=(index,)) for index in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(stream.get_statistics()["frames_skipped"], sum(skipped))
+
+    def test_timeouts_are_counted(self) -> None:
+        source = FrameSource()
+        source.timeouts = 3
+        stream = self.create_stream(source)
+        stream.start()
+
+        stream.get_next_frame(timeout=1.0)
+
+        self.assertEqual(stream.get_statistics()["timeouts"], 3)
+
+    def test_next_frame_timeout(self) -> None:
+        stream = self.create_stream(FrameSource())
+
+        with self.assertRaises(TimeoutError):
+            stream.get_next_frame(timeout=0.01)
+
+    def test_reader_failure_is_raised(self) -> None:
+        source = FrameSource()
+        source.error = ZWOASIErrorCode.CAMERA_REMOVED
+        stream = self.create_stream(source)
+        stream.start()
+
+        with self.assertRaises(RuntimeError):
+            stream.get_next_frame(timeout=1.0)
+
+        self.assertFalse(stream.is_running)
+
+    def test_dropped_frames_are_sampled(self) -> None:
+        sampled = Event()
+
+        def get_dropped_frames() -> int:
+            sampled.set()
+            return 7
+
+        stream = ZWOASIVideoStream(
+            read=FrameSource().read,
+            width=16,
+            height=4,
+            image_type=ZWOASIImageType.RAW8,
+            get_dropped_frames=get_dropped_frames,
+            dropped_frames_interval=0.0,
+        )
+        self.addCleanup(stream.stop)
+        stream.start()
+
+        self.assertTrue(sampled.wait(timeout=1.0))
+        stream.get_next_frame(timeout=1.0)
+
+        self.assertEqual(stream.get_statistics()["dropped_frames"], 7)
+
+    def test_listeners_are_notified(self) -> None:
+        stream = self.create_stream(FrameSource())
+
+        sequences: list[int] = []
+        notified = Event()
+
+        def listener(sequence: int) -> None:
+            sequences.append(sequence)
+            notified.set()
+
+        stream.add_listener(listener)
+        stream.start()
+
+        self.assertTrue(notified.wait(timeout=1.0))
+        self.assertGreaterEqual(sequences[0], 1)
+
+        stream.remove_listener(listener)
+        stream.stop()
+        count = len(sequences)
+
+        # Once removed, the listener is not notified of any further frames:
+        stream.start()
+        stream.get_next_frame(timeout=1.0)
+        stream.stop()
+        self.assertEqual(len(sequences), count)
+
+    def test_listeners_are_notified_on_failure(self) -> None:
+        source = FrameSource()
+        source.error = ZWOASIErrorCode.CAMERA_REMOVED
+        stream = self.create_stream(source)
+
+        notified = Event()
+        stream.add_listener(lambda sequence: notified.set())
+        stream.start()
+
+        self.assertTrue(notified.wait(timeout=1.0))
+        self.assertFalse(stream.is_running)
+
+    def test_stop(self) -> None:
+        stream = self.create_stream(FrameSource())
+        stream.start()
+        self.assertTrue(stream.is_running)
+
+        stream.stop()
+        self.assertFalse(stream.is_running)
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
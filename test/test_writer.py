@@ -0,0 +1,243 @@
+# **************************************************************************************
+
+# @package        zwo
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from collections.abc import Buffer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Event, Thread
+from typing import List, Sequence, Tuple, Union
+
+from zwo import (
+    ZWOASI_FITS_BLOCK_SIZE,
+    ZWOASI_SDK_VERSION,
+    ZWOASICamera,
+    ZWOASIFITSCard,
+    ZWOASIFrameBuffer,
+    ZWOASIFrameBufferPool,
+    ZWOASIFrameWriter,
+    ZWOASIFrameWriterPolicy,
+    ZWOASIImageType,
+    ZWOASISimulatedCameraConfiguration,
+    install_simulated_asi_camera_lib,
+    set_asi_camera_lib,
+)
+
+# **************************************************************************************
+
+
+class GatedWriter(object):
+    """
+    A stand-in for write_fits, which waits to be opened before each write.
+    """
+
+    def __init__(self) -> None:
+        self.gate = Event()
+        self.started = Event()
+        self.written: List[Tuple[str, bytes, ZWOASIImageType]] = []
+        self.error = False
+
+    def write(
+        self,
+        path: Union[str, Path],
+        data: Buffer,
+        width: int,
+        height: int,
+        image_type: ZWOASIImageType,
+        cards: Sequence[ZWOASIFITSCard],
+    ) -> int:
+        self.started.set()
+        self.gate.wait(5.0)
+
+        if self.error:
+            raise OSError("Disk full.")
+
+        self.written.append((str(path), bytes(data), image_type))
+
+        return memoryview(data).nbytes
+
+
+# **************************************************************************************
+
+
+class TestZWOASIFrameWriter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = ZWOASIFrameBufferPool()
+        self.pool.configure(4, 2, ZWOASIImageType.RAW16)
+        self.writer = GatedWriter()
+
+    def create_frame(self, value: int) -> ZWOASIFrameBuffer:
+        frame = self.pool.acquire()
+        memoryview(frame.data)[:] = bytes([value, value + 1]) * 8
+        return frame
+
+    def test_block(self) -> None:
+        writer = ZWOASIFrameWriter(
+            queue_size=1, policy=ZWOASIFrameWriterPolicy.BLOCK, write=self.writer.write
+        )
+
+        # The first frame is taken by the worker, and the second fills the queue:
+        writer.submit(self.create_frame(0), "0")
+        self.assertTrue(self.writer.started.wait(1.0))
+        writer.submit(self.create_frame(1), "1")
+
+        blocked = Thread(target=writer.submit, args=(self.create_frame(2), "2"))
+        blocked.start()
+        blocked.join(0.05)
+
+        self.assertTrue(blocked.is_alive())
+        self.assertEqual(writer.get_statistics()["queue_depth"], 1)
+
+        self.writer.gate.set()
+        blocked.join(1.0)
+
+        writer.close()
+
+        self.assertEqual([path for path, _, _ in self.writer.written], ["0", "1", "2"])
+
+        statistics = writer.get_statistics()
+
+        self.assertEqual(statistics["frames_written"], 3)
+        self.assertEqual(statistics["bytes_written"], 48)
+        self.assertGreater(statistics["blocked_time"], 0.0)
+        self.assertEqual(statistics["maximum_queue_depth"], 1)
+
+        # Every frame buffer was released back to the pool:
+        self.assertEqual(self.pool.get_statistics()["available"], 3)
+
+    def test_drop_oldest(self) -> None:
+        writer = ZWOASIFrameWriter(
+            queue_size=2,
+            policy=ZWOASIFrameWriterPolicy.DROP_OLDEST,
+            write=self.writer.write,
+        )
+
+        writer.submit(self.create_frame(0), "0")
+        self.assertTrue(self.writer.started.wait(1.0))
+
+        for index in range(1, 5):
+            writer.submit(self.create_frame(index), str(index))
+
+        statistics = writer.get_statistics()
+
+        self.assertEqual(statistics["frames_dropped"], 2)
+        self.assertEqual(statistics["queue_depth"], 2)
+
+        self.writer.gate.set()
+        writer.close()
+
+        self.assertEqual([path for path, _, _ in self.writer.written], ["0", "3", "4"])
+
+    def test_degrade(self) -> None:
+        writer = ZWOASIFrameWriter(
+            queue_size=2,
+            policy=ZWOASIFrameWriterPolicy.DEGRADE,
+            write=self.writer.write,
+        )
+
+        writer.submit(self.create_frame(0), "0")
+        self.assertTrue(self.writer.started.wait(1.0))
+        writer.submit(self.create_frame(2), "1")
+        writer.submit(self.create_frame(4), "2")
+
+        self.assertEqual(writer.get_statistics()["frames_degraded"], 1)
+
+        self.writer.gate.set()
+        writer.close()
+
+        [_, second, third] = self.writer.written
+
+        self.assertEqual(second[2], ZWOASIImageType.RAW16)
+        self.assertEqual(third[1:], (bytes([5]) * 8, ZWOASIImageType.RAW8))
+
+    def test_write_errors(self) -> None:
+        writer = ZWOASIFrameWriter(write=self.writer.write)
+
+        self.writer.error = True
+        self.writer.gate.set()
+
+        writer.submit(self.create_frame(0), "0")
+
+        with self.assertRaises(RuntimeError):
+            writer.flush(timeout=1.0)
+
+        self.assertEqual(writer.get_statistics()["write_errors"], 1)
+
+        with self.assertRaises(RuntimeError):
+            writer.close()
+
+        with self.assertRaises(RuntimeError):
+            writer.submit(self.create_frame(0), "1")
+
+    def test_close_without_draining(self) -> None:
+        writer = ZWOASIFrameWriter(queue_size=4, write=self.writer.write)
+
+        writer.submit(self.create_frame(0), "0")
+        self.assertTrue(self.writer.started.wait(1.0))
+        writer.submit(self.create_frame(1), "1")
+
+        self.writer.gate.set()
+        writer.close(drain=False)
+
+        self.assertLessEqual(len(self.writer.written), 2)
+        self.assertEqual(writer.get_statistics()["queue_depth"], 0)
+
+
+# **************************************************************************************
+
+
+class TestZWOASIFrameWriterCapture(unittest.TestCase):
+    def setUp(self) -> None:
+        install_simulated_asi_camera_lib(
+            cameras=[
+                ZWOASISimulatedCameraConfiguration(width=64, height=32, readout_rate=0)
+            ]
+        )
+
+        self.camera = ZWOASICamera(0)
+
+        self.camera.set_image_type(ZWOASIImageType.RAW16)
+        self.camera.set_exposure_time(0.001)
+
+    def tearDown(self) -> None:
+        self.camera.disconnect()
+
+        set_asi_camera_lib(None, version=ZWOASI_SDK_VERSION)
+
+    def test_capture_to_fits(self) -> None:
+        self.camera.frame_buffer_pool.capacity = 1
+
+        with TemporaryDirectory() as directory:
+            with ZWOASIFrameWriter(queue_size=2) as writer:
+                writer.capture(
+                    self.camera, 3, lambda index: Path(directory) / f"{index}.fits"
+                )
+
+            paths = sorted(Path(directory).iterdir())
+
+            self.assertEqual(
+                [path.name for path in paths], ["0.fits", "1.fits", "2.fits"]
+            )
+
+            for path in paths:
+                self.assertEqual(path.stat().st_size, 3 * ZWOASI_FITS_BLOCK_SIZE)
+
+        statistics = writer.get_statistics()
+
+        self.assertEqual(statistics["frames_written"], 3)
+        self.assertGreater(statistics["throughput"], 0.0)
+
+        # The capacity of the camera's frame buffer pool is restored afterwards:
+        self.assertEqual(self.camera.frame_buffer_pool.capacity, 1)
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************